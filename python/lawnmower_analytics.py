@@ -0,0 +1,213 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_analytics.py
+
+Objectives:
+    Path analytics of an Automated Robotic Lawnmower Simulator run, computed during the simulation pass
+    (no pos_history post-processing): the engines feed every executed move (crash move excluded) before
+    the cell is marked as visited
+        visit_counts          heatmap of the visits per cell (start position included), one byte per cell
+                              saturating at 255, row-major, base64
+        revisits              moves onto an already cut cell (overlap), revisit_ratio = revisits / moves
+        efficiency            newly cut cells per move (1 - revisit_ratio)
+        turns                 changes of direction between consecutive moves
+        longest_straight_run  longest sequence of identical moves
+        full_coverage_move    move after which all grass is cut (None if never, 0 at the start)
+        coverage_checkpoints  [move, cut cells] pairs over the run. At most MAX_CHECKPOINTS are kept: when full,
+                              every other checkpoint is dropped and the interval doubled
+    O(1) per move (plus one byte per cell), whatever the path length
+
+Execution:
+    LawnmowerSim(..., analytics=True), or analytics=True in the definition file / ?analytics=true on /simulate:
+    sim_status["analytics"]
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import base64
+from typing import List, Dict, Any, Optional, Tuple
+
+# Bounded coverage curve
+MAX_CHECKPOINTS: int = 64
+
+# Saturation of the per cell visit counts (one byte)
+MAX_VISITS: int = 255
+
+# Moves changing the position. Any other move keeps the mower in place (one "stay" direction)
+DIRECTIONS: Tuple[str, ...] = ("up", "down", "left", "right")
+CODE_DIRECTIONS: Tuple[str, ...] = DIRECTIONS + ("stay",) # by direction code of the numpy engine (MOVE_CODES, NO_MOVE)
+
+
+class PathAnalytics:
+    """
+    Path Analytics Class Definition
+    Accumulates the analytics of one simulator (see module description)
+    """
+    __slots__ = ("grid", "total_grass_squares", "counts", "moves", "revisits", "cut", "turns", "direction", "run",
+                 "longest_run", "full_coverage_move", "checkpoints", "interval", "next_checkpoint")
+
+    def __init__(self, grid: Any, total_grass_squares: int, start_index: Optional[int]) -> None:
+        """
+        Method: __init__ (Object Creation)
+
+        Args:
+            grid (GridState): rock and visited cell maps of the simulator, with the start position already visited
+            total_grass_squares (int): grass cells of the lawn
+            start_index (Optional[int]): cell index of the start position, None when outside the grid
+        """
+        self.grid: Any = grid
+        self.total_grass_squares: int = total_grass_squares
+        self.counts: bytearray = bytearray(grid.height * grid.width)
+        if start_index is not None:
+            self.counts[start_index] = 1
+        self.moves: int = 0
+        self.revisits: int = 0
+        self.cut: int = grid.visited_count()
+        self.turns: int = 0
+        self.direction: Optional[str] = None
+        self.run: int = 0
+        self.longest_run: int = 0
+        self.full_coverage_move: Optional[int] = 0 if self.cut == total_grass_squares else None
+        self.checkpoints: List[Tuple[int, int]] = [(0, self.cut)]
+        self.interval: int = 1
+        self.next_checkpoint: int = 1
+
+    def turn(self, direction: str, count: int) -> None:
+        """
+        Method: turn
+        Direction bookkeeping of count identical moves (turns and straight runs)
+        """
+        if direction == self.direction:
+            self.run += count
+        else:
+            if self.direction is not None:
+                self.turns += 1
+            self.direction = direction
+            self.run = count
+        if self.run > self.longest_run:
+            self.longest_run = self.run
+
+    def checkpoint(self) -> None:
+        """
+        Method: checkpoint
+        Record the coverage at the current move, thinning the curve when full
+        """
+        self.checkpoints.append((self.moves, self.cut))
+        self.next_checkpoint += self.interval
+        if len(self.checkpoints) >= MAX_CHECKPOINTS:
+            self.interval *= 2
+            self.checkpoints = [point for point in self.checkpoints if point[0] % self.interval == 0]
+            self.next_checkpoint = self.checkpoints[-1][0] + self.interval
+
+    def cell(self, index: int) -> None:
+        """
+        Method: cell
+        One executed move onto a cell inside the grid, before the simulator marks it as visited
+        """
+        self.moves += 1
+        count = self.counts[index]
+        if count < MAX_VISITS:
+            self.counts[index] = count + 1
+        if self.grid.visited[index]:
+            self.revisits += 1
+        else:
+            self.cut += 1
+            if self.cut == self.total_grass_squares and self.full_coverage_move is None:
+                self.full_coverage_move = self.moves
+        if self.moves == self.next_checkpoint:
+            self.checkpoint()
+
+    def step(self, move: str, index: int) -> None:
+        """
+        Method: step
+        One executed move (python engine, LawnmowerSim.move)
+
+        Args:
+            move (str): move (up,down,left,right, anything else keeps the position)
+            index (int): cell index row*width+col of the new position
+        """
+        self.turn(move if move in DIRECTIONS else "stay", 1)
+        self.cell(index)
+
+    def straight(self, move: str, start: int, count: int, stride: int) -> None:
+        """
+        Method: straight
+        A straight run of executed moves (LawnmowerSim.move_run). A straight run never visits a cell twice
+
+        Args:
+            move (str): move (up,down,left,right)
+            start (int): cell index of the first cell of the run
+            count (int): number of moves
+            stride (int): index step between cells (+-1 along a row, +-width along a column)
+        """
+        self.turn(move, count)
+        for index in range(start, start + stride * count, stride):
+            self.cell(index)
+
+    def chunk(self, directions: Any, cells: Any, cell_visits: Any, new_moves: Any) -> None:
+        """
+        Method: chunk
+        A chunk of executed moves (numpy engine), before its new cells are marked as visited
+
+        Args:
+            directions (np.ndarray): direction code per move (int8, see CODE_DIRECTIONS)
+            cells (np.ndarray): distinct cell indexes visited by the chunk
+            cell_visits (np.ndarray): visits per distinct cell
+            new_moves (np.ndarray): sorted chunk indexes of the moves cutting a new cell
+        """
+        # Lazy import: only the numpy engine feeds chunks
+        import numpy as np
+        n = len(directions)
+        if not n:
+            return
+        # Directions: boundaries between runs of identical codes
+        starts: Any = np.flatnonzero(directions[1:] != directions[:-1]) + 1
+        lengths = np.diff(np.concatenate(([0], starts, [n])))
+        codes = directions[np.concatenate(([0], starts))].tolist()
+        for code, length in zip(codes, lengths.tolist()):
+            self.turn(CODE_DIRECTIONS[code], length)
+
+        # Heatmap and coverage
+        counts: np.ndarray = np.frombuffer(self.counts, dtype=np.uint8)
+        counts[cells] = np.minimum(counts[cells].astype(np.int64) + cell_visits, MAX_VISITS)
+        moves_before, cut_before = self.moves, self.cut
+        self.revisits += n - len(new_moves)
+        uncut = self.total_grass_squares - cut_before
+        if self.full_coverage_move is None and 0 < uncut <= len(new_moves):
+            self.full_coverage_move = moves_before + int(new_moves[uncut - 1]) + 1
+        while self.next_checkpoint <= moves_before + n:
+            self.moves = self.next_checkpoint
+            self.cut = cut_before + int(np.searchsorted(new_moves, self.moves - moves_before))
+            self.checkpoint()
+        self.moves, self.cut = moves_before + n, cut_before + len(new_moves)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Method: summary
+        Analytics of the run so far (sim_status["analytics"])
+        """
+        checkpoints = [list(point) for point in self.checkpoints]
+        if checkpoints[-1][0] != self.moves:
+            checkpoints.append([self.moves, self.cut])
+        ratio = self.revisits / self.moves if self.moves else 0.0
+        return {
+            "moves": self.moves,
+            "revisits": self.revisits,
+            "revisit_ratio": round(ratio, 6),
+            "efficiency": round(1.0 - ratio, 6) if self.moves else 0.0,
+            "turns": self.turns,
+            "longest_straight_run": self.longest_run,
+            "full_coverage_move": self.full_coverage_move,
+            "coverage_checkpoints": checkpoints,
+            "max_visits": max(self.counts, default=0),
+            "visit_counts": {
+                "shape": [self.grid.height, self.grid.width],
+                "encoding": "uint8",
+                "data": base64.b64encode(self.counts).decode("ascii"),
+            },
+        }
@@ -0,0 +1,91 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_analytics_test.py
+
+Objectives:
+    Auto Test for Automated Robotic Lawnmower Simulator path analytics
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import base64
+from typing import Any, Dict, List
+from fastapi.testclient import TestClient
+import lawnmower_results
+import python.lawnmower_cli_api as cli_api
+from python.lawnmower_sim import LawnmowerSim
+from python.lawnmower_fuzz import generate_scenarios
+from python.lawnmower_analytics import MAX_CHECKPOINTS
+
+def simulate(params: Dict[str, Any], engine: str = "python", runs: bool = False) -> Dict[str, Any]:
+    lm_sim = LawnmowerSim(params["test_name"], params["height"], params["width"], params["rocks"], params["start_pos"],
+                          log_level="off", log_sinks=[], analytics=True)
+    if runs:
+        grouped: List[List[Any]] = []
+        for move in params["path"]:
+            if grouped and grouped[-1][0] == move.lower():
+                grouped[-1][1] += 1
+            else:
+                grouped.append([move.lower(), 1])
+        return lm_sim.execute_runs([(move, count) for move, count in grouped])
+    return lm_sim.execute_path(params["path"], engine=engine)
+
+def test_analytics_01_against_pos_history() -> None:
+    """Verifies the analytics of the reference engine against an offline pass over pos_history."""
+    print(f"\n---  Auto Test test_analytics_01_against_pos_history - heatmap, revisits, coverage curve")
+    for params in generate_scenarios(60, seed=9, max_grid=8, max_moves=2000):
+        sim_status = simulate(dict(params, start_pos=[0, 0]))
+        analytics = sim_status["analytics"]
+        history = sim_status["pos_history"][:-1] if sim_status["did_mower_crash"] else sim_status["pos_history"]
+        width = sim_status["grid_width"]
+        counts = [0] * (sim_status["grid_height"] * width)
+        counts[0] = 1
+        cut, curve, full = {(0, 0)}, [1], None
+        for move, (row, col) in enumerate(history[1:], 1):
+            counts[row * width + col] += 1
+            cut.add((row, col))
+            curve.append(len(cut))
+            if full is None and len(cut) == sim_status["total_grass_squares"]:
+                full = move
+        assert analytics["moves"] == len(history) - 1
+        assert analytics["revisits"] == len(history) - len(cut)
+        assert list(base64.b64decode(analytics["visit_counts"]["data"])) == [min(count, 255) for count in counts]
+        assert analytics["full_coverage_move"] == (0 if sim_status["total_grass_squares"] == 1 else full)
+        assert len(analytics["coverage_checkpoints"]) <= MAX_CHECKPOINTS + 1
+        assert all(curve[move] == cut_cells for move, cut_cells in analytics["coverage_checkpoints"])
+        assert analytics["coverage_checkpoints"][-1][0] == analytics["moves"]
+
+def test_analytics_02_engines_agree() -> None:
+    """Verifies that the run, numpy and parallel engines return the analytics of the reference engine."""
+    print(f"\n---  Auto Test test_analytics_02_engines_agree - python, runs, numpy, parallel")
+    for params in generate_scenarios(60, seed=3, max_grid=10, max_moves=300):
+        reference = simulate(params)["analytics"]
+        assert simulate(params, runs=True)["analytics"] == reference
+        assert simulate(params, engine="numpy")["analytics"] == reference
+        assert simulate(params, engine="parallel")["analytics"] == reference
+    straight = simulate({"test_name": "t", "height": 3, "width": 4, "rocks": [], "start_pos": [0, 0],
+                         "path": ["Right"] * 3 + ["Down"] + ["Left"] * 3 + ["Down"] + ["Right"] * 3})["analytics"]
+    assert (straight["turns"], straight["longest_straight_run"], straight["full_coverage_move"]) == (4, 3, 11)
+
+def test_analytics_03_api(tmp_path: Any, monkeypatch: Any) -> None:
+    """Verifies ?analytics=true and fields=analytics on /simulate, and the analytics of the stream done event."""
+    print(f"\n---  Auto Test test_analytics_03_api - /simulate?analytics=true")
+    monkeypatch.chdir(tmp_path)
+    # Results sink of the module imported by the server (python/ on sys.path)
+    monkeypatch.setattr(lawnmower_results, "_results_sink", lawnmower_results.FileResults(str(tmp_path / "results")))
+    client = TestClient(cli_api.app_lawnmower_simulation)
+    definition = b'test_name="analytics"\nheight=2\nwidth=2\nrocks=[]\nstart_pos=[0,0]\npath="R1D1L1U1"\n'
+
+    def post(url: str, **params: str) -> Any:
+        return client.post(url, params=params, files={"file": ("scenario.txt", definition, "text/plain")})
+
+    assert "analytics" not in post("/simulate").json()
+    assert "analytics" not in post("/simulate", summary="true").json()
+    analytics = post("/simulate", analytics="true", summary="true").json()["analytics"]
+    assert (analytics["moves"], analytics["revisits"], analytics["full_coverage_move"]) == (4, 1, 3)
+    assert post("/simulate", fields="analytics").json() == {"analytics": analytics}
+    assert f'"analytics":{{"moves":4' in post("/simulate/stream", analytics="true").text
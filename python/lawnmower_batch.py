@@ -0,0 +1,223 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_batch.py
+
+Objectives:
+    Batch execution of many Automated Robotic Lawnmower Simulator scenarios
+    Fans execute_and_report out over a configurable ProcessPoolExecutor
+    Yields per-scenario results as they finish
+    Aggregates a summary: crashes by reason, full-coverage rate and latency percentiles
+
+Execution:
+    CLI
+        python ./python/lawnmower_cli.py --cli-batch ./tests [workers]
+        python ./python/lawnmower_cli.py --cli-batch "./tests/*crash*.txt" [workers]
+    API
+        POST /simulate/batch with a multi-file upload (field "files") or an NDJSON body (one params object per line)
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import os
+import glob
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Any, Union, Iterable, Iterator, Optional
+
+# Default number of worker processes. Overridable with environment variable LAWNMOWER_BATCH_WORKERS
+DEFAULT_WORKERS: int = int(os.environ.get("LAWNMOWER_BATCH_WORKERS", os.cpu_count() or 1))
+
+# Fields of sim_status reported per scenario (full trajectories stay in the results sink, see lawnmower_results)
+RESULT_FIELDS: List[str] = ["test_name", "did_mower_crash", "crash_reason", "all_grass_cut", "uncut_grass_remaining"]
+
+# Latency percentiles reported in the batch summary
+PERCENTILES: List[int] = [50, 90, 99]
+
+
+def run_scenario(index: int, scenario: Union[str, Dict[str, Any]], cache: bool = True) -> Dict[str, Any]:
+    """
+    Function: run_scenario
+    Worker function: parse (if needed) and execute one scenario with execute_and_report (through the result cache)
+
+    Args:
+        index: int - position of the scenario in the batch
+        scenario: Union[str, Dict[str, Any]] - definition file content or already parsed params
+        cache: bool - use the result cache unless the scenario sets cache (the CLI batch opts in)
+
+    Output:
+        Dict[str, Any] - index, RESULT_FIELDS, latency_ms, and error (only if the scenario failed)
+    """
+    # Lazy import: the workers only need the core logic
+    from lawnmower_core import parse_text_file, execute_cached
+
+    start = time.perf_counter()
+    result: Dict[str, Any] = {"index": index}
+    try:
+        params = parse_text_file(scenario) if isinstance(scenario, str) else dict(scenario)
+        # Batch runs are silent unless the scenario asks for messages
+        params.setdefault('log_level', 'off')
+        params.setdefault('cache', cache)
+        sim_status = execute_cached(lambda: params)
+        result.update({field: sim_status[field] for field in RESULT_FIELDS})
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+    result["latency_ms"] = (time.perf_counter() - start) * 1000.0
+    return result
+
+
+def run_on_pool(pool: ProcessPoolExecutor, index: int, scenario: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Function: run_on_pool
+    Run one scenario on a process pool and wait for its result (blocking: called from a thread of the
+    API bounded executor, so the batch scenarios share its running slots, see lawnmower_offload)
+
+    Args:
+        pool: ProcessPoolExecutor - process pool
+        index: int - position of the scenario in the batch
+        scenario: Union[str, Dict[str, Any]] - definition file content or already parsed params
+    """
+    return pool.submit(run_scenario, index, scenario).result()
+
+
+def parse_ndjson(text: str) -> List[Dict[str, Any]]:
+    """
+    Function: parse_ndjson
+    Scenarios of an NDJSON batch body: one JSON params object per line (blank lines ignored)
+
+    Args:
+        text: str - NDJSON body
+
+    Output:
+        List[Dict[str, Any]] - params per scenario. Raises ValueError naming the first malformed line
+    """
+    scenarios: List[Dict[str, Any]] = []
+    for number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            params = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"Invalid NDJSON line {number}: {error}") from None
+        if not isinstance(params, dict):
+            raise ValueError(f"Invalid NDJSON line {number}: expected a JSON object of params")
+        scenarios.append(params)
+    return scenarios
+
+
+def find_scenario_files(target: str) -> List[str]:
+    """
+    Function: find_scenario_files
+    List scenario definition files from a directory (all .txt files) or a glob pattern
+
+    Args:
+        target: str - directory or glob pattern
+    """
+    if os.path.isdir(target):
+        return sorted(glob.glob(os.path.join(target, "*.txt")))
+    return sorted(glob.glob(target))
+
+
+class BatchSummary:
+    """
+    Batch Summary Class Definition
+    Aggregates per-scenario results into crash counts by reason, full-coverage rate and latency percentiles
+    """
+
+    def __init__(self) -> None:
+        self.scenarios: int = 0
+        self.errors: int = 0
+        self.full_coverage: int = 0
+        self.crashes_by_reason: Dict[str, int] = {}
+        self.latencies_ms: List[float] = []
+        self.start: float = time.perf_counter()
+
+    def add(self, result: Dict[str, Any]) -> None:
+        """
+        Method: add
+        Account one per-scenario result
+
+        Args:
+            result: Dict[str, Any] - result from run_scenario
+        """
+        self.scenarios += 1
+        self.latencies_ms.append(result["latency_ms"])
+        if "error" in result:
+            self.errors += 1
+            return
+        if result["did_mower_crash"]:
+            self.crashes_by_reason[result["crash_reason"]] = self.crashes_by_reason.get(result["crash_reason"], 0) + 1
+        if result["all_grass_cut"]:
+            self.full_coverage += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Method: summary
+        Aggregate summary of the results added so far
+        """
+        latencies = sorted(self.latencies_ms)
+        latency_ms: Dict[str, float] = {}
+        for percentile in PERCENTILES:
+            # Nearest-rank percentile
+            latency_ms[f"p{percentile}"] = latencies[max(0, -(-percentile * len(latencies) // 100) - 1)] if latencies else 0.0
+        latency_ms["max"] = latencies[-1] if latencies else 0.0
+        return {
+            "scenarios": self.scenarios,
+            "errors": self.errors,
+            "crashes": sum(self.crashes_by_reason.values()),
+            "crashes_by_reason": self.crashes_by_reason,
+            "full_coverage": self.full_coverage,
+            "full_coverage_rate": self.full_coverage / self.scenarios if self.scenarios else 0.0,
+            "latency_ms": latency_ms,
+            "wall_time_s": time.perf_counter() - self.start,
+        }
+
+
+# Process pool shared by the API batch requests of one server worker (created on first use)
+_shared_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_shared_pool() -> ProcessPoolExecutor:
+    """
+    Function: get_shared_pool
+    Process pool reused across API batch requests, sized by DEFAULT_WORKERS
+    """
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = ProcessPoolExecutor(max_workers=DEFAULT_WORKERS)
+    return _shared_pool
+
+
+def run_batch(
+    scenarios: Iterable[Union[str, Dict[str, Any]]],
+    workers: Optional[int] = None,
+    executor: Optional[ProcessPoolExecutor] = None,
+    cache: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Function: run_batch
+    Execute scenarios over a process pool and yield per-scenario results as they finish,
+    followed by the aggregate summary as last item ({"summary": {...}})
+
+    Args:
+        scenarios: Iterable[Union[str, Dict[str, Any]]] - definition file contents or parsed params
+        workers: Optional[int] - number of worker processes (default DEFAULT_WORKERS). Ignored if executor given
+        executor: Optional[ProcessPoolExecutor] - already running pool to reuse
+        cache: bool - use the result cache for the scenarios that do not set cache
+    """
+    batch_summary = BatchSummary()
+    pool = executor or ProcessPoolExecutor(max_workers=workers or DEFAULT_WORKERS)
+    try:
+        futures = [pool.submit(run_scenario, index, scenario, cache) for index, scenario in enumerate(scenarios)]
+        for future in as_completed(futures):
+            result = future.result()
+            batch_summary.add(result)
+            yield result
+    finally:
+        if executor is None:
+            pool.shutdown()
+    yield {"summary": batch_summary.summary()}
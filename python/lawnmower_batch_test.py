@@ -0,0 +1,108 @@
+"""
+Project: 
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_batch_test.py
+
+Objectives: 
+    Auto Test for Automated Robotic Lawnmower Simulator batch execution
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import os
+import sys
+import json
+import subprocess
+from typing import Any, List
+import pytest
+from fastapi.testclient import TestClient
+import python.lawnmower_cli_api as cli_api
+from python.lawnmower_batch import BatchSummary, find_scenario_files, run_batch
+
+PYTHON_DIR = os.path.dirname(os.path.abspath(__file__))
+TESTS_DIR = os.path.join(PYTHON_DIR, "..", "tests")
+PARAMS = {"test_name": "batch", "height": 2, "width": 2, "rocks": [], "start_pos": [0, 0], "path": ["Right", "Down", "Left"]}
+
+def test_batch_01_summary_aggregation() -> None:
+    """Verifies crash counts by reason, full-coverage rate and latency percentiles of a batch."""
+    print(f"\n---  Auto Test test_batch_01_summary_aggregation - batch summary aggregation")
+    batch_summary = BatchSummary()
+    for latency, crash_reason, all_grass_cut in [(1.0, "None", True), (2.0, "Crashed into Rock", False),
+                                                 (3.0, "Crashed into Rock", False), (4.0, "None", False)]:
+        batch_summary.add({"latency_ms": latency, "did_mower_crash": crash_reason != "None",
+                           "crash_reason": crash_reason, "all_grass_cut": all_grass_cut})
+    batch_summary.add({"latency_ms": 5.0, "error": "KeyError: 'path'"})
+    summary = batch_summary.summary()
+    assert summary["scenarios"] == 5
+    assert summary["errors"] == 1
+    assert summary["crashes_by_reason"] == {"Crashed into Rock": 2}
+    assert summary["full_coverage_rate"] == pytest.approx(0.2)
+    assert summary["latency_ms"]["p50"] == 3.0
+    assert summary["latency_ms"]["max"] == 5.0
+
+def test_batch_02_find_scenario_files() -> None:
+    """Verifies scenario discovery from a directory and from a glob pattern."""
+    print(f"\n---  Auto Test test_batch_02_find_scenario_files - scenario discovery")
+    assert len(find_scenario_files("./tests")) == 4
+    assert len(find_scenario_files("./tests/*crash*.txt")) == 2
+
+def test_batch_03_run_batch_over_pool(tmp_path: Any, monkeypatch: Any) -> None:
+    """Verifies that run_batch executes every scenario over a process pool, errors included, and ends with the summary."""
+    print(f"\n---  Auto Test test_batch_03_run_batch_over_pool - run_batch with 2 worker processes")
+    scenarios: List[Any] = []
+    for file_path in find_scenario_files(TESTS_DIR):
+        with open(file_path, "r") as f:
+            scenarios.append(f.read())
+    scenarios += [dict(PARAMS), 'test_name="broken"\nheight=3\n']
+    monkeypatch.chdir(tmp_path)
+    results = list(run_batch(scenarios, workers=2))
+    summary = results.pop()["summary"]
+    assert sorted(result["index"] for result in results) == list(range(len(scenarios)))
+    by_index = {result["index"]: result for result in results}
+    assert by_index[2]["crash_reason"] == "Crashed into Rock" and by_index[4]["all_grass_cut"] and "error" in by_index[5]
+    assert summary["scenarios"] == 6 and summary["errors"] == 1
+    assert summary["crashes_by_reason"] == {"Crashed into Fence": 1, "Crashed into Rock": 1}
+
+def test_batch_04_cli_batch(tmp_path: Any) -> None:
+    """Verifies that --cli-batch prints one JSON line per scenario file and the summary as last line."""
+    print(f"\n---  Auto Test test_batch_04_cli_batch - --cli-batch ./tests 2")
+    completed = subprocess.run([sys.executable, os.path.join(PYTHON_DIR, "lawnmower_cli.py"), "--cli-batch", TESTS_DIR, "2"],
+                               cwd=str(tmp_path), env=dict(os.environ, LAWNMOWER_RESULTS_SINK="off"),
+                               capture_output=True, text=True, timeout=60)
+    assert completed.returncode == 0, completed.stderr
+    lines = [json.loads(line) for line in completed.stdout.splitlines() if line.startswith("{")]
+    assert sorted(line["index"] for line in lines[:-1]) == [0, 1, 2, 3]
+    assert lines[-1]["summary"]["scenarios"] == 4 and lines[-1]["summary"]["crashes"] == 2
+
+def test_batch_05_api_batch(tmp_path: Any, monkeypatch: Any) -> None:
+    """Verifies POST /simulate/batch over NDJSON and multi-file uploads, the 422 of a malformed NDJSON line and the 429."""
+    print(f"\n---  Auto Test test_batch_05_api_batch - POST /simulate/batch")
+    monkeypatch.chdir(tmp_path)
+    client = TestClient(cli_api.app_lawnmower_simulation)
+    body = json.dumps(PARAMS) + "\n\n" + json.dumps(dict(PARAMS, path=["Down", "Down", "Down"])) + "\n"
+    response = client.post("/simulate/batch", content=body, headers={"content-type": "application/x-ndjson"})
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted((line["index"], line["crash_reason"]) for line in lines[:-1]) == [(0, "None"), (1, "Crashed into Fence")]
+    assert lines[-1]["summary"]["scenarios"] == 2
+
+    with open(os.path.join(TESTS_DIR, "lawnmower_scenario03_rock_crash.txt"), "rb") as f:
+        files = [("files", ("scenario03.txt", f.read(), "text/plain"))] * 3
+    lines = [json.loads(line) for line in client.post("/simulate/batch", files=files).text.splitlines()]
+    assert lines[-1]["summary"]["crashes_by_reason"] == {"Crashed into Rock": 3}
+
+    response = client.post("/simulate/batch", content=json.dumps(PARAMS) + '\n{"test_name": \n',
+                           headers={"content-type": "application/x-ndjson"})
+    assert response.status_code == 422 and "line 2" in response.json()["detail"]
+    response = client.post("/simulate/batch", content="[1, 2]\n", headers={"content-type": "application/x-ndjson"})
+    assert response.status_code == 422 and "line 1" in response.json()["detail"]
+
+    # Backpressure: no running slot nor queue place free (executor class of the module imported by the server)
+    busy = type(cli_api.get_simulate_executor())(concurrency=1, queue_depth=0)
+    busy.running = 1
+    monkeypatch.setattr(cli_api, "get_simulate_executor", lambda: busy)
+    response = client.post("/simulate/batch", content=body, headers={"content-type": "application/x-ndjson"})
+    assert response.status_code == 429 and response.headers["Retry-After"] == "1"
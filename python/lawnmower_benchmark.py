@@ -0,0 +1,464 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_benchmark.py
+
+Objectives:
+    Microbenchmark and scaling benchmark suite for Automated Robotic Lawnmower Simulator
+    Times LawnmowerSim construction over grid sizes and rock densities
+    Times execute_path over grid sizes, path lengths and engines
+    Measures streaming ingestion (parse_text_stream) throughput and end-to-end /simulate latency (FastAPI TestClient)
+    Records the peak memory of every case (tracemalloc, in a separate untimed run)
+    Appends every run to a JSON history file and fails when a case regresses past a threshold
+    versus the stored baseline
+
+    Profiles:
+        quick - grids 10^2 to 1000^2, paths 10 to 10^5 (a few seconds, CI friendly)
+        full  - grids 10^2 to 10^4 squared, paths 10 to 10^7 (several minutes)
+
+Execution:
+    python ./python/lawnmower_benchmark.py [quick|full] [--save-baseline] [--threshold 0.5]
+    Exit code 1 if a case regressed versus ./results/benchmark_baseline.json
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import io
+import os
+import sys
+import json
+import time
+import random
+import platform
+import tempfile
+import tracemalloc
+from collections import deque
+from datetime import datetime
+from functools import partial
+from typing import List, Dict, Any, Tuple, Callable, Optional
+from lawnmower_sim import LawnmowerSim
+
+# Benchmark files
+BASELINE_FILE: str = "./results/benchmark_baseline.json"
+HISTORY_FILE: str = "./results/benchmark_history.json"
+
+# Regression threshold: relative slowdown (or memory growth) versus baseline considered a regression
+DEFAULT_THRESHOLD: float = 0.5
+# Absolute differences below these are timer/allocator noise, never a regression
+MIN_DELTA_SECONDS: float = 0.005
+MIN_DELTA_MB: float = 1.0
+
+# Fast cases are repeated (best time kept) until this much time was spent
+REPEAT_SECONDS: float = 0.2
+MAX_REPEATS: int = 5
+
+# Case matrix per profile
+PROFILES: Dict[str, Dict[str, Any]] = {
+    "quick": {
+        "construct_grids": [10, 100, 1000],
+        "densities": [0.0, 0.1],
+        "execute_grids": [10, 100, 1000],
+        "path_lengths": [10, 1000, 100000],
+        "parse_lengths": [1000, 100000],
+        "api_lengths": [10, 10000],
+        "api_requests": 20,
+    },
+    "full": {
+        "construct_grids": [10, 100, 1000, 10000],
+        "densities": [0.0, 0.001, 0.01],
+        "execute_grids": [10, 100, 1000, 10000],
+        "path_lengths": [10, 1000, 100000, 10000000],
+        "parse_lengths": [1000, 100000, 1000000],
+        "api_lengths": [10, 10000, 1000000],
+        "api_requests": 50,
+    },
+}
+
+# Engines benchmarked by execute_path cases
+BENCH_ENGINES: List[str] = ["python", "numpy"]
+
+# Grid used by the path length sweep and path length used by the grid sweep
+SWEEP_GRID: int = 1000
+SWEEP_PATH: int = 100000
+
+
+def sweep_path(height: int, width: int, length: int) -> Tuple[List[str], int]:
+    """
+    Function: sweep_path
+    Crash free path of a given length: horizontal serpentine sweep of the grid,
+    going back up when the last row is reached
+
+    Args:
+        height: int - grid height
+        width: int - grid width
+        length: int - number of moves
+
+    Output:
+        Tuple[List[str], int] - moves and number of rows swept (rocks must be placed below them)
+    """
+    path: List[str] = []
+    row, step, horizontal = 0, 1, "right"
+    rows_swept = 1
+    while len(path) < length:
+        path.extend([horizontal] * (width - 1))
+        horizontal = "left" if horizontal == "right" else "right"
+        if height > 1:
+            if not 0 <= row + step < height:
+                step = -step
+            path.append("down" if step > 0 else "up")
+            row += step
+            rows_swept = max(rows_swept, row + 1)
+        elif width < 2:
+            break
+    return path[:length], rows_swept
+
+
+def random_rocks(height: int, width: int, density: float, first_row: int = 0, seed: int = 0) -> List[List[int]]:
+    """
+    Function: random_rocks
+    Rocks on a random fraction of the cells from first_row down (reproducible)
+
+    Args:
+        height: int - grid height
+        width: int - grid width
+        density: float - fraction of the cells holding a rock
+        first_row: int - rows above are kept free of rocks
+        seed: int - random seed
+    """
+    cells = max(height - first_row, 0) * width
+    count = min(int(height * width * density), cells)
+    offset = first_row * width
+    return [[index // width, index % width] for index in random.Random(seed).sample(range(offset, offset + cells), count)]
+
+
+def definition_text(test_name: str, height: int, width: int, rocks: List[List[int]], path: List[str],
+                    extra: str = "") -> str:
+    """
+    Function: definition_text
+    Definition file content (same format as the ./tests files)
+
+    Args:
+        test_name: str - test name
+        height, width: int - grid dimensions
+        rocks: List[List[int]] - rock coordinates
+        path: List[str] - moves
+        extra: str - additional key lines placed before the path
+    """
+    moves = ", ".join(f'"{move.capitalize()}"' for move in path)
+    return (f'test_name="{test_name}"\nheight={height}\nwidth={width}\nrocks={json.dumps(rocks)}\n'
+            f'start_pos=[0,0]\n{extra}path=[{moves}]\n')
+
+
+def measure(run: Callable[..., Any], setup: Optional[Callable[[], Any]] = None) -> Dict[str, float]:
+    """
+    Function: measure
+    Best wall time of run (fast cases repeated) and peak traced memory of one extra run
+
+    Args:
+        run: Callable - measured code, called with the result of setup if given
+        setup: Optional[Callable] - untimed preparation executed before every run
+
+    Output:
+        Dict[str, float] - seconds, peak_mb and repeats
+    """
+    best = float("inf")
+    spent = 0.0
+    repeats = 0
+    while repeats < MAX_REPEATS and (repeats == 0 or spent < REPEAT_SECONDS):
+        args = (setup(),) if setup else ()
+        start = time.perf_counter()
+        run(*args)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        repeats += 1
+    # Peak memory of the measured code only (setup allocations excluded)
+    args = (setup(),) if setup else ()
+    tracemalloc.start()
+    try:
+        run(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": best, "peak_mb": peak / 1e6, "repeats": repeats}
+
+
+def bench_construct(grid: int, density: float) -> Dict[str, Any]:
+    """
+    Function: bench_construct
+    LawnmowerSim construction time for a grid x grid lawn
+
+    Args:
+        grid: int - grid side
+        density: float - rock density
+    """
+    rocks = random_rocks(grid, grid, density)
+    result = measure(lambda: LawnmowerSim("bench", grid, grid, rocks, [0, 0], log_level="off", log_sinks=[]))
+    return dict(result, cells_per_s=grid * grid / result["seconds"])
+
+
+def bench_execute(grid: int, density: float, length: int, engine: str) -> Dict[str, Any]:
+    """
+    Function: bench_execute
+    execute_path time of a crash free sweep path (construction excluded)
+
+    Args:
+        grid: int - grid side
+        density: float - rock density (below the swept rows)
+        length: int - path length
+        engine: str - execute_path engine
+    """
+    path, rows_swept = sweep_path(grid, grid, length)
+    rocks = random_rocks(grid, grid, density, first_row=rows_swept)
+
+    def setup() -> LawnmowerSim:
+        return LawnmowerSim("bench", grid, grid, rocks, [0, 0], log_level="off", log_sinks=[], keep_history=False)
+
+    def run(sim: LawnmowerSim) -> None:
+        sim_status = sim.execute_path(path, engine=engine)
+        assert not sim_status["did_mower_crash"]
+
+    result = measure(run, setup)
+    return dict(result, moves_per_s=len(path) / result["seconds"])
+
+
+def bench_parse(length: int) -> Dict[str, Any]:
+    """
+    Function: bench_parse
+    Streaming ingestion throughput (parse_text_stream over iter_text_chunks, the CLI and API parser)
+    on a definition file with a path of a given length. The file is read from memory, so disk I/O is not timed
+
+    Args:
+        length: int - path length
+    """
+    from lawnmower_stream import parse_text_stream, iter_text_chunks
+
+    path, _ = sweep_path(SWEEP_GRID, SWEEP_GRID, length)
+    content = definition_text("bench", SWEEP_GRID, SWEEP_GRID, [], path)
+
+    def run() -> None:
+        params = parse_text_stream(iter_text_chunks(io.StringIO(content)))
+        deque(params.get("path", params.get("path_runs", ())), maxlen=0)
+
+    result = measure(run)
+    return dict(result, mb_per_s=len(content) / 1e6 / result["seconds"], moves_per_s=length / result["seconds"])
+
+
+def bench_api(length: int, requests: int) -> Dict[str, Any]:
+    """
+    Function: bench_api
+    End-to-end POST /simulate latency through FastAPI's TestClient (result cache disabled).
+    Executed in a temporary folder so the ./results files of the requests are discarded
+
+    Args:
+        length: int - path length
+        requests: int - number of requests
+    """
+    try:
+        from fastapi.testclient import TestClient
+        from lawnmower_cli_api import app_lawnmower_simulation
+    except ImportError as error:
+        return {"skipped": f"{type(error).__name__}: {error}"}
+
+    path, _ = sweep_path(SWEEP_GRID, SWEEP_GRID, length)
+    content = definition_text("bench", SWEEP_GRID, SWEEP_GRID, [], path, extra="keep_history=False\n").encode("utf-8")
+    client = TestClient(app_lawnmower_simulation)
+
+    def post() -> float:
+        start = time.perf_counter()
+        response = client.post("/simulate", params={"log_level": "off", "cache": "false"},
+                               files={"file": ("bench.txt", content, "text/plain")})
+        assert response.status_code == 200, response.text
+        return time.perf_counter() - start
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as folder:
+        os.chdir(folder)
+        try:
+            os.makedirs("results")
+            post() # warm up
+            latencies = sorted(post() for _ in range(requests))
+            tracemalloc.start()
+            try:
+                post()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        finally:
+            os.chdir(cwd)
+    return {
+        # Median latency is the regression metric of API cases
+        "seconds": latencies[len(latencies) // 2],
+        "p90_s": latencies[max(0, -(-90 * len(latencies) // 100) - 1)],
+        "max_s": latencies[-1],
+        "peak_mb": peak / 1e6,
+        "repeats": requests,
+    }
+
+
+def build_cases(profile: str) -> List[Tuple[str, Callable[[], Dict[str, Any]]]]:
+    """
+    Function: build_cases
+    Named benchmark cases of a profile
+
+    Args:
+        profile: str - quick or full
+    """
+    config = PROFILES[profile]
+    cases: List[Tuple[str, Callable[[], Dict[str, Any]]]] = []
+    for grid in config["construct_grids"]:
+        for density in config["densities"]:
+            cases.append((f"construct/grid{grid}/rocks{density}", partial(bench_construct, grid, density)))
+    for engine in BENCH_ENGINES:
+        # Grid size sweep at a fixed path length, then path length sweep on a fixed grid
+        for grid in config["execute_grids"]:
+            for density in config["densities"]:
+                cases.append((f"execute/{engine}/grid{grid}/rocks{density}/path{SWEEP_PATH}",
+                              partial(bench_execute, grid, density, SWEEP_PATH, engine)))
+        for length in config["path_lengths"]:
+            if length != SWEEP_PATH:
+                cases.append((f"execute/{engine}/grid{SWEEP_GRID}/rocks0.0/path{length}",
+                              partial(bench_execute, SWEEP_GRID, 0.0, length, engine)))
+    for length in config["parse_lengths"]:
+        cases.append((f"parse/path{length}", partial(bench_parse, length)))
+    for length in config["api_lengths"]:
+        cases.append((f"api/simulate/path{length}", partial(bench_api, length, config["api_requests"])))
+    return cases
+
+
+def run_benchmarks(profile: str = "quick", only: str = "") -> Dict[str, Dict[str, Any]]:
+    """
+    Function: run_benchmarks
+    Run the cases of a profile and print one line per case
+
+    Args:
+        profile: str - quick or full
+        only: str - run only the cases whose name contains this text
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, case in build_cases(profile):
+        if only not in name:
+            continue
+        result = case()
+        results[name] = result
+        if "skipped" in result:
+            print(f"--- {name:<50} skipped ({result['skipped']})")
+        else:
+            print(f"--- {name:<50} {result['seconds'] * 1000:>12.3f} ms {result['peak_mb']:>10.2f} MB")
+    return results
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """
+    Function: compare_to_baseline
+    Cases slower (or using more memory) than baseline by more than threshold.
+    Cases missing from either side are not compared
+
+    Args:
+        results: Dict[str, Dict[str, Any]] - current results by case name
+        baseline: Dict[str, Dict[str, Any]] - baseline results by case name
+        threshold: float - allowed relative growth (0.5 = 50%)
+
+    Output:
+        List[str] - one description per regression
+    """
+    regressions: List[str] = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None or "skipped" in result or "skipped" in base:
+            continue
+        for metric, min_delta in (("seconds", MIN_DELTA_SECONDS), ("peak_mb", MIN_DELTA_MB)):
+            if result[metric] > base[metric] * (1 + threshold) and result[metric] - base[metric] > min_delta:
+                regressions.append(f"{name}: {metric} {result[metric]:.4f} vs baseline {base[metric]:.4f}")
+    return regressions
+
+
+def append_history(entry: Dict[str, Any], history_file: str = HISTORY_FILE) -> None:
+    """
+    Function: append_history
+    Append one benchmark run to the JSON history file (a JSON list)
+
+    Args:
+        entry: Dict[str, Any] - benchmark run
+        history_file: str - history file path
+    """
+    history: List[Dict[str, Any]] = []
+    if os.path.exists(history_file):
+        with open(history_file, "r") as f:
+            history = json.load(f)
+    history.append(entry)
+    os.makedirs(os.path.dirname(history_file) or ".", exist_ok=True)
+    with open(history_file, "w") as f:
+        json.dump(history, f, indent=1)
+
+
+def main(argv: List[str]) -> int:
+    """
+    Function: main
+    Benchmark command line: run, record history, save or compare baseline
+
+    Args:
+        argv: List[str] - arguments: [quick|full] [--save-baseline] [--threshold X] [--only TEXT]
+
+    Output:
+        int - exit code (1 if a case regressed)
+    """
+    profile = "quick"
+    save_baseline = False
+    threshold = DEFAULT_THRESHOLD
+    only = ""
+    args = iter(argv)
+    for arg in args:
+        if arg in PROFILES:
+            profile = arg
+        elif arg == "--save-baseline":
+            save_baseline = True
+        elif arg == "--threshold":
+            threshold = float(next(args))
+        elif arg == "--only":
+            only = next(args)
+        else:
+            print(f"\n--- Usage: lawnmower_benchmark.py [quick|full] [--save-baseline] [--threshold X] [--only TEXT]")
+            return 2
+
+    print(f"\n--- Lawnmower Simulator benchmark, profile {profile}")
+    results = run_benchmarks(profile, only)
+    append_history({
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "profile": profile,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    })
+
+    baseline: Dict[str, Dict[str, Any]] = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, "r") as f:
+            baseline = json.load(f)
+    if save_baseline:
+        # Cases of this run replace their baseline entries, other cases are kept
+        baseline.update(results)
+        with open(BASELINE_FILE, "w") as f:
+            json.dump(baseline, f, indent=1)
+        print(f"\n--- Baseline saved to {BASELINE_FILE}")
+        return 0
+    if not baseline:
+        print(f"\n--- No baseline at {BASELINE_FILE}. Run with --save-baseline to create it")
+        return 0
+
+    regressions = compare_to_baseline(results, baseline, threshold)
+    for regression in regressions:
+        print(f"--- REGRESSION {regression}")
+    print(f"\n--- {len(regressions)} regression(s) versus baseline (threshold {threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,45 @@
+"""
+Project: 
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_benchmark_test.py
+
+Objectives: 
+    Auto Test for Automated Robotic Lawnmower Simulator benchmark suite
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+from python.lawnmower_sim import LawnmowerSim
+from python.lawnmower_benchmark import sweep_path, random_rocks, run_benchmarks, compare_to_baseline
+
+def test_benchmark_01_sweep_path_is_crash_free() -> None:
+    """Verifies that the benchmark paths never crash, with rocks placed below the swept rows."""
+    print(f"\n---  Auto Test test_benchmark_01_sweep_path_is_crash_free - sweep path")
+    for height, width, length in [(1, 5, 20), (5, 1, 20), (10, 10, 1000), (100, 100, 550)]:
+        path, rows_swept = sweep_path(height, width, length)
+        rocks = random_rocks(height, width, 0.2, first_row=rows_swept)
+        sim_status = LawnmowerSim("sweep", height, width, rocks, [0, 0], log_level="off", log_sinks=[]).execute_path(path)
+        assert len(path) == length
+        assert not sim_status["did_mower_crash"]
+
+def test_benchmark_02_regression_threshold() -> None:
+    """Verifies that only slowdowns past the threshold (and above timer noise) are regressions."""
+    print(f"\n---  Auto Test test_benchmark_02_regression_threshold - regression threshold")
+    baseline = {"a": {"seconds": 1.0, "peak_mb": 10.0}, "b": {"seconds": 0.001, "peak_mb": 0.1},
+                "c": {"seconds": 1.0, "peak_mb": 10.0}}
+    results = {"a": {"seconds": 1.4, "peak_mb": 30.0}, "b": {"seconds": 0.003, "peak_mb": 0.5},
+               "c": {"seconds": 2.0, "peak_mb": 10.0}, "new": {"seconds": 9.0, "peak_mb": 90.0}}
+    regressions = compare_to_baseline(results, baseline, threshold=0.5)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("a: peak_mb") and regressions[1].startswith("c: seconds")
+
+def test_benchmark_03_run_case() -> None:
+    """Verifies that a selected case runs and reports time and peak memory."""
+    print(f"\n---  Auto Test test_benchmark_03_run_case - run one case")
+    results = run_benchmarks("quick", only="execute/numpy/grid10/rocks0.0/path100000")
+    assert list(results) == ["execute/numpy/grid10/rocks0.0/path100000"]
+    result = results["execute/numpy/grid10/rocks0.0/path100000"]
+    assert result["seconds"] > 0 and result["peak_mb"] > 0 and result["moves_per_s"] > 0
@@ -0,0 +1,297 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_cache.py
+
+Objectives:
+    Content-addressed cache of Automated Robotic Lawnmower Simulator results
+    The cache key is a canonical hash of the normalized params (grid, rocks, start, path and output options)
+    In-process LRU in front of an on-disk store shared by all server workers (./results/cache)
+    Size and TTL eviction, hit/miss counters
+
+Configuration (environment variables):
+    LAWNMOWER_CACHE_DIR       on-disk store folder (default ./results/cache)
+    LAWNMOWER_CACHE_ENTRIES   in-process LRU entries (default 256)
+    LAWNMOWER_CACHE_TTL       entry time to live in seconds (default 86400)
+    LAWNMOWER_CACHE_DISK_MB   on-disk store size limit in MB (default 512)
+    LAWNMOWER_CACHE_FILE_KB   definition files (uploads) up to this size are read whole to be cached, larger ones
+                              are streamed while simulating and not cached (default 1024)
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Tuple, Optional, Iterator
+from lawnmower_sim import parse_log_level
+from lawnmower_path_codec import MOVE_LETTERS, iter_runs, decode_rle, decode_packed_base64
+
+# Default configuration
+CACHE_DIR: str = os.environ.get("LAWNMOWER_CACHE_DIR", "./results/cache")
+CACHE_ENTRIES: int = int(os.environ.get("LAWNMOWER_CACHE_ENTRIES", 256))
+CACHE_TTL: float = float(os.environ.get("LAWNMOWER_CACHE_TTL", 86400))
+CACHE_DISK_BYTES: int = int(float(os.environ.get("LAWNMOWER_CACHE_DISK_MB", 512)) * 1024 * 1024)
+CACHE_FILE_BYTES: int = int(float(os.environ.get("LAWNMOWER_CACHE_FILE_KB", 1024)) * 1024)
+
+# Number of writes between two on-disk store size checks
+DISK_CHECK_INTERVAL: int = 64
+
+
+def path_runs(params: Dict[str, Any]) -> Iterator[Tuple[str, int]]:
+    """
+    Function: path_runs
+    Runs (move, count) of the path of a scenario, whatever its format (list or stream of moves,
+    run-length string, streamed runs or packed binary)
+
+    Args:
+        params: Dict[str, Any] - simulation params (see execute_and_report)
+    """
+    if 'path_runs' in params:
+        return iter(params['path_runs'])
+    if 'path_packed' in params:
+        return decode_packed_base64(params['path_packed'])
+    if isinstance(params['path'], str):
+        return decode_rle(params['path'])
+    return iter_runs(params['path'])
+
+
+def is_streamed(params: Dict[str, Any]) -> bool:
+    """
+    Function: is_streamed
+    True when the path is read from a stream while simulating (not hashable without reading it all)
+
+    Args:
+        params: Dict[str, Any] - simulation params (see execute_and_report)
+    """
+    if 'path_runs' in params:
+        return not isinstance(params['path_runs'], list)
+    return 'path' in params and not isinstance(params['path'], (list, str))
+
+
+def buffer_path(params: Dict[str, Any], size: Optional[int]) -> Dict[str, Any]:
+    """
+    Function: buffer_path
+    Read the streamed path of a small definition file into memory, so the scenario can be cached.
+    Larger files (or unknown sizes) keep streaming: a crash stops the reading, but they are not cached.
+    Scenarios that are not cached (cache=False or a log_file, see lawnmower_core.execute_cached) keep streaming too
+
+    Args:
+        params: Dict[str, Any] - simulation params (see execute_and_report), updated
+        size: Optional[int] - definition file size in bytes
+    """
+    if size is not None and size <= CACHE_FILE_BYTES and params.get('cache', True) and not params.get('log_file'):
+        if 'path_runs' in params:
+            params['path_runs'] = list(params['path_runs'])
+        elif is_streamed(params):
+            params['path'] = list(params['path'])
+    return params
+
+
+def scenario_key(params: Dict[str, Any]) -> str:
+    """
+    Function: scenario_key
+    Canonical hash of the normalized params. Identical grid, rocks, start position and path give the same key
+    whatever the path format, letter case or engine. A registered layout is keyed by its layout id.
+    Options changing the output (log level, messages, pos_history) are part of the key.
+    The test name is only part of the key when messages are included.
+    Obs: a streamed path is consumed by the hashing (see is_streamed, buffer_path)
+
+    Args:
+        params: Dict[str, Any] - simulation params (see execute_and_report)
+
+    Output:
+        str - hexadecimal SHA-256 key
+    """
+    include_messages = bool(params.get('include_messages', False))
+    # A registered layout id is a hash of the grid and rocks
+    layout_id = params.get('layout_id') or None
+    header = {
+        "layout_id": layout_id,
+        "height": int(params['height']) if layout_id is None else None,
+        "width": int(params['width']) if layout_id is None else None,
+        "rocks": [[int(r[0]), int(r[1])] for r in params['rocks']] if layout_id is None else None,
+        "start_pos": [int(params['start_pos'][0]), int(params['start_pos'][1])],
+        "log_level": parse_log_level(params.get('log_level', 'summary')),
+        "include_messages": include_messages,
+        "keep_history": bool(params.get('keep_history', True)),
+        "reachability": bool(params.get('reachability', False) or params.get('early_exit', False)),
+        "early_exit": bool(params.get('early_exit', False)),
+        "analytics": bool(params.get('analytics', False)),
+        "test_name": params['test_name'] if include_messages else None,
+    }
+    hasher = hashlib.sha256(json.dumps(header, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+    # Path hashed as canonical run-length text, in batches
+    batch: List[str] = []
+    for move, count in path_runs(params):
+        batch.append(f"{MOVE_LETTERS.get(move.lower(), '[' + move.lower() + ']')}{count}")
+        if len(batch) >= 4096:
+            hasher.update("".join(batch).encode("utf-8"))
+            batch = []
+    hasher.update("".join(batch).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class ResultCache:
+    """
+    Result Cache Class Definition
+    In-process LRU (size and TTL eviction) in front of an on-disk store of JSON files named by key,
+    shared by the server workers. Writes are atomic (temporary file and rename)
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = CACHE_DIR,
+        max_entries: int = CACHE_ENTRIES,
+        ttl: float = CACHE_TTL,
+        max_disk_bytes: int = CACHE_DISK_BYTES) -> None:
+        """
+        Method: __init__ (Object Creation)
+
+        Args:
+            cache_dir (str): on-disk store folder
+            max_entries (int): in-process LRU entries
+            ttl (float): entry time to live in seconds
+            max_disk_bytes (int): on-disk store size limit in bytes
+        """
+        self.cache_dir: str = cache_dir
+        self.max_entries: int = max_entries
+        self.ttl: float = ttl
+        self.max_disk_bytes: int = max_disk_bytes
+        self.memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.writes: int = 0
+        self.counters: Dict[str, int] = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + ".json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Method: get
+        Cached result of a key, from memory first then from disk. None if missing or expired
+
+        Args:
+            key (str): scenario key
+        """
+        now = time.time()
+        with self.lock:
+            entry = self.memory.get(key)
+            if entry is not None and now - entry[0] <= self.ttl:
+                self.memory.move_to_end(key)
+                self.counters["memory_hits"] += 1
+                return entry[1]
+            if entry is not None:
+                del self.memory[key]
+                self.counters["evictions"] += 1
+        file_name = self._file(key)
+        try:
+            created = os.path.getmtime(file_name)
+            if now - created > self.ttl:
+                os.remove(file_name)
+                with self.lock:
+                    self.counters["evictions"] += 1
+                    self.counters["misses"] += 1
+                return None
+            with open(file_name, "r") as f:
+                result: Dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            with self.lock:
+                self.counters["misses"] += 1
+            return None
+        with self.lock:
+            self.counters["disk_hits"] += 1
+            self._remember(key, created, result)
+        return result
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        Method: put
+        Store a result in memory and on disk
+
+        Args:
+            key (str): scenario key
+            result (Dict[str, Any]): sim_status to cache
+        """
+        with self.lock:
+            self._remember(key, time.time(), result)
+            self.writes += 1
+            check_disk = self.writes % DISK_CHECK_INTERVAL == 0
+        file_name = self._file(key)
+        os.makedirs(os.path.dirname(file_name), exist_ok=True)
+        temp_name = f"{file_name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_name, "w") as f:
+            json.dump(result, f, separators=(",", ":"))
+        os.replace(temp_name, file_name)
+        if check_disk:
+            self.evict_disk()
+
+    def _remember(self, key: str, created: float, result: Dict[str, Any]) -> None:
+        # Insert in the LRU and evict the least recently used entries (lock held by caller)
+        self.memory[key] = (created, result)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+            self.counters["evictions"] += 1
+
+    def evict_disk(self) -> None:
+        """
+        Method: evict_disk
+        Remove expired files, then the oldest files until the on-disk store is under its size limit
+        """
+        now = time.time()
+        files: List[Tuple[float, int, str]] = []
+        for folder, _, names in os.walk(self.cache_dir):
+            for name in names:
+                if not name.endswith(".json"):
+                    continue
+                file_name = os.path.join(folder, name)
+                try:
+                    stat = os.stat(file_name)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, file_name))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        for created, size, file_name in files:
+            if now - created <= self.ttl and total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(file_name)
+            except OSError:
+                continue
+            total -= size
+            with self.lock:
+                self.counters["evictions"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Method: stats
+        Hit/miss counters of this process and LRU occupancy
+        """
+        with self.lock:
+            lookups = self.counters["memory_hits"] + self.counters["disk_hits"] + self.counters["misses"]
+            hits = self.counters["memory_hits"] + self.counters["disk_hits"]
+            return dict(self.counters, entries=len(self.memory), hit_rate=hits / lookups if lookups else 0.0)
+
+
+# Cache shared by the calls of one process (created on first use)
+_result_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> ResultCache:
+    """
+    Function: get_result_cache
+    Result cache of this process, configured from the environment
+    """
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = ResultCache()
+    return _result_cache
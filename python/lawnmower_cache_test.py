@@ -0,0 +1,98 @@
+"""
+Project: 
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_cache_test.py
+
+Objectives: 
+    Auto Test for Automated Robotic Lawnmower Simulator result cache
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import pytest
+from typing import Any, Dict, Iterator, List
+from fastapi.testclient import TestClient
+import lawnmower_core
+import lawnmower_results
+import python.lawnmower_cli_api as cli_api
+import python.lawnmower_core as core
+from python.lawnmower_cache import ResultCache, scenario_key
+
+def scenario(**changes: Any) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"test_name": "CacheTest", "height": 5, "width": 5, "rocks": [[1,1], [2,2]],
+                              "start_pos": [0,0], "path": ["Down", "Down", "Right"]}
+    params.update(changes)
+    return params
+
+def test_cache_01_scenario_key_normalization() -> None:
+    """Verifies that the key ignores path format, letter case, engine and test name, but not the lawn."""
+    print(f"\n---  Auto Test test_cache_01_scenario_key_normalization - canonical scenario key")
+    key = scenario_key(scenario())
+    assert scenario_key(scenario(path=iter(["down", "DOWN", "right"]))) == key
+    assert scenario_key(scenario(path="D2R1", engine="numpy", test_name="Other")) == key
+    assert scenario_key(scenario(rocks=[[1,1]])) != key
+    assert scenario_key(scenario(include_messages=True)) != key
+
+def test_cache_02_lru_ttl_and_shared_disk(tmp_path: Any) -> None:
+    """Verifies LRU eviction, disk hits from another cache instance and TTL expiry."""
+    print(f"\n---  Auto Test test_cache_02_lru_ttl_and_shared_disk - LRU, shared disk store and TTL")
+    cache = ResultCache(cache_dir=str(tmp_path), max_entries=1, ttl=60)
+    cache.put("aa01", {"uncut_grass_remaining": 1})
+    cache.put("bb02", {"uncut_grass_remaining": 2})
+    assert cache.get("aa01") == {"uncut_grass_remaining": 1} # evicted from memory, read from disk
+    assert cache.stats()["disk_hits"] == 1
+    other_worker = ResultCache(cache_dir=str(tmp_path), max_entries=1, ttl=60)
+    assert other_worker.get("bb02") == {"uncut_grass_remaining": 2}
+    assert other_worker.get("cc03") is None
+    expired = ResultCache(cache_dir=str(tmp_path), max_entries=1, ttl=-1)
+    assert expired.get("aa01") is None
+    assert expired.stats()["misses"] == 1
+
+def test_cache_03_execute_cached_hit_reported_and_stream_skipped(tmp_path: Any, monkeypatch: Any, capsys: Any) -> None:
+    """Verifies that a cache hit logs the verdict and reaches the writer, and that a streamed path is not hashed."""
+    print(f"\n---  Auto Test test_cache_03_execute_cached_hit_reported_and_stream_skipped - execute_cached")
+    cache = ResultCache(cache_dir=str(tmp_path), max_entries=4, ttl=60)
+    monkeypatch.setattr(core, "get_result_cache", lambda: cache)
+    written: List[Dict[str, Any]] = []
+    core.execute_cached(lambda: scenario(test_name="First", log_level="summary"), writer=written.append)
+    capsys.readouterr()
+    hit = core.execute_cached(lambda: scenario(test_name="Second", log_level="summary"), writer=written.append)
+    output = capsys.readouterr().out
+    assert cache.stats()["memory_hits"] == 1 and hit["test_name"] == "Second"
+    assert [status["test_name"] for status in written] == ["First", "Second"]
+    assert "Second: Cached result" in output and "Second: Result: NO CRASH" in output
+
+    # Streamed path: simulated without hashing, so reading stops at the crash
+    read: List[str] = []
+
+    def moves() -> Iterator[str]:
+        for move in ["Up"] + ["Down"] * 100:
+            read.append(move)
+            yield move
+
+    status = core.execute_cached(lambda: scenario(path=moves(), log_level="off"), writer=written.append)
+    assert status["crash_reason"] == "Crashed into Fence" and len(read) == 1
+    assert cache.stats()["misses"] == 1
+
+    # Requested log file: simulated (and written) even though the scenario is cached
+    log_file = tmp_path / "second.log"
+    core.execute_cached(lambda: scenario(test_name="Second", log_level="summary", log_file=str(log_file)), writer=written.append)
+    assert cache.stats()["memory_hits"] == 1 and "Second" in log_file.read_text()
+
+def test_cache_04_api_hit_recorded(tmp_path: Any, monkeypatch: Any) -> None:
+    """Verifies that a small /simulate upload is cached and that the cache hit is still stored in the results sink."""
+    print(f"\n---  Auto Test test_cache_04_api_hit_recorded - /simulate cache hit in /results")
+    # Result cache and results sink of the modules imported by the server (python/ on sys.path)
+    cache = ResultCache(cache_dir=str(tmp_path / "cache"), max_entries=4, ttl=60)
+    monkeypatch.setattr(lawnmower_core, "get_result_cache", lambda: cache)
+    monkeypatch.setattr(lawnmower_results, "_results_sink", lawnmower_results.create_results_sink("ndjson", str(tmp_path)))
+    client = TestClient(cli_api.app_lawnmower_simulation)
+    definition = b'test_name="cached"\nheight=2\nwidth=2\nrocks=[]\nstart_pos=[0,0]\npath=["Right","Down"]\n'
+    responses = [client.post("/simulate", params={"log_level": "off"}, files={"file": ("scenario.txt", definition, "text/plain")})
+                 for _ in range(2)]
+    assert responses[0].json() == responses[1].json() and cache.stats()["memory_hits"] == 1
+    lawnmower_results.get_results_sink().flush()
+    assert len(client.get("/results", params={"test_name": "cached"}).json()) == 2
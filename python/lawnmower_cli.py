@@ -0,0 +1,92 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_cli.py
+
+Objectives:
+    Lightweight CLI Entry Point of the Automated Robotic Lawnmower Simulator
+    Only the standard library is imported at start-up. The simulator (lawnmower_core) is loaded when a command
+    runs in process, the web stack (FastAPI, uvicorn) by --api only
+    Warm worker mode: --serve keeps a simulator process running with all the modules loaded, and the CLI forwards
+    its commands to it over a Unix socket when LAWNMOWER_CLI_SOCKET is set (see lawnmower_daemon), without
+    loading the simulator itself. Without a running worker the command runs in process
+
+Execution:
+    CLI
+        Hard Coded Default Scenario:
+            python ./python/lawnmower_cli.py --cli
+        File Based Test:
+            python ./python/lawnmower_cli.py --cli ./tests/lawnmower_scenario01_valid.txt
+        Output Fields (printed JSON: --fields=<comma separated>, --summary for the verdict only, --coordinates=packed):
+            python ./python/lawnmower_cli.py --cli ./tests/lawnmower_scenario01_valid.txt --summary
+        Batch of Files (directory or glob, optional number of worker processes):
+            python ./python/lawnmower_cli.py --cli-batch ./tests 4
+        Fleet of mowers in lockstep on a shared lawn:
+            python ./python/lawnmower_cli.py --fleet ./tests/fleet/lawnmower_fleet01.txt
+        Coverage Path Planning (plan, validate and save a runnable definition file under ./results):
+            python ./python/lawnmower_cli.py --plan ./tests/lawnmower_scenario01_valid.txt
+        Warm Worker (then any of the commands above with LAWNMOWER_CLI_SOCKET=<socket>):
+            python ./python/lawnmower_cli.py --serve [socket]
+    API
+        python ./python/lawnmower_cli.py --api (see lawnmower_cli_api, server configuration in lawnmower_server)
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import sys
+from typing import List
+from lawnmower_daemon import CLI_SOCKET, default_socket, forward
+
+
+def main(argv: List[str]) -> int:
+    """
+    Funnction: main
+    Command line entry point. --api and --serve start the servers, the other commands are forwarded to the
+    warm worker when LAWNMOWER_CLI_SOCKET is set and it answers, otherwise run in process
+
+    Args:
+        argv: List[str] - command line arguments without the script name
+
+    Output:
+        int - exit code
+    """
+    if argv[:1] == ["--api"]:
+        # Call Simulator via API. Lazy imports: the web stack is only loaded by the server
+        import uvicorn
+        from lawnmower_metrics import prepare_multiprocess_dir
+        from lawnmower_server import server_options
+        # Workers, keep-alive and limits from the environment and the container CPU quota (see lawnmower_server)
+        try:
+            options = server_options()
+        except ValueError as error:
+            print(f"\n--- {error}")
+            return 2
+        print(f"\n--- Starting API Server for Lawnmower Simulator at http://localhost:{options['port']}/docs ({options['workers']} workers)")
+        # Metrics of all the workers aggregated by /metrics
+        prepare_multiprocess_dir()
+        uvicorn.run(
+            "lawnmower_cli_api:app_lawnmower_simulation", # String format required for workers
+            access_log=False, 
+            log_level="info",
+            **options
+        )
+        return 0
+    if argv[:1] == ["--serve"]:
+        from lawnmower_core import cli_lawnmower_serve
+        cli_lawnmower_serve(argv[1] if len(argv) > 1 else default_socket())
+        return 0
+    if CLI_SOCKET and argv:
+        code = forward(argv, CLI_SOCKET)
+        if code is not None:
+            return code
+    # Lazy import: the simulator is only loaded when the command runs in process
+    from lawnmower_core import run_command
+    return run_command(argv)
+
+if __name__ == "__main__":
+    # sys.argv[0] is always the script name (e.g., './python/lawnmower_cli.py')
+    sys.exit(main(sys.argv[1:]))
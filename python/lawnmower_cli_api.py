@@ -5,7 +5,8 @@ Automated Robotic Lawnmower Simulator
 File: ./python/lawnmower_cli_api.py
 
 Objectives: 
-    CLI and API Entry Point interfaces for execution of Automated Robotic Lawnmower Simulator
+    API Entry Point interface for execution of Automated Robotic Lawnmower Simulator
+    The core logic and the CLI commands live in lawnmower_core (no web stack imports), re-used here
     Handles input data. Here Example of a definition file:
         test_name="lawnmower_scenario01_valid"
         height=5
@@ -14,14 +15,22 @@ Objectives:
         start_pos=[0,0]
         path=["Down", "Down", "Down", "Right", "Up", "Left"]
     Creates and execute obj LawnmowerSim
-    Handle output in form of Terminal printout and JSON files under ./results folder
+    Handle output in form of Terminal printout and stored results (./results folder by default, see lawnmower_results)
 
 Execution:
-    CLI 
+    CLI (same commands as the lightweight entry point python ./python/lawnmower_cli.py, which starts faster)
         Hard Coded Default Scenario: 
             python ./python/lawnmower_cli_api.py --cli
         File Based Test:
             python ./python/lawnmower_cli_api.py --cli ./tests/lawnmower_scenario01_valid.txt
+        Output Fields (printed JSON: --fields=<comma separated>, --summary for the verdict only, --coordinates=packed):
+            python ./python/lawnmower_cli_api.py --cli ./tests/lawnmower_scenario01_valid.txt --summary
+        Batch of Files (directory or glob, optional number of worker processes):
+            python ./python/lawnmower_cli_api.py --cli-batch ./tests 4
+        Fleet of mowers in lockstep on a shared lawn (definition file with mowers=[{"start_pos": [0,0], "path": "R4D1"}, ...]):
+            python ./python/lawnmower_cli_api.py --fleet ./tests/fleet/lawnmower_fleet01.txt
+        Coverage Path Planning (plan, validate and save a runnable definition file under ./results):
+            python ./python/lawnmower_cli_api.py --plan ./tests/lawnmower_scenario01_valid.txt
     API
         0. Start Server: python ./python/lawnmower_cli_api.py --api
         1. Navigate to `http://localhost:8000` in a browser.
@@ -39,20 +48,50 @@ Version: 31.01.2026 - Creation
 import os
 import json
 import sys
-import ast # Used to safely convert string representations of lists
-import uvicorn
-from datetime import datetime
-from fastapi import FastAPI, UploadFile, File
-from typing import List, Dict, Any, Optional
-from lawnmower_sim import LawnmowerSim
+import time
+import asyncio
+import weakref
+from itertools import islice
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, UploadFile, File, Query, Request, BackgroundTasks, HTTPException
+from typing import List, Dict, Any, Optional, Union, AsyncIterator, Iterator, Callable, Tuple, Set
 from fastapi.responses import HTMLResponse
 from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+from lawnmower_stream import parse_text_stream, iter_binary_chunks
+from lawnmower_cache import get_result_cache, buffer_path
+from lawnmower_batch import BatchSummary, run_on_pool, parse_ndjson, get_shared_pool
+from lawnmower_offload import Overloaded, get_simulate_executor, get_stream_limiter
+from lawnmower_planner import plan_scenario
+from lawnmower_layouts import LayoutNotFound, create_layout, get_layout
+from lawnmower_path_codec import InvalidPath
+from lawnmower_events import simulation_events, format_sse, BATCH_POSITIONS
+from lawnmower_metrics import REQUEST_DURATION, REQUESTS_IN_FLIGHT, PHASE_DURATION, observe_phase, mark_worker_dead, metrics_payload
+from lawnmower_results import get_results_sink
+from lawnmower_sessions import SessionStore, SessionNotFound, SessionCrashed, SessionTooLarge, get_session_store, parse_moves
+from lawnmower_server import sessions_enabled
+from lawnmower_output import parse_fields, output_params, encode_output, dumps, COORDINATE_FORMATS
+from lawnmower_fleet import execute_fleet, fleet_summary
+# Core logic and CLI commands shared with the lightweight CLI entry point (see lawnmower_core, lawnmower_cli)
+from lawnmower_core import (parse_text_file, execute_cached, execute_and_report, save_results, cli_lawnmower_simulation,
+                            cli_lawnmower_batch, cli_lawnmower_plan, cli_lawnmower_fleet, enable_metrics)
+from lawnmower_cli import main
 
-# Prevent "Directory not found" error
-os.makedirs("./results", exist_ok=True)
+# The server records the simulation metrics (see lawnmower_metrics)
+enable_metrics()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Server worker shutdown: write the buffered results and drop its live metrics (multi-process metrics, see lawnmower_metrics)
+    yield
+    get_results_sink().flush()
+    mark_worker_dead()
 
 # Initialise FastAPI with UI customizations
 app_lawnmower_simulation = FastAPI(
+    lifespan=lifespan,
     title="Auto Lawnmower Simulator and Path Verifier MVP",
     description="""
     ## Auto Lawnmower Simulator and Path Verifier MVP
@@ -67,6 +106,34 @@ app_lawnmower_simulation = FastAPI(
     swagger_ui_parameters={"defaultModelsExpandDepth": -1} 
 )
 
+@app_lawnmower_simulation.middleware("http")
+async def observe_requests(request: Request, call_next: Callable[[Request], Any]) -> Any:
+    """
+    Funnction: HTTP middleware recording the in-flight requests and the request latency per endpoint (until the
+    response starts, streamed bodies excluded). The request start is kept for the upload phase of /simulate
+    """
+    request.state.started = time.perf_counter()
+    REQUESTS_IN_FLIGHT.inc()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        REQUESTS_IN_FLIGHT.dec()
+        route = request.scope.get("route")
+        REQUEST_DURATION.labels(getattr(route, "path", "unmatched"), request.method, str(status)).observe(
+            time.perf_counter() - request.state.started)
+
+@app_lawnmower_simulation.get("/metrics", tags=["Monitoring"])
+async def api_metrics() -> Response:
+    """
+    Funnction: API Endpoint function returning the Prometheus metrics (see lawnmower_metrics),
+    aggregated over all the server workers when started with --api
+    """
+    payload, content_type = metrics_payload()
+    return Response(content=payload, media_type=content_type)
+
 @app_lawnmower_simulation.get("/README.md")
 async def serve_readme() -> Any:
     # This points to the file in the parent directory relative to this script
@@ -93,48 +160,44 @@ async def simple_ui() -> Any:
         return HTMLResponse(content="<h1>Error: lawnmower_api.html not found</h1>", status_code=404)
         
     
-def parse_text_file(content: str) -> Dict[str, Any]:
-    """
-    Function: parse_text_file
-    Parses raw text string into simulation arguments.
-    
-    TODO
-        input Error Handling
-        params field error handling
-        
-    Args:
-        content: str - string text 
-            Expected format in text file:
-            test_name - string
-            height=3 - grid height (lines)
-            width=2 - grid width (columns)
-            rocks=[[0,1],[1,1]] - coordinates of the rocks
-            start_pos=[0,0] - start position coordinate in the grid
-            path=["Down","Down","Right"] - sequence of moves from start position (up,down,left,right). Upper Capital will be converted to lower
-            """
-    # Split input in lines
-    lines = content.splitlines()
-    params = {}
-    
-    # Read and parse the lines in variables and values
-    for line in lines:
-        if '=' in line:
-            key, val = line.split('=')
-            params[key.strip()] = ast.literal_eval(val.strip())
-            
-    # Return parsed information
-    return params
-    
 @app_lawnmower_simulation.post("/simulate", tags=["Simulator"])
-async def api_lawnmower_simulation(file: UploadFile = File(..., description="Select the .txt lawn and path definitions file")) -> Dict[str, Any]:
+async def api_lawnmower_simulation(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(..., description="Select the .txt lawn and path definitions file"),
+    engine: Optional[str] = Query(None, description="Simulation engine: python (reference), numpy (vectorized) or parallel (sharded, huge paths)"),
+    log_level: Optional[str] = Query(None, description="Log level: off, summary (default), per-move or trace"),
+    include_messages: bool = Query(False, description="Include the simulator messages in the response"),
+    cache: Optional[bool] = Query(None, description="Use the result cache (default true)"),
+    layout_id: Optional[str] = Query(None, description="Registered lawn layout (see /layouts) used instead of height, width and rocks"),
+    fields: Optional[str] = Query(None, description="Comma separated output fields, e.g. did_mower_crash,crash_reason,uncut_grass_remaining"),
+    summary: bool = Query(False, description="Verdict only: no pos_history, visited_cells, rocks nor messages"),
+    coordinates: str = Query("json", description="pos_history and visited_cells encoding: json lists or packed (base64 int32 pairs)"),
+    analytics: bool = Query(False, description="Path analytics computed during the run: visit heatmap, revisits, turns, coverage over time")) -> Response:
     """
     Funnction: API Endpoint function to execute the Lawnmower simulator
+    The simulation and the JSON encoding run on the bounded simulation executor (lawnmower_offload), never on the
+    event loop. The results are stored by a background task after the response is sent.
+    Answers 429 when the simulation queue is full and 503 when the queue wait times out (Retry-After header)
     
     Args:
+        request: Request - request (start time of the upload phase)
+        background_tasks: BackgroundTasks - tasks run after the response (results file)
         file: UploadFile - file with Simulator config and execution parameters
+        engine: Optional[str] - overrides the engine defined in the file (python, numpy or parallel)
+        log_level: Optional[str] - overrides the log level defined in the file (off, summary, per-move, trace)
+        include_messages: bool - messages are only returned when requested
+        cache: Optional[bool] - overrides the result cache usage defined in the file (default true)
+        layout_id: Optional[str] - overrides the layout defined in the file. The grid and rocks come from the
+            registered layout (404 if unknown)
+        fields: Optional[str] - output only these fields (see lawnmower_output, 422 if unknown). A trajectory
+            or messages not requested are not recorded either
+        summary: bool - output only the verdict fields (plus fields, if any)
+        coordinates: str - json or packed encoding of pos_history and visited_cells (see lawnmower_output)
+        analytics: bool - compute the path analytics in the same pass (see lawnmower_analytics)
 
     Output:
-    JSON object containing following information
+    JSON object containing following information (or the requested fields)
         "test_name": self.test_name,
         "grid_width": self.grid_width,
         "grid_height": self.grid_height,
@@ -149,181 +212,480 @@ async def api_lawnmower_simulation(file: UploadFile = File(..., description="Sel
         "pos_history": self.pos_history,
         "visited_cells": self.visited_cells,
         "last_pos": self.last_pos,
-        "messages": self.messages  
+        "messages": self.messages (only if include_messages)
+        "analytics": path analytics (only if analytics)
     """
 
-    # wait for input file and read its content
-    content = await file.read()  
-    
-    # Parse file content
-    params = parse_text_file(content.decode("utf-8"))
-    
-    # Execute and get  results in Dictionary format
-    sim_status = execute_and_report(params)
+    # Upload phase: from the request start to the upload spooled by the server
+    PHASE_DURATION.labels("upload").observe(time.perf_counter() - request.state.started)
+
+    # Output fields, validated before simulating
+    try:
+        output_fields = parse_fields(fields, summary)
+    except ValueError as error:
+        raise HTTPException(status_code=422, detail=error.args[0])
+    if analytics and output_fields is not None and "analytics" not in output_fields:
+        output_fields.append("analytics")
+    if coordinates not in COORDINATE_FORMATS:
+        raise HTTPException(status_code=422, detail=f"Unknown coordinates format {coordinates}. Expected one of {COORDINATE_FORMATS}")
+
+    def load_params() -> Dict[str, Any]:
+        # Parse file content. The upload is already spooled by the server (to disk when large):
+        # keys are parsed now and the path is streamed from the spooled file while simulating
+        file.file.seek(0)
+        with observe_phase("parse"):
+            params = parse_text_stream(iter_binary_chunks(file.file))
+        if engine is not None:
+            params['engine'] = engine
+        if log_level is not None:
+            params['log_level'] = log_level
+        if cache is not None:
+            params['cache'] = cache
+        if layout_id is not None:
+            params['layout_id'] = layout_id
+        if analytics:
+            params['analytics'] = True
+        params['include_messages'] = include_messages or params.get('include_messages', False)
+        # Small uploads are read whole to be cached, large ones keep streaming (reading stops at a crash)
+        return output_params(buffer_path(params, file.size), output_fields)
     
+    def simulate() -> bytes:
+        # Execute (or get cached results) in Dictionary format, results file deferred to a background task
+        sim_status = execute_cached(load_params, writer=lambda status: background_tasks.add_task(save_results, status))
+        # Convert the requested fields to JSON in the worker thread (large paths make the encoding CPU-bound too)
+        with observe_phase("serialise"):
+            return encode_output(sim_status, output_fields, coordinates)
+
+    # Execute off the event loop, with backpressure
+    try:
+        content = await get_simulate_executor().run(simulate)
+    except Overloaded as error:
+        raise HTTPException(status_code=error.status_code, detail=str(error), headers={"Retry-After": str(error.retry_after)})
+    except LayoutNotFound as error:
+        raise HTTPException(status_code=404, detail=error.args[0])
+    except InvalidPath as error:
+        raise HTTPException(status_code=422, detail=error.args[0])
+
     # Return as JSON Object
-    # sim_status convertion to JSON object is handled automatically by FastAPI
-    return sim_status    
-    
-def cli_lawnmower_simulation(file_path: str) -> str:
+    return Response(content=content, media_type="application/json")
+
+@app_lawnmower_simulation.post("/simulate/stream", tags=["Simulator"])
+async def api_lawnmower_simulation_stream(
+    file: UploadFile = File(..., description="Select the .txt lawn and path definitions file"),
+    layout_id: Optional[str] = Query(None, description="Registered lawn layout (see /layouts) used instead of height, width and rocks"),
+    batch_size: int = Query(BATCH_POSITIONS, ge=1, le=65536, description="Maximum track vertices per moves event"),
+    analytics: bool = Query(False, description="Path analytics in the done event (visit heatmap drawn by the UI)")) -> StreamingResponse:
     """
-    Funnction: cli_lawnmower_simulation
-    Command Line function to ingest a text file and execute the Lawnmower simulator
-    if no args, default test scenario is executed
-        
+    Funnction: API Endpoint function to execute the Lawnmower simulator as a Server-Sent Events stream
+    (see lawnmower_events): start (lawn), moves (batches of track vertices), coverage, crash and done (verdict).
+    The lawn is sent before any move is read, so the first pixel does not wait for the path.
+    The simulation advances batch by batch as the stream is sent (server thread pool) and stops when
+    the client disconnects (cancel). Messages, pos_history, the results file and the result cache are not used.
+    At most LAWNMOWER_STREAM_CONCURRENCY streams are open at once per server worker, beyond it 429 (see lawnmower_offload)
+
     Args:
-        file_path - path to file containing Simulator config and execution parameters
-            TODO input Error Handling
+        file: UploadFile - file with Simulator config and execution parameters
+        layout_id: Optional[str] - overrides the layout defined in the file (see /simulate)
+        batch_size: int - maximum track vertices per moves event
+        analytics: bool - path analytics in the done event (see lawnmower_analytics)
 
     Output:
-    JSON file and string containing following information
-        "test_name": self.test_name,
-        "grid_width": self.grid_width,
-        "grid_height": self.grid_height,
-        "rock_locations": self.rock_locations,
-        "valid_rocks": self.valid_rocks,
-        "start_pos": self.start_pos,
-        "total_grass_squares": self.total_grass_squares,
-        "all_grass_cut": self.all_grass_cut,
-        "uncut_grass_remaining": self.uncut_remaining,
-        "did_mower_crash": self.did_mower_crash,
-        "crash_reason": self.crash_reason,
-        "pos_history": self.pos_history,
-        "visited_cells": self.visited_cells,
-        "last_pos": self.last_pos,
-        "messages": self.messages          
-    """
-    params: Dict[str, Any] = {}
-    if file_path is "":
-        # No File. Use Default scenario 
-        params = {
-            "test_name": "lawnmower_scenario_def_valid",
-            "height": 3,
-            "width": 2,
-            "rocks": [[0, 1], [1, 1]],
-            "start_pos": [0, 0],  
-            "path": ["Down", "Down", "Right"]
-        }
-    else:
-        # Fail Safe Read File
-        with open(file_path, "r") as f:
-            # Parse file
-            params = parse_text_file(f.read())  
-    # Execute and get results in Dictionary format
-    sim_status = execute_and_report(params)
-    # Convert Dictionary to JSON
-    json_string: str = json.dumps(sim_status, indent=4)        
-    # Return JSON Object
-    return json_string
+    text/event-stream. Each event is "event: <name>" and "data: <JSON>"
+    """
+    def start() -> Tuple[Iterator[Tuple[str, Dict[str, Any]]], str]:
+        # Keys parsed and lawn event built before streaming (404 for an unknown layout), the path is read while streaming
+        file.file.seek(0)
+        params = parse_text_stream(iter_binary_chunks(file.file))
+        if layout_id is not None:
+            params['layout_id'] = layout_id
+        if analytics:
+            params['analytics'] = True
+        events = simulation_events(params, batch_positions=batch_size)
+        return events, format_sse(*next(events))
+
+    # Each open stream advances on the server thread pool: bounded number of streams, 429 beyond it
+    try:
+        release = get_stream_limiter().acquire()
+    except Overloaded as error:
+        raise HTTPException(status_code=error.status_code, detail=str(error), headers={"Retry-After": str(error.retry_after)})
+    try:
+        events, first = await run_in_threadpool(start)
+    except LayoutNotFound as error:
+        release()
+        raise HTTPException(status_code=404, detail=error.args[0])
+    except BaseException:
+        release()
+        raise
+
+    def stream_events() -> Iterator[str]:
+        # Sync generator: each event is produced on the server thread pool, never on the event loop.
+        # The slot is released when the stream ends or the client disconnects (generator closed)
+        try:
+            yield first
+            for event, data in events:
+                yield format_sse(event, data)
+        finally:
+            release()
+
+    stream = stream_events()
+    # Stream dropped before its first event (client gone): the slot is released with the generator
+    weakref.finalize(stream, release)
+    return StreamingResponse(stream, media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app_lawnmower_simulation.get("/results", tags=["Results"])
+async def api_results(
+    test_name: Optional[str] = Query(None, description="Only this test name"),
+    crash_reason: Optional[str] = Query(None, description="Only this crash reason (None for runs without crash)"),
+    since: Optional[float] = Query(None, description="Recorded at or after (epoch seconds)"),
+    until: Optional[float] = Query(None, description="Recorded at or before (epoch seconds)"),
+    limit: int = Query(100, ge=1, le=10000, description="Maximum number of records"),
+    include_result: bool = Query(False, description="Include the full simulation results")) -> List[Dict[str, Any]]:
+    """
+    Funnction: API Endpoint function querying the stored results history, most recent first
+    (results sink ndjson or sqlite, see lawnmower_results)
+    """
+    sink = get_results_sink()
+    if not sink.supports_query:
+        raise HTTPException(status_code=501, detail=f"Results sink {sink.name} does not support history queries")
+    return await run_in_threadpool(sink.query, test_name, crash_reason, since, until, limit, include_result)
+
+@app_lawnmower_simulation.get("/simulate/stats", tags=["Simulator"])
+async def api_simulate_stats() -> Dict[str, Any]:
+    """
+    Funnction: API Endpoint function returning the simulation executor limits, occupancy and rejection counters
+    of the serving worker (streams: /simulate/stream limit, open streams and rejections)
+    """
+    return dict(get_simulate_executor().stats(), streams=get_stream_limiter().stats())
     
-def execute_and_report(params: Dict[str, Any])-> Dict[str, Any]:
+@app_lawnmower_simulation.get("/cache/stats", tags=["Simulator"])
+async def api_cache_stats() -> Dict[str, Any]:
+    """
+    Funnction: API Endpoint function returning the result cache hit/miss counters of the serving worker
     """
-    Funnction: execute_and_report
-    Unified core logic: Runs simulation, logs to terminal, and saves local JSON file
-         
-    TODO
-    input Error Handling
+    return get_result_cache().stats()
+
+@app_lawnmower_simulation.post("/simulate/fleet", tags=["Simulator"])
+async def api_lawnmower_fleet(
+    file: UploadFile = File(..., description="Select the .txt fleet definitions file (lawn and mowers=[{start_pos, path}, ...])"),
+    layout_id: Optional[str] = Query(None, description="Registered lawn layout (see /layouts) used instead of height, width and rocks"),
+    summary: bool = Query(False, description="Verdict only: no visited_cells nor pos_history")) -> Response:
+    """
+    Funnction: API Endpoint function to execute several mowers in lockstep on a shared lawn (see lawnmower_fleet)
+    Runs on the bounded simulation executor (429/503 under backpressure, see /simulate)
 
-    params: Dict[str, Any]:
     Args:
-        params: Dict[str, Any]:
-            test_name - string
-            height=3 - grid height (lines)
-            width=2 - grid width (columns)
-            rocks=[[0,1],[1,1]] - coordinates of the rocks
-            start_pos=[0,0] - start position coordinate in the grid
-            path=["Down","Down","Right"] - sequence of moves from start position (up,down,left,right). Upper Capital will be converted to lower
-    
+        file: UploadFile - file with the lawn (height, width, rocks) and mowers=[{"start_pos": [0,0], "path": "R4D1"}, ...]
+            (path as list of moves or run-length string, optional keep_history=True for pos_history per mower)
+        layout_id: Optional[str] - overrides the layout defined in the file (404 if unknown)
+        summary: bool - drop the coordinate lists
+
     Output:
-    JSON file and Dictionary containing following information
-        "test_name": self.test_name,
-        "grid_width": self.grid_width,
-        "grid_height": self.grid_height,
-        "rock_locations": self.rock_locations,
-        "valid_rocks": self.valid_rocks,
-        "start_pos": self.start_pos,
-        "total_grass_squares": self.total_grass_squares,
-        "all_grass_cut": self.all_grass_cut,
-        "uncut_grass_remaining": self.uncut_remaining,
-        "did_mower_crash": self.did_mower_crash,
-        "crash_reason": self.crash_reason,
-        "pos_history": self.pos_history,
-        "visited_cells": self.visited_cells,
-        "last_pos": self.last_pos,
-        "messages": self.messages  
-    """
-
-    # Create Simulator Object
-    print(f"--- {params['test_name']}: Create Simulator Object ---")
-    lm_sim = LawnmowerSim(
-        test_name=params['test_name'],
-        grid_height=params['height'], 
-        grid_width=params['width'], 
-        rock_locations=params['rocks'], 
-        start_pos=params['start_pos']
-    )
-    
-    # Execute and Get results
-    print(f"\n--- {params['test_name']}: Execute and Get results ---")
-    sim_status = lm_sim.execute_path(params['path']) 
+    JSON object (see lawnmower_fleet.LawnmowerFleet.fleet_status): combined lawn, crash summary
+    and one Sim Status Structure per mower ("mowers")
+    """
 
-    # Final Output
-    print(f"\n--- {sim_status['test_name']}: List Simulation Results ---")
-    
-    print(f"--- {sim_status['test_name']}: Pos History ---")
-    for step, mh in enumerate(sim_status['pos_history']):
-        print(f"--- {sim_status['test_name']}: Pos {step}: {mh}")
-        
-    print(f"--- {sim_status['test_name']}: Visited Cells (Discovery Order) ---")
-    for step, coord in enumerate(sim_status['visited_cells']):
-        print(f"--- {sim_status['test_name']}: Cell {step}: {coord}")        
-    
-    print(f"--- {sim_status['test_name']}: Crash Status: {sim_status['did_mower_crash']}")
-    if sim_status['did_mower_crash']:
-        print(f"--- {sim_status['test_name']}: Crash Reason: {sim_status['crash_reason']}")
+    def simulate_fleet() -> bytes:
+        file.file.seek(0)
+        params = parse_text_stream(iter_binary_chunks(file.file))
+        if layout_id is not None:
+            params['layout_id'] = layout_id
+        fleet_status = execute_fleet(params)
+        return dumps(fleet_summary(fleet_status) if summary else fleet_status)
+
+    try:
+        content = await get_simulate_executor().run(simulate_fleet)
+    except Overloaded as error:
+        raise HTTPException(status_code=error.status_code, detail=str(error), headers={"Retry-After": str(error.retry_after)})
+    except LayoutNotFound as error:
+        raise HTTPException(status_code=404, detail=error.args[0])
+    except (KeyError, ValueError) as error:
+        raise HTTPException(status_code=422, detail=f"Invalid fleet definition: {error}")
+    return Response(content=content, media_type="application/json")
+
+@app_lawnmower_simulation.post("/plan", tags=["Planner"])
+async def api_lawnmower_plan(
+    file: UploadFile = File(..., description="Select the .txt lawn definitions file (the path, if any, is ignored)"),
+    validate: bool = Query(True, description="Execute the planned path on the simulator"),
+    include_runs: bool = Query(False, description="Include the path as [move, count] runs")) -> Response:
+    """
+    Funnction: API Endpoint function to plan a crash free path covering all the reachable grass of a lawn
+    Planning runs on the bounded simulation executor (429/503 under backpressure, see /simulate)
     
-    print(f"--- {sim_status['test_name']}: Grass Remaining Uncut: {sim_status['uncut_grass_remaining']}")
-    print(f"--- {sim_status['test_name']}: All Grass Cut: {sim_status['all_grass_cut']}")            
-    print(f"--- {sim_status['test_name']}: Result: {'CRASH!' if sim_status['did_mower_crash'] else 'NO CRASH'}") 
-
-    # Store output to local file
-    # Create a unique filename based on current time
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"./results/{params['test_name']}_{timestamp}.json"
+    Args:
+        file: UploadFile - file with the lawn definition (height, width, rocks, start_pos)
+        validate: bool - execute the planned path on LawnmowerSim and report the verdict
+        include_runs: bool - include the runs list (the run-length "path" is always included)
+
+    Output:
+    JSON object (see lawnmower_planner.plan_scenario)
+        "test_name", "height", "width", "rocks", "start_pos",
+        "path" (run-length, can be sent to /simulate as path="..."), "moves", "reachable_cells", "revisits",
+        "boustrophedon_cells", "unreachable_cells", "unreachable_segments", "validation"
+    """
+
+    def plan() -> bytes:
+        # Only the keys before the path are parsed, the path itself is never read
+        file.file.seek(0)
+        result = plan_scenario(parse_text_stream(iter_binary_chunks(file.file)), validate)
+        if not include_runs:
+            del result["runs"]
+        return json.dumps(result).encode("utf-8")
+
+    try:
+        content = await get_simulate_executor().run(plan)
+    except Overloaded as error:
+        raise HTTPException(status_code=error.status_code, detail=str(error), headers={"Retry-After": str(error.retry_after)})
+    return Response(content=content, media_type="application/json")
+
+@app_lawnmower_simulation.post("/layouts", tags=["Layouts"])
+async def api_create_layout(
+    file: UploadFile = File(..., description="Select the .txt lawn definitions file (height, width, rocks; the rest is ignored)")) -> Dict[str, Any]:
+    """
+    Funnction: API Endpoint function to register a lawn layout (grid and rocks) once, to be referenced by
+    layout_id in /simulate instead of uploading the rocks again. The layout is validated and compiled into
+    the shared memory-mapped layout store (see lawnmower_layouts). Same lawn, same layout_id
+    Answers 422 for an invalid layout
     
-    # Save JSON File with results
-    with open(filename, "w") as f:
-        json.dump(sim_status, f, indent=4)
-        
-    print(f"\n---  {sim_status['test_name']}: Simulation results saved to: {filename}")
+    Args:
+        file: UploadFile - file with the lawn definition (height, width, rocks)
+
+    Output:
+    JSON object
+        "layout_id", "height", "width", "valid_rock_count", "total_grass_squares", "bytes",
+        "ignored_rocks" (rocks outside the grid, disregarded)
+    """
+
+    def register() -> Dict[str, Any]:
+        # Only the keys before the path are parsed, the path itself is never read
+        file.file.seek(0)
+        params = parse_text_stream(iter_binary_chunks(file.file))
+        layout, outside = create_layout(params.get('height'), params.get('width'), params.get('rocks', []))
+        return dict(layout.describe(), ignored_rocks=outside)
+
+    try:
+        return await get_simulate_executor().run(register)
+    except Overloaded as error:
+        raise HTTPException(status_code=error.status_code, detail=str(error), headers={"Retry-After": str(error.retry_after)})
+    except (ValueError, SyntaxError) as error:
+        raise HTTPException(status_code=422, detail=str(error))
+
+@app_lawnmower_simulation.get("/layouts/{layout_id}", tags=["Layouts"])
+async def api_get_layout(
+    layout_id: str,
+    include_rocks: bool = Query(False, description="Include the valid rocks [row, col] in input order")) -> Dict[str, Any]:
+    """
+    Funnction: API Endpoint function returning a registered lawn layout. Answers 404 if unknown
     
-    # Output dictionary
-    return sim_status
+    Args:
+        layout_id: str - layout id returned by POST /layouts
+        include_rocks: bool - include the valid rocks list
+
+    Output:
+    JSON object
+        "layout_id", "height", "width", "valid_rock_count", "total_grass_squares", "bytes", "valid_rocks" (only if include_rocks)
+    """
+    try:
+        layout = get_layout(layout_id)
+    except LayoutNotFound as error:
+        raise HTTPException(status_code=404, detail=error.args[0])
+    description = layout.describe()
+    if include_rocks:
+        description["valid_rocks"] = layout.valid_rocks()
+    return description
+
+def session_store() -> SessionStore:
+    """
+    Function: session_store
+    Session store of this server worker. Answers 503 when sessions are disabled (LAWNMOWER_SESSIONS off by default:
+    a server with several workers could not route a session to the worker keeping it, see lawnmower_server)
+    """
+    if not sessions_enabled():
+        raise HTTPException(status_code=503, detail="Interactive sessions are disabled on this server (set LAWNMOWER_SESSIONS=on)")
+    return get_session_store()
+
+@app_lawnmower_simulation.post("/sessions", tags=["Sessions"])
+async def api_create_session(
+    file: UploadFile = File(..., description="Select the .txt lawn definitions file (the path, if any, is executed as the first moves)"),
+    layout_id: Optional[str] = Query(None, description="Registered lawn layout (see /layouts) used instead of height, width and rocks"),
+    analytics: bool = Query(False, description="Path analytics of the session, returned by GET /sessions/{session_id}")) -> Dict[str, Any]:
+    """
+    Funnction: API Endpoint function to open an interactive simulation session (see lawnmower_sessions).
+    The simulator is created once and kept by this server worker until idle for LAWNMOWER_SESSION_TTL seconds
+    (or evicted, least recently used first, beyond LAWNMOWER_SESSION_MAX sessions or LAWNMOWER_SESSION_MB of lawn maps).
+    Answers 413 for a lawn larger than the whole memory budget
+
+    Args:
+        file: UploadFile - file with the lawn definition (height, width, rocks, start_pos, optional path)
+        layout_id: Optional[str] - overrides the layout defined in the file (see /simulate)
+        analytics: bool - compute the path analytics of the session (see lawnmower_analytics)
+
+    Output:
+    JSON object: session state (see GET /sessions/{session_id}), with "session_id"
+    """
+    store = session_store()
+
+    def create() -> Dict[str, Any]:
+        file.file.seek(0)
+        params = parse_text_stream(iter_binary_chunks(file.file))
+        if layout_id is not None:
+            params['layout_id'] = layout_id
+        if analytics:
+            params['analytics'] = True
+        _, session = store.create(params)
+        return session.state()
+
+    try:
+        return await run_in_threadpool(create)
+    except LayoutNotFound as error:
+        raise HTTPException(status_code=404, detail=error.args[0])
+    except SessionTooLarge as error:
+        raise HTTPException(status_code=413, detail=str(error))
+    except (KeyError, ValueError, SyntaxError) as error:
+        raise HTTPException(status_code=422, detail=f"Invalid definition file: {error}")
+
+@app_lawnmower_simulation.get("/sessions", tags=["Sessions"])
+async def api_session_stats() -> Dict[str, Any]:
+    """
+    Funnction: API Endpoint function returning the active sessions, limits and counters of this server worker
+    """
+    return session_store().stats()
+
+@app_lawnmower_simulation.post("/sessions/{session_id}/moves", tags=["Sessions"])
+async def api_append_moves(session_id: str, request: Request) -> Dict[str, Any]:
+    """
+    Funnction: API Endpoint function appending moves to a session. Only the delta is returned, so the cost
+    depends on the moves appended, not on the session length.
+    Answers 404 for an unknown or expired session (or one kept by another server worker), 409 once the mower crashed and 422 for an invalid body
+
+    Args:
+        session_id: str - session id returned by POST /sessions
+        request: Request - JSON body {"path": ["Up", "Right"]}, {"path": "U1R3"} (run-length) or {"path_packed": "..."}
+
+    Output:
+    JSON object
+        "moves", "total_moves", "last_pos", "new_cells", "uncut_grass_remaining", "all_grass_cut", "did_mower_crash", "crash_reason"
+    """
+    try:
+        runs = parse_moves(json.loads(await request.body() or b"null"))
+    except ValueError as error:
+        raise HTTPException(status_code=422, detail=str(error))
+    try:
+        session = session_store().get(session_id)
+        return await run_in_threadpool(session.append, runs)
+    except SessionNotFound as error:
+        raise HTTPException(status_code=404, detail=error.args[0])
+    except SessionCrashed as error:
+        raise HTTPException(status_code=409, detail=str(error))
+
+@app_lawnmower_simulation.get("/sessions/{session_id}", tags=["Sessions"])
+async def api_get_session(session_id: str) -> Dict[str, Any]:
+    """
+    Funnction: API Endpoint function returning the state of a session. Answers 404 for an unknown or expired session
+
+    Args:
+        session_id: str - session id returned by POST /sessions
+
+    Output:
+    JSON object
+        "session_id", "test_name", "grid_width", "grid_height", "start_pos", "total_grass_squares", "all_grass_cut",
+        "uncut_grass_remaining", "did_mower_crash", "crash_reason", "last_pos", "total_moves",
+        "layout_id" (only with a registered layout), "analytics" (only if the session computes them)
+    """
+    try:
+        session = session_store().get(session_id)
+    except SessionNotFound as error:
+        raise HTTPException(status_code=404, detail=error.args[0])
+    return await run_in_threadpool(session.state)
+
+@app_lawnmower_simulation.delete("/sessions/{session_id}", tags=["Sessions"])
+async def api_delete_session(session_id: str) -> Dict[str, Any]:
+    """
+    Funnction: API Endpoint function closing a session. Answers 404 for an unknown or expired session
+    """
+    try:
+        session_store().delete(session_id)
+    except SessionNotFound as error:
+        raise HTTPException(status_code=404, detail=error.args[0])
+    return {"session_id": session_id, "deleted": True}
+
+# Maximum number of files accepted by one batch upload
+BATCH_MAX_FILES: int = 100000
+
+@app_lawnmower_simulation.post("/simulate/batch", tags=["Simulator"])
+async def api_lawnmower_batch(request: Request) -> StreamingResponse:
+    """
+    Funnction: API Endpoint function to execute a batch of Lawnmower simulations over a process pool
+    Scenarios go through the bounded executor of /simulate (at most one in flight per running slot), so a batch
+    shares the simulation slots and backpressure with the other requests instead of flooding the pool
     
+    Args:
+        request: Request - either a multi-file upload (multipart/form-data, field "files", one .txt definition per file)
+                 or an NDJSON body (application/x-ndjson, one JSON params object per line)
+
+    Output:
+    NDJSON stream, one line per scenario as it finishes:
+        "index", "test_name", "did_mower_crash", "crash_reason", "all_grass_cut", "uncut_grass_remaining", "latency_ms" ("error" if failed)
+    and a last line with the aggregate summary:
+        {"summary": {"scenarios", "errors", "crashes", "crashes_by_reason", "full_coverage", "full_coverage_rate", "latency_ms", "wall_time_s"}}
+    422 for a malformed NDJSON line (line number in the detail), 429 when the simulation queue is full
+    """
+    # Collect the scenarios: definition file contents or parsed params
+    scenarios: List[Union[str, Dict[str, Any]]] = []
+    if request.headers.get("content-type", "").startswith("multipart/form-data"):
+        form = await request.form(max_files=BATCH_MAX_FILES)
+        for upload in form.getlist("files"):
+            if isinstance(upload, str):
+                scenarios.append(upload)
+            else:
+                scenarios.append((await upload.read()).decode("utf-8"))
+    else:
+        body = await request.body()
+        try:
+            scenarios.extend(parse_ndjson(body.decode("utf-8")))
+        except ValueError as error:
+            raise HTTPException(status_code=422, detail=str(error))
+
+    # Backpressure: refuse the batch at once when the simulation queue is already full
+    executor = get_simulate_executor()
+    try:
+        executor.admit()
+    except Overloaded as error:
+        raise HTTPException(status_code=error.status_code, detail=str(error), headers={"Retry-After": str(error.retry_after)})
+
+    async def run_offloaded(pool: Any, index: int, scenario: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+        # One scenario through the bounded executor. Refused by backpressure: error line of the scenario
+        start = time.perf_counter()
+        try:
+            return await executor.run(run_on_pool, pool, index, scenario)
+        except Overloaded as error:
+            return {"index": index, "error": f"Overloaded: {error}", "latency_ms": (time.perf_counter() - start) * 1000.0}
+
+    async def stream_results() -> AsyncIterator[str]:
+        # Fan out over the shared process pool and stream results as they finish
+        pool = get_shared_pool()
+        batch_summary = BatchSummary()
+        queued = iter(enumerate(scenarios))
+        pending: Set["asyncio.Future[Dict[str, Any]]"] = set()
+        try:
+            while True:
+                for index, scenario in islice(queued, max(executor.concurrency - len(pending), 0)):
+                    pending.add(asyncio.ensure_future(run_offloaded(pool, index, scenario)))
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    batch_summary.add(result)
+                    yield json.dumps(result) + "\n"
+        finally:
+            # Client gone: scenarios not started yet are dropped (running ones free their slot when done)
+            for future in pending:
+                future.cancel()
+        yield json.dumps({"summary": batch_summary.summary()}) + "\n"
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
 if __name__ == "__main__":
     # sys.argv[0] is always the script name (e.g., './python/lawnmower_cli_api.py')
-    # sys.argv[1] would be the first argument provided by the user
-    # Check if we have at least one argument
-    if len(sys.argv) < 2:
-        print(f"\n--- Please specify option --api or --cli")
-    elif sys.argv[1] == "--api":
-        # Call Simulator via API
-        print(f"\n--- Starting API Server for Lawnmower Simulator at http://localhost:8000/docs")
-        uvicorn.run(
-            "lawnmower_cli_api:app_lawnmower_simulation", # String format required for workers
-            host="0.0.0.0", 
-            port=8000, 
-            workers=4,        # For Scalability
-            access_log=False, 
-            log_level="info"
-        )
-    elif sys.argv[1] == "--cli":
-        # Check if there is an input file
-        target_file = "" # No file provided, will use default
-        if len(sys.argv) > 2:
-            target_file = sys.argv[2]
-        # Call Simulator via CLI
-        print(f"\n--- Starting CLI Call for Lawnmower Simulator")
-        cli_lawnmower_simulation(target_file)  
-    else:
-        print(f"\n--- Please specify option --api or --cli")
\ No newline at end of file
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,62 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_cli_test.py
+
+Objectives:
+    Auto Test for Automated Robotic Lawnmower Simulator lightweight CLI entry point and warm worker
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import os
+import sys
+import time
+import subprocess
+from typing import Any, Tuple
+
+PYTHON_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFINITION = 'test_name="cli"\nheight=3\nwidth=3\nrocks=[[1,1]]\nstart_pos=[0,0]\ncache=False\npath=["Right","Down"]\n'
+
+def cli(*args: str, **env: str) -> "subprocess.CompletedProcess[str]":
+    return subprocess.run([sys.executable, os.path.join(PYTHON_DIR, "lawnmower_cli.py"), *args],
+                          env=dict(os.environ, **env), capture_output=True, text=True, timeout=60)
+
+def loaded_modules(module: str, names: Tuple[str, ...]) -> str:
+    return subprocess.run([sys.executable, "-c", f"import sys, {module}; print([m for m in {names} if m in sys.modules])"],
+                          cwd=PYTHON_DIR, check=True, capture_output=True, text=True).stdout.strip()
+
+def test_cli_01_no_web_stack_imports() -> None:
+    """Verifies that the core loads neither the web stack, prometheus_client nor numpy, and the entry point not even the simulator."""
+    print(f"\n---  Auto Test test_cli_01_no_web_stack_imports - lightweight imports")
+    assert loaded_modules("lawnmower_core", ("fastapi", "uvicorn", "starlette", "prometheus_client", "numpy")) == "[]"
+    assert loaded_modules("lawnmower_cli", ("lawnmower_core", "lawnmower_sim")) == "[]"
+
+def test_cli_02_warm_worker_same_output(tmp_path: Any) -> None:
+    """Verifies that a command forwarded to the warm worker prints the same verdict and exit code as in process,
+    and that the CLI runs in process when no worker answers."""
+    print(f"\n---  Auto Test test_cli_02_warm_worker_same_output - --serve and LAWNMOWER_CLI_SOCKET")
+    socket_path = str(tmp_path / "cli.sock")
+    scenario = tmp_path / "scenario.txt"
+    scenario.write_text(DEFINITION)
+    env = dict(LAWNMOWER_RESULTS_SINK="off")
+    local = cli("--cli", str(scenario), "--summary", **env)
+    assert local.returncode == 0 and '"crash_reason": "Crashed into Rock"' in local.stdout
+    assert cli("--cli", str(scenario), "--summary", LAWNMOWER_CLI_SOCKET=socket_path, **env).stdout == local.stdout
+
+    server = subprocess.Popen([sys.executable, os.path.join(PYTHON_DIR, "lawnmower_cli.py"), "--serve", socket_path],
+                              env=dict(os.environ, **env), stdout=subprocess.DEVNULL)
+    try:
+        for _ in range(200):
+            if os.path.exists(socket_path):
+                break
+            time.sleep(0.05)
+        forwarded = cli("--cli", str(scenario), "--summary", LAWNMOWER_CLI_SOCKET=socket_path, **env)
+        assert forwarded.returncode == 0 and forwarded.stdout == local.stdout
+        assert cli("--unknown", LAWNMOWER_CLI_SOCKET=socket_path).returncode == 2
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
@@ -0,0 +1,544 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_core.py
+
+Objectives:
+    Core logic and CLI commands of the Automated Robotic Lawnmower Simulator, shared by the CLI (lawnmower_cli)
+    and the API (lawnmower_cli_api)
+    Handles input data (see lawnmower_cli_api for an example of a definition file), creates and executes
+    obj LawnmowerSim and handles the output in form of Terminal printout and stored results (see lawnmower_results)
+    Only the simulator modules are imported: no web stack (FastAPI, uvicorn), prometheus_client only when the
+    metrics are recorded (API server and its worker processes), and the fleet and batch modules by their own commands
+
+Execution:
+    See lawnmower_cli (command line) and lawnmower_cli_api (API)
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import os
+import sys
+import ast # Used to safely convert string representations of lists
+import json
+import time
+from contextlib import nullcontext
+from typing import List, Dict, Any, Optional, TextIO, Callable, ContextManager
+from lawnmower_sim import LawnmowerSim, LogSink, RingBufferSink, StdoutSink, FileSink, parse_log_level, LOG_SUMMARY, LOG_MOVE
+from lawnmower_path_codec import decode_rle, decode_packed_base64
+from lawnmower_stream import parse_text_stream, iter_text_chunks
+from lawnmower_cache import get_result_cache, scenario_key, is_streamed, buffer_path
+from lawnmower_layouts import apply_layout
+from lawnmower_results import get_results_sink
+from lawnmower_output import parse_fields, output_params, encode_output, dumps
+from lawnmower_planner import plan_scenario, plan_definition
+from lawnmower_daemon import serve
+
+# Usage of the command line
+USAGE: str = "\n--- Please specify option --api, --cli, --cli-batch <dir|glob> [workers], --fleet <file>, --plan [file] or --serve [socket]"
+
+# Metrics module once enabled (see get_metrics)
+_metrics: Optional[Any] = None
+
+
+def enable_metrics() -> None:
+    """
+    Function: enable_metrics
+    Record the Prometheus metrics of the simulations of this process (see lawnmower_metrics). Called by the API server
+    """
+    global _metrics
+    import lawnmower_metrics
+    _metrics = lawnmower_metrics
+
+
+def get_metrics() -> Optional[Any]:
+    """
+    Function: get_metrics
+    Metrics module when metrics are recorded: API server, and its worker processes (multi-process metrics folder
+    inherited from --api). None for a CLI run, which does not load prometheus_client
+    """
+    if _metrics is None and os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        enable_metrics()
+    return _metrics
+
+
+def observe_phase(phase: str) -> ContextManager[Any]:
+    """
+    Function: observe_phase
+    Times a request phase when metrics are recorded (see lawnmower_metrics.observe_phase)
+
+    Args:
+        phase: str - upload, parse, construct, execute, serialise or write
+    """
+    metrics = get_metrics()
+    return metrics.observe_phase(phase) if metrics else nullcontext()
+
+
+def _uncounted(moves: Any) -> Any:
+    # Path or runs as they are, when the moves are not counted for the metrics
+    return moves
+
+
+def parse_text_file(content: str) -> Dict[str, Any]:
+    """
+    Function: parse_text_file
+    Parses raw text string into simulation arguments.
+    
+    TODO
+        input Error Handling
+        params field error handling
+        
+    Args:
+        content: str - string text 
+            Expected format in text file:
+            test_name - string
+            height=3 - grid height (lines)
+            width=2 - grid width (columns)
+            rocks=[[0,1],[1,1]] - coordinates of the rocks
+            start_pos=[0,0] - start position coordinate in the grid
+            path=["Down","Down","Right"] - sequence of moves from start position (up,down,left,right). Upper Capital will be converted to lower
+            """
+    # Split input in lines
+    lines = content.splitlines()
+    params = {}
+    
+    # Read and parse the lines in variables and values
+    for line in lines:
+        if '=' in line:
+            key, val = line.split('=', 1)
+            params[key.strip()] = ast.literal_eval(val.strip())
+            
+    # Return parsed information
+    return params
+
+def cli_lawnmower_simulation(file_path: str, fields: Optional[List[str]] = None, coordinates: str = "json") -> str:
+    """
+    Funnction: cli_lawnmower_simulation
+    Command Line function to ingest a text file and execute the Lawnmower simulator
+    if no args, default test scenario is executed
+        
+    Args:
+        file_path - path to file containing Simulator config and execution parameters
+            TODO input Error Handling
+        fields: Optional[List[str]] - output only these fields (see lawnmower_output.parse_fields). Default all
+        coordinates: str - json or packed encoding of pos_history and visited_cells
+
+    Output:
+    Stored results and string containing following information (or the requested fields)
+        "test_name": self.test_name,
+        "grid_width": self.grid_width,
+        "grid_height": self.grid_height,
+        "rock_locations": self.rock_locations,
+        "valid_rocks": self.valid_rocks,
+        "start_pos": self.start_pos,
+        "total_grass_squares": self.total_grass_squares,
+        "all_grass_cut": self.all_grass_cut,
+        "uncut_grass_remaining": self.uncut_remaining,
+        "did_mower_crash": self.did_mower_crash,
+        "crash_reason": self.crash_reason,
+        "pos_history": self.pos_history,
+        "visited_cells": self.visited_cells,
+        "last_pos": self.last_pos,
+        "messages": self.messages          
+    """
+    open_files: List[TextIO] = []
+
+    def load_params() -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if file_path == "":
+            # No File. Use Default scenario 
+            params = {
+                "test_name": "lawnmower_scenario_def_valid",
+                "height": 3,
+                "width": 2,
+                "rocks": [[0, 1], [1, 1]],
+                "start_pos": [0, 0],  
+                "path": ["Down", "Down", "Right"]
+            }
+        else:
+            # Open File. Keys are parsed now, the path is streamed from the file while simulating
+            f = open(file_path, "r")
+            open_files.append(f)
+            params = parse_text_stream(iter_text_chunks(f))
+        # CLI keeps the full terminal trace and messages, and simulates (no result cache), unless the file says otherwise
+        params.setdefault('log_level', 'trace')
+        params.setdefault('include_messages', True)
+        params.setdefault('cache', False)
+        if file_path != "":
+            buffer_path(params, os.path.getsize(file_path))
+        return output_params(params, fields)
+
+    # Execute (or get cached results) in Dictionary format
+    try:
+        sim_status = execute_cached(load_params)
+    finally:
+        for f in open_files:
+            f.close()
+    # Convert the requested fields to JSON
+    json_string: str = encode_output(sim_status, fields, coordinates, indent=True).decode("utf-8")
+    # Return JSON Object
+    return json_string
+    
+def cli_lawnmower_batch(target: str, workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Funnction: cli_lawnmower_batch
+    Command Line function to execute all scenario files of a directory or glob pattern over a process pool
+    Prints one JSON line per scenario as it finishes and the aggregate summary as last line
+        
+    Args:
+        target: str - directory (all .txt files) or glob pattern of scenario definition files
+        workers: Optional[int] - number of worker processes (default LAWNMOWER_BATCH_WORKERS or CPU count)
+
+    Output:
+        Dict[str, Any] - aggregate summary (see lawnmower_batch.BatchSummary)
+    """
+    # Lazy import: the process pool module is only loaded by batch runs
+    from lawnmower_batch import run_batch, find_scenario_files
+
+    scenarios: List[str] = []
+    for file_path in find_scenario_files(target):
+        with open(file_path, "r") as f:
+            scenarios.append(f.read())
+    summary: Dict[str, Any] = {}
+    for result in run_batch(scenarios, workers=workers, cache=False):
+        print(json.dumps(result), flush=True)
+        summary = result.get("summary", summary)
+    return summary
+
+def cli_lawnmower_plan(file_path: str) -> Dict[str, Any]:
+    """
+    Funnction: cli_lawnmower_plan
+    Command Line function to plan a crash free covering path for the lawn of a definition file
+    (default test scenario if no file), validate it on the simulator and save it as a runnable
+    definition file ./results/<test_name>_plan.txt (then: --cli ./results/<test_name>_plan.txt)
+        
+    Args:
+        file_path: str - definition file (the path, if any, is ignored)
+
+    Output:
+        Dict[str, Any] - plan and validation (see lawnmower_planner.plan_scenario), without the runs
+    """
+    if file_path == "":
+        params: Dict[str, Any] = {"test_name": "lawnmower_scenario_def_valid", "height": 3, "width": 2,
+                                  "rocks": [[0, 1], [1, 1]], "start_pos": [0, 0]}
+        result = plan_scenario(params)
+    else:
+        with open(file_path, "r") as f:
+            result = plan_scenario(parse_text_stream(iter_text_chunks(f)))
+    del result["runs"]
+    filename = f"./results/{result['test_name']}_plan.txt"
+    os.makedirs("./results", exist_ok=True)
+    with open(filename, "w") as f:
+        f.write(plan_definition(result))
+    print(json.dumps(result, indent=4))
+    print(f"\n--- {result['test_name']}: Planned path saved to: {filename}")
+    return result
+
+def cli_lawnmower_fleet(file_path: str) -> Dict[str, Any]:
+    """
+    Funnction: cli_lawnmower_fleet
+    Command Line function to execute the mowers of a fleet definition file in lockstep (see lawnmower_fleet)
+    and print the fleet verdict (coordinate lists omitted)
+
+    Args:
+        file_path: str - fleet definition file (lawn and mowers=[{"start_pos": [0,0], "path": "R4D1"}, ...])
+
+    Output:
+        Dict[str, Any] - Fleet Status Structure
+    """
+    # Lazy import: the fleet engine needs numpy
+    from lawnmower_fleet import execute_fleet, fleet_summary
+
+    with open(file_path, "r") as f:
+        fleet_status = execute_fleet(parse_text_stream(iter_text_chunks(f)))
+    print(dumps(fleet_summary(fleet_status), indent=True).decode("utf-8"))
+    return fleet_status
+
+def execute_cached(
+    load_params: Callable[[], Dict[str, Any]],
+    writer: Optional[Callable[[Dict[str, Any]], Any]] = None) -> Dict[str, Any]:
+    """
+    Funnction: execute_cached
+    Returns the cached results of an identical scenario (same grid, rocks, start position, path and
+    output options) without creating a LawnmowerSim. Otherwise runs execute_and_report and caches the results
+    A cache hit is reported like a run: verdict logged and results stored (or handed to the writer)
+    Caching is disabled by params cache=False, and skipped for a streamed path (large definition file or upload
+    read while simulating, see lawnmower_cache.buffer_path): hashing it would read the whole stream before the
+    first move, so a crash would no longer stop the reading. It is also skipped with a log_file: a hit would not
+    write the requested log
+
+    Args:
+        load_params: Callable[[], Dict[str, Any]] - returns the params (see execute_and_report)
+        writer: Optional[Callable[[Dict[str, Any]], Any]] - results writer (see execute_and_report)
+
+    Output:
+        Dictionary - see execute_and_report
+    """
+    params = load_params()
+    if not params.get('cache', True) or is_streamed(params) or params.get('log_file'):
+        return execute_and_report(params, writer)
+
+    result_cache = get_result_cache()
+    key = scenario_key(params)
+    cached = result_cache.get(key)
+    if cached is not None:
+        metrics = get_metrics()
+        if metrics:
+            metrics.SIMULATIONS.labels("cached").inc()
+        summary = parse_log_level(params.get('log_level', 'summary')) >= LOG_SUMMARY
+        if summary: print(f"--- {params['test_name']}: Cached result {key}")
+        sim_status = dict(cached, test_name=params['test_name'])
+        report_results(sim_status, summary, writer)
+        return sim_status
+
+    sim_status = execute_and_report(params, writer)
+    result_cache.put(key, dict(sim_status))
+    return sim_status
+
+def report_results(
+    sim_status: Dict[str, Any],
+    summary: bool,
+    writer: Optional[Callable[[Dict[str, Any]], Any]] = None) -> None:
+    """
+    Funnction: report_results
+    Log the verdict and store the results in the results sink (or hand them to the deferred writer)
+
+    Args:
+        sim_status: Dict[str, Any] - simulation results
+        summary: bool - log the verdict and where the results are stored
+        writer: Optional[Callable[[Dict[str, Any]], Any]] - results writer (see execute_and_report)
+    """
+    if summary:
+        print(f"--- {sim_status['test_name']}: Crash Status: {sim_status['did_mower_crash']}")
+        if sim_status['did_mower_crash']:
+            print(f"--- {sim_status['test_name']}: Crash Reason: {sim_status['crash_reason']}")
+        
+        print(f"--- {sim_status['test_name']}: Grass Remaining Uncut: {sim_status['uncut_grass_remaining']}")
+        print(f"--- {sim_status['test_name']}: All Grass Cut: {sim_status['all_grass_cut']}")            
+        print(f"--- {sim_status['test_name']}: Result: {'CRASH!' if sim_status['did_mower_crash'] else 'NO CRASH'}") 
+
+    # Store results in the results sink (or hand them to the deferred writer)
+    if writer is None:
+        location = save_results(sim_status)
+        if summary and location: print(f"\n---  {sim_status['test_name']}: Simulation results saved to: {location}")
+    else:
+        writer(sim_status)
+        if summary: print(f"\n---  {sim_status['test_name']}: Simulation results queued for saving")
+
+def save_results(sim_status: Dict[str, Any]) -> Optional[str]:
+    """
+    Funnction: save_results
+    Store the results in the configured results sink (see lawnmower_results, LAWNMOWER_RESULTS_SINK)
+
+    Args:
+        sim_status: Dict[str, Any] - simulation results
+
+    Output:
+        Optional[str] - where the results are stored (None if the sink is off)
+    """
+    with observe_phase("write"):
+        return get_results_sink().write(sim_status)
+
+def execute_and_report(
+    params: Dict[str, Any],
+    writer: Optional[Callable[[Dict[str, Any]], Any]] = None) -> Dict[str, Any]:
+    """
+    Funnction: execute_and_report
+    Unified core logic: Runs simulation, logs to terminal, and stores the results (see lawnmower_results)
+         
+    TODO
+    input Error Handling
+
+    params: Dict[str, Any]:
+    Args:
+        params: Dict[str, Any]:
+            test_name - string
+            height=3 - grid height (lines)
+            width=2 - grid width (columns)
+            rocks=[[0,1],[1,1]] - coordinates of the rocks
+            start_pos=[0,0] - start position coordinate in the grid
+            path=["Down","Down","Right"] - sequence of moves from start position (up,down,left,right). Upper Capital will be converted to lower
+                Any iterable of moves is accepted (e.g. streamed by lawnmower_stream.parse_text_stream)
+            path="D3R1U2" - alternative compact run-length path (see lawnmower_path_codec), executed run by run
+            path_packed="AAAAAAAAAAZXIA==" - alternative packed 2-bit per move path, base64 (see lawnmower_path_codec)
+            engine="numpy" - optional simulation engine (python, numpy or parallel). Default python
+            log_level="summary" - optional log level (off, summary, per-move, trace). Default summary
+            log_file="./results/run.log" - optional file streaming the simulator messages
+            include_messages=True - optional, include the messages in the output. Default False
+            keep_history=False - optional, do not record pos_history (flat memory for very long paths). Default True
+            cache=False - optional, do not use the result cache (see execute_cached). Default True
+            layout_id="..." - optional registered lawn layout (see lawnmower_layouts) instead of height, width and rocks
+            reachability=True - optional, report reachable vs unreachable grass (see lawnmower_reach). Default False
+            early_exit=True - optional, stop once coverage can no longer change the verdict. Default False
+            analytics=True - optional, path analytics computed during the run (see lawnmower_analytics). Default False
+        writer: Optional[Callable[[Dict[str, Any]], Any]] - called with the results instead of storing them
+            immediately in the results sink (e.g. the API defers it to a background task)
+    
+    Output:
+    Stored results and Dictionary containing following information
+        "test_name": self.test_name,
+        "grid_width": self.grid_width,
+        "grid_height": self.grid_height,
+        "rock_locations": self.rock_locations,
+        "valid_rocks": self.valid_rocks,
+        "start_pos": self.start_pos,
+        "total_grass_squares": self.total_grass_squares,
+        "all_grass_cut": self.all_grass_cut,
+        "uncut_grass_remaining": self.uncut_remaining,
+        "did_mower_crash": self.did_mower_crash,
+        "crash_reason": self.crash_reason,
+        "pos_history": self.pos_history,
+        "visited_cells": self.visited_cells,
+        "last_pos": self.last_pos,
+        "messages": self.messages (only if include_messages)
+        "reachable_grass", "unreachable_grass", "early_exit" (only with reachability or early_exit)
+        "analytics" (only with analytics)
+        "layout_id" (only with a registered layout)
+    """
+    # Logging configuration: bounded ring buffer and display, optionally streamed to a file
+    log_level = parse_log_level(params.get('log_level', 'summary'))
+    log_sinks: List[LogSink] = [RingBufferSink(), StdoutSink()]
+    if params.get('log_file'):
+        log_sinks.append(FileSink(params['log_file']))
+    summary = log_level >= LOG_SUMMARY
+    per_move = log_level >= LOG_MOVE
+
+    # Registered layout: grid and rocks are mapped from the layout store
+    layout = apply_layout(params)
+
+    # Create Simulator Object
+    if summary: print(f"--- {params['test_name']}: Create Simulator Object ---")
+    with observe_phase("construct"):
+        lm_sim = LawnmowerSim(
+            test_name=params['test_name'],
+            grid_height=params['height'], 
+            grid_width=params['width'], 
+            rock_locations=params['rocks'], 
+            start_pos=params['start_pos'],
+            log_level=log_level,
+            log_sinks=log_sinks,
+            keep_history=params.get('keep_history', True),
+            reachability=params.get('reachability', False),
+            early_exit=params.get('early_exit', False),
+            layout=layout,
+            analytics=params.get('analytics', False)
+        )
+    
+    # Execute and Get results
+    if summary: print(f"\n--- {params['test_name']}: Execute and Get results ---")
+    # Compact path formats are executed run by run (expanded by the parallel engine), move lists by the selected engine
+    metrics = get_metrics()
+    counter = metrics.MoveCounter() if metrics else None # path length and throughput metrics
+    counted_path = counter.path if counter else _uncounted
+    counted_runs = counter.runs if counter else _uncounted
+    started = time.perf_counter()
+    engine = params.get('engine', 'python')
+    if 'path_runs' in params:
+        sim_status = lm_sim.execute_runs(counted_runs(params['path_runs']), engine=engine)
+    elif 'path_packed' in params:
+        sim_status = lm_sim.execute_runs(counted_runs(decode_packed_base64(params['path_packed'])), engine=engine)
+    elif isinstance(params['path'], str):
+        sim_status = lm_sim.execute_runs(counted_runs(decode_rle(params['path'])), engine=engine)
+    else:
+        sim_status = lm_sim.execute_path(counted_path(params['path']), engine=engine) 
+    if metrics and counter:
+        metrics.record_simulation(sim_status, counter.moves, time.perf_counter() - started)
+    for sink in log_sinks:
+        sink.close()
+    if not params.get('include_messages', False):
+        del sim_status['messages']
+
+    # Final Output
+    if summary:
+        print(f"\n--- {sim_status['test_name']}: List Simulation Results ---")
+    
+    if per_move:
+        print(f"--- {sim_status['test_name']}: Pos History ---")
+        for step, mh in enumerate(sim_status['pos_history']):
+            print(f"--- {sim_status['test_name']}: Pos {step}: {mh}")
+            
+        print(f"--- {sim_status['test_name']}: Visited Cells (Discovery Order) ---")
+        for step, coord in enumerate(sim_status['visited_cells']):
+            print(f"--- {sim_status['test_name']}: Cell {step}: {coord}")        
+    
+    report_results(sim_status, summary, writer)
+    
+    # Output dictionary
+    return sim_status
+
+
+def run_command(argv: List[str]) -> int:
+    """
+    Funnction: run_command
+    Runs a CLI command in this process (also the commands forwarded to the warm worker)
+
+    Args:
+        argv: List[str] - command line arguments without the script name
+
+    Output:
+        int - exit code (2 for an unknown command)
+    """
+    if argv and argv[0] == "--cli":
+        # Check if there is an input file and output options (--fields=..., --summary, --coordinates=...)
+        target_file = "" # No file provided, will use default
+        options = [arg for arg in argv[1:] if arg.startswith("--")]
+        files = [arg for arg in argv[1:] if not arg.startswith("--")]
+        if files:
+            target_file = files[0]
+        cli_fields = [arg.split("=", 1)[1] for arg in options if arg.startswith("--fields=")]
+        cli_coordinates = [arg.split("=", 1)[1] for arg in options if arg.startswith("--coordinates=")]
+        # Call Simulator via CLI
+        print(f"\n--- Starting CLI Call for Lawnmower Simulator")
+        json_output = cli_lawnmower_simulation(target_file, parse_fields(",".join(cli_fields), "--summary" in options),
+                                               cli_coordinates[-1] if cli_coordinates else "json")
+        if options:
+            print(json_output)
+    elif argv[:1] == ["--cli-batch"] and len(argv) > 1:
+        # Call Simulator for all scenario files of a directory or glob, optional number of workers
+        workers = int(argv[2]) if len(argv) > 2 else None
+        print(f"\n--- Starting CLI Batch Call for Lawnmower Simulator", file=sys.stderr)
+        cli_lawnmower_batch(argv[1], workers)
+    elif argv[:1] == ["--fleet"] and len(argv) > 1:
+        # Several mowers in lockstep on a shared lawn
+        print(f"\n--- Starting CLI Fleet Call for Lawnmower Simulator")
+        cli_lawnmower_fleet(argv[1])
+    elif argv[:1] == ["--plan"]:
+        # Plan a covering path for the lawn of a file (default scenario if none) and validate it
+        print(f"\n--- Starting CLI Planner for Lawnmower Simulator")
+        cli_lawnmower_plan(argv[1] if len(argv) > 1 else "")
+    else:
+        print(USAGE)
+        return 2
+    return 0
+
+def serve_command(argv: List[str]) -> int:
+    """
+    Funnction: serve_command
+    Runs a command forwarded to the warm worker. The forked child exits without atexit handlers,
+    so the buffered results are written before returning
+    """
+    try:
+        return run_command(argv)
+    finally:
+        get_results_sink().flush()
+
+def cli_lawnmower_serve(path: str) -> None:
+    """
+    Funnction: cli_lawnmower_serve
+    Starts the warm worker: the modules of every command are loaded once, then the commands forwarded
+    by the CLI run in a forked child each (see lawnmower_daemon)
+
+    Args:
+        path: str - Unix socket to listen on
+    """
+    import lawnmower_batch
+    try:
+        import lawnmower_fleet, lawnmower_sim_numpy
+    except ImportError: # numpy not installed: fleet and numpy engines load on use (and fail there)
+        pass
+    print(f"\n--- Serving CLI commands for Lawnmower Simulator at {path} (LAWNMOWER_CLI_SOCKET={path})", flush=True)
+    serve(path, serve_command)
@@ -0,0 +1,160 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_daemon.py
+
+Objectives:
+    Warm simulator worker for the CLI: a process started once keeps the simulator modules loaded and serves the
+    CLI invocations sent over a local Unix socket, so each call skips the interpreter and import start-up
+    1. The client sends one JSON line {"argv": [...], "cwd": "..."} (relative files resolved in the caller folder)
+    2. The server forks a child per call (warm modules, no state shared between calls). The child runs the CLI
+       command and streams its stdout and stderr back as NDJSON frames {"out": text} and {"err": text},
+       then {"exit": code}
+    3. The client replays the frames on its own stdout and stderr and exits with the same code
+    Only the standard library is imported here: the client side must stay as light as the CLI itself
+
+Configuration (environment variables):
+    LAWNMOWER_CLI_SOCKET   socket of the warm worker. The CLI forwards its commands to it when set
+                           (default for --serve: <system temp>/lawnmower-<uid>.sock)
+
+Execution:
+    Server: python ./python/lawnmower_cli.py --serve [socket]
+    Client: LAWNMOWER_CLI_SOCKET=<socket> python ./python/lawnmower_cli.py --cli ./tests/lawnmower_scenario01_valid.txt
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import io
+import os
+import sys
+import json
+import socket
+import tempfile
+import traceback
+import socketserver
+from contextlib import redirect_stdout, redirect_stderr
+from typing import List, Any, Callable, Optional
+
+# Socket the CLI forwards to (None: commands run in process)
+CLI_SOCKET: Optional[str] = os.environ.get("LAWNMOWER_CLI_SOCKET") or None
+
+
+def default_socket() -> str:
+    """
+    Function: default_socket
+    Socket of the warm worker: LAWNMOWER_CLI_SOCKET, else one per user in the system temp folder
+    """
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return CLI_SOCKET or os.path.join(tempfile.gettempdir(), f"lawnmower-{uid}.sock")
+
+
+class FrameWriter(io.TextIOBase):
+    """
+    Frame Writer Class Definition
+    Text stream sending every write to the client as one NDJSON frame {<stream>: text}
+    """
+
+    def __init__(self, wfile: io.BufferedIOBase, stream: str) -> None:
+        self.wfile: io.BufferedIOBase = wfile
+        self.stream: str = stream
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text:
+            self.wfile.write(json.dumps({self.stream: text}).encode("utf-8") + b"\n")
+        return len(text)
+
+    def flush(self) -> None:
+        self.wfile.flush()
+
+
+class CliRequestHandler(socketserver.StreamRequestHandler):
+    """
+    CLI Request Handler Class Definition
+    Runs one forwarded CLI command in the forked child (see module description)
+    """
+    server: "CliServer"
+
+    def handle(self) -> None:
+        request = json.loads(self.rfile.readline())
+        code = 1
+        with redirect_stdout(FrameWriter(self.wfile, "out")), redirect_stderr(FrameWriter(self.wfile, "err")):
+            try:
+                os.chdir(request.get("cwd") or os.getcwd())
+                code = self.server.run(request["argv"])
+            except SystemExit as error:
+                code = error.code if isinstance(error.code, int) else 1
+            except Exception:
+                traceback.print_exc()
+        self.wfile.write(json.dumps({"exit": code}).encode("utf-8") + b"\n")
+
+
+class CliServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """
+    CLI Server Class Definition
+    Unix socket server forking one warm child per CLI command
+    """
+    block_on_close = False
+
+    def __init__(self, path: str, run: Callable[[List[str]], int]) -> None:
+        self.run: Callable[[List[str]], int] = run
+        if os.path.exists(path):
+            os.remove(path) # socket of a previous server
+        super().__init__(path, CliRequestHandler)
+
+
+def serve(path: str, run: Callable[[List[str]], int]) -> None:
+    """
+    Function: serve
+    Serve forwarded CLI commands on a Unix socket until interrupted
+
+    Args:
+        path: str - socket path
+        run: Callable[[List[str]], int] - runs a CLI command (arguments without the script name) and returns its exit code
+    """
+    server = CliServer(path, run)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(path)
+
+
+def forward(argv: List[str], path: str) -> Optional[int]:
+    """
+    Function: forward
+    Run a CLI command on the warm worker, replaying its output here
+
+    Args:
+        argv: List[str] - CLI arguments without the script name
+        path: str - socket path
+
+    Output:
+        Optional[int] - exit code of the command, None if no worker answers on the socket
+    """
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(path)
+    except OSError:
+        connection.close()
+        return None
+    with connection, connection.makefile("rwb") as stream:
+        stream.write(json.dumps({"argv": argv, "cwd": os.getcwd()}).encode("utf-8") + b"\n")
+        stream.flush()
+        for line in stream:
+            frame: Any = json.loads(line)
+            if "exit" in frame:
+                return int(frame["exit"])
+            if "out" in frame:
+                sys.stdout.write(frame["out"])
+            else:
+                sys.stderr.write(frame["err"])
+    return 1 # worker closed the connection without an exit code
@@ -0,0 +1,130 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_events.py
+
+Objectives:
+    Event stream of an Automated Robotic Lawnmower Simulator run, for incremental rendering (browser UI)
+    The simulation advances only when the next event is pulled, so the consumer paces it and stops it
+    (closing the generator, e.g. when the client disconnects) without the rest of the path being read
+    Events, in order:
+        start     lawn (grid, valid rocks, start position), sent before any move is read (constant time to first pixel)
+        moves     batch of position deltas: the vertices of the mower track (one per straight run, crash cell included)
+        coverage  all grass cut (once)
+        crash     crash reason and cell
+        error     malformed path (detail), ends the stream
+        done      final verdict (Sim Status Structure without pos_history, visited_cells and messages),
+                  with the path analytics when params['analytics'] (see lawnmower_analytics)
+    Server-Sent Events framing for the API: format_sse
+
+Execution:
+    for event, data in simulation_events(params): ...
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import json
+from typing import List, Dict, Any, Tuple, Iterator
+from lawnmower_sim import LawnmowerSim, LOG_OFF
+from lawnmower_cache import path_runs
+from lawnmower_path_codec import InvalidPath
+from lawnmower_layouts import apply_layout
+
+# Default batching: a moves event is sent every BATCH_POSITIONS vertices or BATCH_MOVES moves, whichever comes first
+BATCH_POSITIONS: int = 512
+BATCH_MOVES: int = 1 << 16
+
+
+def simulation_events(
+    params: Dict[str, Any],
+    batch_positions: int = BATCH_POSITIONS,
+    batch_moves: int = BATCH_MOVES) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Function: simulation_events
+    Run a simulation as a generator of (event, data). Runs are executed as segments (LawnmowerSim.move_run),
+    without messages nor pos_history, so memory stays flat whatever the path length
+
+    Args:
+        params: Dict[str, Any] - simulation params (see execute_and_report, any path format or layout_id)
+        batch_positions: int - maximum vertices per moves event
+        batch_moves: int - maximum moves per moves event (progress on long straight runs)
+    """
+    layout = apply_layout(params)
+    sim = LawnmowerSim(params['test_name'], params['height'], params['width'], params['rocks'], params['start_pos'],
+                       log_level=LOG_OFF, log_sinks=[], keep_history=False, layout=layout,
+                       analytics=params.get('analytics', False))
+    yield "start", {
+        "test_name": sim.test_name,
+        "grid_height": sim.grid_height,
+        "grid_width": sim.grid_width,
+        "valid_rocks": sim.valid_rocks(),
+        "start_pos": sim.start_pos,
+        "total_grass_squares": sim.total_grass_squares,
+        "uncut_grass_remaining": sim.uncut_remaining,
+    }
+
+    positions: List[List[int]] = []
+    moves, pending, covered = 0, 0, False
+    try:
+        for move, count in path_runs(params):
+            row, col = sim.last_pos
+            ok = sim.move_run(move.lower(), count)
+            # Moves done: the whole run, or up to the crash cell (a run is a straight line)
+            steps = count if ok else abs(sim.last_pos[0] - row) + abs(sim.last_pos[1] - col)
+            moves += steps
+            pending += steps
+            if sim.last_pos != [row, col]:
+                positions.append([sim.last_pos[0], sim.last_pos[1]])
+            # Batch flushed before a crash or coverage event, so the track is drawn up to it
+            covering = sim.all_grass_cut and not covered
+            if positions and (not ok or covering or len(positions) >= batch_positions or pending >= batch_moves):
+                yield "moves", {"positions": positions, "moves": moves, "uncut_grass_remaining": sim.uncut_remaining}
+                positions, pending = [], 0
+            if covering:
+                covered = True
+                yield "coverage", {"all_grass_cut": True, "moves": moves}
+            if not ok:
+                yield "crash", {"crash_reason": sim.crash_reason, "position": list(sim.last_pos), "moves": moves}
+                break
+    except InvalidPath as error:
+        # Malformed path (the response is already streaming): error event instead of a 422
+        yield "error", {"detail": error.args[0], "moves": moves}
+        return
+    if positions:
+        yield "moves", {"positions": positions, "moves": moves, "uncut_grass_remaining": sim.uncut_remaining}
+
+    # Verdict only: the coordinate lists of sim_status are not built
+    done: Dict[str, Any] = {
+        "test_name": sim.test_name,
+        "grid_width": sim.grid_width,
+        "grid_height": sim.grid_height,
+        "start_pos": sim.start_pos,
+        "total_grass_squares": sim.total_grass_squares,
+        "all_grass_cut": sim.all_grass_cut,
+        "uncut_grass_remaining": sim.uncut_remaining,
+        "did_mower_crash": sim.did_mower_crash,
+        "crash_reason": sim.crash_reason,
+        "last_pos": sim.last_pos,
+        "moves": moves,
+    }
+    if layout is not None:
+        done["layout_id"] = layout.layout_id
+    if sim.analytics is not None:
+        done["analytics"] = sim.analytics.summary()
+    yield "done", done
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """
+    Function: format_sse
+    Server-Sent Events frame of an event
+
+    Args:
+        event: str - event name
+        data: Dict[str, Any] - event data, sent as one line of JSON
+    """
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
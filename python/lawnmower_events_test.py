@@ -0,0 +1,95 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_events_test.py
+
+Objectives:
+    Auto Test for Automated Robotic Lawnmower Simulator streamed simulation events (Server-Sent Events)
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import json
+import random
+from typing import Any, Iterator, List
+from fastapi.testclient import TestClient
+import python.lawnmower_cli_api as cli_api
+from python.lawnmower_sim import LawnmowerSim
+from python.lawnmower_events import simulation_events
+
+MOVES = ["up", "down", "left", "right"]
+
+def expand_track(start: Any, positions: List[List[int]]) -> List[tuple]:
+    # Cells of the straight segments between consecutive track vertices
+    cells, (row, col) = [], start
+    for target in positions:
+        while (row, col) != tuple(target):
+            row += (target[0] > row) - (target[0] < row)
+            col += (target[1] > col) - (target[1] < col)
+            cells.append((row, col))
+    return cells
+
+def test_events_01_track_and_verdict_match_simulation() -> None:
+    """Verifies that the streamed track and verdict match a full simulation of random scenarios."""
+    print(f"\n---  Auto Test test_events_01_track_and_verdict_match_simulation - events vs execute_path")
+    rng = random.Random(14)
+    for _ in range(200):
+        height, width = rng.randint(1, 8), rng.randint(1, 8)
+        rocks = [[rng.randrange(height), rng.randrange(width)] for _ in range(rng.randint(0, 6))]
+        start = [rng.randrange(height), rng.randrange(width)]
+        path = [rng.choice(MOVES) for _ in range(rng.randint(0, 40))]
+        expected = LawnmowerSim("events", height, width, rocks, start, log_level="off", log_sinks=[]).execute_path(path)
+        params = {"test_name": "events", "height": height, "width": width, "rocks": rocks, "start_pos": start, "path": path}
+        events = list(simulation_events(params, batch_positions=3))
+        names = [event for event, _ in events]
+        assert names[0] == "start" and names[-1] == "done"
+        positions = [pos for event, data in events if event == "moves" for pos in data["positions"]]
+        assert expand_track(events[0][1]["start_pos"], positions) == expected["pos_history"][1:]
+        done = events[-1][1]
+        for key in ("all_grass_cut", "uncut_grass_remaining", "did_mower_crash", "crash_reason", "last_pos"):
+            assert done[key] == expected[key]
+        assert ("crash" in names) == expected["did_mower_crash"]
+        assert names.count("coverage") == int(expected["all_grass_cut"])
+
+def test_events_02_lazy_and_cancellable() -> None:
+    """Verifies that the lawn is sent before any move is read and that closing the stream stops reading the path."""
+    print(f"\n---  Auto Test test_events_02_lazy_and_cancellable - time to first pixel and cancel")
+    pulled = [0]
+
+    def endless_zigzag() -> Iterator[str]:
+        while True:
+            pulled[0] += 1
+            yield "right" if pulled[0] % 2 else "left"
+
+    params = {"test_name": "cancel", "height": 2, "width": 2, "rocks": [], "start_pos": [0, 0], "path": endless_zigzag()}
+    events = simulation_events(params, batch_positions=10)
+    assert next(events)[0] == "start" and pulled[0] == 0
+    assert next(events)[0] == "moves"
+    events.close()
+    assert pulled[0] < 20
+
+def test_events_03_sse_endpoint() -> None:
+    """Verifies the /simulate/stream Server-Sent Events framing, the 404 of an unknown layout and malformed paths."""
+    print(f"\n---  Auto Test test_events_03_sse_endpoint - /simulate/stream")
+    client = TestClient(cli_api.app_lawnmower_simulation)
+    definition = b'test_name="sse"\nheight=3\nwidth=3\nrocks=[[2,2]]\nstart_pos=[0,0]\npath="R2D2"\n'
+    response = client.post("/simulate/stream", files={"file": ("scenario.txt", definition, "text/plain")})
+    assert response.status_code == 200 and response.headers["content-type"].startswith("text/event-stream")
+    frames = [frame.split("\n") for frame in response.text.strip().split("\n\n")]
+    events = [(lines[0][len("event: "):], json.loads(lines[1][len("data: "):])) for lines in frames]
+    assert [event for event, _ in events] == ["start", "moves", "crash", "done"]
+    assert events[1][1]["positions"] == [[0, 2], [2, 2]]
+    assert events[-1][1]["crash_reason"] == "Crashed into Rock"
+    response = client.post("/simulate/stream", params={"layout_id": "b" * 64}, files={"file": ("scenario.txt", definition, "text/plain")})
+    assert response.status_code == 404
+    invalid = definition.replace(b'"R2D2"', b'"R2Q9D2"')
+    response = client.post("/simulate/stream", files={"file": ("scenario.txt", invalid, "text/plain")})
+    assert response.status_code == 200 and "event: error" in response.text and "event: done" not in response.text
+    response = client.post("/simulate", params={"cache": "false"}, files={"file": ("scenario.txt", invalid, "text/plain")})
+    assert response.status_code == 422 and "position 2" in response.json()["detail"]
+    packed = b'test_name="packed"\nheight=3\nwidth=3\nrocks=[]\nstart_pos=[0,0]\npath_packed="AAA="\n'
+    response = client.post("/simulate", params={"cache": "false"}, files={"file": ("scenario.txt", packed, "text/plain")})
+    assert response.status_code == 422 and "Invalid packed path" in response.json()["detail"]
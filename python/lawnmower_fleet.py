@@ -0,0 +1,511 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_fleet.py
+
+Objectives:
+    Fleet simulation: N mowers executing their paths in lockstep (one move per mower per tick) on a shared lawn
+    Crashes per mower: rock, fence (same rules as LawnmowerSim) and mower to mower collisions:
+        vertex collision   two mowers ending a tick on the same cell, or a mower moving onto a stopped mower
+        swap collision     two mowers exchanging their cells in the same tick
+    A crashed mower stops and stays on the lawn as an obstacle (on its last cell, or on the collision cell).
+    A mower at the end of its path stays parked on its last cell, also as an obstacle
+    Grass cut by the fleet is combined, and every cut cell is attributed to the first mower cutting it
+
+    Vectorized over mowers and ticks (NumPy): ticks are processed in chunks of [ticks, mowers] arrays
+    (positions by cumulative sum, crashes by occupancy mask, collisions by sorting the cells per tick).
+    A chunk is recomputed from the first crash tick only, so the cost stays proportional to ticks x mowers
+
+Execution:
+    fleet = LawnmowerFleet("fleet", 5, 5, [[2,2]], [[0,0], [4,4]])
+    fleet_status = fleet.execute_paths(["R4D1", ["Up", "Left"]])
+    Definition file (API POST /simulate/fleet or CLI --fleet):
+        test_name="fleet"
+        height=5
+        width=5
+        rocks=[[2,2]]
+        mowers=[{"start_pos": [0,0], "path": "R4D1"}, {"start_pos": [4,4], "path": ["Up", "Left"]}]
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import numpy as np
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union, TYPE_CHECKING
+from lawnmower_sim import LawnmowerSim, LOG_OFF
+from lawnmower_sim_numpy import MOVE_CODES, NO_MOVE, ROW_STEP, COL_STEP, encode_path
+from lawnmower_path_codec import RLE_LETTERS, InvalidPath, check_rle
+from lawnmower_layouts import apply_layout
+
+if TYPE_CHECKING:
+    from lawnmower_layouts import Layout
+
+# Crash reason of a mower to mower collision (rock and fence as in LawnmowerSim)
+MOWER_CRASH: str = "Crashed into Mower"
+
+# Array cells (ticks x mowers) per vectorized chunk. Bounds temporary memory
+FLEET_CHUNK_CELLS: int = 1 << 18
+
+# Direction code of each run-length letter byte (-1 for the count digits)
+RLE_LETTER_CODES: np.ndarray = np.full(256, -1, dtype=np.int8)
+for _letter, _move in RLE_LETTERS.items():
+    RLE_LETTER_CODES[ord(_letter)] = RLE_LETTER_CODES[ord(_letter.lower())] = MOVE_CODES[_move]
+
+# Longest run count decoded in int64 (digits)
+RLE_MAX_DIGITS: int = 18
+
+
+def _rle_arrays(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Function: _rle_arrays
+    Runs of a run-length string as arrays, decoded at once over its bytes: letters by lookup, counts as the
+    sum of their digits times the power of ten of their place (a missing count means 1). Raises InvalidPath
+    if malformed
+
+    Args:
+        text: str - run-length string, e.g. "D3R1U2"
+
+    Output:
+        Tuple[np.ndarray, np.ndarray] - direction code (int8) and count (int64) per run
+    """
+    check_rle(text)
+    data: np.ndarray = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    raw: np.ndarray = RLE_LETTER_CODES[data]
+    letters: np.ndarray = np.flatnonzero(raw >= 0)
+    if not len(letters):
+        return np.zeros(0, dtype=np.int8), np.zeros(0, dtype=np.int64)
+    # Run of each byte and place of each digit from the end of its count
+    run_ends: np.ndarray = np.append(letters[1:], len(data))
+    run: np.ndarray = np.cumsum(raw >= 0) - 1
+    place: np.ndarray = run_ends[run] - 1 - np.arange(len(data))
+    if int((run_ends - letters).max()) - 1 > RLE_MAX_DIGITS:
+        raise InvalidPath(f"Invalid run-length path: count above {RLE_MAX_DIGITS} digits")
+    digits: np.ndarray = np.where(raw < 0, data.astype(np.int64) - ord("0"), 0) * (10 ** np.minimum(place, RLE_MAX_DIGITS))
+    counts: np.ndarray = np.add.reduceat(digits, letters)
+    return raw[letters], np.where(run_ends - letters > 1, counts, 1)
+
+
+class _PathReader:
+    """
+    Path Reader Class Definition
+    Direction codes of a mower path, read chunk by chunk. A run-length path is decoded once into run arrays
+    sliced per chunk (np.repeat of the runs overlapping the chunk), a list of moves is encoded per chunk
+    """
+    __slots__ = ("path", "codes", "counts", "ends", "position", "length")
+
+    def __init__(self, path: Union[str, Sequence[str]]) -> None:
+        self.path: Sequence[str] = path
+        self.codes: Optional[np.ndarray] = None # run codes of a run-length path
+        self.counts: np.ndarray = np.zeros(0, dtype=np.int64) # run counts
+        self.ends: np.ndarray = self.counts # run end positions in the path (cumulative counts)
+        self.position: int = 0
+        if isinstance(path, str):
+            self.codes, self.counts = _rle_arrays(path)
+            self.ends = np.cumsum(self.counts)
+            self.length: int = int(self.ends[-1]) if len(self.ends) else 0
+        else:
+            self.length = len(path)
+
+    def read(self, size: int) -> np.ndarray:
+        """
+        Method: read
+        Next codes of the path (fewer than size at the end of the path)
+
+        Args:
+            size: int - maximum number of codes
+        """
+        start = self.position
+        stop = min(start + size, self.length)
+        self.position = stop
+        if self.codes is None:
+            return encode_path(self.path[start:stop])
+        if stop <= start:
+            return np.zeros(0, dtype=np.int8)
+        # Runs overlapping [start, stop), clipped to it
+        first = int(np.searchsorted(self.ends, start, side="right"))
+        last = int(np.searchsorted(self.ends, stop, side="left")) + 1
+        ends: np.ndarray = self.ends[first:last]
+        counts: np.ndarray = np.minimum(ends, stop) - np.maximum(ends - self.counts[first:last], start)
+        return np.repeat(self.codes[first:last], counts)
+
+
+def _shared(keys: np.ndarray) -> np.ndarray:
+    """
+    Function: _shared
+    Mask of the keys present more than once
+
+    Args:
+        keys: np.ndarray - 1D int64 keys
+    """
+    order = np.argsort(keys, kind="stable")
+    ordered = keys[order]
+    equal = ordered[1:] == ordered[:-1]
+    shared_ordered: np.ndarray = np.zeros(len(keys), dtype=bool)
+    shared_ordered[1:] |= equal
+    shared_ordered[:-1] |= equal
+    shared: np.ndarray = np.empty(len(keys), dtype=bool)
+    shared[order] = shared_ordered
+    return shared
+
+
+class LawnmowerFleet:
+    """
+    Lawnmower Fleet Class Definition
+    Lockstep simulation of several mowers on one lawn (see module description)
+    """
+    __slots__ = ("test_name", "lawn", "start_positions", "keep_history", "mower_count", "cells", "rock_mask",
+                 "visited", "order", "owners", "outside", "rows", "cols", "alive", "moves", "crash_reason",
+                 "crash_tick", "crash_pos", "collided_with", "pos_history", "ticks", "moved")
+
+    def __init__(
+        self,
+        test_name: str,
+        grid_height: int,
+        grid_width: int,
+        rock_locations: List[List[int]],
+        start_positions: List[List[int]],
+        keep_history: bool = False,
+        layout: Optional["Layout"] = None) -> None:
+        """
+        Method: __init__ (Object Creation)
+
+        Args:
+            test_name (str): fleet name. Mower i is reported as <test_name>_mower<i>
+            grid_height (int), grid_width (int): lawn dimensions
+            rock_locations (List[List[int]]): rocks (outside the grid disregarded, as in LawnmowerSim)
+            start_positions (List[List[int]]): start position of each mower. An out of grid start is reset
+                to [0,0] and still recorded as first visited entry (as in LawnmowerSim)
+            keep_history (bool): record pos_history per mower. Default False (flat memory for big fleets)
+            layout (Optional[Layout]): precompiled lawn layout instead of rock_locations (see lawnmower_layouts)
+        """
+        self.test_name: str = test_name
+        # Lawn (grid, rocks, grass count) built by the reference simulator, messages off
+        self.lawn = LawnmowerSim(test_name, grid_height, grid_width, rock_locations, [0, 0],
+                                 log_level=LOG_OFF, log_sinks=[], keep_history=False, layout=layout)
+        self.keep_history: bool = keep_history
+        self.mower_count: int = len(start_positions)
+        self.cells: int = grid_height * grid_width
+        self.rock_mask: np.ndarray = np.frombuffer(self.lawn.grid.rocks, dtype=bool)
+
+        # Combined cut cells: map, discovery order and first mower cutting each cell
+        self.visited: np.ndarray = np.zeros(self.cells, dtype=bool)
+        self.order: List[np.ndarray] = []
+        self.owners: List[np.ndarray] = []
+        self.outside: List[Tuple[int, Tuple[int, int]]] = [] # (mower, out of grid start) visited entries
+
+        # Per mower state: position, alive (not crashed), moves, crash
+        self.start_positions: List[Tuple[int, int]] = []
+        for mower, start in enumerate(start_positions):
+            if 0 <= start[0] < grid_height and 0 <= start[1] < grid_width:
+                self.start_positions.append((start[0], start[1]))
+            else:
+                self.start_positions.append((0, 0)) # reset to top left corner
+                self.outside.append((mower, (start[0], start[1])))
+        self.rows: np.ndarray = np.array([pos[0] for pos in self.start_positions], dtype=np.int64)
+        self.cols: np.ndarray = np.array([pos[1] for pos in self.start_positions], dtype=np.int64)
+        self.alive: np.ndarray = np.ones(self.mower_count, dtype=bool)
+        self.moves: np.ndarray = np.zeros(self.mower_count, dtype=np.int64)
+        self.crash_reason: List[str] = ["None"] * self.mower_count
+        self.crash_tick: List[Optional[int]] = [None] * self.mower_count
+        self.crash_pos: List[Optional[List[int]]] = [None] * self.mower_count
+        self.collided_with: List[List[int]] = [[] for _ in range(self.mower_count)]
+        self.pos_history: List[List[Tuple[int, int]]] = [[pos] for pos in self.start_positions]
+        self.ticks: int = 0
+        self.moved: bool = False # a move was executed without crash (all grass cut is only set after a move)
+
+        # Start cells are cut by their mower (out of grid starts are recorded as outside entries instead)
+        outside_mowers = {mower for mower, _ in self.outside}
+        inside = np.array([mower for mower in range(self.mower_count) if mower not in outside_mowers], dtype=np.int64)
+        self._cut(self.rows[inside] * grid_width + self.cols[inside], inside)
+
+        # Mowers starting on the same cell collide before the first tick
+        flat = self.rows * grid_width + self.cols
+        for mower in np.flatnonzero(_shared(flat)).tolist():
+            self._crash(mower, 0, MOWER_CRASH, list(self.start_positions[mower]),
+                        [other for other in np.flatnonzero(flat == flat[mower]).tolist() if other != mower])
+
+    def _cut(self, flat: np.ndarray, mowers: np.ndarray) -> None:
+        """
+        Method: _cut
+        Mark cells as cut, in order, attributing each new cell to the mower cutting it first
+
+        Args:
+            flat: np.ndarray - cell indexes in time order
+            mowers: np.ndarray - mower of each cell index
+        """
+        cells, first = np.unique(flat, return_index=True)
+        new = ~self.visited[cells]
+        first = np.sort(first[new])
+        self.visited[cells[new]] = True
+        self.order.append(flat[first])
+        self.owners.append(mowers[first])
+
+    def _crash(self, mower: int, tick: int, reason: str, position: List[int], collided_with: List[int]) -> None:
+        """
+        Method: _crash
+        Stop a mower on a crash
+
+        Args:
+            mower: int - mower index
+            tick: int - tick of the crash (0 for a start collision)
+            reason: str - crash reason
+            position: List[int] - crash cell (last_pos)
+            collided_with: List[int] - other mowers of a collision
+        """
+        self.alive[mower] = False
+        self.crash_reason[mower] = reason
+        self.crash_tick[mower] = tick
+        self.crash_pos[mower] = position
+        self.collided_with[mower] = collided_with
+
+    def execute_paths(self, paths: Sequence[Union[str, Sequence[str]]]) -> Dict[str, Any]:
+        """
+        Method: execute_paths
+        Execute the paths of all mowers in lockstep until every mower crashed or finished its path
+
+        Args:
+            paths: Sequence[Union[str, Sequence[str]]] - one path per mower: list of moves or run-length string
+                (see lawnmower_path_codec). Unknown moves keep the mower in place (as in LawnmowerSim)
+
+        Output:
+            fleet_status: Dict[str, Any] - see fleet_status
+        """
+        if len(paths) != self.mower_count:
+            raise ValueError(f"{len(paths)} paths for {self.mower_count} mowers")
+        readers = [_PathReader(path) for path in paths]
+        chunk_ticks = max(FLEET_CHUNK_CELLS // max(self.mower_count, 1), 1)
+        ends: np.ndarray = np.zeros(self.mower_count, dtype=np.int64)
+        reading = self.alive.copy() # mowers with a path left to read
+        while reading.any():
+            # Next chunk of codes: [ticks, mowers], parked (NO_MOVE) after the end of a path or a crash
+            codes: np.ndarray = np.full((chunk_ticks, self.mower_count), NO_MOVE, dtype=np.int8)
+            ends[:] = 0
+            for mower in np.flatnonzero(reading).tolist():
+                chunk = readers[mower].read(chunk_ticks)
+                codes[:len(chunk), mower] = chunk
+                ends[mower] = len(chunk)
+                if len(chunk) < chunk_ticks:
+                    reading[mower] = False
+            length = int(ends.max())
+            start = 0
+            while start < length:
+                start = self._execute_chunk(codes, ends, start, length)
+                reading &= self.alive
+        return self.fleet_status()
+
+    def _execute_chunk(self, codes: np.ndarray, ends: np.ndarray, start: int, length: int) -> int:
+        """
+        Method: _execute_chunk
+        Execute the ticks of a chunk from start, up to and including the first tick with a crash
+
+        Args:
+            codes: np.ndarray - [ticks, mowers] direction codes of the chunk
+            ends: np.ndarray - number of codes of each mower in the chunk
+            start: int - first tick to execute
+            length: int - ticks of the chunk
+
+        Output:
+            int - next tick to execute
+        """
+        height, width = self.lawn.grid_height, self.lawn.grid_width
+        block = codes[start:length]
+        ticks = len(block)
+        tick_index = np.arange(start, length)[:, None]
+        active = (tick_index < ends[None, :]) & self.alive[None, :]
+
+        # Positions after every tick as if nobody crashed, and before every tick
+        rows = self.rows[None, :] + np.cumsum(ROW_STEP[block], axis=0)
+        cols = self.cols[None, :] + np.cumsum(COL_STEP[block], axis=0)
+        prev_rows = np.vstack((self.rows[None, :], rows[:-1]))
+        prev_cols = np.vstack((self.cols[None, :], cols[:-1]))
+
+        # Rock and fence crashes (a crashing mower stays on its cell)
+        inside = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+        flat = np.where(inside, rows * width + cols, 0)
+        prev_flat = prev_rows * width + prev_cols
+        hit_rock = inside & self.rock_mask[flat]
+        blocked = active & (~inside | hit_rock)
+        end_flat = np.where(blocked, prev_flat, flat)
+
+        # Mower collisions: shared end cell in a tick, or two mowers exchanging cells
+        collided = np.zeros_like(active)
+        if self.mower_count > 1:
+            # Cells off the grid (only after a fence crash, in ticks recomputed later) kept apart from the next tick
+            tick_keys: np.ndarray = (np.arange(ticks, dtype=np.int64) * (self.cells + 1))[:, None]
+            cell_keys = np.where((end_flat >= 0) & (end_flat < self.cells), end_flat, self.cells)
+            collided = active & _shared((tick_keys + cell_keys).ravel()).reshape(active.shape)
+            moving = (active & ~blocked & (flat != prev_flat)).ravel()
+            movers = np.flatnonzero(moving)
+            if len(movers):
+                # Swap: the mower starting the tick on the destination of a mover moves onto the cell of the mover
+                start_keys = (tick_keys + np.where((prev_flat >= 0) & (prev_flat < self.cells), prev_flat, self.cells)).ravel()
+                order = np.argsort(start_keys)
+                targets = (tick_keys + flat).ravel()[movers]
+                other = order[np.minimum(np.searchsorted(start_keys[order], targets), len(order) - 1)]
+                swapped = (start_keys[other] == targets) & moving[other] & (flat.ravel()[other] == prev_flat.ravel()[movers])
+                collided.ravel()[movers[swapped]] = True
+
+        # Ticks executed: up to the first crash tick (later positions depend on the crash)
+        crashed = blocked | collided
+        crash_ticks = np.flatnonzero(crashed.any(axis=1))
+        last = int(crash_ticks[0]) if len(crash_ticks) else ticks - 1
+        done = slice(0, last + 1)
+        executed = active[done].copy()
+        ok = executed & ~crashed[done]
+
+        # Cut cells of the moves done without crash, in tick order
+        if ok.any():
+            self.moved = True
+            cut = np.flatnonzero(ok.ravel())
+            self._cut(flat[done].ravel()[cut], cut % self.mower_count)
+        if self.keep_history:
+            for mower in np.flatnonzero(executed.any(axis=0)).tolist():
+                steps = np.flatnonzero(executed[:, mower])
+                self.pos_history[mower].extend(zip(rows[steps, mower].tolist(), cols[steps, mower].tolist()))
+        self.moves += executed.sum(axis=0)
+
+        # Crashes of the last executed tick
+        if len(crash_ticks):
+            for mower in np.flatnonzero(crashed[last]).tolist():
+                position = [int(rows[last, mower]), int(cols[last, mower])]
+                if blocked[last, mower]:
+                    reason = "Crashed into Fence" if not inside[last, mower] else "Crashed into Rock"
+                    self._crash(mower, self.ticks + last + 1, reason, position, [])
+                    continue
+                # Other mowers on the same end cell, or the mower of the exchanged cell
+                others = np.flatnonzero((end_flat[last] == end_flat[last, mower]) |
+                                        ((flat[last] == prev_flat[last, mower]) & (prev_flat[last] == flat[last, mower]))).tolist()
+                self._crash(mower, self.ticks + last + 1, MOWER_CRASH, position, [other for other in others if other != mower])
+        # Positions after the last executed tick. Mowers blocked by a rock or the fence stay on their cell
+        self.rows = np.where(blocked[last], prev_rows[last], rows[last])
+        self.cols = np.where(blocked[last], prev_cols[last], cols[last])
+        self.ticks += last + 1
+        codes[start + last + 1:length, ~self.alive] = NO_MOVE
+        return start + last + 1
+
+    def visited_count(self) -> int:
+        """
+        Method: visited_count
+        Number of visited entries of the fleet (cut cells and out of grid starts)
+        """
+        return sum(len(order) for order in self.order) + len(self.outside)
+
+    def fleet_status(self) -> Dict[str, Any]:
+        """
+        Method: fleet_status
+        Build the Fleet Status Structure: the combined lawn and one Sim Status Structure per mower
+
+        Output:
+            fleet_status: Dict[str, Any]
+                "test_name", "grid_width", "grid_height", "rock_locations", "valid_rocks", "total_grass_squares",
+                "all_grass_cut", "uncut_grass_remaining", "visited_cells" - combined lawn, as in sim_status
+                "ticks" - ticks executed
+                "mower_count", "crashes", "crashes_by_reason" - fleet crash summary
+                "mowers" - per mower: "mower", "test_name", "grid_width", "grid_height", "start_pos",
+                    "total_grass_squares", "all_grass_cut", "uncut_grass_remaining" (shared lawn), "did_mower_crash",
+                    "crash_reason", "crash_tick", "collided_with", "pos_history" (start only without keep_history),
+                    "visited_cells" (cells cut first by this mower), "cells_cut", "moves", "last_pos".
+                    The rocks are only reported once, in the combined lawn
+        """
+        lawn = self.lawn
+        width = lawn.grid_width
+        order = np.concatenate(self.order) if self.order else np.zeros(0, dtype=np.int64)
+        owners = np.concatenate(self.owners) if self.owners else np.zeros(0, dtype=np.int64)
+        uncut = lawn.total_grass_squares - self.visited_count()
+        all_grass_cut = self.moved and uncut == 0
+
+        # Cut cells per mower in discovery order: outside start entry first, then the cells it cut first
+        by_mower = np.argsort(owners, kind="stable")
+        bounds: np.ndarray = np.asarray(np.searchsorted(owners[by_mower], np.arange(self.mower_count + 1)))
+        rows_list: List[int] = (order[by_mower] // max(width, 1)).tolist()
+        cols_list: List[int] = (order[by_mower] % max(width, 1)).tolist()
+        outside = dict(self.outside)
+
+        mowers: List[Dict[str, Any]] = []
+        crashes_by_reason: Dict[str, int] = {}
+        for mower in range(self.mower_count):
+            low, high = int(bounds[mower]), int(bounds[mower + 1])
+            visited_cells: List[Tuple[int, int]] = [outside[mower]] if mower in outside else []
+            visited_cells.extend(zip(rows_list[low:high], cols_list[low:high]))
+            crash_pos = self.crash_pos[mower]
+            did_mower_crash = crash_pos is not None
+            if did_mower_crash:
+                crashes_by_reason[self.crash_reason[mower]] = crashes_by_reason.get(self.crash_reason[mower], 0) + 1
+            mowers.append({
+                "mower": mower,
+                "test_name": f"{self.test_name}_mower{mower}",
+                "grid_width": width,
+                "grid_height": lawn.grid_height,
+                "start_pos": self.start_positions[mower],
+                "total_grass_squares": lawn.total_grass_squares,
+                "all_grass_cut": all_grass_cut,
+                "uncut_grass_remaining": uncut,
+                "did_mower_crash": did_mower_crash,
+                "crash_reason": self.crash_reason[mower],
+                "crash_tick": self.crash_tick[mower],
+                "collided_with": self.collided_with[mower],
+                "pos_history": self.pos_history[mower],
+                "visited_cells": visited_cells,
+                "cells_cut": len(visited_cells),
+                "moves": int(self.moves[mower]),
+                "last_pos": crash_pos if crash_pos is not None else [int(self.rows[mower]), int(self.cols[mower])],
+            })
+
+        # Combined visited cells in discovery order (out of grid starts first)
+        combined: List[Tuple[int, int]] = [position for _, position in self.outside]
+        combined.extend(zip((order // max(width, 1)).tolist(), (order % max(width, 1)).tolist()))
+        return {
+            "test_name": self.test_name,
+            "grid_width": width,
+            "grid_height": lawn.grid_height,
+            "rock_locations": lawn.rock_locations,
+            "valid_rocks": lawn.valid_rocks(),
+            "total_grass_squares": lawn.total_grass_squares,
+            "all_grass_cut": all_grass_cut,
+            "uncut_grass_remaining": uncut,
+            "visited_cells": combined,
+            "ticks": self.ticks,
+            "mower_count": self.mower_count,
+            "crashes": sum(crashes_by_reason.values()),
+            "crashes_by_reason": crashes_by_reason,
+            "mowers": mowers,
+        }
+
+
+def execute_fleet(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Function: execute_fleet
+    Run the fleet simulation of a definition (see module description)
+
+    Args:
+        params: Dict[str, Any]:
+            test_name, height, width, rocks - lawn (or layout_id, see lawnmower_layouts)
+            mowers=[{"start_pos": [0,0], "path": "R4D1"}, ...] - start position and path (list of moves or
+                run-length string) of each mower
+            keep_history=True - optional, record pos_history per mower. Default False
+
+    Output:
+        fleet_status: Dict[str, Any] - see LawnmowerFleet.fleet_status
+    """
+    layout = apply_layout(params)
+    fleet = LawnmowerFleet(params['test_name'], params['height'], params['width'], params['rocks'],
+                           [mower['start_pos'] for mower in params['mowers']],
+                           keep_history=params.get('keep_history', False), layout=layout)
+    return fleet.execute_paths([mower.get('path', []) for mower in params['mowers']])
+
+
+def fleet_summary(fleet_status: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Function: fleet_summary
+    Fleet Status Structure without the coordinate lists (visited_cells and pos_history), for the verdict only
+
+    Args:
+        fleet_status: Dict[str, Any] - see LawnmowerFleet.fleet_status
+    """
+    summary = {key: value for key, value in fleet_status.items() if key != "visited_cells"}
+    summary["mowers"] = [{key: value for key, value in mower.items() if key not in ("visited_cells", "pos_history")}
+                         for mower in fleet_status["mowers"]]
+    return summary
@@ -0,0 +1,142 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_fleet_test.py
+
+Objectives:
+    Auto Test for Automated Robotic Lawnmower Simulator fleet simulation (several mowers in lockstep)
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import os
+import random
+from typing import Any, Dict, List, Tuple
+from fastapi.testclient import TestClient
+import python.lawnmower_cli_api as cli_api
+import python.lawnmower_fleet as fleet_module
+from python.lawnmower_fleet import LawnmowerFleet
+from python.lawnmower_sim import LawnmowerSim
+
+MOVES = ["up", "down", "left", "right", "jump"]
+STEPS = {"up": (-1, 0), "down": (1, 0), "left": (0, -1), "right": (0, 1)}
+TESTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests", "fleet")
+
+def reference_fleet(height: int, width: int, rocks: List[List[int]], starts: List[List[int]],
+                    paths: List[List[str]]) -> Tuple[List[str], List[List[int]], Dict[Tuple[int, int], int]]:
+    # Tick by tick, mower by mower: crash reasons, last positions and first mower cutting each cell
+    rock_cells = {(r[0], r[1]) for r in rocks}
+    pos = [(s[0], s[1]) if 0 <= s[0] < height and 0 <= s[1] < width else (0, 0) for s in starts]
+    count = len(starts)
+    alive, reason, last = [True] * count, ["None"] * count, [list(p) for p in pos]
+    owner = {pos[m]: m for m in reversed(range(count)) if tuple(starts[m]) == pos[m]}
+    for m in range(count):
+        if pos.count(pos[m]) > 1:
+            alive[m], reason[m] = False, "Crashed into Mower"
+    tick = 0
+    while True:
+        active = [m for m in range(count) if alive[m] and tick < len(paths[m])]
+        if not active:
+            return reason, last, owner
+        dest, blocked = {}, set()
+        for m in active:
+            row, col = STEPS.get(paths[m][tick], (0, 0))
+            dest[m] = (pos[m][0] + row, pos[m][1] + col)
+            if not (0 <= dest[m][0] < height and 0 <= dest[m][1] < width):
+                blocked.add(m)
+                reason[m] = "Crashed into Fence"
+            elif dest[m] in rock_cells:
+                blocked.add(m)
+                reason[m] = "Crashed into Rock"
+        end = [dest[m] if m in dest and m not in blocked else pos[m] for m in range(count)]
+        collided = {m for m in active if end.count(end[m]) > 1}
+        collided |= {m for m in active for o in active if o != m and m not in blocked and o not in blocked
+                     and dest[m] != pos[m] and dest[m] == pos[o] and dest[o] == pos[m]}
+        for m in active:
+            last[m] = list(dest[m])
+            if m in blocked:
+                alive[m] = False
+            elif m in collided:
+                alive[m], reason[m], pos[m] = False, "Crashed into Mower", dest[m]
+            else:
+                pos[m] = dest[m]
+                owner.setdefault(pos[m], m)
+        tick += 1
+
+def test_fleet_01_single_mower_matches_simulator() -> None:
+    """Verifies that a fleet of one mower reproduces the LawnmowerSim verdict, pos_history and visited_cells."""
+    print(f"\n---  Auto Test test_fleet_01_single_mower_matches_simulator - fleet vs execute_path")
+    rng = random.Random(18)
+    for _ in range(500):
+        height, width = rng.randint(1, 6), rng.randint(1, 6)
+        rocks = [[rng.randrange(-1, height + 1), rng.randrange(-1, width + 1)] for _ in range(rng.randint(0, 5))]
+        start = [rng.randrange(-1, height + 1), rng.randrange(-1, width + 1)]
+        path = [rng.choice(MOVES) for _ in range(rng.randint(0, 30))]
+        expected = LawnmowerSim("fleet", height, width, rocks, start, log_level="off", log_sinks=[]).execute_path(list(path))
+        fleet_status = LawnmowerFleet("fleet", height, width, rocks, [start], keep_history=True).execute_paths([path])
+        mower = fleet_status["mowers"][0]
+        for key in ("all_grass_cut", "uncut_grass_remaining", "did_mower_crash", "crash_reason", "last_pos",
+                    "pos_history", "visited_cells"):
+            assert mower[key] == expected[key]
+        assert fleet_status["valid_rocks"] == expected["valid_rocks"]
+
+def test_fleet_02_collisions_match_reference(monkeypatch: Any) -> None:
+    """Verifies rock, fence, vertex and swap collisions and cell attribution against a tick by tick reference."""
+    print(f"\n---  Auto Test test_fleet_02_collisions_match_reference - fleet vs scalar reference")
+    rng = random.Random(180)
+    for _ in range(1000):
+        # Small chunks exercise the chunk boundaries and the recomputation after a crash
+        monkeypatch.setattr(fleet_module, "FLEET_CHUNK_CELLS", rng.choice([1, 8, 1 << 18]))
+        height, width = rng.randint(1, 5), rng.randint(1, 5)
+        rocks = [[rng.randrange(height), rng.randrange(width)] for _ in range(rng.randint(0, 3))]
+        starts = [[rng.randrange(-1, height), rng.randrange(width)] for _ in range(rng.randint(1, 7))]
+        paths = [[rng.choice(MOVES) for _ in range(rng.randint(0, 15))] for _ in starts]
+        reason, last, owner = reference_fleet(height, width, rocks, starts, paths)
+        fleet_status = LawnmowerFleet("fleet", height, width, rocks, starts).execute_paths(paths)
+        assert [mower["crash_reason"] for mower in fleet_status["mowers"]] == reason
+        assert [mower["last_pos"] for mower in fleet_status["mowers"]] == last
+        cut = {cell: mower["mower"] for mower in fleet_status["mowers"] for cell in mower["visited_cells"]
+               if 0 <= cell[0] < height and 0 <= cell[1] < width}
+        assert cut == owner
+
+def test_fleet_03_api_and_definition_file() -> None:
+    """Verifies /simulate/fleet on the fleet definition file: swap collision, rock crash, shared coverage and summary."""
+    print(f"\n---  Auto Test test_fleet_03_api_and_definition_file - /simulate/fleet")
+    client = TestClient(cli_api.app_lawnmower_simulation)
+    with open(os.path.join(TESTS_DIR, "lawnmower_fleet01.txt"), "rb") as f:
+        definition = f.read()
+    response = client.post("/simulate/fleet", params={"summary": "true"}, files={"file": ("fleet.txt", definition, "text/plain")})
+    assert response.status_code == 200
+    fleet_status = response.json()
+    assert fleet_status["all_grass_cut"] and "visited_cells" not in fleet_status
+    assert fleet_status["crashes_by_reason"] == {"Crashed into Mower": 2, "Crashed into Rock": 1}
+    assert [mower["collided_with"] for mower in fleet_status["mowers"]] == [[], [], [3], [2], []]
+    assert [mower["cells_cut"] for mower in fleet_status["mowers"]] == [10, 10, 1, 1, 2]
+    invalid = b'test_name="fleet"\nheight=2\nwidth=2\nrocks=[]\n'
+    assert client.post("/simulate/fleet", files={"file": ("fleet.txt", invalid, "text/plain")}).status_code == 422
+    garbage = definition.replace(b'"R4D1L4"', b'"R4Q1L4"')
+    response = client.post("/simulate/fleet", files={"file": ("fleet.txt", garbage, "text/plain")})
+    assert response.status_code == 422 and "Invalid run-length path" in response.json()["detail"]
+
+def test_fleet_04_path_reader_chunks() -> None:
+    """Verifies that run-length paths decoded at once and list paths read in chunks give the codes of the moves."""
+    print(f"\n---  Auto Test test_fleet_04_path_reader_chunks - vectorized path reader")
+    codes = {"up": 0, "down": 1, "left": 2, "right": 3}
+    rng = random.Random(4)
+    for _ in range(300):
+        runs = [(rng.choice("UDLRudlr"), rng.choice(["", "0", "1", "3", "012", "25"])) for _ in range(rng.randint(0, 8))]
+        moves = [{"U": "up", "D": "down", "L": "left", "R": "right"}[letter.upper()]
+                 for letter, count in runs for _ in range(int(count or 1))]
+        size = rng.randint(1, 7)
+        for path in ("".join(letter + count for letter, count in runs), moves):
+            reader = fleet_module._PathReader(path)
+            read: List[int] = []
+            while True:
+                chunk = reader.read(size)
+                read.extend(chunk.tolist())
+                if len(chunk) < size:
+                    break
+            assert read == [codes[move] for move in moves]
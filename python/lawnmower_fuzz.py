@@ -0,0 +1,515 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_fuzz.py
+
+Objectives:
+    Scenario generator and differential harness for stress and differential testing of the simulator
+    Generator: reproducible scenarios (in-memory params or definition files in the parse_text_file format)
+    with controllable grid size, rock density, out-of-grid and duplicate rocks, start position and path length
+    Path kinds:
+        random    uniform random moves (optionally unknown moves), usually an early crash
+        walk      random walk over grass cells only, never crashes (long paths, many revisits)
+        crash     walk followed by a run into an adjacent rock or through the fence (guaranteed crash)
+        coverage  planned path covering all the grass (see lawnmower_planner), grass unreachable from the
+                  start is turned into rocks, so all the grass is cut without crash (from a start inside the grid:
+                  the reference simulator counts an outside start as a visited cell)
+    Differential harness: every engine and execution mode runs the same scenarios, each Sim Status Structure is
+    compared exactly with the reference LawnmowerSim.execute_path (python engine, list of moves), and the
+    throughput of every mode is recorded. Modes whose dependencies are missing (numpy) are reported as skipped
+    The compact formats also run through definition files (path="D3R1", path_packed="..." written by scenario_text
+    and read back by parse_text_file and parse_text_stream), and the parallel modes always shard (at least 2 workers,
+    no short path fallback), so a single CPU runner does not silently test the numpy fallback instead
+
+Execution:
+    python ./python/lawnmower_fuzz.py [scenarios] [--seed N] [--max-grid N] [--max-moves N] [--density X]
+                                      [--modes python_stream,numpy,...] [--write DIR]
+    Exit code 1 if any mode differs from the reference
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import io
+import os
+import sys
+import json
+import time
+import base64
+import random
+import importlib
+from typing import List, Dict, Any, Tuple, Callable, Optional, Iterable, Iterator, Set
+from lawnmower_sim import LawnmowerSim, MemorySink
+from lawnmower_path_codec import iter_runs, encode_rle, decode_rle, encode_packed, decode_packed
+from lawnmower_core import parse_text_file
+from lawnmower_stream import parse_text_stream, iter_text_chunks
+from lawnmower_cache import path_runs
+from lawnmower_planner import plan_coverage
+from lawnmower_trie import run_path_variants
+
+# Path kinds of the generator
+PATH_KINDS: Tuple[str, ...] = ("random", "walk", "crash", "coverage")
+
+# Moves of the generated paths (capitalised as in the ./tests files) and their steps
+MOVES: List[str] = ["Up", "Down", "Left", "Right"]
+STEPS: Dict[str, Tuple[int, int]] = {"Up": (-1, 0), "Down": (1, 0), "Left": (0, -1), "Right": (0, 1)}
+UNKNOWN_MOVE: str = "Jump"
+
+# Path formats of the definition files (see scenario_text)
+PATH_FORMATS: Tuple[str, ...] = ("list", "rle", "packed")
+
+# Fields of the Sim Status Structure that a mode does not produce (not compared)
+NO_FIELDS: Set[str] = set()
+
+
+def random_lawn(
+    rng: random.Random,
+    height: int,
+    width: int,
+    density: float,
+    outside_rocks: int = 0,
+    duplicate_rocks: int = 0,
+    start_outside: bool = False) -> Tuple[List[List[int]], List[int]]:
+    """
+    Function: random_lawn
+    Rocks and start position of a random lawn. The start cell (and [0,0], where the simulator resets an
+    outside start) is never a rock
+
+    Args:
+        rng: random.Random - random generator
+        height, width: int - grid dimensions
+        density: float - fraction of the cells holding a rock
+        outside_rocks: int - rocks placed outside the grid (disregarded by the simulator)
+        duplicate_rocks: int - in-grid rocks listed twice
+        start_outside: bool - start position outside the grid
+
+    Output:
+        Tuple[List[List[int]], List[int]] - rocks, start position
+    """
+    cells = height * width
+    if start_outside:
+        start = [height + rng.randrange(1, 4), rng.randrange(-2, width + 2)]
+        start_index = 0
+    else:
+        start = [rng.randrange(height), rng.randrange(width)]
+        start_index = start[0] * width + start[1]
+    count = min(int(cells * density), max(cells - 2, 0))
+    free = {0, start_index}
+    rocks = [[index // width, index % width] for index in rng.sample(range(cells), min(count + 2, cells)) if index not in free][:count]
+    for _ in range(outside_rocks):
+        rocks.append(rng.choice([[rng.randrange(-3, 0), rng.randrange(-3, width + 3)],
+                                 [rng.randrange(height, height + 3), rng.randrange(-3, width + 3)],
+                                 [rng.randrange(height), rng.choice([-1, width])]]))
+    if rocks:
+        rocks.extend(list(rng.choice(rocks)) for _ in range(duplicate_rocks))
+    rng.shuffle(rocks)
+    return rocks, start
+
+
+def random_path(rng: random.Random, length: int, unknown_rate: float = 0.0) -> List[str]:
+    """
+    Function: random_path
+    Uniform random moves
+
+    Args:
+        rng: random.Random - random generator
+        length: int - number of moves
+        unknown_rate: float - fraction of unknown moves (the mower stays in place)
+    """
+    return [UNKNOWN_MOVE if unknown_rate and rng.random() < unknown_rate else rng.choice(MOVES) for _ in range(length)]
+
+
+def walk_path(rng: random.Random, height: int, width: int, rocks: List[List[int]], start: List[int],
+              length: int) -> Tuple[List[str], List[int]]:
+    """
+    Function: walk_path
+    Random walk over grass cells only (never crashes). Stops early when the start cell is enclosed
+
+    Args:
+        rng: random.Random - random generator
+        height, width: int - grid dimensions
+        rocks: List[List[int]] - rock coordinates
+        start: List[int] - start position (reset to [0,0] when outside the grid, as LawnmowerSim does)
+        length: int - number of moves
+
+    Output:
+        Tuple[List[str], List[int]] - moves and the position after the last one
+    """
+    blocked = {(row, col) for row, col in rocks}
+    row, col = start if 0 <= start[0] < height and 0 <= start[1] < width else [0, 0]
+    path: List[str] = []
+    while len(path) < length:
+        options = [move for move in MOVES
+                   if 0 <= row + STEPS[move][0] < height and 0 <= col + STEPS[move][1] < width
+                   and (row + STEPS[move][0], col + STEPS[move][1]) not in blocked]
+        if not options:
+            break
+        move = rng.choice(options)
+        path.append(move)
+        row, col = row + STEPS[move][0], col + STEPS[move][1]
+    return path, [row, col]
+
+
+def crash_path(rng: random.Random, height: int, width: int, rocks: List[List[int]], start: List[int],
+               length: int) -> List[str]:
+    """
+    Function: crash_path
+    Random walk ending with a guaranteed crash: a step into an adjacent rock when there is one,
+    otherwise a straight run through the fence (or into the first rock on the way)
+
+    Args: see walk_path
+    """
+    path, (row, col) = walk_path(rng, height, width, rocks, start, max(length - max(height, width) - 1, 0))
+    blocked = {(r, c) for r, c in rocks}
+    into_rock = [move for move in MOVES if (row + STEPS[move][0], col + STEPS[move][1]) in blocked]
+    if into_rock:
+        return path + [rng.choice(into_rock)]
+    move = rng.choice(MOVES)
+    return path + [move] * (max(height, width) + 1)
+
+
+def coverage_path(height: int, width: int, rocks: List[List[int]], start: List[int]) -> Tuple[List[str], List[List[int]]]:
+    """
+    Function: coverage_path
+    Planned path covering all the grass (see lawnmower_planner.plan_coverage). Grass unreachable from the
+    start position is turned into rocks, so the path cuts all the grass
+
+    Args:
+        height, width: int - grid dimensions
+        rocks: List[List[int]] - rock coordinates
+        start: List[int] - start position
+
+    Output:
+        Tuple[List[str], List[List[int]]] - moves and the rocks (with the unreachable grass added)
+    """
+    plan = plan_coverage(height, width, rocks, start)
+    rocks = rocks + [[row, col] for row, first, last in plan["unreachable_segments"] for col in range(first, last + 1)]
+    return [move.capitalize() for move, count in plan["runs"] for _ in range(count)], rocks
+
+
+def generate_scenario(
+    seed: int,
+    height: int = 10,
+    width: int = 10,
+    kind: str = "walk",
+    length: int = 100,
+    density: float = 0.1,
+    outside_rocks: int = 0,
+    duplicate_rocks: int = 0,
+    start_outside: bool = False,
+    unknown_rate: float = 0.0) -> Dict[str, Any]:
+    """
+    Function: generate_scenario
+    Reproducible scenario params (see lawnmower_core.execute_and_report), with "kind" and "seed" added
+
+    Args:
+        seed: int - random seed (same arguments and seed, same scenario)
+        height, width: int - grid dimensions
+        kind: str - path kind: random, walk, crash or coverage (see module description)
+        length: int - number of moves (coverage: the planned path, whatever its length)
+        density: float - fraction of the cells holding a rock
+        outside_rocks: int - rocks outside the grid
+        duplicate_rocks: int - in-grid rocks listed twice
+        start_outside: bool - start position outside the grid
+        unknown_rate: float - fraction of unknown moves (random kind only)
+    """
+    if kind not in PATH_KINDS:
+        raise ValueError(f"Unknown path kind {kind}. Expected one of {PATH_KINDS}")
+    rng = random.Random(seed)
+    rocks, start = random_lawn(rng, height, width, density, outside_rocks, duplicate_rocks, start_outside)
+    if kind == "random":
+        path = random_path(rng, length, unknown_rate)
+    elif kind == "walk":
+        path, _ = walk_path(rng, height, width, rocks, start, length)
+    elif kind == "crash":
+        path = crash_path(rng, height, width, rocks, start, length)
+    else:
+        path, rocks = coverage_path(height, width, rocks, start)
+    return {"test_name": f"fuzz_{kind}_{seed}", "height": height, "width": width, "rocks": rocks,
+            "start_pos": start, "path": path, "kind": kind, "seed": seed}
+
+
+def generate_scenarios(count: int, seed: int = 0, max_grid: int = 30, max_moves: int = 1000,
+                       density: float = 0.15) -> Iterator[Dict[str, Any]]:
+    """
+    Function: generate_scenarios
+    Mix of scenarios over all the path kinds, with random sizes, densities (up to density),
+    out-of-grid and duplicate rocks, outside starts and unknown moves
+
+    Args:
+        count: int - number of scenarios
+        seed: int - random seed of the mix
+        max_grid: int - largest grid side
+        max_moves: int - longest path
+        density: float - highest rock density
+    """
+    rng = random.Random(seed)
+    for index in range(count):
+        yield generate_scenario(
+            seed=rng.randrange(1 << 30),
+            height=rng.randint(1, max_grid),
+            width=rng.randint(1, max_grid),
+            kind=PATH_KINDS[index % len(PATH_KINDS)],
+            length=rng.randint(0, max_moves),
+            density=rng.uniform(0.0, density),
+            outside_rocks=rng.choice([0, 0, 1, 5]),
+            duplicate_rocks=rng.choice([0, 0, 2]),
+            start_outside=rng.random() < 0.1,
+            unknown_rate=rng.choice([0.0, 0.0, 0.05]))
+
+
+def scenario_text(params: Dict[str, Any], path_format: str = "list") -> str:
+    """
+    Function: scenario_text
+    Definition file content of a scenario (format of the ./tests files, see lawnmower_core.parse_text_file)
+
+    Args:
+        params: Dict[str, Any] - scenario params
+        path_format: str - list (path=[...]), rle (path="D3R1") or packed (path_packed="<base64>"). The compact
+            formats only encode the four moves
+    """
+    if path_format == "rle":
+        path = f'path="{encode_rle(params["path"])}"'
+    elif path_format == "packed":
+        path = f'path_packed="{base64.b64encode(encode_packed(params["path"])).decode("ascii")}"'
+    elif path_format == "list":
+        path = f'path={json.dumps(params["path"])}'
+    else:
+        raise ValueError(f"Unknown path format {path_format}. Expected one of {PATH_FORMATS}")
+    return (f'test_name="{params["test_name"]}"\nheight={params["height"]}\nwidth={params["width"]}\n'
+            f'rocks={json.dumps(params["rocks"])}\nstart_pos={json.dumps(params["start_pos"])}\n{path}\n')
+
+
+def write_scenarios(scenarios: Iterable[Dict[str, Any]], folder: str) -> List[str]:
+    """
+    Function: write_scenarios
+    Write scenarios as definition files (runnable with --cli or --cli-batch)
+
+    Args:
+        scenarios: Iterable[Dict[str, Any]] - scenario params
+        folder: str - output folder
+
+    Output:
+        List[str] - file names
+    """
+    os.makedirs(folder, exist_ok=True)
+    files: List[str] = []
+    for params in scenarios:
+        filename = os.path.join(folder, f"{params['test_name']}.txt")
+        with open(filename, "w") as f:
+            f.write(scenario_text(params))
+        files.append(filename)
+    return files
+
+
+def new_sim(params: Dict[str, Any], log_level: str) -> LawnmowerSim:
+    """
+    Function: new_sim
+    Simulator of a scenario, messages kept in memory
+
+    Args:
+        params: Dict[str, Any] - scenario params
+        log_level: str - simulator log level
+    """
+    return LawnmowerSim(params['test_name'], params['height'], params['width'], params['rocks'], params['start_pos'],
+                        log_level=log_level, log_sinks=[MemorySink()])
+
+
+def _known_moves(path: List[str]) -> bool:
+    # Compact path formats only encode the four moves
+    return all(move.lower() in ("up", "down", "left", "right") for move in path)
+
+
+def _file_status(params: Dict[str, Any], log_level: str, path_format: str, stream: bool) -> Optional[Dict[str, Any]]:
+    # Compact path written to a definition file and read back as the CLI (stream) or parse_text_file would
+    if not _known_moves(params['path']):
+        return None
+    text = scenario_text(params, path_format)
+    parsed = parse_text_stream(iter_text_chunks(io.StringIO(text), 64)) if stream else parse_text_file(text)
+    return new_sim(parsed, log_level).execute_runs(path_runs(parsed))
+
+
+def _parallel_status(params: Dict[str, Any], log_level: str, runs: bool) -> Dict[str, Any]:
+    # Parallel engine forced to shard: at least 2 workers (1 on a single CPU runner falls back to numpy)
+    # and no short path fallback
+    parallel: Any = importlib.import_module("lawnmower_sim_parallel") # numpy required (ImportError: mode skipped)
+    workers, min_moves = parallel.PARALLEL_WORKERS, parallel.PARALLEL_MIN_MOVES
+    parallel.PARALLEL_WORKERS, parallel.PARALLEL_MIN_MOVES = max(workers, 2), 0
+    try:
+        sim = new_sim(params, log_level)
+        if runs:
+            return sim.execute_runs(iter_runs(params['path']), engine="parallel")
+        return sim.execute_path(params['path'], engine="parallel")
+    finally:
+        parallel.PARALLEL_WORKERS, parallel.PARALLEL_MIN_MOVES = workers, min_moves
+
+
+def _trie_status(params: Dict[str, Any], log_level: str) -> Dict[str, Any]:
+    # Path shares its first half with a second variant, so the full path resumes from a snapshot
+    path = params['path']
+    return run_path_variants(dict(params, paths=[path[:len(path) // 2], path]), full=True)[1]
+
+
+# Differential modes: name -> (runner(params, log_level) -> sim_status or None if not applicable, fields not compared)
+MODES: Dict[str, Tuple[Callable[[Dict[str, Any], str], Optional[Dict[str, Any]]], Set[str]]] = {
+    "python_stream": (lambda params, log_level: new_sim(params, log_level).execute_path(iter(params['path'])), NO_FIELDS),
+    "runs": (lambda params, log_level: new_sim(params, log_level).execute_runs(iter_runs(params['path'])), NO_FIELDS),
+    "rle": (lambda params, log_level: new_sim(params, log_level).execute_runs(decode_rle(encode_rle(params['path'])))
+            if _known_moves(params['path']) else None, NO_FIELDS),
+    "packed": (lambda params, log_level: new_sim(params, log_level).execute_runs(decode_packed(encode_packed(params['path'])))
+               if _known_moves(params['path']) else None, NO_FIELDS),
+    "rle_file": (lambda params, log_level: _file_status(params, log_level, "rle", False), NO_FIELDS),
+    "rle_stream": (lambda params, log_level: _file_status(params, log_level, "rle", True), NO_FIELDS),
+    "packed_file": (lambda params, log_level: _file_status(params, log_level, "packed", False), NO_FIELDS),
+    "packed_stream": (lambda params, log_level: _file_status(params, log_level, "packed", True), NO_FIELDS),
+    "numpy": (lambda params, log_level: new_sim(params, log_level).execute_path(params['path'], engine="numpy"), NO_FIELDS),
+    "parallel": (lambda params, log_level: _parallel_status(params, log_level, False), NO_FIELDS),
+    "parallel_runs": (lambda params, log_level: _parallel_status(params, log_level, True), NO_FIELDS),
+    # Variants are simulated silently
+    "trie": (_trie_status, {"messages"}),
+}
+
+
+def first_difference(expected: Dict[str, Any], actual: Dict[str, Any], ignore: Set[str] = NO_FIELDS) -> Optional[str]:
+    """
+    Function: first_difference
+    First field differing between two Sim Status Structures (None if equal)
+
+    Args:
+        expected, actual: Dict[str, Any] - Sim Status Structures
+        ignore: Set[str] - fields not compared
+    """
+    for field in sorted((set(expected) | set(actual)) - ignore):
+        if expected.get(field) != actual.get(field):
+            return field
+    return None
+
+
+def run_differential(
+    scenarios: Iterable[Dict[str, Any]],
+    modes: Optional[List[str]] = None,
+    log_level: str = "summary") -> Dict[str, Any]:
+    """
+    Function: run_differential
+    Run every mode on every scenario, compare with the reference engine and record the throughput
+
+    Args:
+        scenarios: Iterable[Dict[str, Any]] - scenario params
+        modes: Optional[List[str]] - modes to run (default all, see MODES)
+        log_level: str - simulator log level (messages are compared too)
+
+    Output:
+        Dict[str, Any]:
+            "scenarios": int - scenarios run
+            "mismatches": List[Dict] - mode, test_name, seed, kind and the first differing field (or the error)
+            "throughput": Dict[str, Dict] - per mode (reference "python" included): scenarios, moves, seconds,
+                moves_per_s, or "skipped" with the reason
+    """
+    selected = list(MODES) if modes is None else modes
+    for mode in selected:
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode}. Expected one of {list(MODES)}")
+    throughput: Dict[str, Dict[str, Any]] = {mode: {"scenarios": 0, "moves": 0, "seconds": 0.0} for mode in ["python"] + selected}
+    mismatches: List[Dict[str, Any]] = []
+    count = 0
+
+    def timed(mode: str, run: Callable[[], Optional[Dict[str, Any]]], moves: int) -> Optional[Dict[str, Any]]:
+        start = time.perf_counter()
+        result = run()
+        if result is not None:
+            stats = throughput[mode]
+            stats["seconds"] += time.perf_counter() - start
+            stats["moves"] += moves
+            stats["scenarios"] += 1
+        return result
+
+    for params in scenarios:
+        count += 1
+        moves = len(params['path'])
+        reference = timed("python", lambda: new_sim(params, log_level).execute_path(params['path']), moves)
+        assert reference is not None
+        for mode in selected:
+            if "skipped" in throughput[mode]:
+                continue
+            runner, ignore = MODES[mode]
+            try:
+                result = timed(mode, lambda: runner(params, log_level), moves)
+            except ImportError as error:
+                throughput[mode] = {"skipped": f"{type(error).__name__}: {error}"}
+                continue
+            except Exception as error:
+                mismatches.append({"mode": mode, "test_name": params['test_name'], "seed": params.get('seed'),
+                                   "kind": params.get('kind'), "error": f"{type(error).__name__}: {error}"})
+                continue
+            field = None if result is None else first_difference(reference, result, ignore)
+            if field is not None:
+                mismatches.append({"mode": mode, "test_name": params['test_name'], "seed": params.get('seed'),
+                                   "kind": params.get('kind'), "field": field})
+
+    for stats in throughput.values():
+        if "skipped" not in stats:
+            stats["moves_per_s"] = stats["moves"] / stats["seconds"] if stats["seconds"] > 0 else 0.0
+    return {"scenarios": count, "mismatches": mismatches, "throughput": throughput}
+
+
+def main(argv: List[str]) -> int:
+    """
+    Function: main
+    Fuzz command line: generate scenarios, optionally write them, run the differential harness
+
+    Args:
+        argv: List[str] - arguments: [scenarios] [--seed N] [--max-grid N] [--max-moves N] [--density X]
+            [--modes a,b] [--write DIR]
+
+    Output:
+        int - exit code (1 if a mode differs from the reference)
+    """
+    count, seed, max_grid, max_moves, density = 200, 0, 30, 1000, 0.15
+    modes: Optional[List[str]] = None
+    folder = ""
+    args = iter(argv)
+    try:
+        for arg in args:
+            if arg.isdigit():
+                count = int(arg)
+            elif arg == "--seed":
+                seed = int(next(args))
+            elif arg == "--max-grid":
+                max_grid = int(next(args))
+            elif arg == "--max-moves":
+                max_moves = int(next(args))
+            elif arg == "--density":
+                density = float(next(args))
+            elif arg == "--modes":
+                modes = next(args).split(",")
+            elif arg == "--write":
+                folder = next(args)
+            else:
+                raise ValueError(arg)
+    except (StopIteration, ValueError):
+        print(f"\n--- Usage: lawnmower_fuzz.py [scenarios] [--seed N] [--max-grid N] [--max-moves N] [--density X] "
+              f"[--modes {','.join(MODES)}] [--write DIR]")
+        return 2
+
+    scenarios = list(generate_scenarios(count, seed, max_grid, max_moves, density))
+    if folder:
+        files = write_scenarios(scenarios, folder)
+        print(f"\n--- {len(files)} scenario files written to {folder}")
+    print(f"\n--- Lawnmower Simulator differential fuzzing: {count} scenarios, seed {seed}")
+    report = run_differential(scenarios, modes)
+    for mode, stats in report["throughput"].items():
+        if "skipped" in stats:
+            print(f"--- {mode:<15} skipped ({stats['skipped']})")
+        else:
+            print(f"--- {mode:<15} {stats['scenarios']:>6} scenarios {stats['moves_per_s']:>14,.0f} moves/s")
+    for mismatch in report["mismatches"]:
+        print(f"--- MISMATCH {json.dumps(mismatch)}")
+    print(f"\n--- {len(report['mismatches'])} mismatch(es) versus the reference engine")
+    return 1 if report["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
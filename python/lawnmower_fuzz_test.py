@@ -0,0 +1,75 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_fuzz_test.py
+
+Objectives:
+    Auto Test for Automated Robotic Lawnmower Simulator scenario generator and differential harness
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import importlib
+from typing import Any
+from python.lawnmower_sim import LawnmowerSim
+from python.lawnmower_core import parse_text_file
+from python.lawnmower_fuzz import generate_scenario, generate_scenarios, write_scenarios, run_differential, MODES
+
+def simulate(params: dict) -> dict:
+    return LawnmowerSim(params["test_name"], params["height"], params["width"], params["rocks"], params["start_pos"],
+                        log_level="off", log_sinks=[]).execute_path(params["path"])
+
+def test_fuzz_01_path_kinds() -> None:
+    """Verifies that crash paths always crash, walks and coverage paths never do, and coverage paths cut all the grass."""
+    print(f"\n---  Auto Test test_fuzz_01_path_kinds - generator guarantees")
+    for seed in range(30):
+        size = dict(height=1 + seed % 7, width=1 + seed % 5, density=0.3, outside_rocks=2, duplicate_rocks=1, start_outside=seed % 4 == 0)
+        assert simulate(generate_scenario(seed, kind="crash", length=50, **size))["did_mower_crash"]
+        assert not simulate(generate_scenario(seed, kind="walk", length=50, **size))["did_mower_crash"]
+        coverage = simulate(generate_scenario(seed, kind="coverage", **dict(size, start_outside=False)))
+        assert coverage["uncut_grass_remaining"] == 0 and not coverage["did_mower_crash"]
+    assert generate_scenario(5, kind="random", length=20) == generate_scenario(5, kind="random", length=20)
+
+def test_fuzz_02_definition_files(tmp_path: Any) -> None:
+    """Verifies that written scenarios parse back (parse_text_file) to the same lawn and path."""
+    print(f"\n---  Auto Test test_fuzz_02_definition_files - scenario files round trip")
+    scenarios = list(generate_scenarios(8, seed=2, max_grid=6, max_moves=30))
+    for params, filename in zip(scenarios, write_scenarios(scenarios, str(tmp_path))):
+        with open(filename, "r") as f:
+            parsed = parse_text_file(f.read())
+        assert parsed == {key: params[key] for key in ("test_name", "height", "width", "rocks", "start_pos", "path")}
+
+def test_fuzz_03_differential_all_modes(monkeypatch: Any) -> None:
+    """Verifies that every engine and mode returns exactly the reference sim_status and that throughput is recorded."""
+    print(f"\n---  Auto Test test_fuzz_03_differential_all_modes - differential harness")
+    # Single CPU runner: the parallel modes still shard (several shards per path with small chunks)
+    parallel = importlib.import_module("lawnmower_sim_parallel")
+    monkeypatch.setattr(parallel, "PARALLEL_WORKERS", 1)
+    monkeypatch.setattr(parallel, "CHUNK_SIZE", 16)
+    pools = []
+    get_parallel_pool = parallel.get_parallel_pool
+
+    def counted_pool() -> Any:
+        pools.append(1)
+        return get_parallel_pool()
+    monkeypatch.setattr(parallel, "get_parallel_pool", counted_pool)
+    report = run_differential(generate_scenarios(40, seed=1, max_grid=12, max_moves=200))
+    assert pools and parallel.PARALLEL_WORKERS == 1
+    assert report["scenarios"] == 40
+    assert report["mismatches"] == []
+    assert set(report["throughput"]) == {"python"} | set(MODES)
+    assert all(stats.get("moves_per_s", 0) > 0 or "skipped" in stats for stats in report["throughput"].values())
+
+def test_fuzz_04_mismatch_reported() -> None:
+    """Verifies that a mode returning a different sim_status is reported with the first differing field."""
+    print(f"\n---  Auto Test test_fuzz_04_mismatch_reported - mismatch detection")
+    broken = (lambda params, log_level: dict(simulate(params), uncut_grass_remaining=-1), {"messages"})
+    MODES["broken"] = broken
+    try:
+        report = run_differential(generate_scenarios(2, seed=4, max_grid=5, max_moves=10), modes=["broken"])
+    finally:
+        del MODES["broken"]
+    assert [mismatch["field"] for mismatch in report["mismatches"]] == ["uncut_grass_remaining"] * 2
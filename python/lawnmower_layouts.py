@@ -0,0 +1,255 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_layouts.py
+
+Objectives:
+    Lawn layout registry of Automated Robotic Lawnmower Simulator
+    A layout (grid and rocks) is validated and compiled once into an immutable binary file:
+        header        magic, height, width, number of valid rocks
+        occupancy     one byte per cell (1 = rock), indexed by row*width+col (same map as GridState.rocks)
+        rock indexes  valid rocks in input order as int64 cell indexes (valid_rocks output)
+    Layouts are content addressed: the layout id is the canonical layout hash (lawnmower_reach.layout_key),
+    so uploading the same lawn twice gives the same id
+    Files are memory-mapped read-only: simulations use the occupancy map in place without re-filtering the rocks,
+    and all the server workers of a host share the same pages (OS page cache) instead of holding their own copy
+
+Configuration (environment variables):
+    LAWNMOWER_LAYOUT_DIR       layout store folder (default ./results/layouts)
+    LAWNMOWER_LAYOUT_OPEN      layouts kept mapped per process (default 64)
+
+Execution:
+    layout = create_layout(height, width, rocks)
+    params = {"layout_id": layout.layout_id, "start_pos": ..., "path": ...} # see execute_and_report
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import os
+import re
+import mmap
+import struct
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict
+from typing import List, Dict, Any, Tuple, Optional
+from lawnmower_reach import layout_key
+
+# Default configuration
+LAYOUT_DIR: str = os.environ.get("LAWNMOWER_LAYOUT_DIR", "./results/layouts")
+LAYOUT_OPEN: int = int(os.environ.get("LAWNMOWER_LAYOUT_OPEN", 64))
+
+# Binary file format
+LAYOUT_MAGIC: bytes = b"LAWNLYT1"
+LAYOUT_HEADER = struct.Struct("<8sQQQ") # magic, height, width, valid rocks
+LAYOUT_ID_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+class LayoutNotFound(KeyError):
+    """
+    Raised when a layout id is malformed or not in the store
+    """
+
+
+class Layout:
+    """
+    Layout Class Definition
+    Immutable compiled lawn layout, memory-mapped read-only from the store
+    """
+
+    def __init__(self, layout_id: str, filename: str) -> None:
+        """
+        Method: __init__ (Object Creation)
+        Map a layout file
+
+        Args:
+            layout_id (str): layout id (file name in the store)
+            filename (str): layout file path
+        """
+        with open(filename, "rb") as f:
+            self.mapping: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, height, width, rock_count = LAYOUT_HEADER.unpack_from(self.mapping, 0)
+        if magic != LAYOUT_MAGIC:
+            raise ValueError(f"{filename} is not a lawn layout file")
+        self.layout_id: str = layout_id
+        self.height: int = height
+        self.width: int = width
+        self.rock_count: int = rock_count
+        cells = height * width
+        start = LAYOUT_HEADER.size
+        # Views on the mapping (no copy). The mapping stays open as long as a view is in use
+        self.occupancy: memoryview = memoryview(self.mapping)[start:start + cells]
+        start = _aligned(start + cells)
+        self.rock_indexes: memoryview = memoryview(self.mapping)[start:start + 8 * rock_count].cast("q")
+
+    def valid_rocks(self) -> List[Tuple[int, int]]:
+        """
+        Method: valid_rocks
+        Rocks inside the grid in input order, without repetitions (same as LawnmowerSim.valid_rocks)
+        """
+        width = self.width
+        return [divmod(index, width) for index in self.rock_indexes]
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Method: describe
+        Layout metadata (GET /layouts/{layout_id})
+        """
+        return {
+            "layout_id": self.layout_id,
+            "height": self.height,
+            "width": self.width,
+            "valid_rock_count": self.rock_count,
+            "total_grass_squares": self.height * self.width - self.rock_count,
+            "bytes": len(self.mapping),
+        }
+
+
+def _aligned(offset: int) -> int:
+    # Rock indexes start on an 8 byte boundary
+    return (offset + 7) & ~7
+
+
+def _layout_file(layout_id: str, store: str) -> str:
+    """
+    Function: _layout_file
+    Path of a layout in the store. The id is checked first, as it is used as a file name
+
+    Args:
+        layout_id: str - layout id
+        store: str - layout store folder
+    """
+    if not isinstance(layout_id, str) or not LAYOUT_ID_PATTERN.match(layout_id):
+        raise LayoutNotFound(f"Invalid layout id {layout_id!r}")
+    return os.path.join(store, f"{layout_id}.layout")
+
+
+def validate_layout(height: Any, width: Any, rocks: Any) -> Tuple[int, int, List[int], int]:
+    """
+    Function: validate_layout
+    Check a layout definition. Rocks outside the grid are disregarded (as by the simulator) and counted
+
+    Args:
+        height: Any - grid height (integer >= 1)
+        width: Any - grid width (integer >= 1)
+        rocks: Any - list of [row, col] integer pairs
+
+    Output:
+        Tuple - height, width, valid rock cell indexes in input order without repetitions, outside rocks.
+        Raises ValueError on an invalid definition
+    """
+    for name, value in (("height", height), ("width", width)):
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise ValueError(f"{name} must be an integer >= 1, got {value!r}")
+    if not isinstance(rocks, (list, tuple)):
+        raise ValueError("rocks must be a list of [row, col] pairs")
+    indexes: Dict[int, bool] = {}
+    outside = 0
+    for rock in rocks:
+        if (not isinstance(rock, (list, tuple)) or len(rock) != 2
+                or not all(isinstance(v, int) and not isinstance(v, bool) for v in rock)):
+            raise ValueError(f"Invalid rock {rock!r}: expected [row, col] integers")
+        if 0 <= rock[0] < height and 0 <= rock[1] < width:
+            indexes[rock[0] * width + rock[1]] = True
+        else:
+            outside += 1
+    return height, width, list(indexes.keys()), outside
+
+
+def create_layout(height: Any, width: Any, rocks: Any, store: Optional[str] = None) -> Tuple[Layout, int]:
+    """
+    Function: create_layout
+    Validate and compile a layout into the store (nothing is written if the same layout already exists)
+
+    Args:
+        height: Any - grid height
+        width: Any - grid width
+        rocks: Any - rock coordinates
+        store: Optional[str] - layout store folder (default LAYOUT_DIR)
+
+    Output:
+        Tuple[Layout, int] - mapped layout and number of rocks outside the grid (disregarded).
+        Raises ValueError on an invalid definition
+    """
+    store = store or LAYOUT_DIR
+    height, width, indexes, outside = validate_layout(height, width, rocks)
+    layout_id = layout_key(height, width, [list(divmod(index, width)) for index in indexes])
+    filename = _layout_file(layout_id, store)
+    if not os.path.exists(filename):
+        occupancy = bytearray(height * width)
+        for index in indexes:
+            occupancy[index] = 1
+        header = LAYOUT_HEADER.pack(LAYOUT_MAGIC, height, width, len(indexes))
+        padding = bytes(_aligned(len(header) + len(occupancy)) - len(header) - len(occupancy))
+        # Written to a temporary file and renamed: workers never map a partial layout
+        os.makedirs(store, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=store, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as f:
+                f.write(header)
+                f.write(occupancy)
+                f.write(padding)
+                f.write(array("q", indexes).tobytes())
+            os.replace(temporary, filename)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+    return get_layout(layout_id, store), outside
+
+
+# Layouts mapped by this process
+_layouts: "OrderedDict[Tuple[str, str], Layout]" = OrderedDict()
+_layouts_lock = threading.Lock()
+
+
+def get_layout(layout_id: str, store: Optional[str] = None) -> Layout:
+    """
+    Function: get_layout
+    Mapped layout of an id, mapped once per process (LRU of LAYOUT_OPEN layouts).
+    Evicted layouts are not closed: their mapping is released once no simulation uses it
+
+    Args:
+        layout_id: str - layout id
+        store: Optional[str] - layout store folder (default LAYOUT_DIR)
+
+    Output:
+        Layout. Raises LayoutNotFound for a malformed or unknown id
+    """
+    store = store or LAYOUT_DIR
+    filename = _layout_file(layout_id, store)
+    key = (store, layout_id)
+    with _layouts_lock:
+        layout = _layouts.get(key)
+        if layout is not None:
+            _layouts.move_to_end(key)
+            return layout
+    if not os.path.exists(filename):
+        raise LayoutNotFound(f"Unknown layout id {layout_id}")
+    layout = Layout(layout_id, filename)
+    with _layouts_lock:
+        _layouts[key] = layout
+        while len(_layouts) > LAYOUT_OPEN:
+            _layouts.popitem(last=False)
+    return layout
+
+
+def apply_layout(params: Dict[str, Any]) -> Optional[Layout]:
+    """
+    Function: apply_layout
+    Layout referenced by params['layout_id'] (None without it). The grid dimensions of the params are set
+    from the layout and rocks to an empty list, as the rocks come from the layout
+
+    Args:
+        params: Dict[str, Any] - simulation params (see execute_and_report)
+    """
+    if not params.get('layout_id'):
+        return None
+    layout = get_layout(params['layout_id'])
+    params['height'], params['width'], params['rocks'] = layout.height, layout.width, []
+    return layout
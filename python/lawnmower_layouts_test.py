@@ -0,0 +1,73 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_layouts_test.py
+
+Objectives:
+    Auto Test for Automated Robotic Lawnmower Simulator lawn layout registry
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import random
+from typing import Any
+import pytest
+from fastapi.testclient import TestClient
+import python.lawnmower_cli_api as cli_api
+from python.lawnmower_sim import LawnmowerSim
+from python.lawnmower_layouts import LayoutNotFound, create_layout, get_layout
+
+def test_layouts_01_compiled_layout_simulation(tmp_path: Any, monkeypatch: Any) -> None:
+    """Verifies that a registered layout is content addressed and simulates exactly like the embedded rocks."""
+    print(f"\n---  Auto Test test_layouts_01_compiled_layout_simulation - layout vs rocks")
+    store = str(tmp_path)
+    rng = random.Random(13)
+    rocks = [[rng.randrange(9), rng.randrange(8)] for _ in range(20)] + [[9, 0], [-1, 3]]
+    layout, outside = create_layout(9, 8, rocks, store)
+    assert outside == 2
+    assert create_layout(9, 8, rocks[::-1], store)[0].layout_id == layout.layout_id
+    assert get_layout(layout.layout_id, store) is layout
+    path = [rng.choice(["up", "down", "left", "right"]) for _ in range(60)]
+    for engine in ("python", "numpy"):
+        embedded = LawnmowerSim("layout", 9, 8, rocks, [4, 4], log_level="off", log_sinks=[]).execute_path(path, engine=engine)
+        registered = LawnmowerSim("layout", 9, 8, [], [4, 4], log_level="off", log_sinks=[], layout=layout).execute_path(path, engine=engine)
+        assert registered.pop("layout_id") == layout.layout_id
+        assert dict(registered, rock_locations=rocks) == embedded
+
+    # Reachability of a registered layout: the labelling is found by the layout id, without reading the rocks
+    reachable = LawnmowerSim("layout", 9, 8, rocks, [4, 4], log_level="off", log_sinks=[]).reachability()
+    monkeypatch.setattr(layout, "valid_rocks", lambda: pytest.fail("rocks read on a reachability cache hit"))
+    assert LawnmowerSim("layout", 9, 8, [], [4, 4], log_level="off", log_sinks=[], layout=layout).reachability() == reachable
+
+    # Invalid definitions and ids
+    for height, width, bad_rocks in ((0, 3, []), (3, "3", []), (3, 3, [[1]]), (3, 3, [[1, 1.5]])):
+        with pytest.raises(ValueError):
+            create_layout(height, width, bad_rocks, store)
+    for layout_id in ("0" * 64, "../etc/passwd"):
+        with pytest.raises(LayoutNotFound):
+            get_layout(layout_id, store)
+
+def test_layouts_02_api_register_and_simulate(monkeypatch: Any, tmp_path: Any) -> None:
+    """Verifies POST /layouts, GET /layouts/{id} and /simulate referencing a layout_id instead of rocks."""
+    print(f"\n---  Auto Test test_layouts_02_api_register_and_simulate - layouts API")
+    monkeypatch.chdir(tmp_path)
+    client = TestClient(cli_api.app_lawnmower_simulation)
+    response = client.post("/layouts", files={"file": ("lawn.txt", b'height=3\nwidth=3\nrocks=[[1,1],[5,5]]\n', "text/plain")})
+    assert response.status_code == 200
+    layout = response.json()
+    assert (layout["valid_rock_count"], layout["total_grass_squares"], layout["ignored_rocks"]) == (1, 8, 1)
+    described = client.get(f"/layouts/{layout['layout_id']}", params={"include_rocks": "true"}).json()
+    assert described["valid_rocks"] == [[1, 1]]
+
+    definition = f'test_name="by_layout"\nlayout_id="{layout["layout_id"]}"\nstart_pos=[0,0]\npath=["Right","Down"]\n'
+    response = client.post("/simulate", params={"cache": "false"}, files={"file": ("scenario.txt", definition.encode(), "text/plain")})
+    assert response.status_code == 200
+    assert response.json()["crash_reason"] == "Crashed into Rock"
+    assert client.get("/layouts/" + "f" * 64).status_code == 404
+    assert client.post("/layouts", files={"file": ("lawn.txt", b'height=0\nwidth=3\nrocks=[]\n', "text/plain")}).status_code == 422
+    definition = 'test_name="unknown"\nstart_pos=[0,0]\npath=["Right"]\n'
+    response = client.post("/simulate", params={"layout_id": "a" * 64}, files={"file": ("scenario.txt", definition.encode(), "text/plain")})
+    assert response.status_code == 404
@@ -0,0 +1,257 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_loadtest.py
+
+Objectives:
+    Load generator for the /simulate endpoint of a running API server (local, docker or k8s service)
+    Replays the ./tests scenario files and synthetic large scenarios (serpentine sweeps of a 1000 x 1000 lawn)
+    at increasing concurrency levels. Every level sends a fixed number of requests through N concurrent clients
+    (asyncio + httpx, keep-alive connections) and reports:
+        throughput (served requests per second, 2xx responses only)
+        latency percentiles p50, p90, p99 and max of the served requests
+        shed requests (429 queue full, 503 queue timeout or concurrency limit, other 5xx) and connection errors
+        errors: other 4xx answers (e.g. 404, 422), not served and not counted in the latencies
+    The sustainable concurrency is the highest level with nothing shed, no errors and p99 within the latency objective.
+    Run against a single pod (kubectl port-forward) it sets the per pod targets of lawnmower_sim_k8s_hpa.yaml
+    (lawnmower_requests_in_flight below it, see README)
+    Result cache disabled and log level off, so every request simulates
+
+Execution:
+    python ./python/lawnmower_cli.py --api
+    python ./python/lawnmower_loadtest.py [--url http://localhost:8000] [--levels 1,2,4,8,16,32] [--requests 200]
+        [--tests ./tests] [--large 10000,100000] [--slo-ms 1000] [--full-response]
+    The report is also saved under ./results/loadtest_<timestamp>.json
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import os
+import sys
+import glob
+import json
+import math
+import time
+import asyncio
+from datetime import datetime
+from typing import List, Dict, Any, Tuple, Optional
+
+# Default configuration
+DEFAULT_URL: str = "http://localhost:8000"
+DEFAULT_LEVELS: List[int] = [1, 2, 4, 8, 16, 32]
+DEFAULT_REQUESTS: int = 200
+DEFAULT_LARGE: List[int] = [10000, 100000]
+DEFAULT_SLO_MS: float = 1000.0
+LARGE_GRID: int = 1000
+REQUEST_TIMEOUT: float = 120.0
+
+# Scenario: (name, definition file content)
+Scenario = Tuple[str, bytes]
+
+
+def load_scenarios(tests_dir: str = "./tests", large: Optional[List[int]] = None) -> List[Scenario]:
+    """
+    Function: load_scenarios
+    Scenario files of a folder followed by the synthetic large scenarios
+
+    Args:
+        tests_dir: str - folder of .txt definition files ("" for none)
+        large: Optional[List[int]] - path lengths of the synthetic scenarios (default DEFAULT_LARGE)
+
+    Output:
+        List[Scenario] - (name, definition file content) pairs
+    """
+    scenarios: List[Scenario] = []
+    for filename in sorted(glob.glob(os.path.join(tests_dir, "*.txt"))) if tests_dir else []:
+        with open(filename, "rb") as f:
+            scenarios.append((os.path.basename(filename), f.read()))
+    lengths = DEFAULT_LARGE if large is None else large
+    if lengths:
+        # Lazy import: the simulator is only needed to build the synthetic scenarios
+        from lawnmower_benchmark import sweep_path, definition_text
+        for length in lengths:
+            path, _ = sweep_path(LARGE_GRID, LARGE_GRID, length)
+            name = f"large_{length}"
+            scenarios.append((f"{name}.txt", definition_text(name, LARGE_GRID, LARGE_GRID, [], path).encode("utf-8")))
+    return scenarios
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Function: percentile
+    Nearest rank percentile of sorted values (0 if empty)
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values), max(1, math.ceil(q / 100 * len(values)))) - 1]
+
+
+async def run_level(client: Any, scenarios: List[Scenario], concurrency: int, requests: int,
+                    params: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Function: run_level
+    Send requests through concurrent clients, cycling over the scenarios
+
+    Args:
+        client: httpx.AsyncClient - client of the API server
+        scenarios: List[Scenario] - scenarios replayed in turn
+        concurrency: int - concurrent clients
+        requests: int - requests sent at this level
+        params: Dict[str, str] - /simulate query parameters
+
+    Output:
+        Dict[str, Any] - throughput, latency percentiles (ms) and status counts of the level.
+            served: 2xx answers, errors: other 4xx answers, shed: the rest (429, 5xx, connection errors)
+    """
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    next_request = iter(range(requests))
+
+    async def worker() -> None:
+        for index in next_request:
+            name, content = scenarios[index % len(scenarios)]
+            start = time.perf_counter()
+            try:
+                response = await client.post("/simulate", params=params, files={"file": (name, content, "text/plain")})
+                status = str(response.status_code)
+            except Exception as error: # connection refused, reset, timeout
+                status = type(error).__name__
+            elapsed = time.perf_counter() - start
+            statuses[status] = statuses.get(status, 0) + 1
+            if status.startswith("2"):
+                latencies.append(elapsed)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    duration = time.perf_counter() - start
+    latencies.sort()
+    # Client errors (bad scenario, unknown layout): neither served nor shed
+    errors = sum(count for status, count in statuses.items() if status.startswith("4") and status != "429")
+    return {
+        "concurrency": concurrency,
+        "requests": requests,
+        "served": len(latencies),
+        "errors": errors,
+        "shed": requests - len(latencies) - errors,
+        "statuses": dict(sorted(statuses.items())),
+        "duration_s": round(duration, 3),
+        "throughput_rps": round(len(latencies) / duration, 2) if duration > 0 else 0.0,
+        "latency_ms": {name: round(percentile(latencies, q) * 1000, 2) for name, q in (("p50", 50), ("p90", 90), ("p99", 99), ("max", 100))},
+    }
+
+
+async def run_load(client: Any, scenarios: List[Scenario], levels: List[int], requests: int,
+                   slo_ms: float = DEFAULT_SLO_MS, full_response: bool = False) -> Dict[str, Any]:
+    """
+    Function: run_load
+    Run every concurrency level in turn (after one warm up request per scenario)
+
+    Args:
+        client: httpx.AsyncClient - client of the API server
+        scenarios: List[Scenario] - scenarios replayed
+        levels: List[int] - concurrency levels
+        requests: int - requests per level
+        slo_ms: float - p99 latency objective in milliseconds
+        full_response: bool - ask for the full sim_status instead of the verdict only
+
+    Output:
+        Dict[str, Any] - {"levels": [...], "sustainable": level report or None}
+    """
+    params = {"log_level": "off", "cache": "false"}
+    if not full_response:
+        params["summary"] = "true"
+    await run_level(client, scenarios, 1, len(scenarios), params) # warm up
+    report: Dict[str, Any] = {"scenarios": [name for name, _ in scenarios], "slo_ms": slo_ms, "levels": [], "sustainable": None}
+    for concurrency in levels:
+        level = await run_level(client, scenarios, concurrency, requests, params)
+        report["levels"].append(level)
+        if level["shed"] == 0 and level["errors"] == 0 and level["latency_ms"]["p99"] <= slo_ms:
+            report["sustainable"] = level
+    return report
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """
+    Function: print_report
+    Print one line per concurrency level and the sustainable concurrency
+    """
+    print(f"\n--- {'clients':>7} {'req/s':>9} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9} {'shed':>6} {'errors':>6}  statuses")
+    for level in report["levels"]:
+        latency = level["latency_ms"]
+        print(f"--- {level['concurrency']:>7} {level['throughput_rps']:>9.1f} {latency['p50']:>9.1f} {latency['p90']:>9.1f} "
+              f"{latency['p99']:>9.1f} {latency['max']:>9.1f} {level['shed']:>6} {level['errors']:>6}  {json.dumps(level['statuses'])}")
+    sustainable = report["sustainable"]
+    if sustainable:
+        print(f"\n--- Sustainable concurrency (nothing shed, no errors, p99 <= {report['slo_ms']:.0f} ms): {sustainable['concurrency']} "
+              f"clients, {sustainable['throughput_rps']:.1f} req/s")
+    else:
+        print(f"\n--- No level met the objective (nothing shed, no errors, p99 <= {report['slo_ms']:.0f} ms)")
+
+
+def main(argv: List[str]) -> int:
+    """
+    Function: main
+    Load test command line
+
+    Args:
+        argv: List[str] - arguments: [--url URL] [--levels 1,2,4] [--requests N] [--tests DIR] [--large 10000,100000]
+            [--slo-ms X] [--full-response]
+
+    Output:
+        int - exit code (1 if no level met the objective)
+    """
+    url, tests_dir, levels, requests = DEFAULT_URL, "./tests", DEFAULT_LEVELS, DEFAULT_REQUESTS
+    large, slo_ms, full_response = DEFAULT_LARGE, DEFAULT_SLO_MS, False
+    args = iter(argv)
+    try:
+        for arg in args:
+            if arg == "--url":
+                url = next(args)
+            elif arg == "--levels":
+                levels = [int(level) for level in next(args).split(",")]
+            elif arg == "--requests":
+                requests = int(next(args))
+            elif arg == "--tests":
+                tests_dir = next(args)
+            elif arg == "--large":
+                large = [int(length) for length in next(args).split(",") if length]
+            elif arg == "--slo-ms":
+                slo_ms = float(next(args))
+            elif arg == "--full-response":
+                full_response = True
+            else:
+                raise ValueError(arg)
+    except (StopIteration, ValueError):
+        print(f"\n--- Usage: lawnmower_loadtest.py [--url URL] [--levels 1,2,4] [--requests N] [--tests DIR] "
+              f"[--large 10000,100000] [--slo-ms X] [--full-response]")
+        return 2
+
+    import httpx
+    scenarios = load_scenarios(tests_dir, large)
+    if not scenarios:
+        print(f"\n--- No scenarios to replay")
+        return 2
+    print(f"\n--- Lawnmower Simulator load test of {url}/simulate: {len(scenarios)} scenarios, {requests} requests per level")
+
+    async def run() -> Dict[str, Any]:
+        limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+        async with httpx.AsyncClient(base_url=url, timeout=REQUEST_TIMEOUT, limits=limits) as client:
+            return await run_load(client, scenarios, levels, requests, slo_ms, full_response)
+
+    report = asyncio.run(run())
+    report["url"] = url
+    print_report(report)
+    os.makedirs("./results", exist_ok=True)
+    report_file = f"./results/loadtest_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(report_file, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"--- Report saved to {report_file}")
+    return 0 if report["sustainable"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
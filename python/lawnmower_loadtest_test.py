@@ -0,0 +1,63 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_loadtest_test.py
+
+Objectives:
+    Auto Test for Automated Robotic Lawnmower Simulator /simulate load generator
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import os
+import asyncio
+import httpx
+from typing import Any, Dict
+import lawnmower_results
+import python.lawnmower_cli_api as cli_api
+from python.lawnmower_loadtest import load_scenarios, percentile, run_load
+
+TESTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests")
+
+def test_loadtest_01_in_process(tmp_path: Any, monkeypatch: Any) -> None:
+    """Verifies that every level replays the ./tests and synthetic scenarios and reports throughput and latency."""
+    print(f"\n---  Auto Test test_loadtest_01_in_process - run_load over the ASGI app")
+    monkeypatch.chdir(tmp_path)
+    # Results sink of the module imported by the server (python/ on sys.path)
+    monkeypatch.setattr(lawnmower_results, "_results_sink", lawnmower_results.FileResults(str(tmp_path / "results")))
+    scenarios = load_scenarios(TESTS_DIR, [2000])
+    assert len(scenarios) == 5 and scenarios[-1][0] == "large_2000.txt"
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0 and percentile([1.0, 2.0], 99) == 2.0 and percentile([], 50) == 0.0
+
+    async def run() -> Dict[str, Any]:
+        transport = httpx.ASGITransport(app=cli_api.app_lawnmower_simulation)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+            return await run_load(client, scenarios, [1, 4], 10, slo_ms=60000)
+
+    report = asyncio.run(run())
+    assert [level["concurrency"] for level in report["levels"]] == [1, 4]
+    for level in report["levels"]:
+        assert level["served"] == 10 and level["shed"] == 0 and sum(level["statuses"].values()) == 10
+        assert level["throughput_rps"] > 0 and 0 < level["latency_ms"]["p50"] <= level["latency_ms"]["p99"] <= level["latency_ms"]["max"]
+    assert report["sustainable"]["concurrency"] == 4
+
+def test_loadtest_02_client_errors_not_served(tmp_path: Any, monkeypatch: Any) -> None:
+    """Verifies that 4xx answers are reported as errors, left out of the latencies, and disqualify the level."""
+    print(f"\n---  Auto Test test_loadtest_02_client_errors_not_served - 422 counted as errors")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(lawnmower_results, "_results_sink", lawnmower_results.FileResults(str(tmp_path / "results")))
+    scenarios = load_scenarios(TESTS_DIR, [])
+    invalid = ("invalid.txt", b'test_name="invalid"\nheight=3\nwidth=3\nrocks=[]\nstart_pos=[0,0]\npath="R2Q9"\n')
+
+    async def run() -> Dict[str, Any]:
+        transport = httpx.ASGITransport(app=cli_api.app_lawnmower_simulation)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+            return await run_load(client, scenarios[:1] + [invalid], [2], 10, slo_ms=60000)
+
+    report = asyncio.run(run())
+    level = report["levels"][0]
+    assert level["served"] == 5 and level["errors"] == 5 and level["shed"] == 0 and level["statuses"] == {"200": 5, "422": 5}
+    assert report["sustainable"] is None
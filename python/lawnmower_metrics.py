@@ -0,0 +1,197 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_metrics.py
+
+Objectives:
+    Prometheus metrics of the Automated Robotic Lawnmower Simulator service (GET /metrics)
+        lawnmower_request_duration_seconds      request latency by endpoint, method and status
+        lawnmower_requests_in_flight            requests being served
+        lawnmower_phase_duration_seconds        time per request phase: upload, parse, construct, execute, serialise, write
+        lawnmower_simulations_total             simulations by result (crash, no_crash, cached)
+        lawnmower_crashes_total                 crashes by crash_reason
+        lawnmower_moves_total                   moves read by the simulator
+        lawnmower_moves_per_second              simulator throughput per simulation
+        lawnmower_path_length_moves             path length distribution (moves read)
+        lawnmower_grid_cells                    grid size distribution (cells)
+        lawnmower_simulate_running / _waiting   bounded executor occupancy (see lawnmower_offload)
+        lawnmower_streams_open                  simulation streams open (see lawnmower_offload)
+        lawnmower_simulate_rejected_total       backpressure rejections by status (429, 503)
+    Server workers are separate processes: with PROMETHEUS_MULTIPROC_DIR set (done by --api, see prepare_multiprocess_dir)
+    every worker writes its values to that folder and /metrics aggregates all the workers, whichever serves it
+
+Configuration (environment variables):
+    PROMETHEUS_MULTIPROC_DIR   multi-process metrics folder (set by --api to ./results/prometheus when not defined)
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import os
+import time
+import shutil
+from contextlib import contextmanager
+from typing import Dict, Any, Tuple, Iterator, Iterable, Optional, Sized
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import multiprocess
+
+# Default multi-process metrics folder of the API server
+MULTIPROC_DIR: str = "./results/prometheus"
+
+# Histogram buckets
+LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+MOVES_BUCKETS: Tuple[float, ...] = (1, 10, 100, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8)
+CELLS_BUCKETS: Tuple[float, ...] = (1, 100, 1e4, 1e5, 1e6, 1e7, 1e8)
+THROUGHPUT_BUCKETS: Tuple[float, ...] = (1e3, 1e4, 1e5, 1e6, 1e7, 1e8)
+
+# Metrics of this process (own registry: the module can be loaded twice in tests without clashing names)
+REGISTRY = CollectorRegistry(auto_describe=True)
+REQUEST_DURATION = Histogram("lawnmower_request_duration_seconds", "Request latency (until the response starts)",
+                             ["endpoint", "method", "status"], buckets=LATENCY_BUCKETS, registry=REGISTRY)
+REQUESTS_IN_FLIGHT = Gauge("lawnmower_requests_in_flight", "Requests being served",
+                           multiprocess_mode="livesum", registry=REGISTRY)
+PHASE_DURATION = Histogram("lawnmower_phase_duration_seconds", "Time spent per request phase",
+                           ["phase"], buckets=LATENCY_BUCKETS, registry=REGISTRY)
+SIMULATIONS = Counter("lawnmower_simulations_total", "Simulations by result", ["result"], registry=REGISTRY)
+CRASHES = Counter("lawnmower_crashes_total", "Crashes by reason", ["crash_reason"], registry=REGISTRY)
+MOVES = Counter("lawnmower_moves_total", "Moves read by the simulator", registry=REGISTRY)
+MOVES_PER_SECOND = Histogram("lawnmower_moves_per_second", "Simulator throughput per simulation",
+                             buckets=THROUGHPUT_BUCKETS, registry=REGISTRY)
+PATH_LENGTH = Histogram("lawnmower_path_length_moves", "Path length (moves read)", buckets=MOVES_BUCKETS, registry=REGISTRY)
+GRID_CELLS = Histogram("lawnmower_grid_cells", "Grid size (cells)", buckets=CELLS_BUCKETS, registry=REGISTRY)
+SIMULATE_RUNNING = Gauge("lawnmower_simulate_running", "Simulations running on the bounded executor",
+                         multiprocess_mode="livesum", registry=REGISTRY)
+SIMULATE_WAITING = Gauge("lawnmower_simulate_waiting", "Simulations waiting in the bounded executor queue",
+                         multiprocess_mode="livesum", registry=REGISTRY)
+STREAMS_OPEN = Gauge("lawnmower_streams_open", "Simulation streams open (/simulate/stream)",
+                     multiprocess_mode="livesum", registry=REGISTRY)
+SIMULATE_REJECTED = Counter("lawnmower_simulate_rejected_total", "Simulations rejected by backpressure",
+                            ["status"], registry=REGISTRY)
+
+
+@contextmanager
+def observe_phase(phase: str) -> Iterator[None]:
+    """
+    Function: observe_phase
+    Context manager timing a request phase into lawnmower_phase_duration_seconds
+
+    Args:
+        phase: str - upload, parse, construct, execute, serialise or write
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        PHASE_DURATION.labels(phase).observe(time.perf_counter() - start)
+
+
+class MoveCounter:
+    """
+    Move Counter Class Definition
+    Counts the moves of a path as the simulator reads it. Lists are counted at once (kept as lists for
+    the engines and early exit); streamed paths and runs are counted while pulled, so they stop at a crash
+    """
+    __slots__ = ("moves",)
+
+    def __init__(self) -> None:
+        self.moves: int = 0
+
+    def path(self, path: Iterable[str]) -> Iterable[str]:
+        """
+        Method: path
+        Counted path of moves
+
+        Args:
+            path: Iterable[str] - sequence of moves
+        """
+        if isinstance(path, Sized):
+            self.moves = len(path)
+            return path
+        return self._count_moves(path)
+
+    def _count_moves(self, path: Iterable[str]) -> Iterator[str]:
+        for move in path:
+            self.moves += 1
+            yield move
+
+    def runs(self, runs: Iterable[Tuple[str, int]]) -> Iterable[Tuple[str, int]]:
+        """
+        Method: runs
+        Counted runs (move, count)
+
+        Args:
+            runs: Iterable[Tuple[str, int]] - runs of identical moves
+        """
+        if isinstance(runs, Sized):
+            self.moves = sum(count for _, count in runs)
+            return runs
+        return self._count_runs(runs)
+
+    def _count_runs(self, runs: Iterable[Tuple[str, int]]) -> Iterator[Tuple[str, int]]:
+        for move, count in runs:
+            self.moves += count
+            yield move, count
+
+
+def record_simulation(sim_status: Dict[str, Any], moves: Optional[int], seconds: float) -> None:
+    """
+    Function: record_simulation
+    Record the execute phase, outcome, size and throughput of an executed simulation
+
+    Args:
+        sim_status: Dict[str, Any] - Sim Status Structure
+        moves: Optional[int] - moves read by the simulator (None if unknown, see MoveCounter)
+        seconds: float - execution time
+    """
+    PHASE_DURATION.labels("execute").observe(seconds)
+    SIMULATIONS.labels("crash" if sim_status['did_mower_crash'] else "no_crash").inc()
+    if sim_status['did_mower_crash']:
+        CRASHES.labels(sim_status['crash_reason']).inc()
+    GRID_CELLS.observe(sim_status['grid_height'] * sim_status['grid_width'])
+    if moves is not None:
+        MOVES.inc(moves)
+        PATH_LENGTH.observe(moves)
+        if seconds > 0:
+            MOVES_PER_SECOND.observe(moves / seconds)
+
+
+def prepare_multiprocess_dir(path: str = MULTIPROC_DIR) -> str:
+    """
+    Function: prepare_multiprocess_dir
+    Empty multi-process metrics folder exported as PROMETHEUS_MULTIPROC_DIR, for the server workers started after it.
+    Must run before the workers import prometheus_client. An existing PROMETHEUS_MULTIPROC_DIR is kept (and emptied)
+
+    Args:
+        path: str - folder used when PROMETHEUS_MULTIPROC_DIR is not defined
+    """
+    path = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", path)
+    shutil.rmtree(path, ignore_errors=True) # values of a previous server run
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def mark_worker_dead() -> None:
+    """
+    Function: mark_worker_dead
+    Drop the live gauges of this worker at shutdown (multi-process mode only)
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def metrics_payload() -> Tuple[bytes, str]:
+    """
+    Function: metrics_payload
+    Prometheus text exposition of the metrics: all the server workers in multi-process mode, this process otherwise
+
+    Output:
+        Tuple[bytes, str] - payload and content type
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,64 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_metrics_test.py
+
+Objectives:
+    Auto Test for Automated Robotic Lawnmower Simulator Prometheus metrics
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import os
+import sys
+import subprocess
+from typing import Any, Dict
+from prometheus_client.parser import text_string_to_metric_families
+from fastapi.testclient import TestClient
+import python.lawnmower_cli_api as cli_api
+
+PYTHON_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def samples(text: str) -> Dict[Any, float]:
+    return {(sample.name, tuple(sorted(sample.labels.items()))): sample.value
+            for family in text_string_to_metric_families(text) for sample in family.samples}
+
+def test_metrics_01_simulate_phases_and_outcomes(monkeypatch: Any, tmp_path: Any) -> None:
+    """Verifies that /simulate records every phase, the crash reason, the path length and the request latency."""
+    print(f"\n---  Auto Test test_metrics_01_simulate_phases_and_outcomes - /metrics")
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("results")
+    client = TestClient(cli_api.app_lawnmower_simulation)
+    before = samples(client.get("/metrics").text)
+    definition = b'test_name="metrics"\nheight=3\nwidth=3\nrocks=[[1,0]]\nstart_pos=[0,0]\npath=["Right","Down","Left"]\n'
+    assert client.post("/simulate", params={"cache": "false"}, files={"file": ("scenario.txt", definition, "text/plain")}).status_code == 200
+    after = samples(client.get("/metrics").text)
+
+    def delta(name: str, **labels: str) -> float:
+        key = (name, tuple(sorted(labels.items())))
+        return after.get(key, 0.0) - before.get(key, 0.0)
+
+    for phase in ("upload", "parse", "construct", "execute", "serialise", "write"):
+        assert delta("lawnmower_phase_duration_seconds_count", phase=phase) == 1
+    assert delta("lawnmower_crashes_total", crash_reason="Crashed into Rock") == 1
+    assert delta("lawnmower_moves_total") == 3
+    assert delta("lawnmower_request_duration_seconds_count", endpoint="/simulate", method="POST", status="200") == 1
+
+def test_metrics_02_multiprocess_aggregation(tmp_path: Any) -> None:
+    """Verifies that the metrics of separate worker processes are aggregated by any of them."""
+    print(f"\n---  Auto Test test_metrics_02_multiprocess_aggregation - workers aggregation")
+    env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=str(tmp_path))
+    record = ("from lawnmower_metrics import record_simulation; "
+              "record_simulation({'did_mower_crash': True, 'crash_reason': 'Crashed into Fence', "
+              "'grid_height': 2, 'grid_width': 2}, 5, 0.01)")
+    for _ in range(2): # two workers
+        subprocess.run([sys.executable, "-c", record], cwd=PYTHON_DIR, env=env, check=True)
+    payload = subprocess.run([sys.executable, "-c", "from lawnmower_metrics import metrics_payload; print(metrics_payload()[0].decode())"],
+                             cwd=PYTHON_DIR, env=env, check=True, capture_output=True, text=True).stdout
+    aggregated = samples(payload)
+    assert aggregated[("lawnmower_crashes_total", (("crash_reason", "Crashed into Fence"),))] == 2
+    assert aggregated[("lawnmower_moves_total", ())] == 10
@@ -0,0 +1,251 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_offload.py
+
+Objectives:
+    Bounded offloading of CPU-bound simulations from the API event loop
+    Simulations run on a thread pool of configurable size, so the event loop keeps serving other requests
+    Requests beyond the concurrency limit wait in a bounded queue
+    Occupancy and rejections are exported as Prometheus metrics (see lawnmower_metrics)
+    Backpressure instead of piling latency:
+        429 Too Many Requests  - queue full, the request is rejected immediately
+        503 Service Unavailable - the request waited in the queue longer than the queue timeout
+
+Configuration (environment variables):
+    LAWNMOWER_SIMULATE_CONCURRENCY    simulations running at once per server worker (default CPUs available to the container)
+    LAWNMOWER_SIMULATE_QUEUE_DEPTH    simulations waiting for a slot per server worker (default 4 x concurrency)
+    LAWNMOWER_SIMULATE_QUEUE_TIMEOUT  maximum wait in the queue in seconds (default 30)
+    LAWNMOWER_STREAM_CONCURRENCY      /simulate/stream streams open at once per server worker (default concurrency)
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, Callable, List, Optional, TypeVar
+from lawnmower_metrics import SIMULATE_RUNNING, SIMULATE_WAITING, SIMULATE_REJECTED, STREAMS_OPEN
+from lawnmower_server import available_cpus
+
+# Default configuration
+SIMULATE_CONCURRENCY: int = int(os.environ.get("LAWNMOWER_SIMULATE_CONCURRENCY", available_cpus()))
+SIMULATE_QUEUE_DEPTH: int = int(os.environ.get("LAWNMOWER_SIMULATE_QUEUE_DEPTH", 4 * SIMULATE_CONCURRENCY))
+SIMULATE_QUEUE_TIMEOUT: float = float(os.environ.get("LAWNMOWER_SIMULATE_QUEUE_TIMEOUT", 30))
+STREAM_CONCURRENCY: int = int(os.environ.get("LAWNMOWER_STREAM_CONCURRENCY", SIMULATE_CONCURRENCY))
+
+T = TypeVar("T")
+
+
+class Overloaded(Exception):
+    """
+    Raised when a simulation is refused by backpressure. status_code is the HTTP status to answer
+    (429 queue full, 503 queue timeout) and retry_after the suggested retry delay in seconds
+    """
+
+    def __init__(self, status_code: int, message: str, retry_after: int) -> None:
+        super().__init__(message)
+        self.status_code: int = status_code
+        self.retry_after: int = retry_after
+
+
+class BoundedExecutor:
+    """
+    Bounded Executor Class Definition
+    Runs blocking functions on a thread pool with a concurrency limit and a bounded waiting queue.
+    Admission is decided on the event loop thread, so the counters need no lock
+    """
+
+    def __init__(
+        self,
+        concurrency: int = SIMULATE_CONCURRENCY,
+        queue_depth: int = SIMULATE_QUEUE_DEPTH,
+        queue_timeout: float = SIMULATE_QUEUE_TIMEOUT) -> None:
+        """
+        Method: __init__ (Object Creation)
+
+        Args:
+            concurrency (int): functions running at once
+            queue_depth (int): functions waiting for a running slot
+            queue_timeout (float): maximum wait for a running slot in seconds
+        """
+        self.concurrency: int = max(concurrency, 1)
+        self.queue_depth: int = max(queue_depth, 0)
+        self.queue_timeout: float = queue_timeout
+        self.executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="lawnmower-sim")
+        self.running: int = 0
+        self.waiting: int = 0
+        self.counters: Dict[str, int] = {"completed": 0, "failed": 0, "rejected_queue_full": 0, "rejected_queue_timeout": 0}
+        # Running slots, bound to the event loop that created them
+        self.slots: Optional[asyncio.Semaphore] = None
+        self.slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _slots(self) -> asyncio.Semaphore:
+        # (Re)create the slots for the running event loop (e.g. a new test client loop)
+        loop = asyncio.get_running_loop()
+        if self.slots is None or self.slots_loop is not loop:
+            self.slots = asyncio.Semaphore(self.concurrency)
+            self.slots_loop = loop
+        return self.slots
+
+    def admit(self) -> None:
+        """
+        Method: admit
+        Raise Overloaded (429) when neither a running slot nor a queue place is free
+        (checked by run, and before streaming a batch whose functions are run later)
+        """
+        if self.running + self.waiting >= self.concurrency + self.queue_depth:
+            self.counters["rejected_queue_full"] += 1
+            SIMULATE_REJECTED.labels("429").inc()
+            raise Overloaded(429, f"Simulation queue full ({self.queue_depth} waiting)", 1)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Method: run
+        Run func(*args) on the thread pool once a running slot is free
+
+        Args:
+            func: Callable - blocking function
+            args: Any - function arguments
+
+        Output:
+            func result. Raises Overloaded if the queue is full or the wait exceeds the queue timeout
+        """
+        slots = self._slots()
+        self.admit()
+        self.waiting += 1
+        SIMULATE_WAITING.inc()
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.counters["rejected_queue_timeout"] += 1
+            SIMULATE_REJECTED.labels("503").inc()
+            raise Overloaded(503, f"Simulation queue wait exceeded {self.queue_timeout:g} s", int(self.queue_timeout) or 1) from None
+        finally:
+            self.waiting -= 1
+            SIMULATE_WAITING.dec()
+        self.running += 1
+        SIMULATE_RUNNING.inc()
+        # The slot is released when the thread is done, not when this request stops waiting for it:
+        # a cancelled (client gone) or timed out request keeps its slot as long as its function still runs
+        loop = asyncio.get_running_loop()
+        future = self.executor.submit(func, *args)
+        future.add_done_callback(lambda done: self._done_threadsafe(loop, slots, done))
+        return await asyncio.wrap_future(future)
+
+    def _done_threadsafe(self, loop: asyncio.AbstractEventLoop, slots: asyncio.Semaphore, future: "Future[Any]") -> None:
+        # Done-callback of the pool thread: the counters and the slots belong to the event loop thread
+        try:
+            loop.call_soon_threadsafe(self._done, slots, future)
+        except RuntimeError:
+            # Event loop already closed: nobody waits for its slots any more
+            self._done(slots, future)
+
+    def _done(self, slots: asyncio.Semaphore, future: "Future[Any]") -> None:
+        if future.cancelled() or future.exception() is not None:
+            self.counters["failed"] += 1
+        else:
+            self.counters["completed"] += 1
+        self.running -= 1
+        SIMULATE_RUNNING.dec()
+        slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Method: stats
+        Limits, current occupancy and counters
+        """
+        return dict(self.counters, running=self.running, waiting=self.waiting, concurrency=self.concurrency,
+                    queue_depth=self.queue_depth, queue_timeout=self.queue_timeout)
+
+
+# Executor shared by the /simulate requests of one server worker (created on first use)
+_simulate_executor: Optional[BoundedExecutor] = None
+
+
+def get_simulate_executor() -> BoundedExecutor:
+    """
+    Function: get_simulate_executor
+    Bounded executor of this server worker, configured from the environment
+    """
+    global _simulate_executor
+    if _simulate_executor is None:
+        _simulate_executor = BoundedExecutor()
+    return _simulate_executor
+
+
+class StreamLimiter:
+    """
+    Stream Limiter Class Definition
+    Bounds the simulation streams open at once. A stream advances on the server thread pool for as long as
+    its client reads, so it is not queued: beyond the limit it is rejected at once (429).
+    Slots are released from the thread pool, so the counters are guarded by a lock
+    """
+
+    def __init__(self, limit: int = STREAM_CONCURRENCY) -> None:
+        """
+        Method: __init__ (Object Creation)
+
+        Args:
+            limit (int): streams open at once
+        """
+        self.limit: int = max(limit, 1)
+        self.lock = threading.Lock()
+        self.open: int = 0
+        self.counters: Dict[str, int] = {"opened": 0, "rejected": 0}
+
+    def acquire(self) -> Callable[[], None]:
+        """
+        Method: acquire
+        Take a stream slot
+
+        Output:
+            release function of the slot (idempotent). Raises Overloaded (429) when every slot is taken
+        """
+        with self.lock:
+            if self.open >= self.limit:
+                self.counters["rejected"] += 1
+                SIMULATE_REJECTED.labels("429").inc()
+                raise Overloaded(429, f"Simulation streams limit reached ({self.limit} open)", 1)
+            self.open += 1
+            self.counters["opened"] += 1
+        STREAMS_OPEN.inc()
+        released: List[bool] = []
+
+        def release() -> None:
+            with self.lock:
+                if released:
+                    return
+                released.append(True)
+                self.open -= 1
+            STREAMS_OPEN.dec()
+
+        return release
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Method: stats
+        Limit, open streams and counters
+        """
+        with self.lock:
+            return dict(self.counters, open=self.open, limit=self.limit)
+
+
+# Limiter shared by the /simulate/stream requests of one server worker (created on first use)
+_stream_limiter: Optional[StreamLimiter] = None
+
+
+def get_stream_limiter() -> StreamLimiter:
+    """
+    Function: get_stream_limiter
+    Stream limiter of this server worker, configured from the environment
+    """
+    global _stream_limiter
+    if _stream_limiter is None:
+        _stream_limiter = StreamLimiter()
+    return _stream_limiter
@@ -0,0 +1,126 @@
+"""
+Project: 
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_offload_test.py
+
+Objectives: 
+    Auto Test for Automated Robotic Lawnmower Simulator bounded simulation offloading and API backpressure
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import os
+import json
+import time
+import asyncio
+import threading
+from typing import Any
+import pytest
+from fastapi.testclient import TestClient
+import python.lawnmower_cli_api as cli_api
+from python.lawnmower_offload import BoundedExecutor, Overloaded, StreamLimiter
+
+def test_offload_01_queue_full_and_timeout() -> None:
+    """Verifies that a full queue is rejected at once (429) and a queue wait past the timeout gives 503."""
+    print(f"\n---  Auto Test test_offload_01_queue_full_and_timeout - backpressure")
+    executor = BoundedExecutor(concurrency=1, queue_depth=1, queue_timeout=0.2)
+    release = threading.Event()
+
+    async def scenario() -> list:
+        running = asyncio.ensure_future(executor.run(release.wait, 5))
+        await asyncio.sleep(0.05)
+        waiting = asyncio.ensure_future(executor.run(time.sleep, 0))
+        await asyncio.sleep(0)
+        with pytest.raises(Overloaded) as full:
+            await executor.run(time.sleep, 0)
+        with pytest.raises(Overloaded) as timeout:
+            await waiting
+        release.set()
+        assert await running is True
+        assert await executor.run(sum, [1, 2]) == 3
+        return [full.value.status_code, timeout.value.status_code]
+
+    assert asyncio.run(scenario()) == [429, 503]
+    stats = executor.stats()
+    assert stats["rejected_queue_full"] == 1 and stats["rejected_queue_timeout"] == 1 and stats["completed"] == 2
+    assert stats["running"] == 0 and stats["waiting"] == 0
+
+def test_offload_02_simulate_offloaded_results_in_background(tmp_path: Any, monkeypatch: Any) -> None:
+    """Verifies /simulate results and that the results file is written after the response."""
+    print(f"\n---  Auto Test test_offload_02_simulate_offloaded_results_in_background - offloaded /simulate")
+    with open("./tests/lawnmower_scenario03_rock_crash.txt", "rb") as f:
+        content = f.read()
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("results")
+    response = TestClient(cli_api.app_lawnmower_simulation).post(
+        "/simulate", params={"cache": "false"}, files={"file": ("scenario.txt", content, "text/plain")})
+    assert response.status_code == 200
+    assert response.json()["crash_reason"] == "Crashed into Rock"
+    saved = os.listdir("results")
+    assert len(saved) == 1
+    with open(os.path.join("results", saved[0])) as f:
+        assert json.load(f) == response.json()
+
+def test_offload_03_simulate_backpressure_status(monkeypatch: Any) -> None:
+    """Verifies that /simulate answers 429 with Retry-After when no slot and no queue place is free."""
+    print(f"\n---  Auto Test test_offload_03_simulate_backpressure_status - /simulate 429")
+    # Executor class of the module imported by the server (the tests import a separate copy)
+    busy = type(cli_api.get_simulate_executor())(concurrency=1, queue_depth=0)
+    busy.running = 1
+    monkeypatch.setattr(cli_api, "get_simulate_executor", lambda: busy)
+    response = TestClient(cli_api.app_lawnmower_simulation).post(
+        "/simulate", files={"file": ("scenario.txt", b'test_name="t"\nheight=1\nwidth=1\nrocks=[]\nstart_pos=[0,0]\npath=[]\n', "text/plain")})
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+
+def test_offload_04_cancelled_request_keeps_slot() -> None:
+    """Verifies that a cancelled request keeps its slot until its thread is done."""
+    print(f"\n---  Auto Test test_offload_04_cancelled_request_keeps_slot - slot released by the thread")
+    executor = BoundedExecutor(concurrency=1, queue_depth=1, queue_timeout=0.1)
+    release = threading.Event()
+
+    async def scenario() -> None:
+        cancelled = asyncio.ensure_future(executor.run(release.wait, 5))
+        await asyncio.sleep(0.05)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        # Thread still running: the slot is still taken
+        assert executor.stats()["running"] == 1
+        with pytest.raises(Overloaded) as timeout:
+            await executor.run(time.sleep, 0)
+        assert timeout.value.status_code == 503
+        release.set()
+        assert await executor.run(sum, [1, 2]) == 3
+
+    asyncio.run(scenario())
+    stats = executor.stats()
+    assert stats["running"] == 0 and stats["completed"] == 2
+
+def test_offload_05_stream_limit(monkeypatch: Any) -> None:
+    """Verifies that /simulate/stream answers 429 with Retry-After when every stream slot is taken and frees its slot when done."""
+    print(f"\n---  Auto Test test_offload_05_stream_limit - /simulate/stream 429")
+    limiter = StreamLimiter(limit=1)
+    release = limiter.acquire()
+    with pytest.raises(Overloaded) as full:
+        limiter.acquire()
+    assert full.value.status_code == 429
+    release()
+    release()
+    assert limiter.stats() == {"opened": 1, "rejected": 1, "open": 0, "limit": 1}
+    # Limiter class of the module imported by the server (the tests import a separate copy)
+    streams = type(cli_api.get_stream_limiter())(limit=1)
+    client = TestClient(cli_api.app_lawnmower_simulation)
+    definition = b'test_name="sse"\nheight=3\nwidth=3\nrocks=[]\nstart_pos=[0,0]\npath="R2D2"\n'
+    monkeypatch.setattr(cli_api, "get_stream_limiter", lambda: streams)
+    response = client.post("/simulate/stream", files={"file": ("scenario.txt", definition, "text/plain")})
+    assert response.status_code == 200 and "event: done" in response.text
+    assert streams.stats()["open"] == 0
+    response = client.post("/simulate/stream", params={"layout_id": "b" * 64}, files={"file": ("scenario.txt", definition, "text/plain")})
+    assert response.status_code == 404 and streams.stats()["open"] == 0
+    streams.acquire()
+    response = client.post("/simulate/stream", files={"file": ("scenario.txt", definition, "text/plain")})
+    assert response.status_code == 429 and response.headers["Retry-After"] == "1"
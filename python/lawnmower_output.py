@@ -0,0 +1,189 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_output.py
+
+Objectives:
+    Output encoding of the Automated Robotic Lawnmower Simulator results (API responses and CLI output)
+        Field projection    only the requested fields of the Sim Status Structure are encoded (?fields=...),
+                            summary mode returns the verdict without the trajectory
+        Fast serialisation  orjson when installed (optional dependency), compact standard json otherwise
+        Packed coordinates  pos_history and visited_cells as base64 little-endian int16 (int32 on lawns over
+                            32767 cells wide) [row, col] pairs instead of JSON lists (?coordinates=packed)
+    A trajectory that is not requested is not recorded either (see output_params)
+
+Execution:
+    content = encode_output(sim_status, parse_fields("did_mower_crash,crash_reason"))
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import sys
+import json
+import base64
+from array import array
+from itertools import chain
+from typing import List, Dict, Any, Optional, Sequence
+
+# Verdict fields returned by the summary mode (optional fields only when present in the results)
+SUMMARY_FIELDS: List[str] = [
+    "test_name", "grid_width", "grid_height", "start_pos", "total_grass_squares", "all_grass_cut",
+    "uncut_grass_remaining", "did_mower_crash", "crash_reason", "last_pos",
+    "reachable_grass", "unreachable_grass", "early_exit", "layout_id",
+]
+
+# Coordinate lists of the trajectory (the expensive part of the output)
+TRAJECTORY_FIELDS: List[str] = ["pos_history", "visited_cells"]
+
+# All the fields of the Sim Status Structure (see LawnmowerSim.sim_status)
+OUTPUT_FIELDS: List[str] = SUMMARY_FIELDS + ["analytics", "rock_locations", "valid_rocks"] + TRAJECTORY_FIELDS + ["messages"]
+
+# Coordinate list encodings
+COORDINATE_FORMATS = ("json", "packed")
+
+# Packed coordinate types, smallest first: encoding name and array typecode
+PACKED_TYPES: Dict[str, str] = {"int16-le": "h", "int32-le": "i"}
+
+
+def parse_fields(fields: Optional[str] = None, summary: bool = False) -> Optional[List[str]]:
+    """
+    Function: parse_fields
+    Fields to output, from a comma separated list and/or the summary mode
+
+    Args:
+        fields: Optional[str] - comma separated field names (e.g. "did_mower_crash,crash_reason")
+        summary: bool - verdict fields (SUMMARY_FIELDS), plus the listed fields if any
+
+    Output:
+        Optional[List[str]] - field names in output order, None for all fields. Raises ValueError for unknown fields
+    """
+    names = [name.strip() for name in (fields or "").split(",") if name.strip()]
+    unknown = [name for name in names if name not in OUTPUT_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown output fields {unknown}. Expected any of {OUTPUT_FIELDS}")
+    if summary:
+        names = SUMMARY_FIELDS + [name for name in names if name not in SUMMARY_FIELDS]
+    return names or None
+
+
+def output_params(params: Dict[str, Any], fields: Optional[Sequence[str]]) -> Dict[str, Any]:
+    """
+    Function: output_params
+    Skip recording what is not output: pos_history is not kept (flat memory) and messages are not collected
+    when the fields do not include them. The path analytics are computed when the fields list them explicitly.
+    Explicit params of the definition file win
+
+    Args:
+        params: Dict[str, Any] - simulation params (see execute_and_report), updated
+        fields: Optional[Sequence[str]] - output fields (None for all)
+    """
+    if fields is not None:
+        if "pos_history" not in fields:
+            params.setdefault('keep_history', False)
+        if "messages" not in fields:
+            params['include_messages'] = False
+        if "analytics" in fields and "analytics" not in params:
+            params['analytics'] = True
+    return params
+
+
+def project(sim_status: Dict[str, Any], fields: Optional[Sequence[str]]) -> Dict[str, Any]:
+    """
+    Function: project
+    Requested fields of the results (fields absent from the results are skipped)
+
+    Args:
+        sim_status: Dict[str, Any] - Sim Status Structure
+        fields: Optional[Sequence[str]] - output fields (None for all)
+    """
+    if fields is None:
+        return sim_status
+    return {name: sim_status[name] for name in fields if name in sim_status}
+
+
+def pack_coordinates(cells: Sequence[Sequence[int]]) -> Dict[str, Any]:
+    """
+    Function: pack_coordinates
+    Binary encoding of a coordinate list: little-endian row, col pairs of the smallest integer type holding
+    every coordinate (int16-le or int32-le), base64.
+    Decoded with numpy.frombuffer(base64.b64decode(data), "<i2" or "<i4").reshape(shape)
+
+    Args:
+        cells: Sequence[Sequence[int]] - [row, col] coordinates
+    """
+    for encoding, typecode in PACKED_TYPES.items():
+        try:
+            flat = array(typecode, chain.from_iterable(cells))
+        except OverflowError:
+            continue # a coordinate does not fit, next type
+        if sys.byteorder == "big":
+            flat.byteswap()
+        return {"encoding": encoding, "shape": [len(flat) // 2, 2], "data": base64.b64encode(flat.tobytes()).decode("ascii")}
+    raise OverflowError("Coordinates out of int32 range")
+
+
+def unpack_coordinates(packed: Dict[str, Any]) -> List[List[int]]:
+    """
+    Function: unpack_coordinates
+    Coordinate list of a packed encoding (see pack_coordinates)
+
+    Args:
+        packed: Dict[str, Any] - encoding, shape and data
+    """
+    flat = array(PACKED_TYPES[packed["encoding"]])
+    flat.frombytes(base64.b64decode(packed["data"]))
+    if sys.byteorder == "big":
+        flat.byteswap()
+    return [[flat[index], flat[index + 1]] for index in range(0, len(flat), 2)]
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Function: dumps
+    JSON encoding: orjson when installed (native encoding of the coordinate lists), standard json otherwise
+
+    Args:
+        data: Any - JSON serialisable data
+        indent: bool - human readable indentation (CLI)
+    """
+    try:
+        # Lazy import: orjson is an optional dependency
+        import orjson
+    except ImportError:
+        if indent:
+            return json.dumps(data, indent=4).encode("utf-8")
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+
+
+def encode_output(
+    sim_status: Dict[str, Any],
+    fields: Optional[Sequence[str]] = None,
+    coordinates: str = "json",
+    indent: bool = False) -> bytes:
+    """
+    Function: encode_output
+    Encoded results: projection, coordinate encoding and serialisation
+
+    Args:
+        sim_status: Dict[str, Any] - Sim Status Structure
+        fields: Optional[Sequence[str]] - output fields (None for all, see parse_fields)
+        coordinates: str - json (lists) or packed (see pack_coordinates)
+        indent: bool - human readable indentation
+
+    Output:
+        bytes - UTF-8 JSON. Raises ValueError for an unknown coordinates format
+    """
+    if coordinates not in COORDINATE_FORMATS:
+        raise ValueError(f"Unknown coordinates format {coordinates}. Expected one of {COORDINATE_FORMATS}")
+    output = project(sim_status, fields)
+    if coordinates == "packed":
+        output = dict(output)
+        for name in TRAJECTORY_FIELDS:
+            if name in output:
+                output[name] = pack_coordinates(output[name])
+    return dumps(output, indent)
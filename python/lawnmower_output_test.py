@@ -0,0 +1,62 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_output_test.py
+
+Objectives:
+    Auto Test for Automated Robotic Lawnmower Simulator output encoding (field projection, packed coordinates)
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import json
+import pytest
+from typing import Any
+from fastapi.testclient import TestClient
+import lawnmower_results
+import python.lawnmower_cli_api as cli_api
+from python.lawnmower_output import parse_fields, encode_output, unpack_coordinates, SUMMARY_FIELDS
+
+DEFINITION = b'test_name="output"\nheight=3\nwidth=3\nrocks=[[2,2]]\nstart_pos=[0,0]\npath="R2D2"\n'
+
+def test_output_01_projection_and_packing() -> None:
+    """Verifies field parsing, projection order, the summary mode and the packed coordinates round trip."""
+    print(f"\n---  Auto Test test_output_01_projection_and_packing - encode_output")
+    assert parse_fields(None) is None and parse_fields(" crash_reason , last_pos ") == ["crash_reason", "last_pos"]
+    assert parse_fields("pos_history", summary=True) == SUMMARY_FIELDS + ["pos_history"]
+    with pytest.raises(ValueError):
+        parse_fields("crash_reason,speed")
+    sim_status = {"test_name": "t", "crash_reason": None, "pos_history": [[0, 0], [-1, 70000]], "visited_cells": []}
+    assert json.loads(encode_output(sim_status, ["crash_reason", "layout_id"])) == {"crash_reason": None}
+    packed = json.loads(encode_output(sim_status, ["pos_history", "visited_cells"], coordinates="packed"))
+    assert packed["pos_history"]["shape"] == [2, 2] and unpack_coordinates(packed["pos_history"]) == [[0, 0], [-1, 70000]]
+    assert packed["pos_history"]["encoding"] == "int32-le" and packed["visited_cells"]["encoding"] == "int16-le"
+    assert unpack_coordinates(packed["visited_cells"]) == []
+    assert json.loads(encode_output(sim_status)) == sim_status
+    with pytest.raises(ValueError):
+        encode_output(sim_status, coordinates="csv")
+
+def test_output_02_api_fields(tmp_path: Any, monkeypatch: Any) -> None:
+    """Verifies /simulate fields, summary and packed coordinates against the full response, and the 422s."""
+    print(f"\n---  Auto Test test_output_02_api_fields - /simulate?fields=")
+    monkeypatch.chdir(tmp_path)
+    # Results sink of the module imported by the server (python/ on sys.path)
+    monkeypatch.setattr(lawnmower_results, "_results_sink", lawnmower_results.FileResults(str(tmp_path / "results")))
+    client = TestClient(cli_api.app_lawnmower_simulation)
+
+    def simulate(**params: str) -> Any:
+        return client.post("/simulate", params=dict(params, cache="false"), files={"file": ("scenario.txt", DEFINITION, "text/plain")})
+
+    full = simulate().json()
+    verdict = simulate(fields="did_mower_crash,crash_reason,uncut_grass_remaining").json()
+    assert verdict == {key: full[key] for key in ("did_mower_crash", "crash_reason", "uncut_grass_remaining")}
+    summary = simulate(summary="true").json()
+    assert "pos_history" not in summary and "visited_cells" not in summary and summary["last_pos"] == full["last_pos"]
+    packed = simulate(fields="pos_history,visited_cells", coordinates="packed").json()
+    assert unpack_coordinates(packed["pos_history"]) == full["pos_history"]
+    assert unpack_coordinates(packed["visited_cells"]) == full["visited_cells"]
+    assert simulate(fields="speed").status_code == 422
+    assert simulate(coordinates="csv").status_code == 422
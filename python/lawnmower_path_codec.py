@@ -0,0 +1,246 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_path_codec.py
+
+Objectives:
+    Compact path encodings for Automated Robotic Lawnmower Simulator
+    Run-length string: one letter per run (U, D, L, R) followed by an optional count, e.g. "D3R1U2" or "D3RU2".
+        Any other character is rejected (InvalidPath, a ValueError)
+    Packed binary: 8 bytes big-endian move count followed by 2 bits per move (first move in the most
+        significant bits, up=0, down=1, left=2, right=3), base64 encoded in definition files.
+        Invalid base64, a header shorter than 8 bytes or a body shorter than the move count is rejected (InvalidPath)
+    Both decode to runs (move, count) executed as whole segments by LawnmowerSim.execute_runs
+
+    Definition file examples:
+        path="D3R1U2"
+        path_packed="AAAAAAAAAAZXIA=="   (same as ["Down","Down","Down","Right","Up","Left"])
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import re
+import base64
+import struct
+import binascii
+from typing import List, Dict, Tuple, Iterable, Iterator
+
+# Run-length letters and packed 2-bit codes
+RLE_LETTERS: Dict[str, str] = {"U": "up", "D": "down", "L": "left", "R": "right"}
+MOVE_LETTERS: Dict[str, str] = {move: letter for letter, move in RLE_LETTERS.items()}
+PACKED_MOVES: List[str] = ["up", "down", "left", "right"]
+PACKED_CODES: Dict[str, int] = {move: code for code, move in enumerate(PACKED_MOVES)}
+PACKED_HEADER = struct.Struct(">Q")
+
+# Run-length token: letter and optional count. Anything else (or a count without letter) is invalid
+RLE_TOKEN = re.compile(r"([UDLRudlr])(\d*)")
+RLE_INVALID = re.compile(r"^\d|[^UDLRudlr\d]")
+
+# Packed bytes decoded per chunk (4 moves per byte)
+PACKED_CHUNK_SIZE: int = 1 << 18
+
+
+class InvalidPath(ValueError):
+    """
+    Raised when a compact path (run-length string or packed binary) is malformed
+    """
+
+
+def iter_runs(path: Iterable[str]) -> Iterator[Tuple[str, int]]:
+    """
+    Function: iter_runs
+    Group a sequence of moves into runs of identical consecutive moves
+
+    Args:
+        path: Iterable[str] - sequence of moves (up,down,left,right). Upper Capital will be converted to lower
+    """
+    current, count = "", 0
+    for move in path:
+        move = move.lower()
+        if move == current:
+            count += 1
+            continue
+        if count:
+            yield current, count
+        current, count = move, 1
+    if count:
+        yield current, count
+
+
+def expand_runs(runs: Iterable[Tuple[str, int]]) -> Iterator[str]:
+    """
+    Function: expand_runs
+    Expand runs back into single moves
+
+    Args:
+        runs: Iterable[Tuple[str, int]] - runs (move, count)
+    """
+    for move, count in runs:
+        for _ in range(count):
+            yield move
+
+
+def encode_rle(path: Iterable[str]) -> str:
+    """
+    Function: encode_rle
+    Encode a sequence of moves as a run-length string, e.g. ["Down","Down","Down","Right"] -> "D3R1"
+
+    Args:
+        path: Iterable[str] - sequence of moves (up,down,left,right)
+    """
+    return "".join(f"{MOVE_LETTERS[move]}{count}" for move, count in iter_runs(path))
+
+
+def check_rle(text: str, offset: int = 0) -> None:
+    """
+    Function: check_rle
+    Raise InvalidPath at the first character of a run-length string that is not part of a run
+
+    Args:
+        text: str - run-length string (or a piece of it starting with a letter)
+        offset: int - position of the piece in the whole string (error message)
+    """
+    invalid = RLE_INVALID.search(text)
+    if invalid is not None:
+        raise InvalidPath(f"Invalid run-length path: unexpected {invalid.group(0)!r} at position {offset + invalid.start()}")
+
+
+def decode_rle(text: str) -> Iterator[Tuple[str, int]]:
+    """
+    Function: decode_rle
+    Decode a run-length string into runs (move, count). A missing count means 1.
+    The whole string is validated first: raises InvalidPath if malformed, before any run is returned
+
+    Args:
+        text: str - run-length string, e.g. "D3R1U2"
+    """
+    check_rle(text)
+    return _rle_runs(text)
+
+
+def _rle_runs(text: str) -> Iterator[Tuple[str, int]]:
+    # Runs of a valid run-length string (see decode_rle)
+    for token in RLE_TOKEN.finditer(text):
+        count = int(token.group(2)) if token.group(2) else 1
+        if count:
+            yield RLE_LETTERS[token.group(1).upper()], count
+
+
+def iter_rle_runs(chunks: Iterable[str]) -> Iterator[Tuple[str, int]]:
+    """
+    Function: iter_rle_runs
+    Incremental decoder of a quoted run-length string split in text chunks (streaming ingestion).
+    Stops at the closing quote. A run whose count may continue in the next chunk is carried over.
+    Each piece is validated before its runs are returned: raises InvalidPath when the stream reaches
+    a malformed part (runs before it were already returned)
+
+    Args:
+        chunks: Iterable[str] - text chunks starting at (or before) the opening quote
+    """
+    buffer = ""
+    quote = ""
+    position = 0 # position of the buffer in the run-length string
+    for chunk in chunks:
+        if not quote:
+            opening = re.search(r"[\"']", chunk)
+            if opening is None:
+                continue
+            quote = opening.group(0)
+            chunk = chunk[opening.end():]
+        closing = chunk.find(quote)
+        buffer += chunk if closing < 0 else chunk[:closing]
+        if closing >= 0:
+            break
+        # Keep the last run (its count may continue in the next chunk)
+        last_letter = max(buffer.rfind(letter) for letter in "UDLRudlr")
+        if last_letter > 0:
+            check_rle(buffer[:last_letter], position)
+            yield from _rle_runs(buffer[:last_letter])
+            position += last_letter
+            buffer = buffer[last_letter:]
+    check_rle(buffer, position)
+    yield from _rle_runs(buffer)
+
+
+def encode_packed(path: Iterable[str]) -> bytes:
+    """
+    Function: encode_packed
+    Encode a sequence of moves as packed binary: move count header and 2 bits per move
+
+    Args:
+        path: Iterable[str] - sequence of moves (up,down,left,right)
+    """
+    packed = bytearray()
+    count = 0
+    byte = 0
+    for move in path:
+        byte = (byte << 2) | PACKED_CODES[move.lower()]
+        count += 1
+        if count % 4 == 0:
+            packed.append(byte)
+            byte = 0
+    if count % 4:
+        packed.append(byte << (2 * (4 - count % 4)))
+    return PACKED_HEADER.pack(count) + bytes(packed)
+
+
+def decode_packed(data: bytes) -> Iterator[Tuple[str, int]]:
+    """
+    Function: decode_packed
+    Decode packed binary into runs (move, count). Unpacking and run detection are vectorized per chunk.
+    Header and body size are validated first: raises InvalidPath if truncated, before any run is returned
+
+    Args:
+        data: bytes - packed binary (see encode_packed)
+    """
+    if len(data) < PACKED_HEADER.size:
+        raise InvalidPath(f"Invalid packed path: {len(data)} bytes, shorter than the {PACKED_HEADER.size} bytes header")
+    (count,) = PACKED_HEADER.unpack_from(data)
+    body = memoryview(data)[PACKED_HEADER.size:]
+    if len(body) < (count + 3) // 4:
+        raise InvalidPath(f"Invalid packed path: {len(body)} body bytes, {(count + 3) // 4} expected for {count} moves")
+    return _packed_runs(body, count)
+
+
+def _packed_runs(body: memoryview, remaining: int) -> Iterator[Tuple[str, int]]:
+    # Lazy import: numpy is only required for the packed format
+    import numpy as np
+
+    current, count = -1, 0
+    for offset in range(0, len(body), PACKED_CHUNK_SIZE):
+        raw: np.ndarray = np.frombuffer(body[offset:offset + PACKED_CHUNK_SIZE], dtype=np.uint8)
+        codes = np.stack([(raw >> 6) & 3, (raw >> 4) & 3, (raw >> 2) & 3, raw & 3], axis=1).ravel()[:remaining]
+        remaining -= len(codes)
+        if not len(codes):
+            break
+        # Run boundaries inside the chunk, merged with the run carried over from the previous chunk
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(codes)) + 1))
+        lengths = np.diff(np.concatenate((starts, [len(codes)])))
+        for code, length in zip(codes[starts].tolist(), lengths.tolist()):
+            if code == current:
+                count += length
+                continue
+            if count:
+                yield PACKED_MOVES[current], count
+            current, count = code, length
+    if count:
+        yield PACKED_MOVES[current], count
+
+
+def decode_packed_base64(text: str) -> Iterator[Tuple[str, int]]:
+    """
+    Function: decode_packed_base64
+    Decode base64 packed binary (path_packed key of definition files) into runs (move, count)
+
+    Args:
+        text: str - base64 encoded packed binary
+    """
+    try:
+        data = base64.b64decode(text, validate=True)
+    except binascii.Error as error:
+        raise InvalidPath(f"Invalid packed path: {error}") from None
+    return decode_packed(data)
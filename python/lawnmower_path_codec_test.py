@@ -0,0 +1,70 @@
+"""
+Project: 
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_path_codec_test.py
+
+Objectives: 
+    Auto Test for Automated Robotic Lawnmower Simulator compact path encodings
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import base64
+import pytest
+from python.lawnmower_core import parse_text_file
+from python.lawnmower_path_codec import (encode_rle, decode_rle, iter_rle_runs, encode_packed, decode_packed,
+                                         decode_packed_base64, iter_runs, InvalidPath)
+
+PATH = ["Down", "Down", "Down", "Right", "Up", "Left"] + ["Right"] * 10000
+
+def test_codec_01_run_length_round_trip() -> None:
+    """Verifies run-length encoding and decoding of a path, including missing counts."""
+    print(f"\n---  Auto Test test_codec_01_run_length_round_trip - run-length round trip")
+    assert encode_rle(PATH) == "D3R1U1L1R10000"
+    assert list(decode_rle("D3R1U1L1R10000")) == list(iter_runs(PATH))
+    assert list(decode_rle("d3RUl")) == [("down", 3), ("right", 1), ("up", 1), ("left", 1)]
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5])
+def test_codec_02_run_length_stream(chunk_size: int) -> None:
+    """Verifies that a quoted run-length string split in chunks decodes to the same runs."""
+    print(f"\n---  Auto Test test_codec_02_run_length_stream - streamed run-length with chunk size {chunk_size}")
+    text = ' "D3R1U1L1R10000"\n'
+    chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+    assert list(iter_rle_runs(chunks)) == list(iter_runs(PATH))
+
+def test_codec_03_packed_round_trip() -> None:
+    """Verifies packed 2-bit encoding and decoding of a path, including a partial last byte."""
+    print(f"\n---  Auto Test test_codec_03_packed_round_trip - packed round trip")
+    assert len(encode_packed(PATH)) == 8 + (len(PATH) + 3) // 4
+    assert list(decode_packed(encode_packed(PATH))) == list(iter_runs(PATH))
+    assert list(decode_packed_base64("AAAAAAAAAAZXIA==")) == list(iter_runs(PATH[:6]))
+
+@pytest.mark.parametrize("text", ["D2Q9R2", "3D2", "D2 R2", "D2,R2", "D-1"])
+def test_codec_04_run_length_invalid(text: str) -> None:
+    """Verifies that a malformed run-length string is rejected whole or streamed, instead of skipping the garbage."""
+    print(f"\n---  Auto Test test_codec_04_run_length_invalid - {text!r} rejected")
+    with pytest.raises(InvalidPath):
+        decode_rle(text)
+    chunks = [c for c in f'"{text}"']
+    with pytest.raises(InvalidPath):
+        list(iter_rle_runs(chunks))
+    with pytest.raises(InvalidPath, match="position 2"):
+        decode_rle("D2Q9R2")
+
+@pytest.mark.parametrize("text", ["!!!", "AAA=", base64.b64encode(encode_packed(PATH[:6])[:-1]).decode()])
+def test_codec_05_packed_invalid(text: str) -> None:
+    """Verifies that bad base64, a short header or a body shorter than the move count is rejected as InvalidPath."""
+    print(f"\n---  Auto Test test_codec_05_packed_invalid - {text!r} rejected")
+    with pytest.raises(InvalidPath):
+        decode_packed_base64(text)
+
+def test_codec_06_packed_definition_file() -> None:
+    """Verifies that a definition file keeps the base64 padding of path_packed (value split at the first '=')."""
+    print(f"\n---  Auto Test test_codec_06_packed_definition_file - padded path_packed parsed")
+    packed = base64.b64encode(encode_packed(PATH[:5])).decode()
+    assert packed.endswith("==")
+    params = parse_text_file(f'test_name="packed"\npath_packed="{packed}"\n')
+    assert list(decode_packed_base64(params["path_packed"])) == list(iter_runs(PATH[:5]))
@@ -0,0 +1,449 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_planner.py
+
+Objectives:
+    Coverage-path planner for Automated Robotic Lawnmower Simulator
+    Takes the LawnmowerSim inputs (height, width, rocks, start_pos) and produces a crash free path covering
+    every reachable grass cell with few revisits
+    The lawn is split into row segments (free cells between rocks). Vertically overlapping segments of adjacent
+    rows are connected, and unbroken chains of segments form the boustrophedon cells
+    Each segment is swept end to end. An isolated rock at the end of a sweep is sidestepped with a one-row
+    detour (over, two cells across, back) into the next segment of the same row, so the row is swept as a whole
+    instead of being split. The sweep continues into the next segment of the same cell first,
+    then into the nearest unvisited neighbour, and a BFS over the segment graph stitches the sweep to the
+    nearest segment with work left when a cell is finished
+    Cells not connected to the start position are reported as unreachable
+    Work is proportional to the number of segments (rows + rocks), not to the number of cells, and the path is
+    produced as runs (move, count), so 10^4 x 10^4 lawns are planned in seconds
+
+Execution:
+    CLI: python ./python/lawnmower_cli_api.py --plan ./tests/lawnmower_scenario01_valid.txt
+    API: POST /plan with a definition file (the path key, if any, is ignored)
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import json
+from bisect import bisect_right
+from collections import deque
+from typing import List, Dict, Any, Optional, Deque, Sequence, Tuple
+from lawnmower_sim import LawnmowerSim, LOG_OFF
+from lawnmower_path_codec import MOVE_LETTERS
+
+
+class SegmentGraph:
+    """
+    Segment Graph Class Definition
+    Row segments of free cells, their vertical adjacency and their boustrophedon cell
+    """
+
+    def __init__(self, height: int, width: int, rocks: Sequence[Sequence[int]]) -> None:
+        """
+        Method: __init__ (Object Creation)
+
+        Args:
+            height (int): grid height
+            width (int): grid width
+            rocks (List[List[int]]): rock coordinates (outside grid rocks are ignored)
+        """
+        # Rock columns per row (inside grid only, without repetitions)
+        rock_cols: Dict[int, List[int]] = {}
+        for r in rocks:
+            if 0 <= r[0] < height and 0 <= r[1] < width:
+                rock_cols.setdefault(r[0], []).append(r[1])
+
+        # Segments: row, first column, last column. row_segments[row] = first segment index of the row
+        self.row: List[int] = []
+        self.first: List[int] = []
+        self.last: List[int] = []
+        self.row_segments: List[int] = []
+        for row in range(height):
+            self.row_segments.append(len(self.row))
+            col = 0
+            for rock in sorted(set(rock_cols.get(row, []))) + [width]:
+                if rock > col:
+                    self.row.append(row)
+                    self.first.append(col)
+                    self.last.append(rock - 1)
+                col = rock + 1
+        self.row_segments.append(len(self.row))
+
+        # Vertical adjacency: overlapping segments of adjacent rows (merge scan of both rows)
+        self.up: List[List[int]] = [[] for _ in self.row]
+        self.down: List[List[int]] = [[] for _ in self.row]
+        for row in range(height - 1):
+            i, i_end = self.row_segments[row], self.row_segments[row + 1]
+            j, j_end = self.row_segments[row + 1], self.row_segments[row + 2]
+            while i < i_end and j < j_end:
+                if self.first[i] <= self.last[j] and self.first[j] <= self.last[i]:
+                    self.down[i].append(j)
+                    self.up[j].append(i)
+                if self.last[i] < self.last[j]:
+                    i += 1
+                else:
+                    j += 1
+
+        # Boustrophedon cells: a segment continues the cell of the segment above when they are
+        # each other's only vertical neighbour
+        self.cell: List[int] = []
+        cells = 0
+        for segment in range(len(self.row)):
+            above = self.up[segment]
+            if len(above) == 1 and len(self.down[above[0]]) == 1:
+                self.cell.append(self.cell[above[0]])
+            else:
+                self.cell.append(cells)
+                cells += 1
+        self.cell_count: int = cells
+
+    def find(self, row: int, col: int) -> Optional[int]:
+        """
+        Method: find
+        Segment containing a cell (None for rocks and cells outside the grid)
+
+        Args:
+            row (int), col (int): cell coordinate
+        """
+        if not 0 <= row < len(self.row_segments) - 1:
+            return None
+        # Segments of a row are sorted by first column: last one starting at or before col
+        segment = bisect_right(self.first, col, self.row_segments[row], self.row_segments[row + 1]) - 1
+        if segment >= self.row_segments[row] and col <= self.last[segment]:
+            return segment
+        return None
+
+    def neighbours(self, segment: int) -> List[int]:
+        """
+        Method: neighbours
+        Segments vertically adjacent to a segment
+        """
+        return self.up[segment] + self.down[segment]
+
+    def size(self, segment: int) -> int:
+        """
+        Method: size
+        Number of cells of a segment
+        """
+        return self.last[segment] - self.first[segment] + 1
+
+
+class RunBuilder:
+    """
+    Run Builder Class Definition
+    Accumulates moves as runs (move, count), merging consecutive identical moves
+    """
+
+    def __init__(self) -> None:
+        self.runs: List[List[Any]] = []
+        self.moves: int = 0
+
+    def add(self, move: str, count: int) -> None:
+        """
+        Method: add
+        Append count moves (negative or zero counts are ignored)
+        """
+        if count <= 0:
+            return
+        if self.runs and self.runs[-1][0] == move:
+            self.runs[-1][1] += count
+        else:
+            self.runs.append([move, count])
+        self.moves += count
+
+    def horizontal(self, from_col: int, to_col: int) -> None:
+        """
+        Method: horizontal
+        Moves along a row from one column to another
+        """
+        if to_col > from_col:
+            self.add("right", to_col - from_col)
+        else:
+            self.add("left", from_col - to_col)
+
+
+def plan_coverage(height: int, width: int, rocks: List[List[int]], start_pos: List[int]) -> Dict[str, Any]:
+    """
+    Function: plan_coverage
+    Plan a crash free path covering every grass cell reachable from the start position
+
+    Args:
+        height: int - grid height
+        width: int - grid width
+        rocks: List[List[int]] - rock coordinates
+        start_pos: List[int] - start position (reset to [0,0] when outside the grid, as LawnmowerSim does)
+
+    Output:
+        Dict[str, Any]:
+            "path": str - run-length path (see lawnmower_path_codec), e.g. "R4D1L4"
+            "runs": List[List[Any]] - the same path as [move, count] runs
+            "moves": int - number of moves
+            "reachable_cells": int - grass cells reachable from the start (start included)
+            "revisits": int - moves landing on an already cut cell
+            "boustrophedon_cells": int - number of boustrophedon cells of the lawn
+            "unreachable_cells": int - grass cells that cannot be reached
+            "unreachable_segments": List[List[int]] - [row, first column, last column] of the unreachable cells
+    """
+    graph = SegmentGraph(height, width, rocks)
+    if not (0 <= start_pos[0] < height and 0 <= start_pos[1] < width):
+        start_pos = [0, 0]
+    start = graph.find(start_pos[0], start_pos[1])
+
+    # Reachable segments: connected component of the start segment
+    reachable = bytearray(len(graph.row))
+    if start is not None:
+        reachable[start] = 1
+        pending: Deque[int] = deque([start])
+        while pending:
+            for neighbour in graph.neighbours(pending.popleft()):
+                if not reachable[neighbour]:
+                    reachable[neighbour] = 1
+                    pending.append(neighbour)
+
+    builder = RunBuilder()
+    reachable_cells = 0
+    if start is not None:
+        reachable_cells = CoverageSweep(graph, builder).run(start, start_pos[1])
+
+    unreachable_segments = [[graph.row[s], graph.first[s], graph.last[s]] for s in range(len(graph.row)) if not reachable[s]]
+    return {
+        "path": "".join(f"{MOVE_LETTERS[move]}{count}" for move, count in builder.runs),
+        "runs": builder.runs,
+        "moves": builder.moves,
+        "reachable_cells": reachable_cells,
+        "revisits": builder.moves - max(reachable_cells - 1, 0),
+        "boustrophedon_cells": graph.cell_count,
+        "unreachable_cells": sum(last - first + 1 for _, first, last in unreachable_segments),
+        "unreachable_segments": unreachable_segments,
+    }
+
+
+class CoverageSweep:
+    """
+    Coverage Sweep Class Definition
+    Sweeps all the segments connected to the start segment, appending the moves to a RunBuilder
+    """
+
+    def __init__(self, graph: SegmentGraph, builder: RunBuilder) -> None:
+        """
+        Method: __init__ (Object Creation)
+
+        Args:
+            graph (SegmentGraph): lawn segments
+            builder (RunBuilder): path being built
+        """
+        self.graph: SegmentGraph = graph
+        self.builder: RunBuilder = builder
+        self.covered: bytearray = bytearray(len(graph.row))
+        self.queues: Dict[int, List[int]] = {} # neighbours of a covered segment in visiting order
+        self.pointers: Dict[int, int] = {}
+        self.covered_cells: int = 0
+
+    def run(self, start: int, col: int) -> int:
+        """
+        Method: run
+        Sweep from the start segment and column
+
+        Args:
+            start (int): start segment
+            col (int): start column
+
+        Output:
+            int - number of cells covered
+        """
+        segment, col = self.cover(start, col)
+        while True:
+            target = self.next_uncovered(segment)
+            if target is not None:
+                col = self.step(segment, target, col)
+                segment, col = self.cover(target, col)
+                continue
+            # Cell finished: BFS stitching to the nearest covered segment with an uncovered neighbour
+            route = self.route_to_work(segment)
+            if route is None:
+                break
+            for target in route:
+                col = self.step(segment, target, col)
+                segment = target
+        return self.covered_cells
+
+    def cover(self, segment: int, col: int) -> Tuple[int, int]:
+        """
+        Method: cover
+        Sweep a segment from the entry column: nearer end first, then the far end. The sweep goes on past
+        isolated rocks of the row (see detour). Returns the segment and the column where the sweep ends
+        """
+        graph = self.graph
+        while True:
+            first, last = graph.first[segment], graph.last[segment]
+            if col - first <= last - col:
+                self.builder.horizontal(col, first)
+                self.builder.horizontal(first, last)
+                end = last
+            else:
+                self.builder.horizontal(col, last)
+                self.builder.horizontal(last, first)
+                end = first
+            # Visiting order of the neighbours: same boustrophedon cell first, then nearest to the sweep end
+            self.queues[segment] = sorted(
+                graph.neighbours(segment),
+                key=lambda n: (graph.cell[n] != graph.cell[segment], abs(min(max(end, graph.first[n]), graph.last[n]) - end)))
+            self.pointers[segment] = 0
+            self.covered[segment] = 1
+            self.covered_cells += graph.size(segment)
+            beyond = self.detour(segment, end)
+            if beyond is None:
+                return segment, end
+            segment, col = beyond, graph.first[beyond] if end == last else graph.last[beyond]
+
+    def detour(self, segment: int, end: int) -> Optional[int]:
+        """
+        Method: detour
+        Sidestep an isolated rock at the sweep end: when the next segment of the row, one rock away, is uncovered and
+        the three cells around the rock are free in the row above (or below), move there, two cells across and back.
+        Returns the segment reached past the rock, None without a detour
+        """
+        graph = self.graph
+        row = graph.row[segment]
+        beyond, step = (segment + 1, 1) if end == graph.last[segment] else (segment - 1, -1)
+        if not graph.row_segments[row] <= beyond < graph.row_segments[row + 1] or self.covered[beyond]:
+            return None
+        if (graph.first[beyond] if step == 1 else graph.last[beyond]) != end + 2 * step:
+            return None
+        # Covered row first: its cells are already cut either way
+        detours = []
+        for side in (row - 1, row + 1):
+            other = graph.find(side, end)
+            if other is not None and graph.first[other] <= end + 2 * step <= graph.last[other]:
+                detours.append((not self.covered[other], side))
+        if not detours:
+            return None
+        side = min(detours)[1]
+        vertical = ("up", "down") if side < row else ("down", "up")
+        self.builder.add(vertical[0], 1)
+        self.builder.horizontal(end, end + 2 * step)
+        self.builder.add(vertical[1], 1)
+        return beyond
+
+    def next_uncovered(self, segment: int) -> Optional[int]:
+        """
+        Method: next_uncovered
+        Next uncovered neighbour of a covered segment in visiting order (covered ones are skipped once for all)
+        """
+        queue, index = self.queues[segment], self.pointers[segment]
+        while index < len(queue) and self.covered[queue[index]]:
+            index += 1
+        self.pointers[segment] = index
+        return queue[index] if index < len(queue) else None
+
+    def step(self, segment: int, target: int, col: int) -> int:
+        """
+        Method: step
+        Move along the segment row to a column shared with the adjacent target segment, then one row up or down.
+        Returns the new column
+        """
+        graph = self.graph
+        column = min(max(col, graph.first[segment], graph.first[target]), graph.last[segment], graph.last[target])
+        self.builder.horizontal(col, column)
+        self.builder.add("down" if graph.row[target] > graph.row[segment] else "up", 1)
+        return column
+
+    def route_to_work(self, segment: int) -> Optional[List[int]]:
+        """
+        Method: route_to_work
+        Breadth first search over covered segments for the nearest one with an uncovered neighbour
+
+        Output:
+            Optional[List[int]] - segments to walk through (current excluded), None if all is covered
+        """
+        parent: Dict[int, int] = {segment: segment}
+        pending: Deque[int] = deque([segment])
+        while pending:
+            current = pending.popleft()
+            if current != segment and self.next_uncovered(current) is not None:
+                route = [current]
+                while parent[route[-1]] != segment:
+                    route.append(parent[route[-1]])
+                return route[::-1]
+            for neighbour in self.graph.neighbours(current):
+                if neighbour not in parent and self.covered[neighbour]:
+                    parent[neighbour] = current
+                    pending.append(neighbour)
+        return None
+
+
+def validate_plan(height: int, width: int, rocks: List[List[int]], start_pos: List[int], plan: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Function: validate_plan
+    Execute a plan on LawnmowerSim (run by run, no history nor messages) and check it covers all the
+    reachable grass without crashing
+
+    Args:
+        height, width, rocks, start_pos - lawn (see plan_coverage)
+        plan: Dict[str, Any] - output of plan_coverage
+
+    Output:
+        Dict[str, Any]: "did_mower_crash", "crash_reason", "uncut_grass_remaining", "all_grass_cut" from the simulator,
+            "uncut_grass_cells": grass cells of the lawn left uncut, and "valid": no crash and only the unreachable
+            cells left uncut. uncut_grass_cells differs from the simulator remainder for an out of grid start (counted as
+            a visited entry, the reset [0,0] is only marked when the path returns to it) and a rock start (counted as cut)
+    """
+    sim = LawnmowerSim("plan", height, width, rocks, start_pos, log_level=LOG_OFF, log_sinks=[], keep_history=False)
+    for move, count in plan["runs"]:
+        if not sim.move_run(move, count):
+            break
+    # Grass cells cut: visited cells of the grid but a rock start, plus the reset start cell the mower stood on
+    grid = sim.grid
+    start = sim.start_pos[0] * sim.grid_width + sim.start_pos[1]
+    cut = len(grid.order) - (grid.rocks[start] and grid.visited[start])
+    if grid.outside and not grid.visited[start] and not grid.rocks[start]:
+        cut += 1
+    uncut = sim.total_grass_squares - cut
+    return {
+        "did_mower_crash": sim.did_mower_crash,
+        "crash_reason": sim.crash_reason,
+        "uncut_grass_remaining": sim.uncut_remaining,
+        "all_grass_cut": sim.all_grass_cut,
+        "uncut_grass_cells": uncut,
+        "valid": not sim.did_mower_crash and uncut == plan["unreachable_cells"],
+    }
+
+
+def plan_scenario(params: Dict[str, Any], validate: bool = True) -> Dict[str, Any]:
+    """
+    Function: plan_scenario
+    Plan a scenario given as simulation params (the path, if any, is ignored) and validate it on the simulator
+
+    Args:
+        params: Dict[str, Any] - test_name, height, width, rocks, start_pos (see execute_and_report)
+        validate: bool - execute the plan on LawnmowerSim (default)
+
+    Output:
+        Dict[str, Any] - test_name, height, width, rocks, start_pos, the plan_coverage output and
+            "validation" (see validate_plan) when validated
+    """
+    height, width, rocks, start_pos = params['height'], params['width'], params['rocks'], params['start_pos']
+    result: Dict[str, Any] = {"test_name": params.get('test_name', "plan"), "height": height, "width": width,
+                              "rocks": rocks, "start_pos": start_pos}
+    plan = plan_coverage(height, width, rocks, start_pos)
+    result.update(plan)
+    if validate:
+        result["validation"] = validate_plan(height, width, rocks, start_pos, plan)
+    return result
+
+
+def plan_definition(result: Dict[str, Any]) -> str:
+    """
+    Function: plan_definition
+    Definition file content of a planned scenario, with the run-length path (runs with --cli or /simulate)
+
+    Args:
+        result: Dict[str, Any] - output of plan_scenario
+    """
+    return (f'test_name="{result["test_name"]}_plan"\nheight={result["height"]}\nwidth={result["width"]}\n'
+            f'rocks={json.dumps(result["rocks"])}\nstart_pos={json.dumps(result["start_pos"])}\npath="{result["path"]}"\n')
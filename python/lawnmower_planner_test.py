@@ -0,0 +1,92 @@
+"""
+Project: 
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_planner_test.py
+
+Objectives: 
+    Auto Test for Automated Robotic Lawnmower Simulator coverage-path planner
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import random
+from fastapi.testclient import TestClient
+from python.lawnmower_sim import LawnmowerSim
+from python.lawnmower_path_codec import decode_rle, expand_runs
+from python.lawnmower_planner import plan_coverage, validate_plan
+import python.lawnmower_cli_api as cli_api
+
+def test_planner_01_open_lawn_boustrophedon() -> None:
+    """Verifies that an open lawn is covered by a plain boustrophedon without revisits."""
+    print(f"\n---  Auto Test test_planner_01_open_lawn_boustrophedon - open lawn")
+    plan = plan_coverage(3, 4, [], [0, 0])
+    assert plan["path"] == "R3D1L3D1R3"
+    assert plan["revisits"] == 0 and plan["reachable_cells"] == 12 and plan["boustrophedon_cells"] == 1
+
+def test_planner_02_random_lawns_are_covered() -> None:
+    """Verifies on random lawns that plans never crash and leave only the unreachable cells uncut."""
+    print(f"\n---  Auto Test test_planner_02_random_lawns_are_covered - random lawns")
+    rng = random.Random(11)
+    for _ in range(300):
+        height, width = rng.randint(1, 9), rng.randint(1, 9)
+        start = [rng.randrange(height), rng.randrange(width)]
+        rocks = [[rng.randrange(height), rng.randrange(width)] for _ in range(rng.randint(0, height * width // 2))]
+        rocks = [rock for rock in rocks if rock != start] + [[height + 2, 0]]
+        plan = plan_coverage(height, width, rocks, start)
+        sim_status = LawnmowerSim("plan", height, width, rocks, start, log_level="off", log_sinks=[]).execute_path(
+            list(expand_runs(decode_rle(plan["path"]))))
+        assert not sim_status["did_mower_crash"]
+        assert sim_status["uncut_grass_remaining"] == plan["unreachable_cells"]
+        assert validate_plan(height, width, rocks, start, plan)["valid"]
+
+def test_planner_03_walled_off_cells_reported() -> None:
+    """Verifies that cells behind a wall of rocks are reported as unreachable."""
+    print(f"\n---  Auto Test test_planner_03_walled_off_cells_reported - unreachable cells")
+    plan = plan_coverage(3, 3, [[0, 1], [1, 1], [2, 1]], [0, 0])
+    assert plan["reachable_cells"] == 3
+    assert plan["unreachable_cells"] == 3
+    assert plan["unreachable_segments"] == [[0, 2, 2], [1, 2, 2], [2, 2, 2]]
+
+def test_planner_04_plan_endpoint() -> None:
+    """Verifies the /plan endpoint on a test scenario (its path is ignored)."""
+    print(f"\n---  Auto Test test_planner_04_plan_endpoint - /plan")
+    with open("./tests/lawnmower_scenario03_rock_crash.txt", "rb") as f:
+        response = TestClient(cli_api.app_lawnmower_simulation).post(
+            "/plan", files={"file": ("scenario.txt", f.read(), "text/plain")})
+    assert response.status_code == 200
+    result = response.json()
+    assert result["test_name"] == "lawnmower_scenario03_rock_crash"
+    assert result["validation"]["valid"] and result["validation"]["all_grass_cut"]
+    assert "runs" not in result
+
+def test_planner_05_rocky_lawn_revisit_bound() -> None:
+    """Verifies that isolated rocks are sidestepped within the sweep, bounding the revisits on a rocky lawn."""
+    print(f"\n---  Auto Test test_planner_05_rocky_lawn_revisit_bound - one-row detours")
+    rng = random.Random(0)
+    rocks = [[row, col] for row in range(60) for col in range(60) if rng.random() < 0.08 and [row, col] != [0, 0]]
+    plan = plan_coverage(60, 60, rocks, [0, 0])
+    assert validate_plan(60, 60, rocks, [0, 0], plan)["valid"]
+    assert plan["revisits"] <= 0.45 * plan["reachable_cells"]
+    # A lone rock costs the four moves of its detour, not a row split
+    assert plan_coverage(3, 5, [[0, 2]], [0, 0])["path"] == "R1D1R2U1R1D1L4D1R4"
+
+def test_planner_06_out_of_grid_and_rock_starts() -> None:
+    """Verifies that plans from an out of grid start (reset to [0,0]) or a rock start are validated as the cells they cut."""
+    print(f"\n---  Auto Test test_planner_06_out_of_grid_and_rock_starts - start accounting")
+    # Out of grid start reset onto a rock at [0,0]: the simulator counts the outside start as a visited entry
+    plan = plan_coverage(1, 2, [[0, 0]], [-1, 0])
+    validation = validate_plan(1, 2, [[0, 0]], [-1, 0], plan)
+    assert plan["unreachable_cells"] == 1 and validation["uncut_grass_remaining"] == 0
+    assert validation["valid"] and validation["uncut_grass_cells"] == 1 and not validation["did_mower_crash"]
+    rng = random.Random(7)
+    for _ in range(300):
+        height, width = rng.randint(1, 9), rng.randint(1, 9)
+        rocks = [[rng.randrange(height), rng.randrange(width)] for _ in range(rng.randint(0, height * width // 2))]
+        start = [rng.choice([-1, height, rng.randrange(height)]), rng.choice([-1, width, rng.randrange(width)])]
+        if rng.random() < 0.3 and rocks:
+            start = rocks[0] # rock start
+        plan = plan_coverage(height, width, rocks, start)
+        assert validate_plan(height, width, rocks, start, plan)["valid"], (height, width, rocks, start)
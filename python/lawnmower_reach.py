@@ -0,0 +1,148 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_reach.py
+
+Objectives:
+    Reachability precomputation for Automated Robotic Lawnmower Simulator
+    Labels the connected grass regions of a lawn layout (grid and rocks) with a run-based union-find:
+    row segments between rocks are united with the overlapping segments of the next row
+    Reachable grass from a start position is the size of its region; the rest can never be cut
+    Labellings are cached per layout (grid and valid rocks) in a process LRU, so repeated scenarios
+    on the same lawn reuse them whatever their start position and path
+
+Configuration (environment variables):
+    LAWNMOWER_REACH_CACHE_ENTRIES   layouts kept in the LRU (default 64)
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import os
+import bisect
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Callable, Union
+from lawnmower_planner import SegmentGraph
+
+# Rock coordinates, or a function returning them
+Rocks = Union[Sequence[Sequence[int]], Callable[[], Sequence[Sequence[int]]]]
+
+# Default configuration
+REACH_CACHE_ENTRIES: int = int(os.environ.get("LAWNMOWER_REACH_CACHE_ENTRIES", 64))
+
+
+def layout_key(height: int, width: int, rocks: Sequence[Sequence[int]]) -> str:
+    """
+    Function: layout_key
+    Canonical hash of a lawn layout: grid dimensions and the set of rocks inside the grid
+    (order, repetitions and outside rocks do not change the key)
+
+    Args:
+        height: int - grid height
+        width: int - grid width
+        rocks: List[List[int]] - rock coordinates
+    """
+    cells = sorted({r[0] * width + r[1] for r in rocks if 0 <= r[0] < height and 0 <= r[1] < width})
+    hasher = hashlib.sha256(f"{height}x{width}:".encode("utf-8"))
+    hasher.update(array("q", cells).tobytes())
+    return hasher.hexdigest()
+
+
+class LayoutReachability:
+    """
+    Layout Reachability Class Definition
+    Connected grass regions of a layout, kept as compact arrays (segment bounds and region per segment)
+    """
+
+    def __init__(self, height: int, width: int, rocks: Sequence[Sequence[int]]) -> None:
+        """
+        Method: __init__ (Object Creation)
+        Label the regions: union-find over the row segments and their vertical overlaps
+
+        Args:
+            height (int): grid height
+            width (int): grid width
+            rocks (List[List[int]]): rock coordinates
+        """
+        graph = SegmentGraph(height, width, rocks)
+        parent = list(range(len(graph.row)))
+
+        def find(segment: int) -> int:
+            while parent[segment] != segment:
+                parent[segment] = parent[parent[segment]] # path halving
+                segment = parent[segment]
+            return segment
+
+        for segment, below in enumerate(graph.down):
+            for other in below:
+                root_a, root_b = find(segment), find(other)
+                if root_a != root_b:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+
+        # Region of every segment and cells per region
+        self.region: array = array("q", (find(segment) for segment in range(len(parent))))
+        self.region_cells: Dict[int, int] = {}
+        for segment, region in enumerate(self.region):
+            self.region_cells[region] = self.region_cells.get(region, 0) + graph.size(segment)
+        self.row_segments: array = array("q", graph.row_segments)
+        self.first: array = array("q", graph.first)
+        self.last: array = array("q", graph.last)
+        self.height: int = height
+        self.width: int = width
+        self.grass_cells: int = sum(self.region_cells.values())
+
+    def reachable_from(self, row: int, col: int) -> int:
+        """
+        Method: reachable_from
+        Grass cells reachable from a cell (region size). 0 for rocks and cells outside the grid
+
+        Args:
+            row (int), col (int): start cell
+        """
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            return 0
+        lo, hi = self.row_segments[row], self.row_segments[row + 1]
+        segment = bisect.bisect_left(self.last, col, lo, hi)
+        if segment >= hi or self.first[segment] > col:
+            return 0
+        return self.region_cells[self.region[segment]]
+
+
+# Labellings shared by the simulations of one process
+_layouts: "OrderedDict[str, LayoutReachability]" = OrderedDict()
+_layouts_lock = threading.Lock()
+
+
+def get_layout_reachability(height: int, width: int, rocks: Rocks, key: Optional[str] = None) -> LayoutReachability:
+    """
+    Function: get_layout_reachability
+    Region labelling of a layout, from the LRU when the same lawn was already labelled
+
+    Args:
+        height: int - grid height
+        width: int - grid width
+        rocks: List[List[int]] - rock coordinates, or a function returning them (only called to label a new layout)
+        key: Optional[str] - layout_key of the layout when already known (registered layout id), so a cache hit
+            costs O(1) instead of hashing the rocks
+    """
+    if key is None:
+        if callable(rocks):
+            rocks = rocks()
+        key = layout_key(height, width, rocks)
+    with _layouts_lock:
+        layout: Optional[LayoutReachability] = _layouts.get(key)
+        if layout is not None:
+            _layouts.move_to_end(key)
+            return layout
+    layout = LayoutReachability(height, width, rocks() if callable(rocks) else rocks)
+    with _layouts_lock:
+        _layouts[key] = layout
+        while len(_layouts) > REACH_CACHE_ENTRIES:
+            _layouts.popitem(last=False)
+    return layout
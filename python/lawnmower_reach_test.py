@@ -0,0 +1,102 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_reach_test.py
+
+Objectives:
+    Auto Test for Automated Robotic Lawnmower Simulator reachability precomputation and early exit
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import random
+from collections import deque
+from python.lawnmower_sim import LawnmowerSim
+from python.lawnmower_reach import LayoutReachability, get_layout_reachability, layout_key
+
+# 5 x 5 lawn: a wall of rocks on column 2 cuts off the two right columns (10 cells)
+WALL = [[0, 2], [1, 2], [2, 2], [3, 2], [4, 2]]
+
+def flood_fill(height: int, width: int, rocks: list, start: tuple) -> int:
+    blocked = {(r[0], r[1]) for r in rocks}
+    if start in blocked:
+        return 0
+    seen, queue = {start}, deque([start])
+    while queue:
+        row, col = queue.popleft()
+        for cell in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if 0 <= cell[0] < height and 0 <= cell[1] < width and cell not in blocked and cell not in seen:
+                seen.add(cell)
+                queue.append(cell)
+    return len(seen)
+
+def test_reach_01_regions_match_flood_fill() -> None:
+    """Verifies that the union-find labelling gives the flood fill region size from every cell of random lawns."""
+    print(f"\n---  Auto Test test_reach_01_regions_match_flood_fill - labelling vs flood fill")
+    rng = random.Random(12)
+    for _ in range(50):
+        height, width = rng.randint(1, 9), rng.randint(1, 9)
+        rocks = [[rng.randrange(height), rng.randrange(width)] for _ in range(rng.randint(0, height * width // 2))]
+        layout = LayoutReachability(height, width, rocks)
+        for row in range(height):
+            for col in range(width):
+                assert layout.reachable_from(row, col) == flood_fill(height, width, rocks, (row, col))
+
+def test_reach_02_layout_cache() -> None:
+    """Verifies that the layout key ignores rock order and outside rocks, and that labellings are reused."""
+    print(f"\n---  Auto Test test_reach_02_layout_cache - layout cache")
+    assert layout_key(5, 5, WALL) == layout_key(5, 5, list(reversed(WALL)) + [[9, 9], [0, 2]])
+    assert layout_key(5, 5, WALL) != layout_key(5, 6, WALL)
+    assert get_layout_reachability(5, 5, WALL) is get_layout_reachability(5, 5, WALL[::-1])
+
+def test_reach_03_report_and_early_exit() -> None:
+    """Verifies the reachable grass report and the early exit reasons of the python and numpy engines."""
+    print(f"\n---  Auto Test test_reach_03_report_and_early_exit - report and early exit")
+    path = ["down"] * 4 + ["up"] * 4 + ["right", "right"] # crashes into the wall at the end
+    full = LawnmowerSim("reach", 5, 5, WALL, [0, 0], log_level="off", log_sinks=[], reachability=True).execute_path(path)
+    assert (full["reachable_grass"], full["unreachable_grass"], full["early_exit"]) == (10, 10, None)
+    assert full["did_mower_crash"]
+    plain = LawnmowerSim("reach", 5, 5, WALL, [0, 0], log_level="off", log_sinks=[]).execute_path(path)
+    assert "reachable_grass" not in plain
+
+    # Walled off grass: the verdict is settled before the first move (the crash is never reached)
+    for engine in ("python", "numpy"):
+        lm_sim = LawnmowerSim("reach", 5, 5, WALL, [0, 0], log_level="off", log_sinks=[], early_exit=True)
+        status = lm_sim.execute_path(path, engine=engine)
+        assert status["early_exit"].startswith("Unreachable grass")
+        assert not status["did_mower_crash"] and status["pos_history"] == [(0, 0)]
+
+    # Open lawn: stop once fewer moves are left than uncut grass, or once all grass is cut
+    status = LawnmowerSim("reach", 2, 2, [], [0, 0], log_level="off", log_sinks=[], early_exit=True).execute_path(
+        ["right", "left", "right", "down"])
+    assert status["early_exit"].startswith("Not enough moves") and status["last_pos"] == [0, 1]
+    status = LawnmowerSim("reach", 2, 2, [], [0, 0], log_level="off", log_sinks=[], early_exit=True).execute_runs(
+        [("right", 1), ("down", 1), ("left", 1), ("up", 3)])
+    assert status["all_grass_cut"] and status["early_exit"].startswith("All grass cut")
+    assert not status["did_mower_crash"]
+
+def test_reach_04_early_exit_engines_agree() -> None:
+    """Verifies that the engines stop at full coverage like the python engine, and keep the verdict of an out of grid start."""
+    print(f"\n---  Auto Test test_reach_04_early_exit_engines_agree - early exit python, numpy, parallel")
+    path = ["right", "right", "down", "left", "left", "down", "right", "right", "down"] # crashes out after full coverage
+    statuses = [LawnmowerSim("reach", 3, 3, [], [0, 0], log_level="off", log_sinks=[], early_exit=True).execute_path(
+        list(path), engine=engine) for engine in ("python", "numpy", "parallel")]
+    reference = statuses[0]
+    assert not reference["did_mower_crash"] and reference["early_exit"] == "All grass cut: coverage complete"
+    assert len(reference["pos_history"]) == 9
+    assert all(status == reference for status in statuses[1:])
+    # Out of grid start or start on a rock (counted as visited, not grass): the verdict is only known at the end
+    for height, width, rocks, start, path in (
+            (3, 3, [], [5, 5], ["down", "up", "right", "right", "down", "left", "down", "left", "right", "right", "up"]),
+            (3, 3, [[1, 2], [2, 1]], [5, 5], ["right", "right", "left", "down", "left", "down", "up", "up"]),
+            (1, 4, [[0, 0], [0, 2]], [0, 2], ["right", "left", "down"])):
+        expected = LawnmowerSim("reach", height, width, rocks, start, log_level="off", log_sinks=[]).execute_path(list(path))
+        assert expected["all_grass_cut"] or expected["uncut_grass_remaining"] == -1
+        for engine in ("python", "numpy", "parallel"):
+            status = LawnmowerSim("reach", height, width, rocks, start, log_level="off", log_sinks=[], early_exit=True).execute_path(
+                list(path), engine=engine)
+            assert status["early_exit"] is None
+            assert (status["all_grass_cut"], status["uncut_grass_remaining"]) == (expected["all_grass_cut"], expected["uncut_grass_remaining"])
@@ -0,0 +1,409 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_results.py
+
+Objectives:
+    Pluggable results sink of the Automated Robotic Lawnmower Simulator (replaces one indented JSON file per run)
+    Backends:
+        off     results are not stored
+        file    one compact JSON file per run, unique name <test_name>_<timestamp us>_<random>.json (default)
+        ndjson  append-only NDJSON, one file per process (server workers never interleave lines),
+                writes batched in memory and flushed every LAWNMOWER_RESULTS_FLUSH_RECORDS records or
+                LAWNMOWER_RESULTS_FLUSH_SECONDS, rotated at LAWNMOWER_RESULTS_ROTATE_MB keeping LAWNMOWER_RESULTS_KEEP files
+        sqlite  local SQLite store shared by the workers (WAL), indexed by test_name, crash_reason and time
+    History queries (GET /results) by test_name, crash_reason and time range: indexed on sqlite, scanned on ndjson.
+    An ndjson query flushes the records of its own process only: records buffered by the other server workers are
+    seen once they flush them (at most LAWNMOWER_RESULTS_FLUSH_SECONDS later). Use sqlite for immediate history
+
+Configuration (environment variables):
+    LAWNMOWER_RESULTS_SINK            off, file, ndjson or sqlite (default file)
+    LAWNMOWER_RESULTS_DIR             results folder (default ./results)
+    LAWNMOWER_RESULTS_FLUSH_RECORDS   ndjson records buffered before a flush (default 64)
+    LAWNMOWER_RESULTS_FLUSH_SECONDS   ndjson maximum age of a buffered record in seconds, flushed by a timer (default 1)
+    LAWNMOWER_RESULTS_ROTATE_MB       ndjson file size rotation threshold in MB (default 64)
+    LAWNMOWER_RESULTS_KEEP            ndjson rotated files kept per process (default 10)
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import os
+import glob
+import json
+import time
+import uuid
+import atexit
+import sqlite3
+import threading
+from datetime import datetime
+from multiprocessing import util as multiprocessing_util
+from typing import List, Dict, Any, Optional, Iterator
+
+# Default configuration
+RESULTS_SINK: str = os.environ.get("LAWNMOWER_RESULTS_SINK", "file")
+RESULTS_DIR: str = os.environ.get("LAWNMOWER_RESULTS_DIR", "./results")
+RESULTS_FLUSH_RECORDS: int = int(os.environ.get("LAWNMOWER_RESULTS_FLUSH_RECORDS", 64))
+RESULTS_FLUSH_SECONDS: float = float(os.environ.get("LAWNMOWER_RESULTS_FLUSH_SECONDS", 1))
+RESULTS_ROTATE_BYTES: int = int(float(os.environ.get("LAWNMOWER_RESULTS_ROTATE_MB", 64)) * 1024 * 1024)
+RESULTS_KEEP: int = int(os.environ.get("LAWNMOWER_RESULTS_KEEP", 10))
+
+# Available backends
+RESULTS_SINKS = ("off", "file", "ndjson", "sqlite")
+
+# Fields of a history record (plus recorded_at, and the full result on request)
+RECORD_FIELDS: List[str] = ["test_name", "did_mower_crash", "crash_reason", "all_grass_cut", "uncut_grass_remaining"]
+
+
+def _compact(data: Dict[str, Any]) -> str:
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _record(recorded_at: float, result: Dict[str, Any], include_result: bool) -> Dict[str, Any]:
+    record: Dict[str, Any] = {"recorded_at": recorded_at}
+    record.update((field, result.get(field)) for field in RECORD_FIELDS)
+    if include_result:
+        record["result"] = result
+    return record
+
+
+class ResultsSink:
+    """
+    Results Sink Class Definition (base class, backend "off")
+    Stores the results of the simulations. Backends override write, and query when they support history queries
+    (supports_query)
+    """
+    name: str = "off"
+    supports_query: bool = False
+
+    def write(self, sim_status: Dict[str, Any]) -> Optional[str]:
+        """
+        Method: write
+        Store the results of a simulation
+
+        Args:
+            sim_status: Dict[str, Any] - Sim Status Structure
+
+        Output:
+            Optional[str] - where the results are stored (None if not stored)
+        """
+        return None
+
+    def query(
+        self,
+        test_name: Optional[str] = None,
+        crash_reason: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: int = 100,
+        include_result: bool = False) -> List[Dict[str, Any]]:
+        """
+        Method: query
+        History of stored results, most recent first
+
+        Args:
+            test_name (Optional[str]): only this test name
+            crash_reason (Optional[str]): only this crash reason ("None" for runs without crash)
+            since (Optional[float]), until (Optional[float]): recorded time range (epoch seconds, inclusive)
+            limit (int): maximum number of records
+            include_result (bool): include the full Sim Status Structure
+
+        Output:
+            List[Dict[str, Any]] - recorded_at, RECORD_FIELDS (and result). Empty if the backend does not
+            support queries (supports_query False)
+        """
+        return []
+
+    def flush(self) -> None:
+        """
+        Method: flush
+        Write buffered results
+        """
+
+    def close(self) -> None:
+        """
+        Method: close
+        Flush and release the backend
+        """
+        self.flush()
+
+
+class FileResults(ResultsSink):
+    """
+    File Results Class Definition
+    One compact JSON file per run. Names are unique (microseconds and a random suffix), so runs of the same test
+    in the same second never overwrite each other
+    """
+    name = "file"
+
+    def __init__(self, directory: str = RESULTS_DIR) -> None:
+        self.directory: str = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, sim_status: Dict[str, Any]) -> Optional[str]:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        filename = os.path.join(self.directory, f"{sim_status['test_name']}_{timestamp}_{uuid.uuid4().hex[:8]}.json")
+        with open(filename, "w") as f:
+            f.write(_compact(sim_status))
+        return filename
+
+
+class NdjsonResults(ResultsSink):
+    """
+    NDJSON Results Class Definition
+    Append-only NDJSON file of this process (results-<pid>.ndjson), one {"recorded_at", "result"} line per run.
+    Lines are buffered and written in batches, at most flush_seconds after the oldest one (timer thread, so an idle
+    worker does not keep them in memory); the file is rotated by size and old rotations are deleted
+    """
+    name = "ndjson"
+    supports_query = True
+
+    def __init__(
+        self,
+        directory: str = RESULTS_DIR,
+        flush_records: int = RESULTS_FLUSH_RECORDS,
+        flush_seconds: float = RESULTS_FLUSH_SECONDS,
+        rotate_bytes: int = RESULTS_ROTATE_BYTES,
+        keep: int = RESULTS_KEEP) -> None:
+        """
+        Method: __init__ (Object Creation)
+
+        Args:
+            directory (str): results folder
+            flush_records (int): buffered records before a flush
+            flush_seconds (float): maximum age of the oldest buffered record before a flush (timer)
+            rotate_bytes (int): file size rotation threshold
+            keep (int): rotated files kept for this process
+        """
+        self.directory: str = directory
+        self.flush_records: int = max(flush_records, 1)
+        self.flush_seconds: float = flush_seconds
+        self.rotate_bytes: int = rotate_bytes
+        self.keep: int = keep
+        self.pid: int = os.getpid()
+        self.filename: str = os.path.join(directory, f"results-{self.pid}.ndjson")
+        self.buffer: List[str] = []
+        self.buffered_at: float = 0.0
+        self.timer: Optional[threading.Timer] = None
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, sim_status: Dict[str, Any]) -> Optional[str]:
+        now = time.time()
+        line = _compact({"recorded_at": now, "result": sim_status}) + "\n"
+        self._check_fork()
+        with self.lock:
+            if not self.buffer:
+                self.buffered_at = now
+            self.buffer.append(line)
+            if len(self.buffer) >= self.flush_records or now - self.buffered_at >= self.flush_seconds:
+                self._flush()
+            elif self.timer is None:
+                # No further write may come (idle worker): flush the buffer flush_seconds later at most
+                self.timer = threading.Timer(self.flush_seconds, self._timed_flush)
+                self.timer.daemon = True
+                self.timer.start()
+        return self.filename
+
+    def _timed_flush(self) -> None:
+        self._check_fork()
+        with self.lock:
+            self.timer = None
+            self._flush()
+
+    def flush(self) -> None:
+        self._check_fork()
+        with self.lock:
+            self._flush()
+
+    def close(self) -> None:
+        self._check_fork()
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            self._flush()
+
+    def _check_fork(self) -> None:
+        # Forked process: own file and lock (a parent thread may have held the copied lock at fork),
+        # the parent buffer is not ours to write. Checked before taking the lock
+        if os.getpid() != self.pid:
+            self.pid, self.buffer, self.timer, self.lock = os.getpid(), [], None, threading.Lock()
+            self.filename = os.path.join(self.directory, f"results-{self.pid}.ndjson")
+
+    def _flush(self) -> None:
+        # Caller holds the lock
+        if not self.buffer:
+            return
+        with open(self.filename, "a") as f:
+            f.write("".join(self.buffer))
+            size = f.tell()
+        self.buffer = []
+        if size >= self.rotate_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        # Rename the full file and delete the oldest rotations of this process
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        os.replace(self.filename, os.path.join(self.directory, f"results-{self.pid}-{timestamp}.ndjson"))
+        rotated = sorted(glob.glob(os.path.join(self.directory, f"results-{self.pid}-*.ndjson")))
+        for filename in rotated[:max(len(rotated) - self.keep, 0)]:
+            os.remove(filename)
+
+    def _records(self) -> Iterator[Dict[str, Any]]:
+        # All the NDJSON files of the folder (every process, rotated included)
+        for filename in glob.glob(os.path.join(self.directory, "results-*.ndjson")):
+            try:
+                with open(filename) as f:
+                    for line in f:
+                        if line.endswith("\n"): # a line being written by another process is skipped
+                            yield json.loads(line)
+            except FileNotFoundError:
+                continue # rotated away meanwhile
+
+    def query(
+        self,
+        test_name: Optional[str] = None,
+        crash_reason: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: int = 100,
+        include_result: bool = False) -> List[Dict[str, Any]]:
+        # Full scan of the files (use the sqlite backend for frequent queries).
+        # Records still buffered by other processes are not seen until their timed flush
+        self.flush()
+        matches: List[Dict[str, Any]] = []
+        for line in self._records():
+            result, recorded_at = line["result"], line["recorded_at"]
+            if ((test_name is None or result.get("test_name") == test_name)
+                    and (crash_reason is None or result.get("crash_reason") == crash_reason)
+                    and (since is None or recorded_at >= since) and (until is None or recorded_at <= until)):
+                matches.append(_record(recorded_at, result, include_result))
+        matches.sort(key=lambda record: record["recorded_at"], reverse=True)
+        return matches[:limit]
+
+
+class SqliteResults(ResultsSink):
+    """
+    SQLite Results Class Definition
+    Local SQLite store (results.sqlite3, WAL journal so the server workers write concurrently)
+    with the record fields as indexed columns and the full result as compact JSON
+    """
+    name = "sqlite"
+    supports_query = True
+
+    def __init__(self, directory: str = RESULTS_DIR) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.filename: str = os.path.join(directory, "results.sqlite3")
+        self.pid: int = os.getpid()
+        self.lock = threading.Lock()
+        self.connection = self._connect()
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS results (id INTEGER PRIMARY KEY, recorded_at REAL NOT NULL, "
+                "test_name TEXT, did_mower_crash INTEGER, crash_reason TEXT, all_grass_cut INTEGER, "
+                "uncut_grass_remaining INTEGER, result TEXT NOT NULL)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS results_test_name ON results (test_name, recorded_at)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS results_crash_reason ON results (crash_reason, recorded_at)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS results_recorded_at ON results (recorded_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.filename, timeout=30, check_same_thread=False)
+
+    def _check_fork(self) -> None:
+        # Forked process (batch workers of a threaded server worker): a connection must not be used across a fork
+        # and a parent thread may have held the copied lock at fork. Own connection and lock, checked before locking
+        if os.getpid() != self.pid:
+            self.pid, self.lock = os.getpid(), threading.Lock()
+            self.connection = self._connect()
+
+    def write(self, sim_status: Dict[str, Any]) -> Optional[str]:
+        self._check_fork()
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT INTO results (recorded_at, test_name, did_mower_crash, crash_reason, all_grass_cut, "
+                "uncut_grass_remaining, result) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (time.time(), sim_status.get("test_name"), sim_status.get("did_mower_crash"), sim_status.get("crash_reason"),
+                 sim_status.get("all_grass_cut"), sim_status.get("uncut_grass_remaining"), _compact(sim_status)))
+        return self.filename
+
+    def query(
+        self,
+        test_name: Optional[str] = None,
+        crash_reason: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: int = 100,
+        include_result: bool = False) -> List[Dict[str, Any]]:
+        conditions: List[str] = []
+        args: List[Any] = []
+        for condition, value in (("test_name = ?", test_name), ("crash_reason = ?", crash_reason),
+                                 ("recorded_at >= ?", since), ("recorded_at <= ?", until)):
+            if value is not None:
+                conditions.append(condition)
+                args.append(value)
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        self._check_fork()
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT recorded_at, result FROM results{where} ORDER BY recorded_at DESC LIMIT ?", args + [limit]).fetchall()
+        return [_record(recorded_at, json.loads(result), include_result) for recorded_at, result in rows]
+
+    def close(self) -> None:
+        self._check_fork()
+        with self.lock:
+            self.connection.close()
+
+
+def create_results_sink(name: str = RESULTS_SINK, directory: str = RESULTS_DIR) -> ResultsSink:
+    """
+    Function: create_results_sink
+    New results sink of a backend
+
+    Args:
+        name: str - off, file, ndjson or sqlite
+        directory: str - results folder
+    """
+    if name == "off":
+        return ResultsSink()
+    if name == "file":
+        return FileResults(directory)
+    if name == "ndjson":
+        return NdjsonResults(directory)
+    if name == "sqlite":
+        return SqliteResults(directory)
+    raise ValueError(f"Unknown results sink {name}. Expected one of {RESULTS_SINKS}")
+
+
+# Sink shared by the simulations of one process (created on first use)
+_results_sink: Optional[ResultsSink] = None
+_results_sink_lock = threading.Lock()
+
+
+def _reset_results_sink_lock() -> None:
+    # Forked process: a parent thread may have held the lock at fork
+    global _results_sink_lock
+    _results_sink_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_results_sink_lock)
+
+
+def get_results_sink() -> ResultsSink:
+    """
+    Function: get_results_sink
+    Results sink of this process, configured from the environment.
+    Buffered results are flushed at exit, also in process pool workers (which skip atexit)
+    """
+    global _results_sink
+    with _results_sink_lock:
+        if _results_sink is None:
+            _results_sink = create_results_sink()
+            atexit.register(_results_sink.close)
+            multiprocessing_util.Finalize(None, _results_sink.close, exitpriority=10)
+        return _results_sink
@@ -0,0 +1,121 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_results_test.py
+
+Objectives:
+    Auto Test for Automated Robotic Lawnmower Simulator results sinks (off, file, ndjson, sqlite)
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import os
+import json
+import time
+from typing import Any, Dict
+from fastapi.testclient import TestClient
+import lawnmower_results
+import python.lawnmower_cli_api as cli_api
+from python.lawnmower_results import ResultsSink, FileResults, NdjsonResults, SqliteResults, create_results_sink
+
+def status(test_name: str, crash_reason: Any = None) -> Dict[str, Any]:
+    return {"test_name": test_name, "did_mower_crash": crash_reason is not None, "crash_reason": crash_reason,
+            "all_grass_cut": False, "uncut_grass_remaining": 3, "pos_history": [[0, 0]]}
+
+def test_results_01_file_names_unique(tmp_path: Any) -> None:
+    """Verifies that runs of the same test in the same second get their own compact JSON file."""
+    print(f"\n---  Auto Test test_results_01_file_names_unique - file sink")
+    sink = FileResults(str(tmp_path))
+    names = {sink.write(status("same")) for _ in range(20)}
+    assert len(names) == 20 and len(os.listdir(tmp_path)) == 20
+    with open(names.pop()) as f: # type: ignore[arg-type]
+        content = f.read()
+    assert json.loads(content) == status("same") and " " not in content
+    assert create_results_sink("off", str(tmp_path)).write(status("off")) is None
+
+def test_results_02_ndjson_batched_and_rotated(tmp_path: Any) -> None:
+    """Verifies NDJSON batched flushes, size rotation with bounded rotated files and the scan query."""
+    print(f"\n---  Auto Test test_results_02_ndjson_batched_and_rotated - ndjson sink")
+    sink = NdjsonResults(str(tmp_path), flush_records=4, flush_seconds=3600, rotate_bytes=1, keep=2)
+    for index in range(3):
+        sink.write(status(f"run{index}"))
+    assert os.listdir(tmp_path) == [] # buffered
+    sink.write(status("run3", "Crashed into Rock"))
+    assert len(os.listdir(tmp_path)) == 1 # one batch, rotated
+    for index in range(4, 12):
+        sink.write(status(f"run{index}"))
+    assert len(os.listdir(tmp_path)) == 2 # 3 rotations, 2 kept
+    sink.rotate_bytes = 1 << 30
+    sink.write(status("run12", "Crashed into Rock"))
+    records = sink.query(crash_reason="Crashed into Rock")
+    assert [record["test_name"] for record in records] == ["run12"] # run3 rotated away, flushed by the query
+    assert len(sink.query(limit=3)) == 3 and "result" in sink.query(limit=1, include_result=True)[0]
+    sink.close()
+
+def test_results_03_sqlite_indexed_queries(tmp_path: Any) -> None:
+    """Verifies SQLite queries by test name, crash reason and time range, most recent first."""
+    print(f"\n---  Auto Test test_results_03_sqlite_indexed_queries - sqlite sink")
+    sink = SqliteResults(str(tmp_path))
+    sink.write(status("alpha"))
+    middle = time.time()
+    sink.write(status("alpha", "Crashed into Fence"))
+    sink.write(status("beta", "Crashed into Fence"))
+    assert [r["test_name"] for r in sink.query(crash_reason="Crashed into Fence")] == ["beta", "alpha"]
+    assert [r["crash_reason"] for r in sink.query(test_name="alpha")] == ["Crashed into Fence", None]
+    assert len(sink.query(since=middle)) == 2 and len(sink.query(until=middle)) == 1
+    assert sink.query(test_name="beta", include_result=True)[0]["result"] == status("beta", "Crashed into Fence")
+    plan = sink.connection.execute("EXPLAIN QUERY PLAN SELECT result FROM results WHERE test_name = ? "
+                                   "ORDER BY recorded_at DESC", ("alpha",)).fetchall()
+    assert "results_test_name" in str(plan)
+    sink.close()
+
+def test_results_04_api_history(monkeypatch: Any, tmp_path: Any) -> None:
+    """Verifies that /simulate stores into the configured sink and /results queries it (501 without queries)."""
+    print(f"\n---  Auto Test test_results_04_api_history - /results")
+    # Results sink of the module imported by the server (python/ on sys.path)
+    monkeypatch.setattr(lawnmower_results, "_results_sink", lawnmower_results.SqliteResults(str(tmp_path)))
+    client = TestClient(cli_api.app_lawnmower_simulation)
+    definition = b'test_name="history"\nheight=2\nwidth=2\nrocks=[]\nstart_pos=[0,0]\npath=["Up"]\n'
+    response = client.post("/simulate", params={"cache": "false"}, files={"file": ("scenario.txt", definition, "text/plain")})
+    assert response.status_code == 200
+    records = client.get("/results", params={"test_name": "history", "include_result": "true"}).json()
+    assert len(records) == 1 and records[0]["crash_reason"] == "Crashed into Fence"
+    assert records[0]["result"] == response.json()
+    monkeypatch.setattr(lawnmower_results, "_results_sink", lawnmower_results.FileResults(str(tmp_path)))
+    response = client.get("/results")
+    assert response.status_code == 501 and "file" in response.json()["detail"]
+    assert lawnmower_results.ResultsSink().query() == []
+
+def test_results_05_sqlite_fork_safe(tmp_path: Any) -> None:
+    """Verifies that a forked child writes through its own connection even if a parent thread held the sink lock."""
+    print(f"\n---  Auto Test test_results_05_sqlite_fork_safe - sqlite sink after fork")
+    sink = SqliteResults(str(tmp_path))
+    with sink.lock: # held by "another thread" of the parent at fork
+        pid = os.fork()
+        if pid == 0:
+            try:
+                sink.write(status("child"))
+                sink.close()
+            finally:
+                os._exit(0)
+    assert os.waitpid(pid, 0)[1] == 0
+    assert [r["test_name"] for r in sink.query()] == ["child"]
+    sink.close()
+
+def test_results_06_ndjson_timed_flush(tmp_path: Any) -> None:
+    """Verifies that an idle NDJSON sink flushes its buffer after flush_seconds, so other workers query it."""
+    print(f"\n---  Auto Test test_results_06_ndjson_timed_flush - ndjson flushed without a further write")
+    sink = NdjsonResults(str(tmp_path), flush_records=100, flush_seconds=0.05)
+    other_worker = NdjsonResults(str(tmp_path))
+    sink.write(status("idle"))
+    assert os.listdir(tmp_path) == [] and other_worker.query() == [] # buffered
+    deadline = time.time() + 5
+    while not os.listdir(tmp_path) and time.time() < deadline:
+        time.sleep(0.01)
+    assert [r["test_name"] for r in other_worker.query()] == ["idle"] and sink.timer is None
+    sink.write(status("closed"))
+    sink.close()
+    assert sink.timer is None and len(other_worker.query()) == 2
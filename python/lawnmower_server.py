@@ -0,0 +1,125 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_server.py
+
+Objectives:
+    API server (uvicorn) configuration derived from the container resources and the environment
+    The CPUs available to the container are read from its cgroup CPU quota (cgroup v2 cpu.max, or v1
+    cpu.cfs_quota_us / cpu.cfs_period_us), bounded by the CPUs the process may run on. A pod limited to
+    1000m gets 1 server worker instead of one per CPU of the node
+    Interactive sessions (lawnmower_sessions) live in the memory of the server worker that created them, so they are
+    opt-in: with sessions enabled the server runs a single worker (and the k8s service routes a client to the same pod),
+    otherwise the worker count follows the CPU quota
+    Only the standard library is imported here (loaded by the lightweight CLI for --api)
+
+Configuration (environment variables):
+    LAWNMOWER_API_HOST               listening address (default 0.0.0.0)
+    LAWNMOWER_API_PORT               listening port (default 8000)
+    LAWNMOWER_API_WORKERS            server worker processes (default CPUs available to the container, 1 with sessions)
+    LAWNMOWER_API_KEEP_ALIVE         idle keep-alive connection timeout in seconds (default 5)
+    LAWNMOWER_API_LIMIT_CONCURRENCY  connections plus requests per worker before answering 503 (default unlimited)
+    LAWNMOWER_API_BACKLOG            pending connections of the listening socket (default 2048)
+    LAWNMOWER_SESSIONS               interactive sessions on or off (default off, on runs a single server worker)
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import os
+import math
+from typing import Dict, Any, Optional
+
+# cgroup file system of the container
+CGROUP_ROOT: str = "/sys/fs/cgroup"
+
+
+def read_first_line(filename: str) -> Optional[str]:
+    """
+    Function: read_first_line
+    First line of a file, None if it cannot be read
+    """
+    try:
+        with open(filename, "r") as f:
+            return f.readline().strip()
+    except OSError:
+        return None
+
+
+def cgroup_cpu_limit(root: str = CGROUP_ROOT) -> Optional[float]:
+    """
+    Function: cgroup_cpu_limit
+    CPU quota of the container in CPUs (e.g. 0.25 for a 250m limit)
+
+    Args:
+        root: str - cgroup file system
+
+    Output:
+        Optional[float] - CPUs allowed by the quota, None without a quota (or outside a container)
+    """
+    # cgroup v2: "<quota> <period>", quota "max" when unlimited
+    line = read_first_line(os.path.join(root, "cpu.max"))
+    if line:
+        quota, _, period = line.partition(" ")
+        if quota != "max" and period:
+            return int(quota) / int(period)
+        return None
+    # cgroup v1: quota -1 when unlimited
+    for folder in ("cpu", "cpu,cpuacct", ""):
+        quota_line = read_first_line(os.path.join(root, folder, "cpu.cfs_quota_us"))
+        period_line = read_first_line(os.path.join(root, folder, "cpu.cfs_period_us"))
+        if quota_line and period_line:
+            quota_us, period_us = int(quota_line), int(period_line)
+            return quota_us / period_us if quota_us > 0 and period_us > 0 else None
+    return None
+
+
+def available_cpus(root: str = CGROUP_ROOT) -> int:
+    """
+    Function: available_cpus
+    Whole CPUs available to this process: the CPUs it may run on, bounded by the cgroup quota (rounded up, min 1)
+
+    Args:
+        root: str - cgroup file system
+    """
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    limit = cgroup_cpu_limit(root)
+    if limit is not None:
+        cpus = min(cpus, math.ceil(limit))
+    return max(cpus, 1)
+
+
+def sessions_enabled() -> bool:
+    """
+    Function: sessions_enabled
+    True when the API serves interactive sessions (LAWNMOWER_SESSIONS, default off)
+    """
+    return os.environ.get("LAWNMOWER_SESSIONS", "off").strip().lower() in ("on", "true", "1")
+
+
+def server_options(root: str = CGROUP_ROOT) -> Dict[str, Any]:
+    """
+    Function: server_options
+    uvicorn.run keyword arguments of the API server (see module description).
+    Raises ValueError for several workers with sessions enabled
+
+    Args:
+        root: str - cgroup file system
+    """
+    sessions = sessions_enabled()
+    workers = int(os.environ.get("LAWNMOWER_API_WORKERS") or (1 if sessions else available_cpus(root)))
+    if sessions and workers > 1:
+        raise ValueError(f"LAWNMOWER_API_WORKERS={workers} with sessions enabled: sessions live in the memory of one "
+                         f"server worker. Run one worker per pod or set LAWNMOWER_SESSIONS=off")
+    limit_concurrency = os.environ.get("LAWNMOWER_API_LIMIT_CONCURRENCY")
+    return {
+        "host": os.environ.get("LAWNMOWER_API_HOST", "0.0.0.0"),
+        "port": int(os.environ.get("LAWNMOWER_API_PORT", 8000)),
+        "workers": workers,
+        "timeout_keep_alive": int(os.environ.get("LAWNMOWER_API_KEEP_ALIVE", 5)),
+        "limit_concurrency": int(limit_concurrency) if limit_concurrency else None,
+        "backlog": int(os.environ.get("LAWNMOWER_API_BACKLOG", 2048)),
+    }
@@ -0,0 +1,62 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_server_test.py
+
+Objectives:
+    Auto Test for Automated Robotic Lawnmower Simulator API server configuration (cgroup CPU quota, environment)
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import os
+import pytest
+from typing import Any
+from python.lawnmower_server import cgroup_cpu_limit, available_cpus, server_options
+
+def write(path: Any, text: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+def test_server_01_cgroup_quota(tmp_path: Any) -> None:
+    """Verifies the cgroup v2 and v1 CPU quotas, unlimited quotas and the worker count derived from them."""
+    print(f"\n---  Auto Test test_server_01_cgroup_quota - cpu.max and cpu.cfs_quota_us")
+    v2, v1, none = tmp_path / "v2", tmp_path / "v1", tmp_path / "none"
+    write(v2 / "cpu.max", "250000 100000\n")
+    write(v1 / "cpu" / "cpu.cfs_quota_us", "50000\n")
+    write(v1 / "cpu" / "cpu.cfs_period_us", "100000\n")
+    assert cgroup_cpu_limit(str(v2)) == 2.5 and cgroup_cpu_limit(str(v1)) == 0.5
+    assert cgroup_cpu_limit(str(none)) is None
+    write(none / "cpu.max", "max 100000\n")
+    assert cgroup_cpu_limit(str(none)) is None
+    assert available_cpus(str(v1)) == 1
+    assert available_cpus(str(v2)) == min(3, available_cpus(str(none)))
+
+def test_server_02_environment(tmp_path: Any, monkeypatch: Any) -> None:
+    """Verifies that the environment overrides the derived worker count and sets keep-alive and limits."""
+    print(f"\n---  Auto Test test_server_02_environment - LAWNMOWER_API_*")
+    write(tmp_path / "cpu.max", "100000 100000\n")
+    options = server_options(str(tmp_path))
+    assert options["workers"] == 1 and options["limit_concurrency"] is None and options["port"] == 8000
+    monkeypatch.setenv("LAWNMOWER_SESSIONS", "off")
+    monkeypatch.setenv("LAWNMOWER_API_WORKERS", "3")
+    monkeypatch.setenv("LAWNMOWER_API_KEEP_ALIVE", "30")
+    monkeypatch.setenv("LAWNMOWER_API_LIMIT_CONCURRENCY", "64")
+    options = server_options(str(tmp_path))
+    assert (options["workers"], options["timeout_keep_alive"], options["limit_concurrency"]) == (3, 30, 64)
+
+def test_server_03_sessions_single_worker(tmp_path: Any, monkeypatch: Any) -> None:
+    """Verifies that sessions are opt-in, run a single worker whatever the CPUs and reject several workers explicitly."""
+    print(f"\n---  Auto Test test_server_03_sessions_single_worker - LAWNMOWER_SESSIONS")
+    write(tmp_path / "cpu.max", "400000 100000\n")
+    monkeypatch.delenv("LAWNMOWER_SESSIONS", raising=False)
+    assert server_options(str(tmp_path))["workers"] == available_cpus(str(tmp_path))
+    monkeypatch.setenv("LAWNMOWER_SESSIONS", "on")
+    assert server_options(str(tmp_path))["workers"] == 1
+    monkeypatch.setenv("LAWNMOWER_API_WORKERS", "4")
+    with pytest.raises(ValueError, match="LAWNMOWER_SESSIONS=off"):
+        server_options(str(tmp_path))
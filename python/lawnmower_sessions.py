@@ -0,0 +1,343 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_sessions.py
+
+Objectives:
+    Interactive simulation sessions (teleoperation): a LawnmowerSim is created once and kept in memory,
+    moves or batches of moves are appended to it and each append answers only the delta
+    (moves done, new position, crash, newly cut cells), so an append costs O(moves appended) whatever the
+    session length, instead of replaying the whole path on every update
+    Sessions run without messages nor pos_history (memory bounded by the lawn) and are evicted after an idle
+    time to live or, beyond the maximum number of sessions or the memory budget of the lawn maps (2 bytes per
+    cell: rock and visited maps), least recently used first
+    Sessions live in the memory of the server worker that created them, so they are opt-in: with sessions enabled
+    the server runs a single worker (see lawnmower_server) and the k8s service must route a client to the same pod (uncomment its sessionAffinity ClientIP).
+    Session ids start with the tag of their worker, so a request reaching another worker (or a restarted one)
+    gets an explicit 404 instead of a plain unknown session
+
+Configuration (environment variables):
+    LAWNMOWER_SESSION_TTL   idle time to live of a session in seconds (default 600)
+    LAWNMOWER_SESSION_MAX   sessions kept per server worker (default 1000)
+    LAWNMOWER_SESSION_MB    memory budget of the session lawn maps per server worker in MB (default 256)
+    LAWNMOWER_SESSIONS      interactive sessions on or off (default off, see lawnmower_server)
+
+Execution:
+    store = get_session_store()
+    session_id, session = store.create(params)
+    store.get(session_id).append([("up", 1), ("right", 3)])
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import os
+import time
+import secrets
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+from lawnmower_sim import LawnmowerSim, LOG_OFF
+from lawnmower_cache import path_runs
+from lawnmower_layouts import apply_layout
+
+# Default configuration
+SESSION_TTL: float = float(os.environ.get("LAWNMOWER_SESSION_TTL", 600))
+SESSION_MAX: int = int(os.environ.get("LAWNMOWER_SESSION_MAX", 1000))
+SESSION_BYTES: int = int(float(os.environ.get("LAWNMOWER_SESSION_MB", 256)) * 1024 * 1024)
+
+# Bytes per lawn cell of a session: rock and visited maps of its GridState
+SESSION_CELL_BYTES: int = 2
+
+
+class SessionNotFound(KeyError):
+    """
+    Raised when a session id is unknown, expired or evicted
+    """
+
+
+class SessionCrashed(Exception):
+    """
+    Raised when moves are appended to a session whose mower already crashed
+    """
+
+
+class SessionTooLarge(Exception):
+    """
+    Raised when the lawn of a new session alone exceeds the memory budget of the sessions
+    """
+
+
+class Session:
+    """
+    Session Class Definition
+    One simulator kept between requests. Appends of the same session are serialised by its lock
+    """
+    __slots__ = ("session_id", "sim", "nbytes", "lock", "moves", "last_used")
+
+    def __init__(self, session_id: str, sim: LawnmowerSim, nbytes: int = 0) -> None:
+        """
+        Method: __init__ (Object Creation)
+
+        Args:
+            session_id (str): session id
+            sim (LawnmowerSim): simulator of the session, at its start position
+            nbytes (int): memory of the session counted against the budget of the store
+        """
+        self.session_id: str = session_id
+        self.sim: LawnmowerSim = sim
+        self.nbytes: int = nbytes
+        self.lock = threading.Lock()
+        self.moves: int = 0
+        self.last_used: float = time.monotonic()
+
+    def append(self, runs: Iterable[Tuple[str, int]]) -> Dict[str, Any]:
+        """
+        Method: append
+        Execute runs of moves (move, count) from the current position, stopping at a crash
+
+        Args:
+            runs: Iterable[Tuple[str, int]] - runs of identical moves (up,down,left,right)
+
+        Output:
+            Dict[str, Any] - delta of the append:
+                "moves" (moves done, crash move included), "total_moves", "last_pos", "new_cells" (cells cut by
+                the append), "uncut_grass_remaining", "all_grass_cut", "did_mower_crash", "crash_reason"
+        """
+        with self.lock:
+            sim = self.sim
+            if sim.did_mower_crash:
+                raise SessionCrashed(f"Session {self.session_id} already crashed: {sim.crash_reason}")
+            visited_before = sim.grid.visited_count()
+            moves = 0
+            for move, count in runs:
+                row, col = sim.last_pos
+                ok = sim.move_run(move.lower(), count)
+                # Moves done: the whole run, or up to the crash cell (a run is a straight line)
+                moves += count if ok else abs(sim.last_pos[0] - row) + abs(sim.last_pos[1] - col)
+                if not ok:
+                    break
+            self.moves += moves
+            return {
+                "moves": moves,
+                "total_moves": self.moves,
+                "last_pos": list(sim.last_pos),
+                "new_cells": sim.grid.visited_count() - visited_before,
+                "uncut_grass_remaining": sim.uncut_remaining,
+                "all_grass_cut": sim.all_grass_cut,
+                "did_mower_crash": sim.did_mower_crash,
+                "crash_reason": sim.crash_reason,
+            }
+
+    def state(self) -> Dict[str, Any]:
+        """
+        Method: state
+        Current verdict of the session (Sim Status Structure without the coordinate lists),
+        with the path analytics when the session was created with analytics
+        """
+        with self.lock:
+            sim = self.sim
+            state: Dict[str, Any] = {
+                "session_id": self.session_id,
+                "test_name": sim.test_name,
+                "grid_width": sim.grid_width,
+                "grid_height": sim.grid_height,
+                "start_pos": sim.start_pos,
+                "total_grass_squares": sim.total_grass_squares,
+                "all_grass_cut": sim.all_grass_cut,
+                "uncut_grass_remaining": sim.uncut_remaining,
+                "did_mower_crash": sim.did_mower_crash,
+                "crash_reason": sim.crash_reason,
+                "last_pos": list(sim.last_pos),
+                "total_moves": self.moves,
+            }
+            if sim.layout is not None:
+                state["layout_id"] = sim.layout.layout_id
+            if sim.analytics is not None:
+                state["analytics"] = sim.analytics.summary()
+            return state
+
+
+class SessionStore:
+    """
+    Session Store Class Definition
+    Sessions of this server worker in least recently used order, with idle TTL, count and memory eviction
+    """
+
+    def __init__(
+        self,
+        ttl: float = SESSION_TTL,
+        max_sessions: int = SESSION_MAX,
+        worker: Optional[str] = None,
+        max_bytes: int = SESSION_BYTES) -> None:
+        """
+        Method: __init__ (Object Creation)
+
+        Args:
+            ttl (float): idle time to live of a session in seconds
+            max_sessions (int): sessions kept, least recently used evicted beyond
+            worker (Optional[str]): tag of this server worker, prefixed to its session ids (default random)
+            max_bytes (int): memory budget of the session lawn maps, least recently used evicted beyond
+        """
+        self.worker: str = worker or secrets.token_hex(4)
+        self.ttl: float = ttl
+        self.max_sessions: int = max(max_sessions, 1)
+        self.max_bytes: int = max_bytes
+        self.nbytes: int = 0
+        self.sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.counters: Dict[str, int] = {"created": 0, "expired": 0, "evicted": 0, "deleted": 0}
+
+    def _remove(self, session_id: str) -> Optional[Session]:
+        # Caller holds the lock
+        session = self.sessions.pop(session_id, None)
+        if session is not None:
+            self.nbytes -= session.nbytes
+        return session
+
+    def _expire(self, now: float) -> None:
+        # Least recently used first: stop at the first session still alive
+        while self.sessions:
+            session = next(iter(self.sessions.values()))
+            if now - session.last_used <= self.ttl:
+                break
+            self._remove(session.session_id)
+            self.counters["expired"] += 1
+
+    def _evict(self, sessions: int = 0, nbytes: int = 0) -> None:
+        # Least recently used first, until the sessions and bytes to add fit in the limits
+        while self.sessions and (len(self.sessions) + sessions > self.max_sessions
+                                 or self.nbytes + nbytes > self.max_bytes):
+            self._remove(next(iter(self.sessions)))
+            self.counters["evicted"] += 1
+
+    def create(self, params: Dict[str, Any]) -> Tuple[str, Session]:
+        """
+        Method: create
+        New session from a scenario (see execute_and_report: grid, rocks or layout_id, start_pos, optional
+        analytics). A path, if any, is appended as the first moves.
+        Least recently used sessions are evicted first to make room for its lawn maps. Raises SessionTooLarge
+        if the lawn alone exceeds the memory budget
+
+        Args:
+            params: Dict[str, Any] - scenario params
+
+        Output:
+            Tuple[str, Session] - session id and session
+        """
+        layout = apply_layout(params)
+        nbytes = int(params['height']) * int(params['width']) * SESSION_CELL_BYTES
+        if nbytes > self.max_bytes:
+            raise SessionTooLarge(f"Lawn of {params['height']}x{params['width']} needs {nbytes} bytes, above the session "
+                                  f"memory budget of {self.max_bytes} bytes (LAWNMOWER_SESSION_MB)")
+        with self.lock:
+            self._expire(time.monotonic())
+            self._evict(1, nbytes)
+        sim = LawnmowerSim(params['test_name'], params['height'], params['width'], params['rocks'], params['start_pos'],
+                           log_level=LOG_OFF, log_sinks=[], keep_history=False, layout=layout,
+                           analytics=params.get('analytics', False))
+        session = Session(f"{self.worker}-{secrets.token_urlsafe(16)}", sim, nbytes)
+        if any(key in params for key in ('path', 'path_runs', 'path_packed')):
+            session.append(path_runs(params))
+        with self.lock:
+            self._expire(time.monotonic())
+            self.sessions[session.session_id] = session
+            self.nbytes += nbytes
+            self.counters["created"] += 1
+            # Sessions created concurrently since the first eviction
+            self._evict()
+        return session.session_id, session
+
+    def get(self, session_id: str) -> Session:
+        """
+        Method: get
+        Session of an id, marked as used. Raises SessionNotFound if unknown, expired or evicted
+
+        Args:
+            session_id (str): session id returned by create
+        """
+        now = time.monotonic()
+        with self.lock:
+            self._expire(now)
+            session = self.sessions.get(session_id)
+            if session is None:
+                raise self.not_found(session_id)
+            session.last_used = now
+            self.sessions.move_to_end(session_id)
+            return session
+
+    def delete(self, session_id: str) -> None:
+        """
+        Method: delete
+        Close a session. Raises SessionNotFound if unknown
+
+        Args:
+            session_id (str): session id returned by create
+        """
+        with self.lock:
+            if self._remove(session_id) is None:
+                raise self.not_found(session_id)
+            self.counters["deleted"] += 1
+
+    def not_found(self, session_id: str) -> SessionNotFound:
+        """
+        Method: not_found
+        SessionNotFound of an id, explicit when the session was created by another (or a restarted) server worker
+
+        Args:
+            session_id (str): session id
+        """
+        worker, _, token = session_id.partition("-")
+        if token and worker != self.worker:
+            return SessionNotFound(f"Session {session_id} was created by server worker {worker}, this is worker "
+                                   f"{self.worker}: sessions live in the memory of one worker. Run a single server worker "
+                                   f"per pod and route each client to the same pod (sessionAffinity ClientIP)")
+        return SessionNotFound(f"Session {session_id} not found (unknown, expired or evicted)")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Method: stats
+        Active sessions, limits and counters of this server worker
+        """
+        with self.lock:
+            self._expire(time.monotonic())
+            return dict(self.counters, active=len(self.sessions), max_sessions=self.max_sessions, ttl=self.ttl,
+                        bytes=self.nbytes, max_bytes=self.max_bytes, worker=self.worker)
+
+
+def parse_moves(body: Any) -> List[Tuple[str, int]]:
+    """
+    Function: parse_moves
+    Runs of an append request body, validated before any move is executed
+
+    Args:
+        body: Any - decoded JSON body: {"path": ["Up", "Right"]}, {"path": "U1R3"} (run-length)
+            or {"path_packed": "..."} (see lawnmower_path_codec)
+
+    Output:
+        List[Tuple[str, int]] - runs (move, count). Raises ValueError for an invalid body
+    """
+    if not isinstance(body, dict) or not ('path' in body or 'path_packed' in body):
+        raise ValueError('Expected a JSON object with "path" (list of moves or run-length string) or "path_packed"')
+    path = body.get('path', "")
+    if not isinstance(path, str) and not (isinstance(path, list) and all(isinstance(move, str) for move in path)):
+        raise ValueError('"path" must be a list of moves or a run-length string')
+    return list(path_runs({key: body[key] for key in ('path', 'path_packed') if key in body}))
+
+
+# Store of this server worker
+_session_store: Optional[SessionStore] = None
+
+
+def get_session_store() -> SessionStore:
+    """
+    Function: get_session_store
+    Session store of this server worker, configured from the environment
+    """
+    global _session_store
+    if _session_store is None:
+        _session_store = SessionStore()
+    return _session_store
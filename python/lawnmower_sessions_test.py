@@ -0,0 +1,131 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_sessions_test.py
+
+Objectives:
+    Auto Test for Automated Robotic Lawnmower Simulator interactive sessions
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import pytest
+from typing import Any
+from fastapi.testclient import TestClient
+import lawnmower_sessions
+import python.lawnmower_cli_api as cli_api
+from python.lawnmower_sim import LawnmowerSim
+from python.lawnmower_fuzz import generate_scenarios
+from python.lawnmower_sessions import SessionStore, SessionNotFound, SessionCrashed, SessionTooLarge, parse_moves
+
+def test_sessions_01_appends_match_full_run() -> None:
+    """Verifies that a path appended move by move ends in the state of a full run, with per append deltas."""
+    print(f"\n---  Auto Test test_sessions_01_appends_match_full_run - append deltas")
+    store = SessionStore()
+    for params in generate_scenarios(40, seed=5, max_grid=8, max_moves=100):
+        full = LawnmowerSim(params["test_name"], params["height"], params["width"], params["rocks"], params["start_pos"],
+                            log_level="off", log_sinks=[]).execute_path(params["path"])
+        session_id, session = store.create({key: params[key] for key in ("test_name", "height", "width", "rocks", "start_pos")})
+        new_cells = 0
+        for move in params["path"]:
+            try:
+                delta = store.get(session_id).append(parse_moves({"path": [move]}))
+            except SessionCrashed:
+                break
+            new_cells += delta["new_cells"]
+            assert delta["moves"] == 1 and delta["last_pos"] == session.sim.last_pos
+        state = session.state()
+        assert {key: state[key] for key in ("last_pos", "did_mower_crash", "crash_reason", "uncut_grass_remaining", "all_grass_cut")} == \
+               {key: full[key] for key in ("last_pos", "did_mower_crash", "crash_reason", "uncut_grass_remaining", "all_grass_cut")}
+        assert new_cells == len(full["visited_cells"]) - 1 and len(session.sim.pos_history) == 1
+
+def test_sessions_02_expiry_and_eviction(monkeypatch: Any) -> None:
+    """Verifies the idle TTL expiry, the LRU eviction beyond the maximum and delete."""
+    print(f"\n---  Auto Test test_sessions_02_expiry_and_eviction - TTL and LRU")
+    clock = [1000.0]
+    monkeypatch.setattr("python.lawnmower_sessions.time.monotonic", lambda: clock[0])
+    store = SessionStore(ttl=10, max_sessions=2)
+    lawn = {"test_name": "s", "height": 2, "width": 2, "rocks": [], "start_pos": [0, 0]}
+    first, _ = store.create(dict(lawn, path="R1"))
+    second, _ = store.create(dict(lawn))
+    clock[0] += 5
+    store.get(first) # first is now the most recently used
+    third, _ = store.create(dict(lawn))
+    with pytest.raises(SessionNotFound):
+        store.get(second)
+    assert store.get(first).state()["total_moves"] == 1
+    clock[0] += 11
+    with pytest.raises(SessionNotFound):
+        store.get(third)
+    assert store.stats()["active"] == 0 and store.stats()["evicted"] == 1 and store.stats()["expired"] == 2
+    fourth, _ = store.create(dict(lawn))
+    store.delete(fourth)
+    with pytest.raises(SessionNotFound):
+        store.delete(fourth)
+
+def test_sessions_03_api(monkeypatch: Any) -> None:
+    """Verifies the session endpoints: create, append (list and run-length), state, 409 after a crash, 422 and 404."""
+    print(f"\n---  Auto Test test_sessions_03_api - /sessions")
+    monkeypatch.setenv("LAWNMOWER_SESSIONS", "on")
+    client = TestClient(cli_api.app_lawnmower_simulation)
+    definition = b'test_name="teleop"\nheight=3\nwidth=3\nrocks=[[2,2]]\nstart_pos=[0,0]\n'
+    created = client.post("/sessions", params={"analytics": "true"}, files={"file": ("lawn.txt", definition, "text/plain")}).json()
+    moves_url = f"/sessions/{created['session_id']}/moves"
+    assert created["total_moves"] == 0 and created["uncut_grass_remaining"] == 7
+    assert client.post(moves_url, json={"path": ["Right"]}).json()["new_cells"] == 1
+    delta = client.post(moves_url, json={"path": "R1D2"}).json()
+    assert (delta["moves"], delta["new_cells"], delta["last_pos"], delta["total_moves"]) == (3, 2, [2, 2], 4)
+    assert delta["crash_reason"] == "Crashed into Rock"
+    assert client.post(moves_url, json={"path": ["Up"]}).status_code == 409
+    assert client.post(moves_url, json={"moves": ["Up"]}).status_code == 422
+    state = client.get(f"/sessions/{created['session_id']}").json()
+    assert state["did_mower_crash"] and state["analytics"]["moves"] == 3
+    assert client.delete(f"/sessions/{created['session_id']}").json()["deleted"]
+    assert client.get(f"/sessions/{created['session_id']}").status_code == 404
+    assert client.post(moves_url, json={"path": ["Up"]}).status_code == 404
+
+def test_sessions_04_other_worker(monkeypatch: Any) -> None:
+    """Verifies the explicit 404 of a session kept by another server worker and the 503 with sessions disabled."""
+    print(f"\n---  Auto Test test_sessions_04_other_worker - cross worker 404")
+    first, second = SessionStore(worker="a1"), SessionStore(worker="b2")
+    session_id, _ = first.create({"test_name": "s", "height": 2, "width": 2, "rocks": [], "start_pos": [0, 0]})
+    assert session_id.startswith("a1-")
+    with pytest.raises(SessionNotFound, match="created by server worker a1, this is worker b2"):
+        second.get(session_id)
+    with pytest.raises(SessionNotFound, match="unknown, expired or evicted"):
+        first.get("a1-unknown")
+    # Stores of the module imported by the server (python/ on sys.path), one per server worker
+    first, second = lawnmower_sessions.SessionStore(worker="a1"), lawnmower_sessions.SessionStore(worker="b2")
+    client = TestClient(cli_api.app_lawnmower_simulation)
+    definition = b'test_name="teleop"\nheight=3\nwidth=3\nrocks=[]\nstart_pos=[0,0]\n'
+    monkeypatch.setenv("LAWNMOWER_SESSIONS", "on")
+    monkeypatch.setattr(cli_api, "get_session_store", lambda: first)
+    created = client.post("/sessions", files={"file": ("lawn.txt", definition, "text/plain")}).json()
+    monkeypatch.setattr(cli_api, "get_session_store", lambda: second)
+    response = client.post(f"/sessions/{created['session_id']}/moves", json={"path": ["Right"]})
+    assert response.status_code == 404 and "sessionAffinity" in response.json()["detail"]
+    monkeypatch.delenv("LAWNMOWER_SESSIONS")
+    assert client.get("/sessions").status_code == 503
+
+def test_sessions_05_memory_budget() -> None:
+    """Verifies the LRU eviction against the memory budget of the lawn maps and the rejection of a lawn above it."""
+    print(f"\n---  Auto Test test_sessions_05_memory_budget - LAWNMOWER_SESSION_MB")
+    store = SessionStore(max_bytes=2 * 100 * 100 * 2)
+    lawn = {"test_name": "s", "height": 100, "width": 100, "rocks": [], "start_pos": [0, 0]}
+    first, _ = store.create(dict(lawn))
+    second, _ = store.create(dict(lawn))
+    assert store.stats()["bytes"] == 2 * 100 * 100 * 2
+    third, _ = store.create(dict(lawn, height=50))
+    with pytest.raises(SessionNotFound):
+        store.get(first)
+    store.get(second)
+    store.get(third)
+    assert store.stats()["bytes"] == 150 * 100 * 2 and store.stats()["evicted"] == 1
+    store.delete(third)
+    assert store.stats()["bytes"] == 100 * 100 * 2
+    with pytest.raises(SessionTooLarge, match="LAWNMOWER_SESSION_MB"):
+        store.create(dict(lawn, height=201))
+    assert store.stats()["active"] == 1
@@ -17,7 +17,254 @@ Version: 31.01.2026 - Creation
 """
 
 # Import Definitions
-from typing import List, Tuple, Dict, Any, Set
+import abc
+import heapq
+import bisect
+from array import array
+from collections import deque
+from typing import List, Tuple, Dict, Any, Set, Deque, Optional, TextIO, Union, Iterable, NamedTuple, Sized, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lawnmower_layouts import Layout
+    from lawnmower_analytics import PathAnalytics
+
+# Available engines for execute_path
+ENGINES: Tuple[str, ...] = ("python", "numpy", "parallel")
+
+# Log levels. A message is only formatted and written if its level <= simulator log level
+LOG_OFF: int = 0      # no messages at all
+LOG_SUMMARY: int = 1  # configuration, warnings, crash and final verdict
+LOG_MOVE: int = 2     # one line per executed move and resulting position
+LOG_TRACE: int = 3    # every internal step of the move (legacy behaviour)
+LOG_LEVELS: Dict[str, int] = {"off": LOG_OFF, "summary": LOG_SUMMARY, "per-move": LOG_MOVE, "trace": LOG_TRACE}
+
+# Default number of per-move/trace messages retained by RingBufferSink
+MESSAGE_BUFFER_SIZE: int = 10000
+
+
+def parse_log_level(level: Union[int, str]) -> int:
+    """
+    Function: parse_log_level
+    Convert a log level name (off, summary, per-move, trace) or number into a log level number
+
+    Args:
+        level: Union[int, str] - log level name or number
+    """
+    if isinstance(level, str):
+        if level.lower() not in LOG_LEVELS:
+            raise ValueError(f"Unknown log level {level}. Expected one of {list(LOG_LEVELS)}")
+        return LOG_LEVELS[level.lower()]
+    return level
+
+
+class LogSink(abc.ABC):
+    """
+    Log Sink Base Class Definition
+    Receives the formatted simulator messages. Subclasses implement write and decide where they go
+    """
+
+    @abc.abstractmethod
+    def write(self, level: int, message: str) -> None:
+        """
+        Method: write
+        Store or forward one formatted message
+
+        Args:
+            level: (int) - log level of the message
+            message: (str) - formatted message
+        """
+
+    def get_messages(self) -> List[str]:
+        """
+        Method: get_messages
+        Messages retained by the sink (for the Sim Status Structure). Forwarding sinks retain none
+        """
+        return []
+
+    def close(self) -> None:
+        """
+        Method: close
+        Release sink resources
+        """
+
+
+class MemorySink(LogSink):
+    """
+    Unbounded in-memory list of messages (legacy behaviour)
+    """
+
+    def __init__(self) -> None:
+        self.messages: List[str] = []
+
+    def write(self, level: int, message: str) -> None:
+        self.messages.append(message)
+
+    def get_messages(self) -> List[str]:
+        return self.messages
+
+
+class RingBufferSink(LogSink):
+    """
+    Bounded message store: summary messages are all kept, per-move/trace messages
+    are kept in a ring buffer holding only the most recent maxlen messages.
+    Original message order is preserved on retrieval
+    """
+
+    def __init__(self, maxlen: int = MESSAGE_BUFFER_SIZE) -> None:
+        self.sequence: int = 0
+        self.summary: List[Tuple[int, str]] = []
+        self.details: Deque[Tuple[int, str]] = deque(maxlen=maxlen)
+
+    def write(self, level: int, message: str) -> None:
+        if level <= LOG_SUMMARY:
+            self.summary.append((self.sequence, message))
+        else:
+            self.details.append((self.sequence, message))
+        self.sequence += 1
+
+    def get_messages(self) -> List[str]:
+        return [message for _, message in heapq.merge(self.summary, self.details)]
+
+
+class FileSink(LogSink):
+    """
+    Streams messages to a text file, one message per line. Nothing kept in memory
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.file: TextIO = open(file_path, "a", encoding="utf-8")
+
+    def write(self, level: int, message: str) -> None:
+        self.file.write(message + "\n")
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class StdoutSink(LogSink):
+    """
+    Prints messages on display (legacy behaviour)
+    """
+
+    def write(self, level: int, message: str) -> None:
+        print(message)
+
+
+class GridState:
+    """
+    Grid State Class Definition
+    Compact rock and visited cell maps of the lawn: one byte per cell in bytearrays indexed by row*width+col
+    (no tuple per lookup, and viewable without copy as NumPy boolean arrays by the vectorized engine).
+    The visited cells discovery order is kept as an array of cell indexes.
+    The coordinate lists of the output are only built at serialisation time
+    """
+    __slots__ = ("height", "width", "rocks", "visited", "order", "outside")
+
+    def __init__(self, height: int, width: int, rocks: Optional[memoryview] = None) -> None:
+        """
+        Method: __init__ (Object Creation)
+
+        Args:
+            height (int): number of rows
+            width (int): number of columns
+            rocks (Optional[memoryview]): shared read-only rock map of a precompiled layout (see lawnmower_layouts).
+                Default a new empty rock map
+        """
+        cells = max(height * width, 0)
+        self.height: int = height
+        self.width: int = width
+        self.rocks: Union[bytearray, memoryview] = bytearray(cells) if rocks is None else rocks
+        self.visited: bytearray = bytearray(cells)
+        self.order: array = array("I" if cells <= 0xFFFFFFFF else "Q") # visited cell indexes in order of discovery
+        self.outside: List[Tuple[int, int]] = [] # visited entries outside the grid (out of grid start position)
+
+    def add_rock(self, row: int, col: int) -> bool:
+        """
+        Method: add_rock
+        Mark a cell inside the grid as rock. Returns False if it was already a rock
+
+        Args:
+            row (int), col (int): cell inside the grid
+        """
+        index = row * self.width + col
+        if self.rocks[index]:
+            return False
+        self.rocks[index] = 1
+        return True
+
+    def visit(self, index: int) -> None:
+        """
+        Method: visit
+        Mark a cell inside the grid as visited. Repeated visits are ignored
+
+        Args:
+            index (int): cell index row*width+col
+        """
+        if not self.visited[index]:
+            self.visited[index] = 1
+            self.order.append(index)
+
+    def visit_range(self, start: int, count: int, stride: int) -> None:
+        """
+        Method: visit_range
+        Mark count cells inside the grid as visited, from index start every stride indexes (a straight run).
+        Runs over uncut cells only are marked with one slice assignment
+
+        Args:
+            start (int): index of the first cell
+            count (int): number of cells
+            stride (int): index step between cells (+-1 along a row, +-width along a column)
+        """
+        stop: Optional[int] = start + stride * count
+        if stop is not None and stop < 0:
+            stop = None # run ending at index 0
+        if 1 in self.visited[start:stop:stride]:
+            for index in range(start, start + stride * count, stride):
+                self.visit(index)
+            return
+        self.visited[start:stop:stride] = b"\x01" * count
+        self.order.extend(range(start, start + stride * count, stride))
+
+    def visited_count(self) -> int:
+        """
+        Method: visited_count
+        Number of visited entries (distinct cells)
+        """
+        return len(self.outside) + len(self.order)
+
+    def truncate(self, count: int) -> None:
+        """
+        Method: truncate
+        Forget the most recently discovered cells down to count visited entries
+
+        Args:
+            count (int): number of visited entries to keep
+        """
+        keep = max(count - len(self.outside), 0)
+        while len(self.order) > keep:
+            self.visited[self.order.pop()] = 0
+        del self.outside[count:]
+
+    def visited_list(self) -> List[Tuple[int, int]]:
+        """
+        Method: visited_list
+        Visited cells [row, col] in order of discovery (serialisation)
+        """
+        width = self.width
+        return self.outside + [divmod(index, width) for index in self.order]
+
+class SimSnapshot(NamedTuple):
+    """
+    Simulator state captured by LawnmowerSim.snapshot.
+    Visited cells and pos_history only grow during a simulation, so their lengths are enough to roll them back
+    """
+    last_pos: Tuple[int, int]
+    visited_count: int
+    history_count: int
+    uncut_remaining: int
+    all_grass_cut: bool
+    did_mower_crash: bool
+    crash_reason: str
 
 class LawnmowerSim:
     """
@@ -31,6 +278,10 @@ class LawnmowerSim:
     This ensure the crash location is recorded in the audit messages under pos_history
     while visited_cells only contain valid cells (not crashed)        
     """
+    __slots__ = ("test_name", "log_level", "log_sinks", "grid_height", "grid_width", "rock_locations", "grid",
+                 "valid_rock_count", "total_grass_squares", "uncut_remaining", "all_grass_cut", "start_pos", "last_pos",
+                 "number_visited_cells", "pos_history", "keep_history", "rocks_by_row", "rocks_by_col",
+                 "did_mower_crash", "crash_reason", "reachable_grass", "early_exit", "early_exit_reason", "layout", "analytics")
 
     def __init__(
         self, 
@@ -38,7 +289,14 @@ class LawnmowerSim:
         grid_height: int, 
         grid_width: int, 
         rock_locations: List[List[int]], 
-        start_pos: List[int]) -> None:
+        start_pos: List[int],
+        log_level: Union[int, str] = LOG_TRACE,
+        log_sinks: Optional[List[LogSink]] = None,
+        keep_history: bool = True,
+        reachability: bool = False,
+        early_exit: bool = False,
+        layout: Optional["Layout"] = None,
+        analytics: bool = False) -> None:
         """
         Method: __init__ (Object Creation)
         Initializes the lawnmower simulator with grid dimensions and obstacles.
@@ -52,38 +310,62 @@ class LawnmowerSim:
             grid_width (int): The total number of columns in the lawn.
             rock_locations (List[List[int]]): Y,X coordinates of rocks within the grid.
             start_pos (List[int]): The starting coordinate [Y, X] for the mower.
+            log_level (Union[int, str]): off, summary, per-move or trace (default trace, every step logged)
+            log_sinks (Optional[List[LogSink]]): where messages go. Default in-memory list and display
+            keep_history (bool): record every move in pos_history (default). If False pos_history only holds 
+                the start position and memory stays flat regardless of path length
+            reachability (bool): precompute the grass reachable from the start position (see lawnmower_reach)
+                and report reachable vs unreachable grass. Default False
+            early_exit (bool): stop the run once coverage can no longer change the all grass cut verdict
+                (unreachable grass, fewer moves left than uncut grass, or all grass cut). Implies reachability
+            layout (Optional[Layout]): precompiled lawn layout (see lawnmower_layouts). Its rock map is used in place
+                of rock_locations (normally empty) and must have the grid dimensions
+            analytics (bool): compute the path analytics (visit heatmap, revisits, turns, coverage over time)
+                during the run (see lawnmower_analytics). Default False
         """
         # Initialise Test NameError
         self.test_name: str = test_name
         
         # Initialise Messages
-        self.messages: List[str] = []
-        self.log(f"--- {self.test_name}: Simulator Config start")
+        self.log_level: int = parse_log_level(log_level)
+        self.log_sinks: List[LogSink] = log_sinks if log_sinks is not None else [MemorySink(), StdoutSink()]
+        self.log(LOG_SUMMARY, "--- %s: Simulator Config start", self.test_name)
         
         # Initialise Grid
         self.grid_height: int = grid_height
         self.grid_width: int = grid_width
-        self.log(f"--- {self.test_name}: Initialise Grid {self.grid_height} x {self.grid_width}")
+        self.log(LOG_SUMMARY, "--- %s: Initialise Grid %s x %s", self.test_name, self.grid_height, self.grid_width)
         
         # Initialize Rock Position
         self.rock_locations: List[List[int]] = rock_locations
+        self.layout: Optional["Layout"] = layout
         # Filter Out Rock Locations outside Grid dimensions and Warn user
-        self.valid_rocks: Dict[Tuple[int, int], bool] = {}
-        for r in self.rock_locations:
+        self.grid: GridState
+        self.valid_rock_count: int = 0
+        if self.layout is not None:
+            # Precompiled layout: shared rock map, already filtered
+            if (self.layout.height, self.layout.width) != (self.grid_height, self.grid_width):
+                raise ValueError(f"Layout {self.layout.layout_id} is {self.layout.height} x {self.layout.width}, not {self.grid_height} x {self.grid_width}")
+            self.grid = GridState(self.grid_height, self.grid_width, rocks=self.layout.occupancy)
+            self.valid_rock_count = self.layout.rock_count
+            self.log(LOG_SUMMARY, "--- %s: Layout %s with %s valid Rock positions", self.test_name, self.layout.layout_id, self.valid_rock_count)
+        else:
+            self.grid = GridState(self.grid_height, self.grid_width) # rock and visited cell maps
+            for r in self.rock_locations:
                 row, col = r[0], r[1]
                 if 0 <= row < self.grid_height and 0 <= col < self.grid_width:
-                    self.valid_rocks[r[0],r[1]] = True
+                    self.valid_rock_count += self.grid.add_rock(row, col)
                 else:
-                    self.log(f"--- {self.test_name}: warning: Rock at {r} is outside the {self.grid_height} x {self.grid_width} lawn. Ignoring.")
-        self.log(f"--- {self.test_name}: {len(self.valid_rocks)} valid Rock positions defined inside grid. {len(self.rock_locations)-len(self.valid_rocks)} Rocks outside grid disregarded")
+                    self.log(LOG_SUMMARY, "--- %s: warning: Rock at %s is outside the %s x %s lawn. Ignoring.", self.test_name, r, self.grid_height, self.grid_width)
+            self.log(LOG_SUMMARY, "--- %s: %s valid Rock positions defined inside grid. %s Rocks outside grid disregarded", self.test_name, self.valid_rock_count, len(self.rock_locations)-self.valid_rock_count)
         
         # Initialize Grass Cut status
-        self.total_grass_squares: int = (self.grid_width * self.grid_height) - len(self.valid_rocks)
-        self.log(f"--- {self.test_name}: Initialize Total Grass squares {self.total_grass_squares}")
+        self.total_grass_squares: int = (self.grid_width * self.grid_height) - self.valid_rock_count
+        self.log(LOG_SUMMARY, "--- %s: Initialize Total Grass squares %s", self.test_name, self.total_grass_squares)
         self.uncut_remaining: int = self.total_grass_squares-1 # start pos is always cut
-        self.log(f"--- {self.test_name}: Initialize Remaining Uncut {self.uncut_remaining}")
+        self.log(LOG_SUMMARY, "--- %s: Initialize Remaining Uncut %s", self.test_name, self.uncut_remaining)
         self.all_grass_cut: bool = False
-        self.log(f"--- {self.test_name}: Initialize All Grass Cut status {self.all_grass_cut}")
+        self.log(LOG_SUMMARY, "--- %s: Initialize All Grass Cut status %s", self.test_name, self.all_grass_cut)
         
         # Initialise start position
         self.start_pos: Tuple[int, int]  
@@ -91,32 +373,73 @@ class LawnmowerSim:
             self.start_pos = (start_pos[0], start_pos[1])
         else:
             self.start_pos = (0,0) # reset to top left corner
-            self.log(f"--- {self.test_name}: WARNING: start pos at {start_pos} is outside the {self.grid_height} x {self.grid_width} lawn. Resetting to top left [0,0]")
+            self.log(LOG_SUMMARY, "--- %s: WARNING: start pos at %s is outside the %s x %s lawn. Resetting to top left [0,0]", self.test_name, start_pos, self.grid_height, self.grid_width)
         self.last_pos: List[int] = [self.start_pos[0], self.start_pos[1]]
-        self.log(f"--- {self.test_name}: Initialise start position at {start_pos}")    
+        self.log(LOG_SUMMARY, "--- %s: Initialise start position at %s", self.test_name, start_pos)    
                 
         # Initialise pos_history 
-        self.visited_cells: Dict[Tuple[int, int], bool] = {(start_pos[0], start_pos[1]): True} # record cells visited in order of discover. Multiple visits count only once       
+        # record cells visited in order of discover. Multiple visits count only once
+        # an out of grid start position is still recorded as first visited entry (the reset [0,0] is not)
+        if self.start_pos == (start_pos[0], start_pos[1]):
+            self.grid.visit(start_pos[0] * self.grid_width + start_pos[1])
+        else:
+            self.grid.outside.append((start_pos[0], start_pos[1]))
         self.number_visited_cells: int = 1 # start pos is a cell
-        self.log(f"--- {self.test_name}: Initialise Number of Cells Visited {self.number_visited_cells} (start position counts 1 already)")
+        self.log(LOG_SUMMARY, "--- %s: Initialise Number of Cells Visited %s (start position counts 1 already)", self.test_name, self.number_visited_cells)
         self.pos_history: List[Tuple[int, int]] = [self.start_pos] # record of all moves
-        self.log(f"--- {self.test_name}: Initialise Number of Moves 0")
+        self.keep_history: bool = keep_history
+        self.rocks_by_row: Optional[Dict[int, List[int]]] = None # sorted rock columns per row (run execution)
+        self.rocks_by_col: Optional[Dict[int, List[int]]] = None # sorted rock rows per column (run execution)
+        self.log(LOG_SUMMARY, "--- %s: Initialise Number of Moves 0", self.test_name)
         
         # Initialise Crash Status
         self.did_mower_crash: bool = False
         self.crash_reason: str = "None"
-        self.log(f"--- {self.test_name}: Initialise Crash Status {self.did_mower_crash} for Reason {self.crash_reason}") 
+        self.log(LOG_SUMMARY, "--- %s: Initialise Crash Status %s for Reason %s", self.test_name, self.did_mower_crash, self.crash_reason) 
+
+        # Initialise Reachability (computed on request, see reachability)
+        self.reachable_grass: Optional[int] = None
+        self.early_exit: bool = early_exit
+        self.early_exit_reason: Optional[str] = None
+        if reachability or early_exit:
+            self.reachability()
+
+        # Initialise Path Analytics (fed by the engines move by move, see lawnmower_analytics)
+        self.analytics: Optional["PathAnalytics"] = None
+        if analytics:
+            # Lazy import: the analytics are only required when requested
+            from lawnmower_analytics import PathAnalytics
+            start_index = self.start_pos[0] * self.grid_width + self.start_pos[1] if not self.grid.outside else None
+            self.analytics = PathAnalytics(self.grid, self.total_grass_squares, start_index)
 
-    def log(self, message: str) -> None:
+    def log(self, level: int, message: str, *args: Any) -> None:
         """
         Method: log
-        Log messages on display and store for result retrieval
+        Log messages to the configured sinks (display, memory, ring buffer, file)
+        Formatting is lazy: messages above the simulator log level are never formatted
 
         Args:
-            message: (str) - Message to be logged
+            level: (int) - Message log level (LOG_SUMMARY, LOG_MOVE, LOG_TRACE)
+            message: (str) - Message to be logged, with %s placeholders for args
+            args: (Any) - Message arguments
         """    
-        self.messages.append(message)
-        print(message)
+        if level > self.log_level:
+            return
+        if args:
+            message = message % args
+        for sink in self.log_sinks:
+            sink.write(level, message)
+
+    @property
+    def messages(self) -> List[str]:
+        """
+        Property: messages
+        Messages retained by the sinks for result retrieval
+        """
+        messages: List[str] = []
+        for sink in self.log_sinks:
+            messages.extend(sink.get_messages())
+        return messages
 
     def move(self, move: str) -> bool:
         """
@@ -130,54 +453,59 @@ class LawnmowerSim:
             move (str) - move to be executed (up,down,left,right)
         """
         # Execute Move
-        self.log(f"--- {self.test_name}: Current Position {self.last_pos}")
-        self.log(f"--- {self.test_name}: execute move {move}")
+        self.log(LOG_TRACE, "--- %s: Current Position %s", self.test_name, self.last_pos)
+        self.log(LOG_MOVE, "--- %s: execute move %s", self.test_name, move)
         if   move == "up":    self.last_pos[0] -= 1 # decrease row number
         elif move == "down":  self.last_pos[0] += 1 # increase row number
         elif move == "left":  self.last_pos[1] -= 1 # decrease column number
         elif move == "right": self.last_pos[1] += 1 # increase column number
-        self.log(f"--- {self.test_name}: Last Position {self.last_pos}")
-        self.pos_history.append((self.last_pos[0], self.last_pos[1])) # record move in pos_history. Crashes will also be recorded as last entry
+        self.log(LOG_MOVE, "--- %s: Last Position %s", self.test_name, self.last_pos)
+        if self.keep_history:
+            self.pos_history.append((self.last_pos[0], self.last_pos[1])) # record move in pos_history. Crashes will also be recorded as last entry
 
         # Check if crashed
         # crashing coordinate is recorded in pos_history and visited_cells because the update happens at the start of the move method
-        self.log(f"--- {self.test_name}: check if crashed")
+        self.log(LOG_TRACE, "--- %s: check if crashed", self.test_name)
         # Check Rock crash
-        if tuple(self.last_pos) in self.valid_rocks:
+        row, col = self.last_pos[0], self.last_pos[1]
+        inside = 0 <= row < self.grid_height and 0 <= col < self.grid_width
+        if inside and self.grid.rocks[row * self.grid_width + col]:
             # If hitting a rock, Cause a crash
-            self.log(f"--- {self.test_name}: rock crash!")
+            self.log(LOG_SUMMARY, "--- %s: rock crash!", self.test_name)
             self.did_mower_crash = True
             self.crash_reason = "Crashed into Rock"
-            self.log(f"--- {self.test_name}: Termination: {self.crash_reason}")
+            self.log(LOG_SUMMARY, "--- %s: Termination: %s", self.test_name, self.crash_reason)
         # Check Fence crash
-        elif not (0 <= self.last_pos[0] < self.grid_height and 
-                0 <= self.last_pos[1] < self.grid_width):
+        elif not inside:
             # If Grid limits invaded, Cause a crash
-            self.log(f"--- {self.test_name}: fence crash!")
+            self.log(LOG_SUMMARY, "--- %s: fence crash!", self.test_name)
             self.did_mower_crash = True 
             self.crash_reason = "Crashed into Fence"
-            self.log(f"--- {self.test_name}: Termination: {self.crash_reason}")
+            self.log(LOG_SUMMARY, "--- %s: Termination: %s", self.test_name, self.crash_reason)
         else:
-            self.log(f"--- {self.test_name}: no crash")
-            self.visited_cells[(self.last_pos[0], self.last_pos[1])] = True# record visited cells. repeated visits are ignored
-            self.number_visited_cells = len(self.visited_cells)
-            self.log(f"--- {self.test_name}: number_visited_cells: {self.number_visited_cells}")
+            self.log(LOG_TRACE, "--- %s: no crash", self.test_name)
+            index = row * self.grid_width + col
+            if self.analytics is not None:
+                self.analytics.step(move, index) # before the cell is marked as visited
+            self.grid.visit(index) # record visited cells. repeated visits are ignored
+            self.number_visited_cells = self.grid.visited_count()
+            self.log(LOG_TRACE, "--- %s: number_visited_cells: %s", self.test_name, self.number_visited_cells)
             self.uncut_remaining = self.total_grass_squares - self.number_visited_cells
-            self.log(f"--- {self.test_name}: remaining uncut: {self.uncut_remaining}")
+            self.log(LOG_TRACE, "--- %s: remaining uncut: %s", self.test_name, self.uncut_remaining)
             self.all_grass_cut = self.uncut_remaining == 0
             if self.all_grass_cut:
-                self.log(f"--- {self.test_name}: All Gras Cut")
+                self.log(LOG_TRACE, "--- %s: All Gras Cut", self.test_name)
             else:
-                self.log(f"--- {self.test_name}: Still Gras to Cut")
+                self.log(LOG_TRACE, "--- %s: Still Gras to Cut", self.test_name)
             
         if self.did_mower_crash:
-            self.log(f"--- {self.test_name}: Move Failed due crash")
+            self.log(LOG_SUMMARY, "--- %s: Move Failed due crash", self.test_name)
             return False
             
-        self.log(f"--- {self.test_name}: Move OK")
+        self.log(LOG_TRACE, "--- %s: Move OK", self.test_name)
         return True    
 
-    def execute_path(self, path: List[str]) -> Dict[str, Any]:
+    def execute_path(self, path: Iterable[str], engine: str = "python") -> Dict[str, Any]:
         """
         Method: execute_path
         execute path as sequence of moves
@@ -186,7 +514,12 @@ class LawnmowerSim:
         Core Engine and App Logic.
 
         Args:
-            path: List[str] - sequence of moves from start position (up,down,left,right). Upper Capital will be converted to lower
+            path: Iterable[str] - sequence of moves from start position (up,down,left,right). Upper Capital will be converted to lower
+                Any iterable is accepted (e.g. a streaming parser generator). Moves are pulled one by one and no more are read after a crash
+            engine: str - "python" (reference step by step engine), "numpy" (vectorized engine, see lawnmower_sim_numpy.py)
+                or "parallel" (sharded over a process pool for huge paths, see lawnmower_sim_parallel.py).
+                The shards have no single pass over the path, so with analytics "parallel" runs the python engine.
+                The early exit is checked before every move, so with early_exit both run the python engine
             
         Output:
         sim_status = {
@@ -194,7 +527,7 @@ class LawnmowerSim:
             "grid_width": self.grid_width,
             "grid_height": self.grid_height,
             "rock_locations": self.rock_locations,
-            "valid_rocks": list(self.valid_rocks.keys()),  
+            "valid_rocks": self.valid_rocks(),  
             "start_pos": self.start_pos,
             "total_grass_squares": self.total_grass_squares,
             "all_grass_cut": self.all_grass_cut,
@@ -202,32 +535,314 @@ class LawnmowerSim:
             "did_mower_crash": self.did_mower_crash,
             "crash_reason": self.crash_reason,
             "pos_history": self.pos_history,
-            "visited_cells": list(self.visited_cells.keys()), 
+            "visited_cells": self.grid.visited_list(), 
             "last_pos": self.last_pos,
             "messages": self.messages
         }
+        plus, when reachability was computed (reachability or early_exit):
+            "reachable_grass", "unreachable_grass" and "early_exit" (reason of the early exit or None)
+        plus, with analytics: "analytics" (see lawnmower_analytics)
         """    
+        # Early exit: verdict already settled before the first move
+        remaining: Optional[int] = len(path) if isinstance(path, Sized) else None
+        if self.early_exit and self.check_early_exit(remaining):
+            return self.sim_status()
+
+        # Alternative engines work on the whole path at once
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine}. Expected one of {ENGINES}")
+        elif engine == "numpy" and not self.early_exit:
+            # Lazy import: numpy is only required when the vectorized engine is selected
+            from lawnmower_sim_numpy import execute_path_numpy
+            return execute_path_numpy(self, path)
+        elif engine == "parallel" and not self.early_exit and self.analytics is None:
+            # Lazy import: the process pool is only created when the parallel engine is selected
+            from lawnmower_sim_parallel import execute_path_parallel
+            return execute_path_parallel(self, path)
+
+        if self.early_exit:
+            return self.execute_path_early_exit(path, remaining)
+
         # Execute Step by step move on required path sequence
         for step, move in enumerate(path):
             # Move and Update Position 
-            self.log(f"\n--- {self.test_name}: Move index {step}") 
+            self.log(LOG_MOVE, "\n--- %s: Move index %s", self.test_name, step) 
+            if not self.move(move.lower()):
+                break
+
+        return self.sim_status()
+
+    def execute_path_early_exit(self, path: Iterable[str], remaining: Optional[int]) -> Dict[str, Any]:
+        """
+        Method: execute_path_early_exit
+        python engine loop of execute_path with the early exit check before every move (see check_early_exit)
+
+        Args:
+            path: Iterable[str] - sequence of moves (up,down,left,right)
+            remaining: Optional[int] - number of moves in the path, None when unknown (streamed path)
+
+        Output:
+            sim_status: Dict[str, Any] - see execute_path
+        """
+        for step, move in enumerate(path):
+            # Verdict checked before the first move by the caller
+            if step and self.check_early_exit(None if remaining is None else remaining - step):
+                break
+            self.log(LOG_MOVE, "\n--- %s: Move index %s", self.test_name, step) 
             if not self.move(move.lower()):
                 break
+        return self.sim_status()
+
+    def move_run(self, move: str, count: int) -> bool:
+        """
+        Method: move_run
+        execute a run of count identical moves as one segment.
+        The fence is checked once per run and rocks with a range query (bisect) over the rocks
+        of the row or column of the run. Same result as count calls of move
+
+        Args:
+            move (str) - move to be executed (up,down,left,right)
+            count (int) - number of repetitions of the move
+        """
+        if move not in ("up", "down", "left", "right"):
+            # Unknown move: the mower stays in place, executed move by move
+            for _ in range(count):
+                if not self.move(move):
+                    return False
+            return True
+
+        # Rocks sorted per row and per column, built on first use
+        if self.rocks_by_row is None or self.rocks_by_col is None:
+            self.rocks_by_row, self.rocks_by_col = {}, {}
+            for (row, col) in sorted(self.valid_rocks()):
+                self.rocks_by_row.setdefault(row, []).append(col)
+                self.rocks_by_col.setdefault(col, []).append(row)
+            for rows in self.rocks_by_col.values():
+                rows.sort()
+
+        # Run axis: position along the axis, grid limit and rocks on the same line
+        row, col = self.last_pos[0], self.last_pos[1]
+        if move in ("left", "right"):
+            pos, limit, line = col, self.grid_width, self.rocks_by_row.get(row, [])
+        else:
+            pos, limit, line = row, self.grid_height, self.rocks_by_col.get(col, [])
+        step = 1 if move in ("down", "right") else -1
+
+        # Steps (1-based) at which the run reaches the fence and the first rock
+        if step > 0:
+            fence_at = limit - pos
+            index = bisect.bisect_right(line, pos)
+            rock_at = line[index] - pos if index < len(line) else fence_at + 1
+        else:
+            fence_at = pos + 1
+            index = bisect.bisect_left(line, pos) - 1
+            rock_at = pos - line[index] if index >= 0 else fence_at + 1
+        crash_at = min(rock_at, fence_at)
+        steps_ok = count if crash_at > count else crash_at - 1
+        steps = steps_ok if crash_at > count else crash_at
+
+        # Cells of the run (crash cell included as last entry). Index stride of one step in the grid maps
+        if move in ("left", "right"):
+            if self.keep_history:
+                self.pos_history.extend((row, c) for c in range(col + step, col + step * (steps + 1), step))
+            self.last_pos = [row, col + step * steps]
+            stride = step
+        else:
+            if self.keep_history:
+                self.pos_history.extend((r, col) for r in range(row + step, row + step * (steps + 1), step))
+            self.last_pos = [row + step * steps, col]
+            stride = step * self.grid_width
+        if steps_ok:
+            if self.analytics is not None:
+                self.analytics.straight(move, row * self.grid_width + col + stride, steps_ok, stride)
+            self.grid.visit_range(row * self.grid_width + col + stride, steps_ok, stride)
+            self.number_visited_cells = self.grid.visited_count()
+            self.uncut_remaining = self.total_grass_squares - self.number_visited_cells
+            self.all_grass_cut = self.uncut_remaining == 0
+
+        if crash_at <= count:
+            self.did_mower_crash = True
+            if rock_at < fence_at:
+                self.log(LOG_SUMMARY, "--- %s: rock crash!", self.test_name)
+                self.crash_reason = "Crashed into Rock"
+            else:
+                self.log(LOG_SUMMARY, "--- %s: fence crash!", self.test_name)
+                self.crash_reason = "Crashed into Fence"
+            self.log(LOG_SUMMARY, "--- %s: Termination: %s", self.test_name, self.crash_reason)
+            self.log(LOG_SUMMARY, "--- %s: Move Failed due crash", self.test_name)
+            return False
+        return True
+
+    def execute_runs(self, runs: Iterable[Tuple[str, int]], engine: str = "python") -> Dict[str, Any]:
+        """
+        Method: execute_runs
+        execute a path given as runs (move, count), e.g. decoded from the compact path formats
+        of lawnmower_path_codec. Each run is executed as one segment (see move_run).
+        At per-move and trace log levels the runs are expanded and executed move by move,
+        so the messages are the same as for execute_path
+
+        Args:
+            runs: Iterable[Tuple[str, int]] - runs of identical moves (up,down,left,right)
+            engine: str - "parallel" expands the runs into the sharded engine (see lawnmower_sim_parallel.py),
+                any other engine executes the runs segment by segment
+
+        Output:
+            sim_status: Dict[str, Any] - see execute_path
+        """
+        if engine == "parallel" and not self.early_exit and self.analytics is None:
+            # Lazy import: the process pool is only created when the parallel engine is selected
+            from lawnmower_sim_parallel import execute_runs_parallel
+            return execute_runs_parallel(self, runs)
+        if self.early_exit:
+            # Moves left are known when the runs are a list
+            remaining: Optional[int] = sum(count for _, count in runs) if isinstance(runs, Sized) else None
+            if self.check_early_exit(remaining):
+                return self.sim_status()
+            if self.log_level >= LOG_MOVE:
+                return self.execute_path_early_exit((move for move, count in runs for _ in range(count)), remaining)
+            for move, count in runs:
+                if not self.move_run(move.lower(), count):
+                    break
+                remaining = None if remaining is None else remaining - count
+                if self.check_early_exit(remaining):
+                    break
+            return self.sim_status()
+        if self.log_level >= LOG_MOVE:
+            return self.execute_path(move for move, count in runs for _ in range(count))
+        for move, count in runs:
+            if not self.move_run(move.lower(), count):
+                break
+        return self.sim_status()
+
+    def reachability(self) -> int:
+        """
+        Method: reachability
+        Grass cells reachable from the start position (start included), from the region labelling
+        of the lawn layout. Labellings are cached per layout, so repeated scenarios on the same lawn reuse them.
+        A mower starting on a rock can only leave it once, into the largest of the neighbouring regions
+
+        Output:
+            int - reachable grass cells. total_grass_squares minus it can never be cut
+        """
+        if self.reachable_grass is None:
+            # Lazy import: the labelling is only required when reachability is requested
+            from lawnmower_reach import get_layout_reachability
+            if self.layout is None:
+                layout = get_layout_reachability(self.grid_height, self.grid_width, self.rock_locations)
+            else:
+                # Registered layout: its id is the layout hash, rocks only read to label it the first time
+                layout = get_layout_reachability(self.grid_height, self.grid_width, self.layout.valid_rocks,
+                                                 key=self.layout.layout_id)
+            row, col = self.start_pos
+            if self.grid.rocks[row * self.grid_width + col]:
+                self.reachable_grass = max(layout.reachable_from(row + step_row, col + step_col)
+                                           for step_row, step_col in ((-1, 0), (1, 0), (0, -1), (0, 1)))
+            else:
+                self.reachable_grass = layout.reachable_from(row, col)
+            self.log(LOG_SUMMARY, "--- %s: Reachable grass %s, unreachable grass %s", self.test_name,
+                     self.reachable_grass, self.total_grass_squares - self.reachable_grass)
+        return self.reachable_grass
+
+    def check_early_exit(self, remaining: Optional[int]) -> bool:
+        """
+        Method: check_early_exit
+        True (and early_exit_reason set) when the rest of the path can no longer change the all grass cut verdict.
+        The moves after an early exit are not executed, so a later crash is not detected.
+        An out of grid start, or a start on a rock, is counted as a visited entry that is not grass (see __init__):
+        the uncut count reaches 0 one grass cell early and goes below 0 when the last one is cut, so the verdict
+        is only all grass cut when exactly one grass cell stays uncut. No exit on full coverage then, and one
+        unreachable grass cell is allowed
+
+        Args:
+            remaining (Optional[int]): moves left in the path, None when unknown (streamed path)
+        """
+        row, col = self.start_pos
+        not_grass = len(self.grid.outside) or self.grid.rocks[row * self.grid_width + col]
+        if self.all_grass_cut and not not_grass:
+            self.early_exit_reason = "All grass cut: coverage complete"
+        elif self.reachability() < self.total_grass_squares - not_grass:
+            self.early_exit_reason = "Unreachable grass: all grass can never be cut"
+        elif remaining is not None and remaining < self.uncut_remaining:
+            self.early_exit_reason = f"Not enough moves: {remaining} moves left for {self.uncut_remaining} uncut grass"
+        else:
+            return False
+        self.log(LOG_SUMMARY, "--- %s: Early exit: %s", self.test_name, self.early_exit_reason)
+        return True
+
+    def valid_rocks(self) -> List[Tuple[int, int]]:
+        """
+        Method: valid_rocks
+        Rocks inside the grid in input order, without repetitions (serialisation)
+        """
+        if self.layout is not None:
+            return self.layout.valid_rocks()
+        rocks: Dict[Tuple[int, int], bool] = {}
+        for r in self.rock_locations:
+            if 0 <= r[0] < self.grid_height and 0 <= r[1] < self.grid_width:
+                rocks[r[0], r[1]] = True
+        return list(rocks.keys())
+
+    def snapshot(self) -> SimSnapshot:
+        """
+        Method: snapshot
+        Capture the simulation state (position, visited cells, uncut count and crash state)
+        in constant time, to be resumed later with restore
+        """
+        return SimSnapshot(
+            (self.last_pos[0], self.last_pos[1]),
+            self.grid.visited_count(),
+            len(self.pos_history),
+            self.uncut_remaining,
+            self.all_grass_cut,
+            self.did_mower_crash,
+            self.crash_reason)
+
+    def restore(self, snapshot: SimSnapshot) -> None:
+        """
+        Method: restore
+        Resume the simulation from a snapshot taken earlier on this simulator.
+        Cells visited since the snapshot are removed (most recent first), so the cost is
+        proportional to the moves executed since the snapshot, not to the path length.
+        Obs: only snapshots taken on the current execution branch (before the moves to undo) are valid.
+        Messages already logged and path analytics are not rolled back
 
+        Args:
+            snapshot (SimSnapshot) - state returned by snapshot
+        """
+        if snapshot.visited_count > self.grid.visited_count() or snapshot.history_count > len(self.pos_history):
+            raise ValueError("Snapshot was not taken on the current execution branch of this simulator")
+        self.grid.truncate(snapshot.visited_count)
+        del self.pos_history[snapshot.history_count:]
+        self.last_pos = [snapshot.last_pos[0], snapshot.last_pos[1]]
+        self.number_visited_cells = snapshot.visited_count
+        self.uncut_remaining = snapshot.uncut_remaining
+        self.all_grass_cut = snapshot.all_grass_cut
+        self.did_mower_crash = snapshot.did_mower_crash
+        self.crash_reason = snapshot.crash_reason
+
+    def sim_status(self) -> Dict[str, Any]:
+        """
+        Method: sim_status
+        Log the simulation verdict and build the Sim Status Structure.
+        Shared by all engines so the output is identical whichever engine executed the path
+
+        Output:
+            sim_status: Dict[str, Any] - see execute_path
+        """
         # Output results
         if not self.did_mower_crash:
-            self.log(f"\n--- {self.test_name}: Simulator Success. All Moves done")
+            self.log(LOG_SUMMARY, "\n--- %s: Simulator Success. All Moves done", self.test_name)
         else:
-            self.log(f"\n--- {self.test_name}: Simulator Fail due Crash. Move abort")
+            self.log(LOG_SUMMARY, "\n--- %s: Simulator Fail due Crash. Move abort", self.test_name)
                    
         # Output Sim Status Structure
-        self.log(f"--- {self.test_name}: Output Sim Status Structure")
+        self.log(LOG_SUMMARY, "--- %s: Output Sim Status Structure", self.test_name)
         sim_status: Dict[str, Any] = {
             "test_name": self.test_name,
             "grid_width": self.grid_width,
             "grid_height": self.grid_height,
             "rock_locations": self.rock_locations,
-            "valid_rocks": list(self.valid_rocks.keys()),  
+            "valid_rocks": self.valid_rocks(),  
             "start_pos": self.start_pos,
             "total_grass_squares": self.total_grass_squares,
             "all_grass_cut": self.all_grass_cut,
@@ -235,9 +850,17 @@ class LawnmowerSim:
             "did_mower_crash": self.did_mower_crash,
             "crash_reason": self.crash_reason,
             "pos_history": self.pos_history,
-            "visited_cells": list(self.visited_cells.keys()), 
+            "visited_cells": self.grid.visited_list(), 
             "last_pos": self.last_pos,
             "messages": self.messages
         }
+        if self.reachable_grass is not None:
+            sim_status["reachable_grass"] = self.reachable_grass
+            sim_status["unreachable_grass"] = self.total_grass_squares - self.reachable_grass
+            sim_status["early_exit"] = self.early_exit_reason
+        if self.layout is not None:
+            sim_status["layout_id"] = self.layout.layout_id
+        if self.analytics is not None:
+            sim_status["analytics"] = self.analytics.summary()
         
         return sim_status
\ No newline at end of file
@@ -0,0 +1,212 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_sim_numpy.py
+
+Objectives:
+    Vectorized (NumPy) engine for Automated Robotic Lawnmower Simulator
+    Encodes the path as an int8 direction array
+    Computes positions with a cumulative sum
+    Finds the first fence or rock crash with a boolean occupancy mask
+    Counts cut cells on the simulator visited cell map and np.unique (discovery order preserved)
+    Feeds the path analytics chunk by chunk when requested (see lawnmower_analytics)
+    Returns exactly the same sim_status as the reference LawnmowerSim.execute_path
+
+Execution:
+    Selected per call:
+        lm_sim.execute_path(path, engine="numpy")
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import numpy as np
+from itertools import islice
+from typing import List, Dict, Any, Sequence, Iterable
+from lawnmower_sim import LOG_SUMMARY, LOG_MOVE, LOG_TRACE
+
+# Direction encoding. Unknown moves keep the mower in place (same as the reference engine)
+MOVE_CODES: Dict[str, int] = {"up": 0, "down": 1, "left": 2, "right": 3}
+NO_MOVE: int = 4
+ROW_STEP = np.array([-1, 1, 0, 0, 0], dtype=np.int64) # up decreases row number, down increases it
+COL_STEP = np.array([0, 0, -1, 1, 0], dtype=np.int64) # left decreases column number, right increases it
+
+# Moves processed per vectorized chunk. Bounds temporary memory and stops early after a crash
+CHUNK_SIZE: int = 1 << 16
+
+
+def encode_path(path: Sequence[str]) -> np.ndarray:
+    """
+    Function: encode_path
+    Encode a path of move names as an int8 direction array
+
+    Args:
+        path: Sequence[str] - sequence of moves (up,down,left,right). Upper Capital will be converted to lower
+
+    Output:
+        np.ndarray (int8) - one direction code per move (see MOVE_CODES, NO_MOVE)
+    """
+    return np.fromiter((MOVE_CODES.get(move.lower(), NO_MOVE) for move in path), dtype=np.int8, count=len(path))
+
+
+def execute_path_numpy(sim: Any, path: Iterable[str]) -> Dict[str, Any]:
+    """
+    Function: execute_path_numpy
+    Vectorized equivalent of LawnmowerSim.execute_path.
+    Updates the simulator state (pos_history, visited_cells, crash status...) and returns
+    the same Sim Status Structure, including the same audit messages
+
+    Args:
+        sim: LawnmowerSim - freshly initialised simulator object
+        path: Iterable[str] - sequence of moves from start position (up,down,left,right).
+            Consumed chunk by chunk, so streamed paths are supported
+
+    Output:
+        sim_status: Dict[str, Any] - see LawnmowerSim.execute_path
+    """
+    height: int = sim.grid_height
+    width: int = sim.grid_width
+
+    # Boolean views (no copy) of the simulator rock and visited cell maps, indexed by row*width+col
+    # Cells marked in visited_mask are marked in the simulator grid state
+    grid = sim.grid
+    rock_mask: np.ndarray = np.frombuffer(grid.rocks, dtype=bool)
+    visited_mask: np.ndarray = np.frombuffer(grid.visited, dtype=bool)
+
+    row, col = sim.last_pos[0], sim.last_pos[1]
+    moves = iter(path)
+    chunk_start = 0
+    while True:
+        # Pull the next chunk of moves (streamed paths are never read past the crash chunk)
+        chunk_moves = list(islice(moves, CHUNK_SIZE))
+        if not chunk_moves:
+            break
+        chunk = encode_path(chunk_moves)
+
+        # Absolute positions of every move in the chunk
+        rows = row + np.cumsum(ROW_STEP[chunk])
+        cols = col + np.cumsum(COL_STEP[chunk])
+
+        # First crash: fence (outside grid) or rock (occupied cell)
+        inside = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+        flat = np.where(inside, rows * width + cols, 0)
+        hit_rock = inside & rock_mask[flat]
+        crash_idx = np.flatnonzero(~inside | hit_rock)
+        n_ok = int(crash_idx[0]) if crash_idx.size else len(chunk)
+        n_recorded = n_ok + 1 if crash_idx.size else n_ok
+
+        # Cells cut in discovery order: first occurrence in the chunk of cells not visited before
+        ok_flat = flat[:n_ok]
+        if sim.analytics is None:
+            cells, first_idx = np.unique(ok_flat, return_index=True)
+        else:
+            cells, first_idx, cell_visits = np.unique(ok_flat, return_index=True, return_counts=True)
+        new = ~visited_mask[cells]
+        new_idx = np.sort(first_idx[new])
+        if sim.analytics is not None:
+            sim.analytics.chunk(chunk[:n_ok], cells, cell_visits, new_idx)
+        visited_mask[cells[new]] = True
+
+        rows_list: List[int] = rows[:n_recorded].tolist()
+        cols_list: List[int] = cols[:n_recorded].tolist()
+        number_visited_before = grid.visited_count()
+        if sim.keep_history:
+            sim.pos_history.extend(zip(rows_list, cols_list))
+        grid.order.extend(ok_flat[new_idx].tolist())
+
+        # Replay the audit messages of the reference engine
+        # Per-move messages are only replayed when the log level requires them
+        if sim.log_level >= LOG_MOVE:
+            _replay_messages(sim, chunk_moves, chunk_start, [row, col], rows_list, cols_list, n_ok,
+                             number_visited_before, new_idx, hit_rock)
+        elif crash_idx.size:
+            _log_crash(sim, bool(hit_rock[n_ok]))
+
+        # Update simulator state as the reference engine would after the last executed move
+        if n_ok > 0:
+            sim.number_visited_cells = grid.visited_count()
+            sim.uncut_remaining = sim.total_grass_squares - sim.number_visited_cells
+            sim.all_grass_cut = sim.uncut_remaining == 0
+        if n_recorded > 0:
+            row, col = rows_list[-1], cols_list[-1]
+            sim.last_pos = [row, col]
+
+        if crash_idx.size:
+            sim.did_mower_crash = True
+            sim.crash_reason = "Crashed into Rock" if hit_rock[n_ok] else "Crashed into Fence"
+            break
+        chunk_start += len(chunk_moves)
+
+    return sim.sim_status()
+
+
+def _log_crash(sim: Any, rock: bool) -> None:
+    """
+    Function: _log_crash
+    Log the crash messages of the reference engine
+
+    Args:
+        sim: LawnmowerSim - simulator object
+        rock: bool - True for a rock crash, False for a fence crash
+    """
+    if rock:
+        sim.log(LOG_SUMMARY, "--- %s: rock crash!", sim.test_name)
+        sim.log(LOG_SUMMARY, "--- %s: Termination: %s", sim.test_name, "Crashed into Rock")
+    else:
+        sim.log(LOG_SUMMARY, "--- %s: fence crash!", sim.test_name)
+        sim.log(LOG_SUMMARY, "--- %s: Termination: %s", sim.test_name, "Crashed into Fence")
+    sim.log(LOG_SUMMARY, "--- %s: Move Failed due crash", sim.test_name)
+
+
+def _replay_messages(
+    sim: Any,
+    chunk_moves: List[str],
+    chunk_start: int,
+    prev_pos: List[int],
+    rows_list: List[int],
+    cols_list: List[int],
+    n_ok: int,
+    number_visited_before: int,
+    new_idx: np.ndarray,
+    hit_rock: np.ndarray) -> None:
+    """
+    Function: _replay_messages
+    Log the per-move messages of the reference engine for one chunk from the computed arrays
+
+    Args:
+        sim: LawnmowerSim - simulator object
+        chunk_moves: List[str] - moves of the chunk
+        chunk_start: int - path index of the first move of the chunk
+        prev_pos: List[int] - position before the first move of the chunk
+        rows_list, cols_list: List[int] - recorded positions of the chunk (crash position included)
+        n_ok: int - number of moves executed without crash
+        number_visited_before: int - number of visited cells before the chunk
+        new_idx: np.ndarray - chunk indexes of the moves discovering a new cell
+        hit_rock: np.ndarray - rock crash flag per move of the chunk
+    """
+    is_new: np.ndarray = np.zeros(n_ok, dtype=np.int64)
+    is_new[new_idx] = 1
+    number_visited: List[int] = (number_visited_before + np.cumsum(is_new)).tolist()
+    for i in range(len(rows_list)):
+        new_pos = [rows_list[i], cols_list[i]]
+        sim.log(LOG_MOVE, "\n--- %s: Move index %s", sim.test_name, chunk_start + i)
+        sim.log(LOG_TRACE, "--- %s: Current Position %s", sim.test_name, prev_pos)
+        sim.log(LOG_MOVE, "--- %s: execute move %s", sim.test_name, chunk_moves[i].lower())
+        sim.log(LOG_MOVE, "--- %s: Last Position %s", sim.test_name, new_pos)
+        sim.log(LOG_TRACE, "--- %s: check if crashed", sim.test_name)
+        if i < n_ok:
+            uncut = sim.total_grass_squares - number_visited[i]
+            sim.log(LOG_TRACE, "--- %s: no crash", sim.test_name)
+            sim.log(LOG_TRACE, "--- %s: number_visited_cells: %s", sim.test_name, number_visited[i])
+            sim.log(LOG_TRACE, "--- %s: remaining uncut: %s", sim.test_name, uncut)
+            if uncut == 0:
+                sim.log(LOG_TRACE, "--- %s: All Gras Cut", sim.test_name)
+            else:
+                sim.log(LOG_TRACE, "--- %s: Still Gras to Cut", sim.test_name)
+            sim.log(LOG_TRACE, "--- %s: Move OK", sim.test_name)
+        else:
+            _log_crash(sim, bool(hit_rock[i]))
+        prev_pos = new_pos
@@ -0,0 +1,292 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_sim_parallel.py
+
+Objectives:
+    Parallel sharded engine for Automated Robotic Lawnmower Simulator: one huge path checked by a process pool
+    1. The path is encoded once as int8 direction codes into a memory-mapped file shared with the workers
+       (tmpfs /dev/shm when available), after the lawn rock map. The net displacement of every chunk of
+       codes is counted while encoding
+    2. A prefix sum of the displacements gives the absolute start position of every shard
+    3. Each worker scans its shard from its start position: first fence or rock crash, and the cells of the
+       shard in first visit order (deduplicated on a partial visited bitmap of the worker)
+    4. The shards are merged in path order: the first crash ends the path and the shard cells not visited by
+       the earlier shards are appended to the visited cells, so the Sim Status Structure is exactly the one
+       of the reference LawnmowerSim.execute_path
+    Per-move logging, short paths, a single worker or a call from a pool worker process use the numpy engine
+    (same output, no process overhead)
+
+Configuration (environment variables):
+    LAWNMOWER_PARALLEL_WORKERS     worker processes (default CPU count)
+    LAWNMOWER_PARALLEL_MIN_MOVES   shortest path executed in parallel (default 1048576)
+    LAWNMOWER_PARALLEL_DIR         folder of the shared code files (default /dev/shm when present, else system temp)
+
+Execution:
+    Selected per call:
+        lm_sim.execute_path(path, engine="parallel")
+        lm_sim.execute_runs(runs, engine="parallel")
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import os
+import tempfile
+import multiprocessing
+import numpy as np
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, Future
+from typing import List, Dict, Any, Tuple, Iterable, Iterator, Optional
+from lawnmower_sim import LOG_MOVE
+from lawnmower_sim_numpy import MOVE_CODES, NO_MOVE, ROW_STEP, COL_STEP, CHUNK_SIZE, encode_path, execute_path_numpy, _log_crash
+
+# Default configuration
+PARALLEL_WORKERS: int = int(os.environ.get("LAWNMOWER_PARALLEL_WORKERS", os.cpu_count() or 1))
+PARALLEL_MIN_MOVES: int = int(os.environ.get("LAWNMOWER_PARALLEL_MIN_MOVES", 1 << 20))
+PARALLEL_DIR: Optional[str] = os.environ.get("LAWNMOWER_PARALLEL_DIR") or ("/dev/shm" if os.path.isdir("/dev/shm") else None)
+
+# Move name per direction code (NO_MOVE decoded as an unknown move)
+MOVE_NAMES: List[str] = list(MOVE_CODES) + [""]
+
+# Shards per worker (balances shards ending early on a crash)
+SHARDS_PER_WORKER: int = 4
+
+
+def encode_path_chunks(path: Iterable[str]) -> Iterator[np.ndarray]:
+    """
+    Function: encode_path_chunks
+    Direction codes of a path of moves, CHUNK_SIZE codes per chunk (see lawnmower_sim_numpy.encode_path)
+
+    Args:
+        path: Iterable[str] - sequence of moves (up,down,left,right)
+    """
+    moves = iter(path)
+    while True:
+        chunk = list(islice(moves, CHUNK_SIZE))
+        if not chunk:
+            return
+        yield encode_path(chunk)
+
+
+def encode_runs_chunks(runs: Iterable[Tuple[str, int]]) -> Iterator[np.ndarray]:
+    """
+    Function: encode_runs_chunks
+    Direction codes of a path given as runs (move, count), CHUNK_SIZE codes per chunk
+
+    Args:
+        runs: Iterable[Tuple[str, int]] - runs of identical moves
+    """
+    codes: List[int] = []
+    counts: List[int] = []
+    pending = 0
+    for move, count in runs:
+        code = MOVE_CODES.get(move.lower(), NO_MOVE)
+        while count:
+            take = min(count, CHUNK_SIZE - pending)
+            codes.append(code)
+            counts.append(take)
+            pending += take
+            count -= take
+            if pending == CHUNK_SIZE:
+                yield np.repeat(np.array(codes, dtype=np.int8), counts)
+                codes, counts, pending = [], [], 0
+    if pending:
+        yield np.repeat(np.array(codes, dtype=np.int8), counts)
+
+
+def _scan_shard(
+    filename: str,
+    height: int,
+    width: int,
+    offset: int,
+    length: int,
+    row: int,
+    col: int) -> Tuple[int, bool, bool, np.ndarray, int, int]:
+    """
+    Function: _scan_shard
+    Worker: scan a shard of the shared codes from its absolute start position
+
+    Args:
+        filename: str - shared file (rock map, then codes)
+        height: int, width: int - lawn dimensions
+        offset: int - index of the first move of the shard
+        length: int - number of moves of the shard
+        row: int, col: int - position before the first move of the shard
+
+    Output:
+        Tuple - moves done without crash, crashed, rock crash, cells in first visit order within the shard,
+        and the position after the last move done (the crash position after a crash)
+    """
+    cells = height * width
+    rocks: np.ndarray = np.memmap(filename, dtype=bool, mode="r", shape=(cells,))
+    codes: np.ndarray = np.memmap(filename, dtype=np.int8, mode="r", offset=cells + offset, shape=(length,))
+    visited: np.ndarray = np.zeros(cells, dtype=bool) # partial visited bitmap of the shard
+    pieces: List[np.ndarray] = []
+    done = 0
+    try:
+        for start in range(0, length, CHUNK_SIZE):
+            chunk = codes[start:start + CHUNK_SIZE]
+            rows: np.ndarray = row + np.cumsum(ROW_STEP[chunk])
+            cols: np.ndarray = col + np.cumsum(COL_STEP[chunk])
+            inside = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+            flat = np.where(inside, rows * width + cols, 0)
+            hit_rock = inside & rocks[flat]
+            crash_idx = np.flatnonzero(~inside | hit_rock)
+            n_ok = int(crash_idx[0]) if crash_idx.size else len(chunk)
+
+            # Cells of the chunk in first visit order, not seen before in the shard
+            ok_flat = flat[:n_ok]
+            unique, first_idx = np.unique(ok_flat, return_index=True)
+            new = ~visited[unique]
+            visited[unique[new]] = True
+            pieces.append(ok_flat[np.sort(first_idx[new])])
+            done += n_ok
+            if crash_idx.size:
+                return done, True, bool(hit_rock[n_ok]), np.concatenate(pieces), int(rows[n_ok]), int(cols[n_ok])
+            row, col = int(rows[-1]), int(cols[-1])
+        return done, False, False, np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.int64), row, col
+    finally:
+        del rocks, codes
+
+
+# Process pool of the parallel engine (created on first use)
+_parallel_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_parallel_pool() -> ProcessPoolExecutor:
+    """
+    Function: get_parallel_pool
+    Process pool of the parallel engine, sized by PARALLEL_WORKERS and reused across simulations
+    """
+    global _parallel_pool
+    if _parallel_pool is None:
+        _parallel_pool = ProcessPoolExecutor(max_workers=PARALLEL_WORKERS)
+    return _parallel_pool
+
+
+def execute_path_parallel(sim: Any, path: Iterable[str]) -> Dict[str, Any]:
+    """
+    Function: execute_path_parallel
+    Parallel equivalent of LawnmowerSim.execute_path (see module description)
+
+    Args:
+        sim: LawnmowerSim - freshly initialised simulator object
+        path: Iterable[str] - sequence of moves from start position (up,down,left,right)
+
+    Output:
+        sim_status: Dict[str, Any] - see LawnmowerSim.execute_path
+    """
+    if sim.log_level >= LOG_MOVE or PARALLEL_WORKERS <= 1 or multiprocessing.parent_process() is not None:
+        return execute_path_numpy(sim, path)
+    return _execute_codes(sim, encode_path_chunks(path))
+
+
+def execute_runs_parallel(sim: Any, runs: Iterable[Tuple[str, int]]) -> Dict[str, Any]:
+    """
+    Function: execute_runs_parallel
+    Parallel equivalent of LawnmowerSim.execute_runs: the runs are expanded into direction codes (vectorized)
+    and executed as execute_path_parallel
+
+    Args:
+        sim: LawnmowerSim - freshly initialised simulator object
+        runs: Iterable[Tuple[str, int]] - runs of identical moves (up,down,left,right)
+
+    Output:
+        sim_status: Dict[str, Any] - see LawnmowerSim.execute_path
+    """
+    if sim.log_level >= LOG_MOVE or PARALLEL_WORKERS <= 1 or multiprocessing.parent_process() is not None:
+        return sim.execute_runs(runs)
+    return _execute_codes(sim, encode_runs_chunks(runs))
+
+
+def _execute_codes(sim: Any, chunks: Iterator[np.ndarray]) -> Dict[str, Any]:
+    """
+    Function: _execute_codes
+    Write the direction codes to the shared file, scan the shards over the pool and merge them into the simulator
+
+    Args:
+        sim: LawnmowerSim - freshly initialised simulator object
+        chunks: Iterator[np.ndarray] - direction codes, CHUNK_SIZE per chunk (the last one may be shorter)
+
+    Output:
+        sim_status: Dict[str, Any] - see LawnmowerSim.execute_path
+    """
+    height, width = sim.grid_height, sim.grid_width
+    handle, filename = tempfile.mkstemp(prefix="lawnmower-path-", suffix=".bin", dir=PARALLEL_DIR)
+    try:
+        # Shared file: rock map, then the codes. Net displacement per chunk counted while writing
+        steps: List[Tuple[int, int]] = []
+        moves = 0
+        with os.fdopen(handle, "wb") as f:
+            f.write(bytes(sim.grid.rocks))
+            for chunk in chunks:
+                counts = np.bincount(chunk, minlength=NO_MOVE + 1)
+                steps.append((int(counts[1] - counts[0]), int(counts[3] - counts[2])))
+                f.write(chunk.tobytes())
+                moves += len(chunk)
+        if moves < PARALLEL_MIN_MOVES:
+            # Short path: no process overhead
+            codes: np.ndarray = np.fromfile(filename, dtype=np.int8, offset=height * width)
+            return execute_path_numpy(sim, (MOVE_NAMES[code] for code in codes.tolist()))
+
+        # Shards of whole chunks, start positions by prefix sum of the chunk displacements
+        shard_chunks = max(-(-len(steps) // (PARALLEL_WORKERS * SHARDS_PER_WORKER)), 1)
+        displacement = np.cumsum(np.array([(0, 0)] + steps, dtype=np.int64), axis=0)
+        pool = get_parallel_pool()
+        futures: List["Future[Tuple[int, bool, bool, np.ndarray, int, int]]"] = []
+        for first in range(0, len(steps), shard_chunks):
+            offset = first * CHUNK_SIZE
+            row = sim.last_pos[0] + int(displacement[first][0])
+            col = sim.last_pos[1] + int(displacement[first][1])
+            futures.append(pool.submit(_scan_shard, filename, height, width, offset,
+                                       min(shard_chunks * CHUNK_SIZE, moves - offset), row, col))
+
+        # Merge in path order until the first crash
+        visited: np.ndarray = np.frombuffer(sim.grid.visited, dtype=bool)
+        order_type = np.dtype(sim.grid.order.typecode)
+        done = 0
+        crashed, rock = False, False
+        last_pos: Optional[List[int]] = None
+        for future in futures:
+            shard_done, crashed, rock, cells, row, col = future.result()
+            new = cells[~visited[cells]]
+            visited[new] = True
+            sim.grid.order.frombytes(new.astype(order_type).tobytes())
+            done += shard_done
+            last_pos = [row, col]
+            if crashed:
+                break
+        for future in futures:
+            future.cancel() # shards after the crash
+
+        # Positions only needed for pos_history
+        if sim.keep_history:
+            codes_map: np.ndarray = np.memmap(filename, dtype=np.int8, mode="r", offset=height * width, shape=(moves,))
+            row, col = sim.last_pos[0], sim.last_pos[1]
+            recorded = done + 1 if crashed else done
+            for start in range(0, recorded, CHUNK_SIZE):
+                chunk = codes_map[start:min(start + CHUNK_SIZE, recorded)]
+                rows = row + np.cumsum(ROW_STEP[chunk])
+                cols = col + np.cumsum(COL_STEP[chunk])
+                sim.pos_history.extend(zip(rows.tolist(), cols.tolist()))
+                row, col = int(rows[-1]), int(cols[-1])
+            del codes_map
+    finally:
+        os.remove(filename)
+
+    # Update simulator state as the reference engine would after the last executed move
+    if done > 0:
+        sim.number_visited_cells = sim.grid.visited_count()
+        sim.uncut_remaining = sim.total_grass_squares - sim.number_visited_cells
+        sim.all_grass_cut = sim.uncut_remaining == 0
+    if last_pos is not None and (done > 0 or crashed):
+        sim.last_pos = last_pos
+    if crashed:
+        _log_crash(sim, rock)
+        sim.did_mower_crash = True
+        sim.crash_reason = "Crashed into Rock" if rock else "Crashed into Fence"
+    return sim.sim_status()
@@ -0,0 +1,65 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_sim_parallel_test.py
+
+Objectives:
+    Auto Test for Automated Robotic Lawnmower Simulator parallel sharded engine (differential against the reference engine)
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import random
+import importlib
+from typing import Any, List, Tuple
+from python.lawnmower_sim import LawnmowerSim
+
+MOVES = ["Up", "Down", "Left", "Right", "jump"]
+ROCKS = [[1, 1], [3, 4], [5, 2], [9, 9]]
+
+def sharded(monkeypatch: Any) -> Any:
+    # Engine module used by LawnmowerSim, with tiny chunks so that every path spans several shards
+    parallel = importlib.import_module("lawnmower_sim_parallel")
+    monkeypatch.setattr(parallel, "PARALLEL_WORKERS", 2)
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_MOVES", 0)
+    monkeypatch.setattr(parallel, "CHUNK_SIZE", 8)
+    return parallel
+
+def runs_of(path: List[str]) -> List[Tuple[str, int]]:
+    runs: List[Tuple[str, int]] = []
+    for move in path:
+        if runs and runs[-1][0] == move:
+            runs[-1] = (move, runs[-1][1] + 1)
+        else:
+            runs.append((move, 1))
+    return runs
+
+def test_parallel_01_matches_reference(monkeypatch: Any) -> None:
+    """Verifies that random paths (crashes, unknown moves, outside start) return exactly the reference sim_status."""
+    print(f"\n---  Auto Test test_parallel_01_matches_reference - sharded engine identical to execute_path")
+    sharded(monkeypatch)
+    rng = random.Random(19)
+    for case in range(40):
+        start = [rng.randrange(-1, 7), rng.randrange(0, 7)]
+        # Mostly back and forth moves so that long paths survive several shards
+        path = [rng.choice(MOVES) for _ in range(rng.randrange(0, 200))]
+        if case % 2:
+            path = ["Right", "Left"] * 60 + path
+        keep_history = case % 3 != 0
+        reference = LawnmowerSim("ParallelTest", 6, 7, ROCKS, start, keep_history=keep_history).execute_path(path)
+        parallel = LawnmowerSim("ParallelTest", 6, 7, ROCKS, start, keep_history=keep_history).execute_path(path, engine="parallel")
+        assert parallel == reference
+
+def test_parallel_02_runs_and_fallback(monkeypatch: Any) -> None:
+    """Verifies that runs are expanded by the parallel engine and that short paths fall back to the numpy engine."""
+    print(f"\n---  Auto Test test_parallel_02_runs_and_fallback - runs and short path fallback")
+    parallel = sharded(monkeypatch)
+    path = ["Down"] * 5 + ["Right"] * 2 + ["Up"] * 3 + ["Right"] * 4 + ["Left"] * 30 # fence crash after a full sweep of rows
+    reference = LawnmowerSim("RunsTest", 6, 7, [], [0, 0]).execute_path(path)
+    assert LawnmowerSim("RunsTest", 6, 7, [], [0, 0]).execute_runs(runs_of(path), engine="parallel") == reference
+    monkeypatch.setattr(parallel, "get_parallel_pool", lambda: None) # any pool use would fail
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_MOVES", len(path) + 1)
+    assert LawnmowerSim("RunsTest", 6, 7, [], [0, 0]).execute_path(iter(path), engine="parallel") == reference
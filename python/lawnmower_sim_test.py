@@ -13,7 +13,7 @@ Version: 31.01.2026 - Creation
 """
 
 import pytest
-from python.lawnmower_sim import LawnmowerSim
+from python.lawnmower_sim import LawnmowerSim, LogSink, MemorySink, RingBufferSink
 
 def test_scenario_01_valid_path() -> None:
     """Verifies that a valid path cuts all grass and doesn't crash."""
@@ -47,4 +47,50 @@ def test_scenario_04_incomplete_cut() -> None:
     lm_sim = LawnmowerSim("IncompleteTest", 3, 2, [[1,1], [0,1]], [0,0])
     status = lm_sim.execute_path(["down"]) # Only 1 move 
     assert status["all_grass_cut"] is False
-    assert status["uncut_grass_remaining"] == 2 # 4 total grass squares - 2 cut 
\ No newline at end of file
+    assert status["uncut_grass_remaining"] == 2 # 4 total grass squares - 2 cut 
+
+@pytest.mark.parametrize("start_pos, path", [
+    ([0, 0], ["Down", "Down", "Right", "Up"]),             # valid path, full cut
+    ([0, 0], ["Down", "Right"]),                           # rock crash
+    ([2, 0], ["Down"]),                                    # fence crash
+    ([10, 10], ["Down", "jump", "Right"]),                 # start reset outside grid and unknown move
+])
+def test_scenario_05_numpy_engine_matches_reference(start_pos: list, path: list) -> None:
+    """Verifies that the vectorized engine returns exactly the same sim_status as the reference engine."""
+    print(f"\n---  Auto Test test_scenario_05_numpy_engine_matches_reference - engines return identical sim_status")
+    reference = LawnmowerSim("EngineTest", 3, 2, [[1,1], [0,1], [5,5]], start_pos).execute_path(path)
+    vectorized = LawnmowerSim("EngineTest", 3, 2, [[1,1], [0,1], [5,5]], start_pos).execute_path(path, engine="numpy")
+    assert vectorized == reference
+
+def test_scenario_06_summary_log_level() -> None:
+    """Verifies that per-move messages are not logged at summary level and the verdict is unchanged."""
+    print(f"\n---  Auto Test test_scenario_06_summary_log_level - summary log level keeps only summary messages")
+    lm_sim = LawnmowerSim("SummaryTest", 3, 2, [[1,1], [0,1]], [0,0], log_level="summary", log_sinks=[MemorySink()])
+    status = lm_sim.execute_path(["down", "down", "right"])
+    assert status["all_grass_cut"] is True
+    assert not any("execute move" in message for message in status["messages"])
+    assert status["messages"][-1] == "--- SummaryTest: Output Sim Status Structure"
+
+def test_scenario_07_ring_buffer_sink() -> None:
+    """Verifies that the ring buffer sink bounds per-move messages but keeps summary messages."""
+    print(f"\n---  Auto Test test_scenario_07_ring_buffer_sink - ring buffer bounds per-move messages")
+    lm_sim = LawnmowerSim("RingTest", 3, 3, [], [0,0], log_level="trace", log_sinks=[RingBufferSink(maxlen=5)])
+    status = lm_sim.execute_path(["right", "left"] * 100)
+    assert status["messages"][0] == "--- RingTest: Simulator Config start"
+    assert status["messages"][-1] == "--- RingTest: Output Sim Status Structure"
+    assert len(status["messages"]) == 12 + 5 # 12 summary messages + last 5 trace messages
+    with pytest.raises(TypeError):
+        LogSink() # type: ignore[abstract]
+
+@pytest.mark.parametrize("runs", [
+    [("down", 2), ("right", 1), ("up", 1)],                # valid path, full cut
+    [("right", 3)],                                        # rock crash in the middle of a run
+    [("down", 5)],                                         # fence crash in the middle of a run
+])
+def test_scenario_08_runs_match_moves(runs: list) -> None:
+    """Verifies that executing runs as segments returns the same sim_status as executing single moves."""
+    print(f"\n---  Auto Test test_scenario_08_runs_match_moves - run segments equal single moves")
+    moves = [move for move, count in runs for _ in range(count)]
+    reference = LawnmowerSim("RunTest", 3, 2, [[1,1], [0,1]], [0,0], log_level="summary", log_sinks=[MemorySink()]).execute_path(moves)
+    segments = LawnmowerSim("RunTest", 3, 2, [[1,1], [0,1]], [0,0], log_level="summary", log_sinks=[MemorySink()]).execute_runs(runs)
+    assert segments == reference
@@ -0,0 +1,189 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_stream.py
+
+Objectives:
+    Streaming ingestion of Automated Robotic Lawnmower Simulator definition files
+    Reads the definition keys line by line
+    Tokenizes the path=[...] list incrementally, chunk by chunk, as a generator of moves
+    The simulator pulls moves from the generator, so reading stops as soon as a crash is detected
+    and the path never materialises in memory
+    Rules of streamed definition files:
+        path (or its run-length string) is streamed when it is the last key: keys after it are not read
+        a path before any of the required keys (test_name, start_pos, and height, width, rocks or layout_id) is not
+        streamed: the rest of the file is read and parsed as parse_text_file does (any key order)
+        the path list holds quoted moves separated by commas only: anything else between the tokens, or a
+        list without its closing bracket, raises InvalidPath when the stream reaches it
+
+Execution:
+    CLI: with open(file_path) as f: params = parse_text_stream(iter_text_chunks(f))
+    API: params = parse_text_stream(iter_binary_chunks(upload.file))
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+import re
+import ast
+import codecs
+from itertools import chain
+from typing import Dict, Any, Iterator, Iterable, Tuple, TextIO, BinaryIO
+from lawnmower_path_codec import iter_rle_runs, InvalidPath
+
+# Read size for files and uploads
+CHUNK_SIZE: int = 1 << 16
+
+# Path tokens: a quoted move or the closing bracket of the list
+PATH_TOKEN = re.compile(r'"([^"]*)"|\'([^\']*)\'|(\])')
+
+# Allowed text between the tokens: opening bracket before the first one, comma between moves
+# (and an optional trailing comma before the closing bracket)
+PATH_OPEN = re.compile(r'\s*\[\s*')
+PATH_SEPARATOR = re.compile(r'\s*,\s*')
+PATH_TRAILING = re.compile(r'\s*,?\s*')
+
+# Keys of a definition file the simulator needs: test_name, start_pos and the lawn (height, width, rocks or layout_id)
+REQUIRED_KEYS: Tuple[str, ...] = ("test_name", "start_pos")
+LAWN_KEYS: Tuple[str, ...] = ("height", "width", "rocks")
+
+
+def _missing_keys(params: Dict[str, Any]) -> bool:
+    # A required key of the definition file is not parsed yet
+    return any(key not in params for key in REQUIRED_KEYS) or (
+        'layout_id' not in params and any(key not in params for key in LAWN_KEYS))
+
+
+def _parse_lines(params: Dict[str, Any], text: str) -> Dict[str, Any]:
+    # key=value lines of a definition file (as parse_text_file)
+    for line in text.splitlines():
+        if '=' in line:
+            key, val = line.split('=', 1)
+            params[key.strip()] = ast.literal_eval(val.strip())
+    return params
+
+
+def iter_text_chunks(f: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Function: iter_text_chunks
+    Read a text file in chunks
+
+    Args:
+        f: TextIO - open text file
+        chunk_size: int - characters per chunk
+    """
+    return iter(lambda: f.read(chunk_size), "")
+
+
+def iter_binary_chunks(f: BinaryIO, chunk_size: int = CHUNK_SIZE, encoding: str = "utf-8") -> Iterator[str]:
+    """
+    Function: iter_binary_chunks
+    Read a binary file (e.g. an uploaded file) in chunks decoded to text.
+    Multi-byte characters split across chunks are handled by an incremental decoder
+
+    Args:
+        f: BinaryIO - open binary file
+        chunk_size: int - bytes per chunk
+        encoding: str - text encoding
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for data in iter(lambda: f.read(chunk_size), b""):
+        text = decoder.decode(data)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def iter_path_moves(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Function: iter_path_moves
+    Incremental tokenizer of a path list body such as ["Down", "Down", "Right"].
+    Yields one move at a time and stops at the closing bracket.
+    Only the partial token at the end of a chunk is carried over to the next chunk.
+    Raises InvalidPath at any text between the tokens other than the brackets, commas and spaces
+    (e.g. an unquoted move), or when the stream ends before the closing bracket
+
+    Args:
+        chunks: Iterable[str] - text chunks starting at the opening bracket (spaces before it are allowed)
+    """
+    buffer = ""
+    position = 0 # position of the buffer in the path value (error messages)
+    moves = 0
+    for chunk in chunks:
+        buffer += chunk
+        consumed = 0
+        for token in PATH_TOKEN.finditer(buffer):
+            separator = buffer[consumed:token.start()]
+            closing = token.group(3) is not None
+            expected = PATH_OPEN if not moves else PATH_TRAILING if closing else PATH_SEPARATOR
+            if not expected.fullmatch(separator):
+                raise InvalidPath(f"Invalid path list: unexpected {separator!r} at position {position + consumed}")
+            if closing:
+                return
+            yield token.group(1) if token.group(1) is not None else token.group(2)
+            moves += 1
+            consumed = token.end()
+        buffer = buffer[consumed:]
+        position += consumed
+    raise InvalidPath(f"Invalid path list: missing closing bracket after {moves} moves")
+
+
+def parse_text_stream(chunks: Iterable[str]) -> Dict[str, Any]:
+    """
+    Function: parse_text_stream
+    Streaming equivalent of parse_text_file.
+    Keys before the path are parsed line by line (ast.literal_eval), the path value is
+    returned as a generator of moves reading the remaining chunks on demand.
+    A run-length path string (path="D3R1U2") is returned as a generator of runs in params['path_runs'].
+    path is streamed when it is the last key of the definition file: keys after it are not read.
+    A path read before the required keys (REQUIRED_KEYS, LAWN_KEYS) is not streamed: the rest of the file is read and
+    parsed as parse_text_file does, so the keys may come in any order.
+    A malformed path raises InvalidPath when the simulator pulls the moves up to it
+
+    Args:
+        chunks: Iterable[str] - text chunks of the definition file
+
+    Output:
+        params: Dict[str, Any] - parsed keys, with params['path'] an Iterator[str]
+            or params['path_runs'] an Iterator[Tuple[str, int]]
+    """
+    params: Dict[str, Any] = {}
+    chunk_iter = iter(chunks)
+    buffer = ""
+    for chunk in chunk_iter:
+        buffer += chunk
+        while True:
+            newline = buffer.find("\n")
+            line = buffer if newline < 0 else buffer[:newline]
+            if '=' in line and line.split('=', 1)[0].strip() == "path":
+                if _missing_keys(params):
+                    # Required keys after the path: whole file parsed (path as a list or run-length string)
+                    return _parse_lines(params, buffer + "".join(chunk_iter))
+                # Path value: tokenize the rest of the line and the remaining chunks lazily
+                remainder = buffer[buffer.index('=') + 1:]
+                while not remainder.strip():
+                    more = next(chunk_iter, None)
+                    if more is None:
+                        # Empty path value
+                        params["path"] = iter([])
+                        return params
+                    remainder += more
+                if remainder.lstrip()[0] in "\"'":
+                    # Compact run-length string (lawnmower_path_codec), e.g. path="D3R1U2"
+                    params["path_runs"] = iter_rle_runs(chain([remainder], chunk_iter))
+                else:
+                    params["path"] = iter_path_moves(chain([remainder], chunk_iter))
+                return params
+            if newline < 0:
+                break
+            if '=' in line:
+                key, val = line.split('=', 1)
+                params[key.strip()] = ast.literal_eval(val.strip())
+            buffer = buffer[newline + 1:]
+    # No path key. Parse the last line (no trailing new line)
+    return _parse_lines(params, buffer)
@@ -0,0 +1,78 @@
+"""
+Project: 
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_stream_test.py
+
+Objectives: 
+    Auto Test for Automated Robotic Lawnmower Simulator streaming ingestion
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import io
+import os
+import json
+from typing import Any
+import pytest
+from python.lawnmower_sim import LawnmowerSim
+from python.lawnmower_core import parse_text_file
+from lawnmower_core import cli_lawnmower_simulation
+from python.lawnmower_stream import parse_text_stream, iter_text_chunks, iter_binary_chunks
+from lawnmower_path_codec import InvalidPath # the class raised by the module imported by lawnmower_stream
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 65536])
+def test_stream_01_parse_definition_file(chunk_size: int) -> None:
+    """Verifies that the streaming parser returns the same params as the definition file, whatever the chunk size."""
+    print(f"\n---  Auto Test test_stream_01_parse_definition_file - streamed params with chunk size {chunk_size}")
+    with open("./tests/lawnmower_scenario01_valid.txt", "rb") as f:
+        params = parse_text_stream(iter_binary_chunks(f, chunk_size))
+        params["path"] = list(params["path"])
+    assert params == {
+        "test_name": "lawnmower_scenario01_valid",
+        "height": 5,
+        "width": 5,
+        "rocks": [[1,1], [2,2], [3,3]],
+        "start_pos": [0,0],
+        "path": ["Down", "Down", "Down", "Right", "Up", "Left"]
+    }
+
+def test_stream_02_stop_reading_after_crash() -> None:
+    """Verifies that no more moves are read from the stream once the mower crashed."""
+    print(f"\n---  Auto Test test_stream_02_stop_reading_after_crash - stream not read past the crash")
+    content = 'test_name="StreamTest"\nheight=3\nwidth=3\nrocks=[]\nstart_pos=[0,0]\npath=["Up"' + ', "Down"' * 10000 + ']\n'
+    stream = io.StringIO(content)
+    params = parse_text_stream(iter_text_chunks(stream, 16))
+    lm_sim = LawnmowerSim(params["test_name"], params["height"], params["width"], params["rocks"], params["start_pos"],
+                          log_level="off", log_sinks=[], keep_history=False)
+    status = lm_sim.execute_path(params["path"])
+    assert status["crash_reason"] == "Crashed into Fence"
+    assert stream.tell() < 100
+
+@pytest.mark.parametrize("path", ['["Down", Up, garbage "Right"]', '["Down" "Right"]', '["Down", "Right"', 'Down, "Right"]'])
+def test_stream_03_invalid_path_list(path: str) -> None:
+    """Verifies that unquoted moves, missing commas or brackets are rejected instead of skipped."""
+    print(f"\n---  Auto Test test_stream_03_invalid_path_list - {path!r} rejected")
+    content = f'test_name="StreamTest"\nheight=3\nwidth=3\nrocks=[]\nstart_pos=[0,0]\npath={path}\n'
+    for chunk_size in (1, 7, 65536):
+        params = parse_text_stream(iter_text_chunks(io.StringIO(content), chunk_size))
+        with pytest.raises(InvalidPath):
+            list(params["path"])
+    params = parse_text_stream(iter_text_chunks(io.StringIO(content.replace(path, ' [ "Down" , "Right", ]'))))
+    assert list(params["path"]) == ["Down", "Right"]
+
+@pytest.mark.parametrize("path", ['["Down","Right"]', '"D1R1"'])
+def test_stream_04_path_before_required_keys(path: str, tmp_path: Any, monkeypatch: Any) -> None:
+    """Verifies that a path line before the other keys is parsed as the whole file, as parse_text_file does."""
+    print(f"\n---  Auto Test test_stream_04_path_before_required_keys - path={path} first")
+    content = f'path={path}\ntest_name="PathFirst"\nheight=3\nwidth=2\nrocks=[[2,1]]\nstart_pos=[0,0]\nkeep_history=False\n'
+    for chunk_size in (1, 7, 65536):
+        assert parse_text_stream(iter_text_chunks(io.StringIO(content), chunk_size)) == parse_text_file(content)
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("results")
+    with open("path_first.txt", "w") as f:
+        f.write(content)
+    status = json.loads(cli_lawnmower_simulation("path_first.txt"))
+    assert status["test_name"] == "PathFirst" and status["last_pos"] == [1, 1] and status["did_mower_crash"] is False
@@ -0,0 +1,186 @@
+"""
+Project:
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_trie.py
+
+Objectives:
+    Prefix-sharing simulation of many path variants of the same scenario
+    Paths are merged in a trie (one node per distinct prefix)
+    The trie is walked depth first on a single LawnmowerSim: each node executes its one move,
+    takes a snapshot, and its children branch from that snapshot (LawnmowerSim.snapshot / restore)
+    Shared prefixes are simulated once, so the work scales with the number of trie nodes,
+    not with the sum of all path lengths
+    Subtrees below a crash are not simulated (all their paths end with the same crash)
+
+Execution:
+    results = run_path_variants({"test_name": ..., "height": ..., "width": ..., "rocks": ...,
+                                 "start_pos": ..., "paths": [[...], [...], ...]})
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+# Import Definitions
+from typing import List, Dict, Any, Tuple, Optional, Iterable
+from lawnmower_sim import LawnmowerSim, SimSnapshot, LOG_OFF
+
+# Fields of the simulation status reported per path variant (full status with full=True)
+VARIANT_FIELDS: List[str] = ["all_grass_cut", "uncut_grass_remaining", "did_mower_crash", "crash_reason"]
+
+
+class TrieNode:
+    """
+    Trie Node Class Definition
+    One distinct path prefix: children by next move and indexes of the paths ending here
+    """
+    __slots__ = ("children", "ends")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "TrieNode"] = {}
+        self.ends: List[int] = []
+
+
+class PathTrie:
+    """
+    Path Trie Class Definition
+    Merges paths sharing prefixes. Moves are lower case (same as the simulator)
+    """
+
+    def __init__(self, paths: Iterable[Iterable[str]] = ()) -> None:
+        """
+        Method: __init__ (Object Creation)
+
+        Args:
+            paths (Iterable[Iterable[str]]): paths to insert, indexed in order
+        """
+        self.root: TrieNode = TrieNode()
+        self.node_count: int = 1 # root (start position)
+        self.path_count: int = 0
+        for path in paths:
+            self.insert(path)
+
+    def insert(self, path: Iterable[str]) -> int:
+        """
+        Method: insert
+        Insert a path and return its index
+
+        Args:
+            path (Iterable[str]): sequence of moves (up,down,left,right)
+        """
+        node = self.root
+        for move in path:
+            move = move.lower()
+            child = node.children.get(move)
+            if child is None:
+                child = node.children[move] = TrieNode()
+                self.node_count += 1
+            node = child
+        index = self.path_count
+        node.ends.append(index)
+        self.path_count += 1
+        return index
+
+
+def _subtree_ends(node: TrieNode) -> List[int]:
+    """
+    Function: _subtree_ends
+    Indexes of all the paths ending in a subtree
+
+    Args:
+        node: TrieNode - subtree root
+    """
+    ends: List[int] = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        ends.extend(current.ends)
+        stack.extend(current.children.values())
+    return ends
+
+
+def _variant_result(sim: LawnmowerSim, full: bool) -> Dict[str, Any]:
+    """
+    Function: _variant_result
+    Result of the path variant ending at the current simulator state.
+    Copies the mutable state, as the simulator goes on with the other variants
+
+    Args:
+        sim: LawnmowerSim - simulator positioned at the end of the variant
+        full: bool - full Sim Status Structure instead of VARIANT_FIELDS and last_pos
+    """
+    if full:
+        sim_status = sim.sim_status()
+        sim_status.update(pos_history=list(sim.pos_history), last_pos=list(sim.last_pos))
+        return sim_status
+    result: Dict[str, Any] = {
+        "all_grass_cut": sim.all_grass_cut,
+        "uncut_grass_remaining": sim.uncut_remaining,
+        "did_mower_crash": sim.did_mower_crash,
+        "crash_reason": sim.crash_reason,
+    }
+    result["last_pos"] = [sim.last_pos[0], sim.last_pos[1]]
+    return result
+
+
+def run_trie(sim: LawnmowerSim, trie: PathTrie, full: bool = False) -> List[Dict[str, Any]]:
+    """
+    Function: run_trie
+    Simulate all the paths of a trie from the current state of a simulator.
+    Depth first walk: one move per trie node, children resumed from the snapshot of their parent
+
+    Args:
+        sim: LawnmowerSim - simulator at the start position (left at an arbitrary variant on return)
+        trie: PathTrie - path variants
+        full: bool - full Sim Status Structure per variant (costs a copy of the state per variant)
+
+    Output:
+        List[Dict[str, Any]] - one result per path, in insertion order
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * trie.path_count
+    root_snapshot = sim.snapshot()
+    for index in trie.root.ends:
+        results[index] = _variant_result(sim, full)
+
+    # Stack of (move, node, snapshot of the parent node)
+    stack: List[Tuple[str, TrieNode, SimSnapshot]] = [
+        (move, child, root_snapshot) for move, child in trie.root.children.items()]
+    while stack:
+        move, node, parent_snapshot = stack.pop()
+        sim.restore(parent_snapshot)
+        if not sim.move(move):
+            # Crash: the moves after it are never executed, so the whole subtree shares this result
+            result = _variant_result(sim, full)
+            for index in _subtree_ends(node):
+                results[index] = result if not full else dict(result)
+            continue
+        if node.ends:
+            result = _variant_result(sim, full)
+            for index in node.ends:
+                results[index] = result if not full else dict(result)
+        if node.children:
+            snapshot = sim.snapshot()
+            stack.extend((child_move, child, snapshot) for child_move, child in node.children.items())
+    return [result for result in results if result is not None]
+
+
+def run_path_variants(params: Dict[str, Any], full: bool = False) -> List[Dict[str, Any]]:
+    """
+    Function: run_path_variants
+    Simulate many path variants of one scenario with shared prefixes simulated once
+
+    Args:
+        params: Dict[str, Any] - scenario (test_name, height, width, rocks, start_pos, see execute_and_report)
+            with params['paths'] the list of path variants instead of params['path']
+        full: bool - full Sim Status Structure per variant (without messages) instead of
+            VARIANT_FIELDS and last_pos
+
+    Output:
+        List[Dict[str, Any]] - one result per path variant, in the order of params['paths']
+    """
+    trie = PathTrie(params['paths'])
+    # Messages would mix the variants, so the walk is silent
+    sim = LawnmowerSim(params['test_name'], params['height'], params['width'], params['rocks'], params['start_pos'],
+                       log_level=LOG_OFF, log_sinks=[], keep_history=full and params.get('keep_history', True))
+    return run_trie(sim, trie, full)
@@ -0,0 +1,66 @@
+"""
+Project: 
+Automated Robotic Lawnmower Simulator
+
+File: ./python/lawnmower_trie_test.py
+
+Objectives: 
+    Auto Test for Automated Robotic Lawnmower Simulator snapshots and prefix-sharing path variants
+
+Author: gustavobaldocarvalho @ yahoo.com
+
+Version: 16.10.2026 - Creation
+"""
+
+import random
+import pytest
+from python.lawnmower_sim import LawnmowerSim
+from python.lawnmower_trie import PathTrie, run_path_variants
+
+SCENARIO = {"test_name": "variants", "height": 6, "width": 7, "rocks": [[2, 2], [4, 5], [9, 9]], "start_pos": [0, 0]}
+
+def reference(path: list) -> dict:
+    lm_sim = LawnmowerSim(SCENARIO["test_name"], SCENARIO["height"], SCENARIO["width"], SCENARIO["rocks"],
+                          SCENARIO["start_pos"], log_level="off", log_sinks=[])
+    return lm_sim.execute_path(path)
+
+def reference_4x4(path: list) -> dict:
+    return LawnmowerSim("snapshot", 4, 4, [[3, 0]], [0, 0], log_level="off", log_sinks=[]).execute_path(path)
+
+def test_trie_01_snapshot_restore() -> None:
+    """Verifies that restoring a snapshot resumes the exact state, whatever was executed after it."""
+    print(f"\n---  Auto Test test_trie_01_snapshot_restore - snapshot and restore")
+    lm_sim = LawnmowerSim("snapshot", 4, 4, [[3, 0]], [0, 0], log_level="off", log_sinks=[])
+    lm_sim.execute_path(["right", "down"])
+    snapshot = lm_sim.snapshot()
+    expected = lm_sim.sim_status()
+    expected = dict(expected, pos_history=list(expected["pos_history"]), last_pos=list(expected["last_pos"]))
+    lm_sim.execute_path(["down", "left", "down"]) # rock crash
+    assert lm_sim.did_mower_crash
+    lm_sim.restore(snapshot)
+    assert lm_sim.sim_status() == expected
+    assert lm_sim.execute_path(["right", "right"]) == reference_4x4(["right", "down", "right", "right"])
+    with pytest.raises(ValueError):
+        LawnmowerSim("other", 4, 4, [], [0, 0], log_level="off", log_sinks=[]).restore(snapshot)
+
+def test_trie_02_variants_match_fresh_simulations() -> None:
+    """Verifies that every variant gives the same result as a fresh simulation of the full path."""
+    print(f"\n---  Auto Test test_trie_02_variants_match_fresh_simulations - prefix-sharing variants")
+    rng = random.Random(7)
+    moves = ["up", "down", "left", "right", "Right", "jump"]
+    prefix = [rng.choice(["down", "right"]) for _ in range(6)]
+    paths = [prefix + [rng.choice(moves) for _ in range(rng.randint(0, 8))] for _ in range(300)] + [[], prefix]
+    results = run_path_variants(dict(SCENARIO, paths=paths))
+    full_results = run_path_variants(dict(SCENARIO, paths=paths), full=True)
+    for path, result, full_result in zip(paths, results, full_results):
+        expected = reference(path)
+        assert result == {key: expected[key] for key in result}
+        assert full_result == expected
+
+def test_trie_03_work_scales_with_trie_nodes() -> None:
+    """Verifies that shared prefixes are stored (and simulated) once."""
+    print(f"\n---  Auto Test test_trie_03_work_scales_with_trie_nodes - trie nodes")
+    prefix = ["right"] * 3 + ["down"] * 3
+    trie = PathTrie(prefix + [tail] for tail in ["up", "down", "left", "right"])
+    assert trie.path_count == 4
+    assert trie.node_count == 1 + len(prefix) + 4